@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+🚦 ADMISSION CONTROL - Rate limits and queue-wait admission for MCP tools
+Token buckets cap how fast one client may call each tool, so a client
+looping on task_orchestrate or polling task_status cannot starve the rest.
+The AdmissionController measures how long tasks wait before their work
+starts and rejects (or defers) new tasks while that wait is over target,
+answering with a retry_after hint instead of piling on more work.
+"""
+
+import asyncio
+import threading
+import time
+from collections import Counter, OrderedDict, deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+ADMISSION_MODES = ("reject", "defer")
+
+
+class TokenBucket:
+    """`rate` tokens per second, holding at most `burst`"""
+
+    __slots__ = ("rate", "burst", "tokens", "updated")
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def take(self, now: Optional[float] = None) -> float:
+        """Take one token; returns 0 on success, else seconds until one is available"""
+        now = time.monotonic() if now is None else now
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class RateLimiter:
+    """Token-bucket limits per client and tool
+
+    `limits` maps tool name → (tokens per second, burst); "*" covers every
+    other tool. Buckets live with the caller (one dict per client session),
+    so they go away with the client.
+    """
+
+    def __init__(self, limits: Dict[str, Tuple[float, float]]):
+        self.limits = dict(limits)
+        self.rejected: Counter = Counter()
+
+    def acquire(self, buckets: Dict[str, TokenBucket], tool: str) -> float:
+        """Spend a token from the client's bucket for tool; 0 if allowed, else retry-after seconds"""
+        limit = self.limits.get(tool, self.limits.get("*"))
+        if limit is None:
+            return 0.0
+        bucket = buckets.get(tool)
+        if bucket is None:
+            bucket = buckets[tool] = TokenBucket(*limit)
+        retry_after = bucket.take()
+        if retry_after:
+            self.rejected[tool] += 1
+        return retry_after
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "limits": {tool: {"rate": rate, "burst": burst} for tool, (rate, burst) in self.limits.items()},
+            "rejected": dict(self.rejected),
+            "rejected_total": sum(self.rejected.values())
+        }
+
+
+class AdmissionController:
+    """Admits new tasks while queue wait stays under `target` seconds
+
+    Queue wait is the time from a task's creation to the start of its work:
+    event-loop lag, tier slots, analyzer threads. As in CoDel, the signal is
+    the lowest wait seen over the last `interval` (a standing queue, not a
+    burst), or the age of the oldest task still waiting if that is higher.
+    Over target, new tasks are rejected, or in "defer" mode held for up to
+    `max_defer` seconds in case the queue drains. Thread-safe.
+    """
+
+    def __init__(self, target: float = 0.5, interval: float = 1.0, mode: str = "reject", max_defer: float = 2.0):
+        if mode not in ADMISSION_MODES:
+            raise ValueError(f"mode must be one of {ADMISSION_MODES}")
+        self.target = target
+        self.interval = interval
+        self.mode = mode
+        self.max_defer = max_defer
+        self.counters: Counter = Counter()
+        self._lock = threading.Lock()
+        # task id → enqueue time, oldest first
+        self._waiting: "OrderedDict[str, float]" = OrderedDict()
+        # (time, wait) with increasing waits: the front is the window minimum
+        self._window: Deque[Tuple[float, float]] = deque()
+        self._ewma = 0.0
+        self._max = 0.0
+
+    def enqueued(self, key: str):
+        with self._lock:
+            self._waiting[key] = time.monotonic()
+
+    def started(self, key: str):
+        """Work for key began; its wait becomes a sample"""
+        now = time.monotonic()
+        with self._lock:
+            enqueued_at = self._waiting.pop(key, None)
+            if enqueued_at is None:
+                return
+            wait = now - enqueued_at
+            while self._window and self._window[-1][1] >= wait:
+                self._window.pop()
+            self._window.append((now, wait))
+            self._ewma = wait if not self.counters["samples"] else 0.8 * self._ewma + 0.2 * wait
+            self._max = max(self._max, wait)
+            self.counters["samples"] += 1
+
+    def discard(self, key: str):
+        with self._lock:
+            self._waiting.pop(key, None)
+
+    def current_wait(self) -> float:
+        now = time.monotonic()
+        with self._lock:
+            while self._window and self._window[0][0] < now - self.interval:
+                self._window.popleft()
+            standing = self._window[0][1] if self._window else 0.0
+            head = now - next(iter(self._waiting.values())) if self._waiting else 0.0
+        return max(standing, head)
+
+    def settings(self) -> Dict[str, Any]:
+        """Constructor arguments for an equivalent controller, e.g. in a shard process"""
+        return {"target": self.target, "interval": self.interval, "mode": self.mode, "max_defer": self.max_defer}
+
+    async def admit(self) -> Tuple[bool, float]:
+        """(admitted, retry_after seconds) for one new task"""
+        wait = self.current_wait()
+        if wait > self.target and self.mode == "defer":
+            self.counters["deferred"] += 1
+            deadline = time.monotonic() + self.max_defer
+            while wait > self.target and time.monotonic() < deadline:
+                await asyncio.sleep(min(self.interval / 4, self.target))
+                wait = self.current_wait()
+        if wait > self.target:
+            self.counters["rejected"] += 1
+            # The standing wait is roughly how long the backlog needs to drain
+            return False, round(max(wait, 0.1), 3)
+        self.counters["admitted"] += 1
+        return True, 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        current = self.current_wait()
+        with self._lock:
+            return {
+                "mode": self.mode,
+                "target_wait_ms": round(self.target * 1000, 1),
+                "queue_wait_ms": {
+                    "current": round(current * 1000, 1),
+                    "ewma": round(self._ewma * 1000, 1),
+                    "max": round(self._max * 1000, 1),
+                    "samples": self.counters["samples"]
+                },
+                "waiting": len(self._waiting),
+                "admitted": self.counters["admitted"],
+                "deferred": self.counters["deferred"],
+                "rejected": self.counters["rejected"]
+            }
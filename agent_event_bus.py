@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+📡 AGENT EVENT BUS - Execution events, heartbeats and stall detection
+Executing agents publish lifecycle events; the ExecutionMonitor subscribes and
+keeps an O(1) status table, flagging agents that stop sending heartbeats.
+Heartbeats come from the agent's own work through a ProgressReporter, never
+from a timer beside it, so an agent that hangs goes silent and is flagged.
+"""
+
+import asyncio
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Dict, List, Optional
+
+
+class EventType(Enum):
+    STARTED = "started"
+    PROGRESS = "progress"
+    HEARTBEAT = "heartbeat"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+@dataclass
+class AgentEvent:
+    type: EventType
+    task_id: str
+    agent_id: str
+    timestamp: float = field(default_factory=time.monotonic)
+    data: Dict[str, Any] = field(default_factory=dict)
+
+
+class AgentEventBus:
+    """Fan-out bus: every subscriber gets its own queue of events"""
+
+    def __init__(self):
+        self._subscribers: List[asyncio.Queue] = []
+        self.published = 0
+
+    def subscribe(self) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue()
+        self._subscribers.append(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        if queue in self._subscribers:
+            self._subscribers.remove(queue)
+
+    def publish(self, event: AgentEvent):
+        """Non-blocking publish, safe to call from inside agent code"""
+        self.published += 1
+        for queue in self._subscribers:
+            queue.put_nowait(event)
+
+    def emit(self, event_type: EventType, task_id: str, agent_id: str, **data):
+        self.publish(AgentEvent(type=event_type, task_id=task_id, agent_id=agent_id, data=data))
+
+
+class ProgressReporter:
+    """Handed to the code doing a task's work, which calls it each time it gets further
+
+    report() sends a heartbeat, report(0.4) a progress fraction as well.
+    """
+
+    def __init__(self, bus: AgentEventBus, task_id: str, agent_id: str):
+        self.bus = bus
+        self.task_id = task_id
+        self.agent_id = agent_id
+
+    def __call__(self, progress: Optional[float] = None, **data):
+        if progress is None:
+            self.bus.emit(EventType.HEARTBEAT, self.task_id, self.agent_id, **data)
+        else:
+            self.bus.emit(EventType.PROGRESS, self.task_id, self.agent_id, progress=progress, **data)
+
+
+@dataclass
+class TaskExecutionStatus:
+    task_id: str
+    agent_id: str
+    state: str = "pending"
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    last_heartbeat: Optional[float] = None
+    progress: float = 0.0
+    stall_count: int = 0
+    error: Optional[str] = None
+
+    @property
+    def duration(self) -> Optional[float]:
+        if self.started_at is None:
+            return None
+        end = self.finished_at if self.finished_at is not None else time.monotonic()
+        return end - self.started_at
+
+
+class ExecutionMonitor:
+    """Subscribes to the bus and maintains per-task execution state"""
+
+    def __init__(self, bus: AgentEventBus, heartbeat_timeout: float = 5.0):
+        self.bus = bus
+        self.heartbeat_timeout = heartbeat_timeout
+        self.status: Dict[str, TaskExecutionStatus] = {}
+        self.state_counts: Counter = Counter()
+        self._queue: Optional[asyncio.Queue] = None
+        self._consumer: Optional[asyncio.Task] = None
+        self._watchdog: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Begin consuming events and watching for missed heartbeats"""
+        if self._consumer is not None:
+            return
+        self._queue = self.bus.subscribe()
+        self._consumer = asyncio.ensure_future(self._consume())
+        self._watchdog = asyncio.ensure_future(self._watch())
+
+    async def stop(self):
+        await self.drain()
+        for worker in (self._consumer, self._watchdog):
+            if worker is not None:
+                worker.cancel()
+                try:
+                    await worker
+                except asyncio.CancelledError:
+                    pass
+        if self._queue is not None:
+            self.bus.unsubscribe(self._queue)
+        self._consumer = self._watchdog = self._queue = None
+
+    async def drain(self):
+        """Wait until every published event has been applied"""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def _consume(self):
+        while True:
+            event = await self._queue.get()
+            try:
+                self.apply(event)
+            finally:
+                self._queue.task_done()
+
+    async def _watch(self):
+        while True:
+            await asyncio.sleep(self.heartbeat_timeout / 2)
+            self.check_stalls()
+
+    def _transition(self, status: TaskExecutionStatus, state: str):
+        if status.state == state:
+            return
+        self.state_counts[status.state] -= 1
+        self.state_counts[state] += 1
+        status.state = state
+
+    def apply(self, event: AgentEvent):
+        """Apply one event to the status table"""
+        status = self.status.get(event.task_id)
+        if status is None:
+            status = TaskExecutionStatus(task_id=event.task_id, agent_id=event.agent_id)
+            self.status[event.task_id] = status
+            self.state_counts[status.state] += 1
+
+        status.last_heartbeat = event.timestamp
+
+        if event.type == EventType.STARTED:
+            status.started_at = event.timestamp
+            self._transition(status, "running")
+        elif event.type == EventType.PROGRESS:
+            status.progress = float(event.data.get("progress", status.progress))
+            if status.state == "stalled":
+                self._transition(status, "running")
+        elif event.type == EventType.HEARTBEAT:
+            if status.state == "stalled":
+                self._transition(status, "running")
+        elif event.type == EventType.COMPLETED:
+            status.finished_at = event.timestamp
+            status.progress = 1.0
+            self._transition(status, "completed")
+        elif event.type == EventType.FAILED:
+            status.finished_at = event.timestamp
+            status.error = event.data.get("error")
+            self._transition(status, "failed")
+
+    def check_stalls(self, now: Optional[float] = None) -> List[str]:
+        """Flag running tasks that reported no progress within the timeout"""
+        now = time.monotonic() if now is None else now
+        stalled = []
+        for status in self.status.values():
+            if status.state != "running" or status.last_heartbeat is None:
+                continue
+            if now - status.last_heartbeat > self.heartbeat_timeout:
+                status.stall_count += 1
+                self._transition(status, "stalled")
+                stalled.append(status.task_id)
+        return stalled
+
+    def get(self, task_id: str) -> Optional[TaskExecutionStatus]:
+        return self.status.get(task_id)
+
+    def summary(self) -> Dict[str, int]:
+        return {state: count for state, count in self.state_counts.items() if count}
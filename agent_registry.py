@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+📇 AGENT REGISTRY - Indexed agent lookup with least-loaded assignment
+Agents are indexed by name, specialization and capability. Assignment picks the
+matching agent with the lowest expected wait, estimated from its queue depth
+and recent (exponentially weighted) latency.
+"""
+
+import heapq
+import itertools
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# Latency assumed for agents that have not completed anything yet
+DEFAULT_LATENCY = 1.0
+
+
+@dataclass
+class AgentLoad:
+    agent_id: str
+    name: str
+    specialization: str
+    capabilities: List[str]
+    queue_depth: int = 0
+    latency_ewma: float = DEFAULT_LATENCY
+    completed: int = 0
+    version: int = 0
+    order: int = 0
+
+    @property
+    def expected_wait(self) -> float:
+        """Time until a newly queued phase would finish on this agent"""
+        return (self.queue_depth + 1) * self.latency_ewma
+
+
+@dataclass
+class _IndexHeap:
+    # Entries are (expected_wait, registration order, version, agent_id); stale
+    # versions are discarded lazily when they reach the top
+    entries: List[Tuple[float, int, int, str]] = field(default_factory=list)
+    members: Set[str] = field(default_factory=set)
+
+
+class AgentRegistry:
+    """Indexed registry; lookups and assignments avoid scanning all agents"""
+
+    def __init__(self, latency_alpha: float = 0.3, default_latency: float = DEFAULT_LATENCY):
+        self.latency_alpha = latency_alpha
+        self.default_latency = default_latency
+        self.agents: Dict[str, AgentLoad] = {}
+        self._indexes: Dict[Tuple[str, str], _IndexHeap] = {}
+        self._order = itertools.count()
+        # Registry-wide so re-registered agents never match their old heap entries
+        self._versions = itertools.count(1)
+
+    def _keys(self, load: AgentLoad) -> List[Tuple[str, str]]:
+        keys = [("name", load.name), ("specialization", load.specialization)]
+        keys.extend(("capability", capability) for capability in load.capabilities)
+        return keys
+
+    def _push(self, load: AgentLoad):
+        entry = (load.expected_wait, load.order, load.version, load.agent_id)
+        for key in self._keys(load):
+            index = self._indexes[key]
+            heapq.heappush(index.entries, entry)
+            # Compact when stale entries dominate the heap
+            if len(index.entries) > 4 * len(index.members) + 16:
+                index.entries = [
+                    (a.expected_wait, a.order, a.version, a.agent_id)
+                    for a in (self.agents[m] for m in index.members)
+                ]
+                heapq.heapify(index.entries)
+
+    def register(self, agent_id: str, name: str, specialization: str = "",
+                 capabilities: Iterable[str] = ()) -> AgentLoad:
+        """Add an agent to every index it belongs to"""
+        if agent_id in self.agents:
+            self.unregister(agent_id)
+        load = AgentLoad(agent_id=agent_id, name=name, specialization=specialization,
+                         capabilities=list(capabilities), latency_ewma=self.default_latency,
+                         version=next(self._versions), order=next(self._order))
+        self.agents[agent_id] = load
+        for key in self._keys(load):
+            self._indexes.setdefault(key, _IndexHeap()).members.add(agent_id)
+        self._push(load)
+        return load
+
+    def unregister(self, agent_id: str):
+        load = self.agents.pop(agent_id, None)
+        if load is None:
+            return
+        for key in self._keys(load):
+            index = self._indexes.get(key)
+            if index is not None:
+                index.members.discard(agent_id)
+                if not index.members:
+                    del self._indexes[key]
+
+    def find(self, name: Optional[str] = None, specialization: Optional[str] = None,
+             capability: Optional[str] = None) -> Set[str]:
+        """Agent ids matching every given criterion"""
+        criteria = self._criteria(name, specialization, capability)
+        if not criteria:
+            return set(self.agents)
+        sets = sorted((self._indexes[key].members if key in self._indexes else set() for key in criteria), key=len)
+        return set.intersection(*sets) if len(sets) > 1 else set(sets[0])
+
+    @staticmethod
+    def _criteria(name, specialization, capability) -> List[Tuple[str, str]]:
+        criteria = []
+        if name is not None:
+            criteria.append(("name", name))
+        if specialization is not None:
+            criteria.append(("specialization", specialization))
+        if capability is not None:
+            criteria.append(("capability", capability))
+        return criteria
+
+    def least_loaded(self, name: Optional[str] = None, specialization: Optional[str] = None,
+                     capability: Optional[str] = None) -> Optional[str]:
+        """Matching agent with the lowest expected wait, without assigning"""
+        criteria = self._criteria(name, specialization, capability)
+        if not criteria:
+            best = min(self.agents.values(), key=lambda a: (a.expected_wait, a.order), default=None)
+            return best.agent_id if best else None
+
+        indexes = [self._indexes.get(key) for key in criteria]
+        if any(index is None for index in indexes):
+            return None
+
+        if len(indexes) > 1:
+            # Several criteria: scan the smallest candidate set only
+            candidates = self.find(name, specialization, capability)
+            best = min((self.agents[a] for a in candidates), key=lambda a: (a.expected_wait, a.order), default=None)
+            return best.agent_id if best else None
+
+        index = indexes[0]
+        while index.entries:
+            _, _, version, agent_id = index.entries[0]
+            load = self.agents.get(agent_id)
+            if load is not None and load.version == version and agent_id in index.members:
+                return agent_id
+            heapq.heappop(index.entries)
+        return None
+
+    def assign(self, name: Optional[str] = None, specialization: Optional[str] = None,
+               capability: Optional[str] = None) -> Optional[str]:
+        """Pick the least-loaded matching agent and queue one unit of work on it"""
+        agent_id = self.least_loaded(name, specialization, capability)
+        if agent_id is not None:
+            self.begin(agent_id)
+        return agent_id
+
+    def _update(self, load: AgentLoad):
+        load.version = next(self._versions)
+        self._push(load)
+
+    def begin(self, agent_id: str):
+        """Record work queued on an agent"""
+        load = self.agents[agent_id]
+        load.queue_depth += 1
+        self._update(load)
+
+    def complete(self, agent_id: str, latency: Optional[float] = None):
+        """Record finished work and fold its latency into the running average"""
+        load = self.agents.get(agent_id)
+        if load is None:
+            return
+        load.queue_depth = max(0, load.queue_depth - 1)
+        load.completed += 1
+        if latency is not None:
+            if load.completed == 1:
+                load.latency_ewma = latency
+            else:
+                load.latency_ewma += self.latency_alpha * (latency - load.latency_ewma)
+        self._update(load)
+
+    def load_table(self) -> Dict[str, Dict[str, float]]:
+        return {
+            load.name: {
+                "queue_depth": load.queue_depth,
+                "latency_ewma": load.latency_ewma,
+                "completed": load.completed
+            }
+            for load in self.agents.values()
+        }
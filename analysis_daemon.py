@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""
+🏠 ANALYSIS DAEMON - Resident analyzers with a warm registry, file cache and indexes
+Every mission script starts a fresh interpreter, rebuilds its agents and then
+walks and reads the plugin tree again. The daemon keeps that state alive
+between missions:
+  - a Workspace per plugin tree, holding its StandaloneHiveMind and
+    FunctionalHiveMindOrchestrator with their agents, and a TreeIndex of
+    the tree's directories;
+  - one FileCache shared by every workspace;
+  - the process-wide canvas scan cache (fabric_canvas_scanner), the index of
+    fabric.Canvas sites and aliases keyed by content hash;
+  - an AgentOrchestrator whose agents stay registered from one task mission
+    to the next.
+Each analyze mission starts with TreeIndex.refresh(), one stat per cached
+directory, so edits made between missions are seen without a re-walk.
+
+mission_client.py submits missions as SUBMIT frames (wire_protocol) and gets
+a stream of REPLY frames back. A CANCEL frame or a dropped connection cancels
+the mission.
+
+    python analysis_daemon.py
+    python analysis_daemon.py --listen 127.0.0.1:7411 --preload ../checkout
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import os
+import signal
+import sys
+import time
+from collections import Counter, OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+
+import fabric_canvas_scanner
+from agent_orchestrator_core import AgentOrchestrator, AgentType, task_info
+from functional_hive_mind_orchestrator import ANALYSES as FUNCTIONAL_ANALYSES, FunctionalHiveMindOrchestrator
+from mission_client import (
+    ACCEPTED, ANALYZE, CANCELLED, CONNECTION_ERRORS, DEFAULT_ADDRESS, DONE, ERROR, MISSION_KINDS, RESULT, SHUTDOWN,
+    STATS, TASK, new_mission_id
+)
+from standalone_agent_system import StandaloneHiveMind
+from tree_index import DEFAULT_MAX_CHARS, FileCache, TreeIndex
+from wire_protocol import MessageType, ProtocolError, open_connection, parse_address, read_frame, start_server, write_frame
+
+# Plugin trees kept warm at once; the least recently analyzed is dropped first
+DEFAULT_MAX_WORKSPACES = 8
+
+# Canvas scan results kept; the scanner's one-shot default of 256 thrashes on a large tree's bundles
+DEFAULT_SCAN_CACHE_ENTRIES = 100000
+
+# Spawned for task missions that bring no agents of their own: one agent per tier of a hierarchical swarm
+DEFAULT_SWARM = [
+    {"name": "Lead", "type": "coordinator", "capabilities": ["coordination", "planning"]},
+    {"name": "Researcher", "type": "researcher", "capabilities": ["investigation", "documentation"]},
+    {"name": "Analyst", "type": "analyst", "capabilities": ["root_cause", "performance"]},
+    {"name": "Coder", "type": "coder", "capabilities": ["php", "javascript"]}
+]
+
+
+class Workspace:
+    """Warm analyzers and directory index of one plugin tree"""
+
+    def __init__(self, codebase: str, files: FileCache):
+        self.codebase = codebase
+        self.index = TreeIndex(codebase)
+        standalone = StandaloneHiveMind(codebase_path=codebase, index=self.index, files=files)
+        with contextlib.redirect_stdout(io.StringIO()):
+            functional = FunctionalHiveMindOrchestrator(project_path=codebase, simulated_delay=0,
+                                                        index=self.index, files=files)
+        self.analyzers: Dict[str, Callable[[], Awaitable[Dict[str, Any]]]] = {
+            name: getattr(standalone, name) for name in sorted(dir(standalone)) if name.startswith("_analyze_")
+        }
+        self.analyzers.update({name: getattr(functional, name) for name in FUNCTIONAL_ANALYSES})
+        self.missions = 0
+
+
+class AnalysisDaemon:
+    """Serves missions from warm workspaces over a wire_protocol socket"""
+
+    def __init__(self, max_workspaces: int = DEFAULT_MAX_WORKSPACES, files: Optional[FileCache] = None):
+        self.max_workspaces = max_workspaces
+        self.files = files or FileCache()
+        self.workspaces: "OrderedDict[str, Workspace]" = OrderedDict()
+        # Agents spawned by task missions stay registered for the next one
+        self.orchestrator = AgentOrchestrator()
+        self._agents: Dict[Tuple[str, str, Optional[str]], str] = {}
+        self.counters: Counter = Counter()
+        self.started_at = time.time()
+        self.address: Optional[str] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._missions: Dict[str, asyncio.Task] = {}
+        self._connections: Set[asyncio.Task] = set()
+        self._stopped = asyncio.Event()
+
+    async def start(self, address: str = DEFAULT_ADDRESS) -> str:
+        """Listen for clients; returns the bound address"""
+        family, target = parse_address(address)
+        if family == "unix" and os.path.exists(target):
+            try:
+                _, writer = await open_connection(address)
+            except OSError:
+                # Left behind by a daemon that did not shut down cleanly
+                os.unlink(target)
+            else:
+                writer.close()
+                raise RuntimeError(f"An analysis daemon is already listening on {address}")
+        self._server, self.address = await start_server(self._handle_connection, address)
+        return self.address
+
+    def stop(self):
+        """Ask serve() to shut down"""
+        self._stopped.set()
+
+    async def wait_stopped(self):
+        await self._stopped.wait()
+
+    async def close(self):
+        if self._server:
+            self._server.close()
+        missions = list(self._missions.values())
+        for mission in missions:
+            mission.cancel()
+        await asyncio.gather(*missions, return_exceptions=True)
+        if self._connections:
+            await asyncio.wait(self._connections, timeout=1.0)
+        self.orchestrator.close()
+        if self._server:
+            await self._server.wait_closed()
+            family, target = parse_address(self.address)
+            if family == "unix":
+                with contextlib.suppress(FileNotFoundError):
+                    os.unlink(target)
+
+    # Warm state
+
+    def workspace(self, codebase: str) -> Tuple[Workspace, bool]:
+        """The workspace of a plugin tree and whether it was already warm"""
+        codebase = os.path.realpath(codebase)
+        if not os.path.isdir(codebase):
+            raise ValueError(f"No such codebase directory: {codebase}")
+        workspace = self.workspaces.get(codebase)
+        if workspace is not None:
+            self.workspaces.move_to_end(codebase)
+            return workspace, True
+        workspace = self.workspaces[codebase] = Workspace(codebase, self.files)
+        while len(self.workspaces) > self.max_workspaces:
+            self.workspaces.popitem(last=False)
+        return workspace, False
+
+    def agent(self, spec: Dict[str, Any]) -> str:
+        """Id of the registered agent matching spec, spawning it the first time"""
+        key = (spec["name"], spec["type"], spec.get("team"))
+        agent_id = self._agents.get(key)
+        if agent_id is None or agent_id not in self.orchestrator.agents:
+            agent = self.orchestrator.create_agent(spec["name"], AgentType(spec["type"]),
+                                                   list(spec.get("capabilities") or []), spec.get("team"))
+            agent_id = self._agents[key] = agent.id
+        return agent_id
+
+    def cache_info(self, workspace: Optional[Workspace] = None) -> Dict[str, Any]:
+        info = {"files": self.files.cache_info(), "canvas": fabric_canvas_scanner.default_cache.cache_info()}
+        if workspace is not None:
+            info["index"] = workspace.index.cache_info()
+        return info
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "pid": os.getpid(),
+            "address": self.address,
+            "uptime_s": round(time.time() - self.started_at, 3),
+            "missions": dict(self.counters),
+            "running": len(self._missions),
+            "agents": len(self.orchestrator.agents),
+            "workspaces": {codebase: {"missions": workspace.missions, "index": workspace.index.cache_info()}
+                           for codebase, workspace in self.workspaces.items()},
+            "cache": self.cache_info()
+        }
+
+    # Missions
+
+    async def _analyze(self, mission: Dict[str, Any], reply: Callable[..., Awaitable[None]]) -> Dict[str, Any]:
+        if not mission.get("codebase"):
+            raise ValueError("An analyze mission needs a codebase")
+        workspace, warm = self.workspace(mission["codebase"])
+        stale = workspace.index.refresh()
+        names = mission.get("analyzers") or list(workspace.analyzers)
+        unknown = [name for name in names if name not in workspace.analyzers]
+        if unknown:
+            raise ValueError(f"Unknown analyzers: {', '.join(unknown)} (have: {', '.join(workspace.analyzers)})")
+        workspace.missions += 1
+        for name in names:
+            started = time.perf_counter()
+            result = await workspace.analyzers[name]()
+            await reply(RESULT, analyzer=name, ms=round((time.perf_counter() - started) * 1000, 3), result=result)
+        return {"codebase": workspace.codebase, "warm": warm, "analyzers": len(names), "stale_directories": stale,
+                "cache": self.cache_info(workspace)}
+
+    async def _task(self, mission: Dict[str, Any], reply: Callable[..., Awaitable[None]]) -> Dict[str, Any]:
+        if not mission.get("task"):
+            raise ValueError("A task mission needs a task description")
+        for spec in mission.get("agents") or ([] if self.orchestrator.agents else DEFAULT_SWARM):
+            self.agent(spec)
+        task = await self.orchestrator.run_task(mission["task"], mission.get("priority") or "medium",
+                                                timeout=mission.get("timeout"))
+        await reply(RESULT, task=task_info(task))
+        return {"status": task.status.value, "agents": len(self.orchestrator.agents)}
+
+    async def _run(self, writer: asyncio.StreamWriter, mission_id: str, mission: Dict[str, Any]):
+        async def reply(event: str, **fields):
+            await write_frame(writer, MessageType.REPLY, {"mission_id": mission_id, "event": event, **fields})
+
+        def elapsed() -> float:
+            return round((time.perf_counter() - started) * 1000, 3)
+
+        started = time.perf_counter()
+        kind = mission.get("kind") or ANALYZE
+        self.counters["submitted"] += 1
+        try:
+            await reply(ACCEPTED, kind=kind)
+            if kind == ANALYZE:
+                summary = await self._analyze(mission, reply)
+            elif kind == TASK:
+                summary = await self._task(mission, reply)
+            elif kind == STATS:
+                summary = self.stats()
+            elif kind == SHUTDOWN:
+                summary = {}
+            else:
+                raise ValueError(f"Unknown mission kind {kind!r} (expected one of {', '.join(MISSION_KINDS)})")
+            self.counters["completed"] += 1
+            await reply(DONE, ms=elapsed(), **summary)
+            if kind == SHUTDOWN:
+                self.stop()
+        except asyncio.CancelledError:
+            self.counters["cancelled"] += 1
+            with contextlib.suppress(*CONNECTION_ERRORS):
+                await reply(CANCELLED, ms=elapsed())
+            raise
+        except CONNECTION_ERRORS:
+            self.counters["disconnected"] += 1
+        except Exception as e:
+            self.counters["failed"] += 1
+            with contextlib.suppress(*CONNECTION_ERRORS):
+                await reply(ERROR, ms=elapsed(), error=f"{type(e).__name__}: {e}")
+        finally:
+            self._missions.pop(mission_id, None)
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        connection = asyncio.current_task()
+        self._connections.add(connection)
+        submitted: Set[str] = set()
+        try:
+            while True:
+                message_type, message = await read_frame(reader)
+                if message_type == MessageType.SUBMIT:
+                    mission_id = str(message.get("mission_id") or new_mission_id())
+                    if mission_id in self._missions:
+                        await write_frame(writer, MessageType.REPLY, {
+                            "mission_id": mission_id, "event": ERROR, "error": f"Mission {mission_id} is already running"
+                        })
+                        continue
+                    submitted.add(mission_id)
+                    self._missions[mission_id] = asyncio.ensure_future(self._run(writer, mission_id, message))
+                elif message_type == MessageType.CANCEL:
+                    mission_id = message.get("mission_id")
+                    # A client can only cancel its own missions
+                    if mission_id in submitted and mission_id in self._missions:
+                        self._missions[mission_id].cancel()
+                else:
+                    raise ProtocolError(f"Unexpected {message_type.name} from client")
+        except CONNECTION_ERRORS:
+            pass
+        finally:
+            # Nobody is left to read the replies
+            for mission_id in submitted:
+                mission = self._missions.get(mission_id)
+                if mission is not None:
+                    mission.cancel()
+            writer.close()
+            self._connections.discard(connection)
+
+
+async def serve(args) -> AnalysisDaemon:
+    fabric_canvas_scanner.default_cache.max_entries = args.scan_cache_entries
+    daemon = AnalysisDaemon(args.max_workspaces, FileCache(args.file_cache_mb * 1024 * 1024))
+    for codebase in args.preload:
+        workspace, _ = daemon.workspace(codebase)
+        for analyze in workspace.analyzers.values():
+            await analyze()
+    address = await daemon.start(args.listen)
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        with contextlib.suppress(NotImplementedError):
+            loop.add_signal_handler(signum, daemon.stop)
+    print(f"🏠 Analysis daemon {os.getpid()} listening on {address}", flush=True)
+    try:
+        await daemon.wait_stopped()
+    finally:
+        await daemon.close()
+    return daemon
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Resident analysis daemon for mission_client.py")
+    parser.add_argument("--listen", default=DEFAULT_ADDRESS, help="unix:/path or host:port")
+    parser.add_argument("--max-workspaces", type=int, default=DEFAULT_MAX_WORKSPACES,
+                        help="plugin trees kept warm at once")
+    parser.add_argument("--file-cache-mb", type=int, default=DEFAULT_MAX_CHARS // (1024 * 1024),
+                        help="file contents kept in memory, in millions of characters")
+    parser.add_argument("--scan-cache-entries", type=int, default=DEFAULT_SCAN_CACHE_ENTRIES,
+                        help="canvas scan results kept in memory")
+    parser.add_argument("--preload", nargs="+", default=[], metavar="CODEBASE",
+                        help="run every analyzer on these trees before accepting missions")
+    args = parser.parse_args(argv)
+
+    daemon = asyncio.run(serve(args))
+    print(f"✅ Analysis daemon stopped after {daemon.counters['completed']} mission(s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+📦 ARTIFACT STORE - Content-addressed phase outputs
+Phase results are stored once under the hash of their canonical JSON and passed
+between tasks by ID. Recently used artifacts stay in memory; the rest spill to
+disk and are loaded back lazily when an agent asks for them.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+# Keep up to 64 MB of artifacts resident before spilling to disk
+DEFAULT_MEMORY_LIMIT = 64 * 1024 * 1024
+
+
+class ArtifactNotFound(KeyError):
+    """Raised when an artifact id is neither in memory nor on disk"""
+
+
+@dataclass
+class ArtifactInfo:
+    artifact_id: str
+    size: int
+    resident: bool
+
+
+def _canonical(value: Any) -> bytes:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+
+
+class ArtifactStore:
+    """Memory-first content-addressed store with LRU spill to disk"""
+
+    def __init__(self, memory_limit: int = DEFAULT_MEMORY_LIMIT, spill_dir: Optional[str] = None):
+        self.memory_limit = memory_limit
+        self._spill_dir = spill_dir
+        # A spill directory the store made itself is removed by close(); a caller's is only emptied
+        self._owns_spill_dir = spill_dir is None
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self.memory_bytes = 0
+        self.spills = 0
+        self.disk_loads = 0
+
+    @property
+    def spill_dir(self) -> str:
+        # Created on first spill so small runs never touch the filesystem
+        if self._spill_dir is None:
+            self._spill_dir = tempfile.mkdtemp(prefix="hive-artifacts-")
+        os.makedirs(self._spill_dir, exist_ok=True)
+        return self._spill_dir
+
+    def _path(self, artifact_id: str) -> str:
+        return os.path.join(self.spill_dir, f"{artifact_id.split(':', 1)[-1]}.json")
+
+    def put(self, value: Any) -> str:
+        """Store a JSON-serialisable value and return its artifact id"""
+        blob = _canonical(value)
+        artifact_id = f"sha256:{hashlib.sha256(blob).hexdigest()}"
+        if artifact_id in self._sizes:
+            # Identical content is stored once; only refresh recency
+            if artifact_id in self._memory:
+                self._memory.move_to_end(artifact_id)
+            return artifact_id
+
+        self._sizes[artifact_id] = len(blob)
+        self._memory[artifact_id] = blob
+        self.memory_bytes += len(blob)
+        self._spill()
+        return artifact_id
+
+    def _spill(self):
+        # Always keep the newest artifact resident, even if it alone exceeds the limit
+        while self.memory_bytes > self.memory_limit and len(self._memory) > 1:
+            artifact_id, blob = self._memory.popitem(last=False)
+            path = self._path(artifact_id)
+            if not os.path.exists(path):
+                tmp_path = f"{path}.tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(blob)
+                os.replace(tmp_path, path)
+            self.memory_bytes -= len(blob)
+            self.spills += 1
+
+    def get(self, artifact_id: str) -> Any:
+        """Load an artifact, reading it back from disk if it was spilled"""
+        blob = self._memory.get(artifact_id)
+        if blob is not None:
+            self._memory.move_to_end(artifact_id)
+            return json.loads(blob)
+
+        if artifact_id not in self._sizes:
+            raise ArtifactNotFound(artifact_id)
+        with open(self._path(artifact_id), "rb") as f:
+            blob = f.read()
+        self.disk_loads += 1
+
+        self._memory[artifact_id] = blob
+        self.memory_bytes += len(blob)
+        self._spill()
+        return json.loads(blob)
+
+    def __contains__(self, artifact_id: str) -> bool:
+        return artifact_id in self._sizes
+
+    def __len__(self) -> int:
+        return len(self._sizes)
+
+    def info(self, artifact_id: str) -> ArtifactInfo:
+        if artifact_id not in self._sizes:
+            raise ArtifactNotFound(artifact_id)
+        return ArtifactInfo(artifact_id=artifact_id, size=self._sizes[artifact_id],
+                            resident=artifact_id in self._memory)
+
+    def close(self):
+        """Drop every artifact and delete the spilled files; the store can be used again afterwards"""
+        if self._spill_dir is not None and os.path.isdir(self._spill_dir):
+            if self._owns_spill_dir:
+                shutil.rmtree(self._spill_dir, ignore_errors=True)
+                self._spill_dir = None
+            else:
+                for artifact_id in self._sizes:
+                    try:
+                        os.unlink(self._path(artifact_id))
+                    except FileNotFoundError:
+                        pass
+        self._memory.clear()
+        self._sizes.clear()
+        self.memory_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "artifacts": len(self._sizes),
+            "resident": len(self._memory),
+            "memory_bytes": self.memory_bytes,
+            "total_bytes": sum(self._sizes.values()),
+            "spills": self.spills,
+            "disk_loads": self.disk_loads
+        }
@@ -0,0 +1,4 @@
+"""
+📏 BENCHMARKS - Performance measurements for the agent orchestrator
+Each module is runnable with `python -m benchmarks.<name>` and prints JSON.
+"""
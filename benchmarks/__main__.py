@@ -0,0 +1,7 @@
+"""Run the whole benchmark suite: `python -m benchmarks [options]`"""
+
+import sys
+
+from benchmarks.suite import main
+
+sys.exit(main())
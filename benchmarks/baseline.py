@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+📏 BENCHMARK BASELINES - Per-machine baseline store and a regression gate
+Suite reports (python -m benchmarks --output report.json) are saved as
+baselines keyed by the machine fingerprint, so a laptop run is never judged
+against a CI runner. `compare` sets a new report against the baseline for
+its machine: per benchmark, the p50 and p95 deltas, each with a one-sided
+test on the raw samples (Mann-Whitney U for the median shift, a permutation
+test of the p95 difference for the tail, which a rank test barely sees).
+A benchmark regresses only when its p50 or p95 grew beyond the tolerance
+AND that growth is significant (p < alpha), so run-to-run noise does not
+fail the build. Exits 1 on any regression, 2 when there is no baseline to
+compare with.
+
+    python -m benchmarks.baseline save report.json
+    python -m benchmarks.baseline compare new.json --tolerance 10 --alpha 0.05
+    python -m benchmarks.baseline list
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from benchmarks.machine import REPO_ROOT, fingerprint
+from benchmarks.stats import mann_whitney_u, percentile, permutation_test
+
+BASELINE_DIR = os.environ.get("HIVE_BASELINE_DIR", os.path.join(REPO_ROOT, ".hive_baselines"))
+DEFAULT_NAME = "default"
+
+# Row verdicts; only REGRESSED fails the gate
+REGRESSED, IMPROVED, NOISE, OK, UNTESTED, NEW, MISSING = (
+    "REGRESSED", "improved", "noise", "ok", "untested", "new", "missing")
+
+
+def report_fingerprint(report: Dict[str, Any]) -> str:
+    machine = report.get("machine") or {}
+    return machine.get("fingerprint") or fingerprint(machine)
+
+
+def baseline_path(machine_id: str, name: str = DEFAULT_NAME, directory: Optional[str] = None) -> str:
+    return os.path.join(directory or BASELINE_DIR, machine_id, f"{name}.json")
+
+
+def save_baseline(report: Dict[str, Any], name: str = DEFAULT_NAME, directory: Optional[str] = None) -> str:
+    """Store report as the named baseline of the machine it ran on; returns the path"""
+    path = baseline_path(report_fingerprint(report), name, directory)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temporary = f"{path}.tmp"
+    with open(temporary, "w") as handle:
+        json.dump({**report, "baseline": {"name": name, "saved_at": time.time()}}, handle, indent=2)
+    os.replace(temporary, path)
+    return path
+
+
+def load_baseline(machine_id: str, name: str = DEFAULT_NAME, directory: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    try:
+        with open(baseline_path(machine_id, name, directory)) as handle:
+            return json.load(handle)
+    except FileNotFoundError:
+        return None
+
+
+def list_baselines(directory: Optional[str] = None) -> List[Dict[str, Any]]:
+    directory = directory or BASELINE_DIR
+    found = []
+    for machine_id in sorted(os.listdir(directory)) if os.path.isdir(directory) else []:
+        for filename in sorted(os.listdir(os.path.join(directory, machine_id))):
+            if not filename.endswith(".json"):
+                continue
+            with open(os.path.join(directory, machine_id, filename)) as handle:
+                report = json.load(handle)
+            machine = report.get("machine", {})
+            found.append({
+                "fingerprint": machine_id,
+                "name": filename[:-len(".json")],
+                "saved_at": report.get("baseline", {}).get("saved_at"),
+                "git_commit": machine.get("git_commit"),
+                "cpu_model": machine.get("cpu_model"),
+                "python": machine.get("python"),
+                "benchmarks": len(report.get("results", {}))
+            })
+    return found
+
+
+def p95(samples) -> float:
+    return percentile(samples, 95)
+
+
+def _delta_pct(before: float, after: float) -> float:
+    if before == 0:
+        return 0.0 if after == 0 else math.inf
+    return (after - before) / before * 100
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], tolerance: float = 10.0,
+            p95_tolerance: Optional[float] = None, alpha: float = 0.05, metric: str = "wall_ms") -> List[Dict[str, Any]]:
+    """One row per benchmark in either report; tolerances are percentages"""
+    p95_tolerance = tolerance if p95_tolerance is None else p95_tolerance
+    before, after = baseline.get("results", {}), current.get("results", {})
+    rows = []
+    for name in list(after) + [name for name in before if name not in after]:
+        row: Dict[str, Any] = {"benchmark": name, "verdict": None, "p50_p": None, "p95_p": None}
+        if name not in before or name not in after:
+            row["verdict"] = NEW if name in after else MISSING
+            rows.append(row)
+            continue
+        old, new = before[name][metric], after[name][metric]
+        row.update({
+            "base_p50": old["p50"], "p50": new["p50"], "p50_delta_pct": _delta_pct(old["p50"], new["p50"]),
+            "base_p95": old["p95"], "p95": new["p95"], "p95_delta_pct": _delta_pct(old["p95"], new["p95"])
+        })
+        old_samples = before[name].get("samples", {}).get(metric)
+        new_samples = after[name].get("samples", {}).get(metric)
+        # Below this many arrangements even the most extreme ranking is not significant at alpha
+        if not old_samples or not new_samples or 1 / math.comb(len(old_samples) + len(new_samples), len(new_samples)) >= alpha:
+            row["verdict"] = UNTESTED
+            rows.append(row)
+            continue
+
+        # Each delta is tested in the direction it moved
+        p50_slower, p95_slower = row["p50_delta_pct"] > 0, row["p95_delta_pct"] > 0
+        row["p50_p"] = mann_whitney_u(new_samples, old_samples, "greater" if p50_slower else "less")["p"]
+        row["p95_p"] = permutation_test(new_samples, old_samples, p95, "greater" if p95_slower else "less")
+        grew = [(row["p50_delta_pct"] > tolerance, row["p50_p"]), (row["p95_delta_pct"] > p95_tolerance, row["p95_p"])]
+        shrank = [(row["p50_delta_pct"] < -tolerance, row["p50_p"]), (row["p95_delta_pct"] < -p95_tolerance, row["p95_p"])]
+        if any(beyond and p < alpha for beyond, p in grew):
+            row["verdict"] = REGRESSED
+        elif any(beyond and p < alpha for beyond, p in shrank):
+            row["verdict"] = IMPROVED
+        elif any(beyond for beyond, _ in grew + shrank):
+            row["verdict"] = NOISE
+        else:
+            row["verdict"] = OK
+        rows.append(row)
+    return rows
+
+
+def regressions(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [row for row in rows if row["verdict"] == REGRESSED]
+
+
+def format_table(rows: List[Dict[str, Any]], unit: str = "ms") -> str:
+    def number(value: Optional[float]) -> str:
+        return "-" if value is None else f"{value:.4g}"
+
+    def delta(value: Optional[float]) -> str:
+        return "-" if value is None else f"{value:+.1f}%"
+
+    def p_value(value: Optional[float]) -> str:
+        return "-" if value is None else f"{value:.3g}"
+
+    header = ["benchmark", f"base p50 {unit}", f"p50 {unit}", "Δp50", "p", f"base p95 {unit}", f"p95 {unit}", "Δp95", "p",
+              "verdict"]
+    table = [header] + [
+        [row["benchmark"], number(row.get("base_p50")), number(row.get("p50")), delta(row.get("p50_delta_pct")),
+         p_value(row["p50_p"]), number(row.get("base_p95")), number(row.get("p95")), delta(row.get("p95_delta_pct")),
+         p_value(row["p95_p"]), row["verdict"]]
+        for row in rows
+    ]
+    widths = [max(len(line[column]) for line in table) for column in range(len(header))]
+    lines = ["  ".join(cell.ljust(width) if column == 0 else cell.rjust(width)
+                       for column, (cell, width) in enumerate(zip(line, widths))) for line in table]
+    lines.insert(1, "-" * len(lines[0]))
+    return "\n".join(lines)
+
+
+def _load(path: str) -> Dict[str, Any]:
+    if path == "-":
+        return json.load(sys.stdin)
+    with open(path) as handle:
+        return json.load(handle)
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Per-machine benchmark baselines and a regression gate")
+    parser.add_argument("--dir", default=None, help=f"baseline store (default {BASELINE_DIR}, or HIVE_BASELINE_DIR)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    save = commands.add_parser("save", help="store a suite report as this machine's baseline")
+    save.add_argument("report", help="suite report JSON, or - for stdin")
+    save.add_argument("--name", default=DEFAULT_NAME)
+
+    check = commands.add_parser("compare", help="compare a suite report with its machine's baseline")
+    check.add_argument("report", help="suite report JSON, or - for stdin")
+    check.add_argument("--name", default=DEFAULT_NAME, help="which stored baseline to compare with")
+    check.add_argument("--baseline", help="compare with this report file instead of the store")
+    check.add_argument("--tolerance", type=float, default=10.0, help="allowed p50 growth in percent")
+    check.add_argument("--p95-tolerance", type=float, help="allowed p95 growth in percent (default: --tolerance)")
+    check.add_argument("--alpha", type=float, default=0.05, help="significance level of the Mann-Whitney U test")
+    check.add_argument("--metric", choices=["wall_ms", "cpu_ms"], default="wall_ms")
+    check.add_argument("--any-machine", action="store_true", help="allow a baseline from a different machine")
+    check.add_argument("--output", help="also write the comparison as JSON to this file")
+
+    commands.add_parser("list", help="list stored baselines")
+    args = parser.parse_args(argv)
+
+    if args.command == "list":
+        print(json.dumps(list_baselines(args.dir), indent=2))
+        return 0
+
+    report = _load(args.report)
+    if args.command == "save":
+        print(f"📏 Saved baseline {save_baseline(report, args.name, args.dir)}")
+        return 0
+
+    machine_id = report_fingerprint(report)
+    baseline = _load(args.baseline) if args.baseline else load_baseline(machine_id, args.name, args.dir)
+    if baseline is None:
+        print(f"❌ No baseline '{args.name}' for machine {machine_id}; store one with: "
+              f"python -m benchmarks.baseline save {args.report}", file=sys.stderr)
+        return 2
+    if report_fingerprint(baseline) != machine_id and not args.any_machine:
+        print(f"❌ Baseline ran on machine {report_fingerprint(baseline)}, this report on {machine_id}; "
+              f"pass --any-machine to compare anyway", file=sys.stderr)
+        return 2
+
+    rows = compare(baseline, report, args.tolerance, args.p95_tolerance, args.alpha, args.metric)
+    print(f"📏 {args.metric} vs baseline from commit {baseline.get('machine', {}).get('git_commit')} "
+          f"(tolerance {args.tolerance:g}%, alpha {args.alpha:g})")
+    print(format_table(rows))
+    failed = regressions(rows)
+    if args.output:
+        with open(args.output, "w") as handle:
+            json.dump({"machine": machine_id, "regressions": len(failed), "rows": rows}, handle, indent=2)
+    if failed:
+        print(f"\n❌ {len(failed)} benchmark(s) regressed: {', '.join(row['benchmark'] for row in failed)}")
+        return 1
+    print("\n✅ No regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
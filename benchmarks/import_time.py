@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+⏱️ IMPORT TIME BENCHMARK - What `import X` costs a fresh interpreter
+Runs `python -X importtime -c "import X"` in a new process per sample and
+summarises the interpreter's own report: the cumulative import time of X,
+how many modules it pulled in, the heaviest of them, and whether the MCP
+stack was among them. The default pair shows what the core/server split
+buys: agent_orchestrator_core must import without mcp.
+
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --modules standalone_agent_system --repeat 20
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Any, Dict, List, Optional, Sequence
+
+from benchmarks.stats import summarize
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_MODULES = ("agent_orchestrator_core", "mcp_agent_orchestrator")
+# Top-level packages of the MCP server stack
+MCP_STACK = ("mcp", "pydantic", "starlette", "uvicorn", "anyio", "httpx")
+
+
+def parse_importtime(stderr: str) -> List[Dict[str, Any]]:
+    """Rows of an -X importtime report, in the order the interpreter printed them
+
+        import time: self [us] | cumulative | imported package
+        import time:       383 |      46992 |   asyncio
+    """
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # the header
+        name = fields[2].rstrip()
+        module = name.lstrip()
+        rows.append({
+            "module": module,
+            "self_us": int(fields[0]),
+            "cumulative_us": int(fields[1]),
+            # Two spaces of indent per level of nesting, the first after the bar
+            "depth": (len(name) - len(module) - 1) // 2
+        })
+    return rows
+
+
+def import_profile(module: str, python: str = sys.executable, cwd: str = REPO_ROOT) -> Dict[str, Any]:
+    """Import module in a fresh interpreter and read back -X importtime"""
+    cpu_start = os.times()
+    completed = subprocess.run([python, "-X", "importtime", "-c", f"import {module}"], cwd=cwd,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    cpu_end = os.times()
+    rows = parse_importtime(completed.stderr)
+    if completed.returncode != 0:
+        error = completed.stderr.strip().splitlines()[-1] if completed.stderr.strip() else "no output"
+        raise RuntimeError(f"import {module} failed: {error}")
+    top = next(row for row in reversed(rows) if row["module"] == module and row["depth"] == 0)
+    return {
+        "module": module,
+        "import_ms": top["cumulative_us"] / 1000,
+        # The whole child process: interpreter startup and teardown included
+        "process_cpu_ms": ((cpu_end.children_user - cpu_start.children_user)
+                           + (cpu_end.children_system - cpu_start.children_system)) * 1000,
+        "rows": rows
+    }
+
+
+def loaded_packages(rows: List[Dict[str, Any]]) -> List[str]:
+    return sorted({row["module"].split(".")[0] for row in rows})
+
+
+def heaviest(rows: List[Dict[str, Any]], top: int, exclude: str) -> List[Dict[str, Any]]:
+    """The top slowest imports by cumulative time, not counting the benchmarked module itself"""
+    ranked = sorted((row for row in rows if row["module"] != exclude), key=lambda row: -row["cumulative_us"])
+    return [{"module": row["module"], "cumulative_ms": round(row["cumulative_us"] / 1000, 3),
+             "self_ms": round(row["self_us"] / 1000, 3)} for row in ranked[:top]]
+
+
+def measure_import(module: str, repeat: int = 10, warmup: int = 1, top: int = 10,
+                   python: str = sys.executable) -> Dict[str, Any]:
+    """Warmup runs also write the bytecode caches, so samples time imports rather than compiles"""
+    samples, cpu, profile = [], [], None
+    for index in range(warmup + repeat):
+        profile = import_profile(module, python)
+        if index >= warmup:
+            samples.append(profile["import_ms"])
+            cpu.append(profile["process_cpu_ms"])
+    packages = loaded_packages(profile["rows"])
+    return {
+        "import_ms": summarize(samples),
+        "process_cpu_ms": summarize(cpu),
+        "modules_loaded": len(profile["rows"]),
+        "mcp_stack": [package for package in MCP_STACK if package in packages],
+        "heaviest": heaviest(profile["rows"], top, module)
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Import time of the orchestrator modules in a fresh interpreter")
+    parser.add_argument("--modules", nargs="+", default=list(DEFAULT_MODULES))
+    parser.add_argument("--repeat", type=int, default=10, help="timed imports per module")
+    parser.add_argument("--warmup", type=int, default=1, help="untimed imports per module")
+    parser.add_argument("--top", type=int, default=10, help="heaviest imports listed per module")
+    parser.add_argument("--python", default=sys.executable, help="interpreter to import with")
+    parser.add_argument("--output", help="also write the report to this file")
+    args = parser.parse_args(argv)
+
+    text = json.dumps({
+        "benchmark": "import_time",
+        "python": args.python,
+        "repeat": args.repeat,
+        "results": {module: measure_import(module, args.repeat, args.warmup, args.top, args.python)
+                    for module in args.modules}
+    }, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, "w") as handle:
+            handle.write(text + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+"""
+🖥️ MACHINE METADATA - What a benchmark ran on
+Recorded with every suite report so numbers from different hosts, Pythons
+or commits are never compared by accident. The fingerprint keys stored
+baselines: it covers the hardware and interpreter, not the hostname (CI
+containers get a new one every run) or the commit under test.
+"""
+
+import hashlib
+import json
+import os
+import platform
+import subprocess
+from typing import Any, Dict, Optional
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _proc_field(path: str, key: str) -> Optional[str]:
+    """First `key: value` line of a /proc file; None where /proc is unavailable"""
+    try:
+        with open(path) as handle:
+            for line in handle:
+                name, _, value = line.partition(":")
+                if name.strip() == key:
+                    return value.strip()
+    except OSError:
+        pass
+    return None
+
+
+def git_commit() -> Optional[str]:
+    try:
+        result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT,
+                                capture_output=True, text=True, timeout=5)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def machine_info() -> Dict[str, Any]:
+    memory_kb = _proc_field("/proc/meminfo", "MemTotal")
+    return {
+        "hostname": platform.node(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_model": _proc_field("/proc/cpuinfo", "model name") or platform.processor() or None,
+        "cpu_count": os.cpu_count(),
+        "cpus_usable": len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count(),
+        "memory_mb": int(memory_kb.split()[0]) // 1024 if memory_kb else None,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "git_commit": git_commit()
+    }
+
+
+# Fields that change what the numbers mean; anything else may differ between comparable runs
+FINGERPRINT_FIELDS = ("machine", "cpu_model", "cpu_count", "cpus_usable", "memory_mb", "implementation", "python")
+
+
+def fingerprint(info: Optional[Dict[str, Any]] = None) -> str:
+    """Short stable id of the machine a report ran on"""
+    info = machine_info() if info is None else info
+    key = json.dumps({name: info.get(name) for name in FINGERPRINT_FIELDS}, sort_keys=True)
+    return hashlib.sha256(key.encode()).hexdigest()[:12]
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+🔥 MCP LOAD GENERATOR - Concurrent tool-call load against the orchestrator
+Grows the test_mcp_agents.py client script into a load harness: N
+concurrent sessions (streamable HTTP) or N concurrent requests on one
+session, a weighted tool mix, a ramp-up phase where clients start staggered
+and a steady-state phase. Reports throughput, per-tool p50/p95/p99 latency,
+error rates and server RSS over time as JSON.
+
+A server started here runs with --no-rate-limits unless --rate-limits is
+given, so the numbers measure the orchestrator rather than the per-tool
+token buckets; the summary reports the share of calls rejected either way.
+
+    python -m benchmarks.mcp_load --mode requests --concurrency 8 --duration 20
+    python -m benchmarks.mcp_load --mode sessions --transport streamable-http \\
+        --mix spawn=1,orchestrate=2,status=5,results=2 --ramp-up 5
+"""
+
+import argparse
+import asyncio
+import glob
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from contextlib import AsyncExitStack
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from mcp import ClientSession
+
+from benchmarks.stats import summarize
+from benchmarks.transport_latency import SERVER, free_port, wait_for_port
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from test_mcp_agents import AGENTS_TO_CREATE, FABRIC_TASK, orchestrator_transport  # noqa: E402
+
+# Mix names → MCP tools
+TOOLS = {
+    "spawn": "agent_spawn",
+    "orchestrate": "task_orchestrate",
+    "status": "task_status",
+    "results": "task_results",
+    "list": "agent_list",
+    "swarm": "swarm_status"
+}
+DEFAULT_MIX = "spawn=1,orchestrate=2,status=5,results=2"
+
+
+@dataclass
+class Call:
+    tool: str
+    started: float  # seconds since the load started
+    latency_ms: float
+    # ok | rejected (rate limit or admission: success false with retry_after) |
+    # unsuccessful (any other success false, e.g. results not ready) | error (exception or isError)
+    outcome: str
+
+
+@dataclass
+class LoadState:
+    """Shared across clients: tasks to poll and a counter for agent names"""
+    task_ids: List[str] = field(default_factory=list)
+    agents_spawned: int = 0
+
+    def arguments(self, tool: str, rng: random.Random) -> Dict[str, Any]:
+        if tool == "agent_spawn":
+            self.agents_spawned += 1
+            template = rng.choice(AGENTS_TO_CREATE)
+            return {**template, "name": f"{template['name']}-{self.agents_spawned}"}
+        if tool == "task_orchestrate":
+            return {"task": FABRIC_TASK, "strategy": "adaptive", "priority": "critical", "max_agents": 4}
+        if tool in ("task_status", "task_results"):
+            # Bias toward recent tasks, the ones a client would still be polling
+            recent = self.task_ids[-32:]
+            return {"task_id": rng.choice(recent)} if recent else {"task_id": "task-unknown"}
+        return {}
+
+
+def parse_mix(text: str) -> Dict[str, float]:
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in TOOLS:
+            raise argparse.ArgumentTypeError(f"unknown tool {name!r}; choose from {', '.join(TOOLS)}")
+        mix[TOOLS[name]] = float(weight or 1)
+    return mix
+
+
+def child_pids() -> List[int]:
+    """Direct children of this process (the stdio server), via /proc; empty where unavailable"""
+    pids = []
+    for path in glob.glob(f"/proc/{os.getpid()}/task/*/children"):
+        try:
+            with open(path) as children:
+                pids.extend(int(pid) for pid in children.read().split())
+        except OSError:
+            continue
+    return pids
+
+
+def rss_mb(pid: int) -> Optional[float]:
+    try:
+        with open(f"/proc/{pid}/status") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+async def sample_rss(pid_of, t0: float, interval: float, samples: List[Dict[str, float]]):
+    while True:
+        pid = pid_of()
+        mb = rss_mb(pid) if pid else None
+        if mb is not None:
+            samples.append({"t": round(time.perf_counter() - t0, 2), "mb": mb})
+        await asyncio.sleep(interval)
+
+
+async def call_tool(session: ClientSession, tool: str, arguments: Dict[str, Any], t0: float,
+                    state: LoadState, calls: List[Call]):
+    started = time.perf_counter()
+    outcome = "error"
+    try:
+        result = await session.call_tool(tool, arguments)
+        if not result.isError:
+            payload = json.loads(result.content[0].text)
+            if payload.get("success", True):
+                outcome = "ok"
+            else:
+                outcome = "rejected" if "retry_after" in payload else "unsuccessful"
+            if tool == "task_orchestrate" and outcome == "ok":
+                state.task_ids.append(payload["task_id"])
+    except Exception:
+        pass
+    calls.append(Call(tool, started - t0, (time.perf_counter() - started) * 1000, outcome))
+
+
+async def client_loop(session: ClientSession, mix: Dict[str, float], rng: random.Random, t0: float,
+                      stop_at: float, think: float, state: LoadState, calls: List[Call]):
+    tools, weights = list(mix), list(mix.values())
+    while time.perf_counter() < stop_at:
+        tool = rng.choices(tools, weights)[0]
+        await call_tool(session, tool, state.arguments(tool, rng), t0, state, calls)
+        if think:
+            await asyncio.sleep(think)
+
+
+async def open_session(stack: AsyncExitStack, url: Optional[str], errlog,
+                       server_args: List[str] = ()) -> ClientSession:
+    read, write, *_ = await stack.enter_async_context(orchestrator_transport(url, errlog, server_args))
+    session = await stack.enter_async_context(ClientSession(read, write))
+    await session.initialize()
+    return session
+
+
+async def prepare(session: ClientSession, state: LoadState):
+    """Same opening as the client script: a swarm, its agents and one task to poll"""
+    await session.call_tool("swarm_init", {"topology": "hierarchical", "max_agents": 16, "strategy": "specialized"})
+    for agent_config in AGENTS_TO_CREATE:
+        await session.call_tool("agent_spawn", agent_config)
+    result = await session.call_tool("task_orchestrate", {"task": FABRIC_TASK, "priority": "critical"})
+    state.task_ids.append(json.loads(result.content[0].text)["task_id"])
+
+
+async def run_load(args, url: Optional[str], server_pid: Optional[int]) -> Dict[str, Any]:
+    mix = args.mix
+    state, calls, rss = LoadState(), [], []
+    errlog = open(os.devnull, "w")
+    async with AsyncExitStack() as stack:
+        stack.callback(errlog.close)
+        shared = await open_session(stack, url, errlog, args.server_arg)
+        await prepare(shared, state)
+        # A stdio server is our child; an HTTP one was started (or named) by the caller
+        pid_of = (lambda: server_pid) if server_pid else (lambda: next(iter(child_pids()), None))
+
+        t0 = time.perf_counter()
+        stop_at = t0 + args.ramp_up + args.duration
+        sampler = asyncio.create_task(sample_rss(pid_of, t0, args.rss_interval, rss))
+
+        async def client(index: int):
+            # Ramp-up: clients start evenly spread over the ramp-up window
+            await asyncio.sleep(args.ramp_up * index / args.concurrency)
+            if args.mode == "sessions":
+                async with AsyncExitStack() as own:
+                    session = await open_session(own, url, errlog)
+                    await client_loop(session, mix, random.Random(args.seed + index), t0, stop_at,
+                                      args.think_ms / 1000, state, calls)
+            else:
+                await client_loop(shared, mix, random.Random(args.seed + index), t0, stop_at,
+                                  args.think_ms / 1000, state, calls)
+
+        try:
+            await asyncio.gather(*(client(i) for i in range(args.concurrency)))
+        finally:
+            sampler.cancel()
+        elapsed = time.perf_counter() - t0
+        final_rss = rss_mb(pid_of()) if pid_of() else None
+
+    if final_rss is not None:
+        rss.append({"t": round(elapsed, 2), "mb": final_rss})
+    phases = {}
+    if args.ramp_up > 0:
+        phases["ramp_up"] = phase_report([c for c in calls if c.started < args.ramp_up], args.ramp_up)
+    phases["steady"] = phase_report([c for c in calls if c.started >= args.ramp_up], elapsed - args.ramp_up)
+    return {
+        "phases": phases,
+        "total": phase_report(calls, elapsed),
+        "rss_mb": {"samples": rss, "peak": max((s["mb"] for s in rss), default=None)}
+    }
+
+
+def phase_report(calls: List[Call], seconds: float) -> Dict[str, Any]:
+    def rates(subset: List[Call]) -> Dict[str, Any]:
+        count = len(subset)
+        return {
+            "calls": count,
+            "error_rate": round(sum(c.outcome == "error" for c in subset) / count, 4) if count else 0.0,
+            "rejected_rate": round(sum(c.outcome == "rejected" for c in subset) / count, 4) if count else 0.0,
+            "unsuccessful_rate": round(sum(c.outcome == "unsuccessful" for c in subset) / count, 4) if count else 0.0
+        }
+
+    tools = {}
+    for tool in sorted({c.tool for c in calls}):
+        subset = [c for c in calls if c.tool == tool]
+        tools[tool] = {**rates(subset), "latency_ms": summarize([c.latency_ms for c in subset])}
+    return {
+        "seconds": round(seconds, 2),
+        "throughput_per_s": round(len(calls) / seconds, 1) if seconds > 0 else None,
+        **rates(calls),
+        "latency_ms": summarize([c.latency_ms for c in calls]),
+        "tools": tools
+    }
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Concurrent MCP load generator for the agent orchestrator")
+    parser.add_argument("--mode", choices=["requests", "sessions"], default="requests",
+                        help="N concurrent requests on one session, or N concurrent sessions (HTTP only)")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--transport", choices=["stdio", "streamable-http"], default="stdio")
+    parser.add_argument("--url", help="load an already running HTTP server instead of starting one")
+    parser.add_argument("--server-pid", type=int, help="pid of the --url server, for RSS sampling")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix(DEFAULT_MIX),
+                        help=f"weighted tool mix over {', '.join(TOOLS)} (default {DEFAULT_MIX})")
+    parser.add_argument("--ramp-up", type=float, default=2.0, help="seconds over which clients start")
+    parser.add_argument("--duration", type=float, default=10.0, help="steady-state seconds")
+    parser.add_argument("--think-ms", type=float, default=0.0, help="pause between a client's calls")
+    parser.add_argument("--rss-interval", type=float, default=0.5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--server-arg", action="append", default=[],
+                        help="extra argument for a server started here, e.g. --server-arg=--admission-mode=defer")
+    parser.add_argument("--rate-limits", action="store_true",
+                        help="keep the default per-tool rate limits of a server started here (off otherwise)")
+    args = parser.parse_args(argv)
+    if args.mode == "sessions" and args.transport == "stdio" and not args.url:
+        parser.error("--mode sessions needs --transport streamable-http or --url (stdio serves one session)")
+    if not args.url and not args.rate_limits and "--no-rate-limits" not in args.server_arg:
+        args.server_arg.append("--no-rate-limits")
+
+    url, server_pid, server = args.url, args.server_pid, None
+    if not url and args.transport == "streamable-http":
+        port = free_port()
+        server = subprocess.Popen([sys.executable, SERVER, "--transport", "streamable-http", "--port", str(port),
+                                   *args.server_arg],
+                                  cwd=REPO_ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        url, server_pid = f"http://127.0.0.1:{port}/mcp", server.pid
+        asyncio.run(wait_for_port(port))
+    try:
+        report = asyncio.run(run_load(args, url, server_pid))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(10)
+    total = report["total"]
+    if total["rejected_rate"] > 0.05:
+        print(f"⚠️  {total['rejected_rate']:.0%} of calls were rejected (rate limits or admission control); "
+              "throughput and latency include them", file=sys.stderr)
+
+    print(json.dumps({
+        "benchmark": "mcp_load",
+        "config": {
+            "mode": args.mode,
+            "concurrency": args.concurrency,
+            "transport": "streamable-http" if url else "stdio",
+            "mix": args.mix,
+            "ramp_up_s": args.ramp_up,
+            "duration_s": args.duration,
+            "think_ms": args.think_ms,
+            "seed": args.seed,
+            "rate_limits": "server" if args.url else ("on" if "--no-rate-limits" not in args.server_arg else "off"),
+            "server_args": args.server_arg
+        },
+        "machine": {"cpu_count": os.cpu_count(), "python": platform.python_version(), "platform": platform.platform()},
+        "summary": {
+            "calls": total["calls"],
+            "throughput_per_s": total["throughput_per_s"],
+            "ok_share": round(1 - total["rejected_rate"] - total["unsuccessful_rate"] - total["error_rate"], 4),
+            "rejected_share": total["rejected_rate"],
+            "unsuccessful_share": total["unsuccessful_rate"],
+            "error_share": total["error_rate"]
+        },
+        **report
+    }, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+📈 SHARD SCALING BENCHMARK - Tasks/sec for 1..8 orchestrator shards
+Runs a CPU-bound analyzer (an uncached fabric canvas scan of the designer
+bundle) through ShardedOrchestrator and reports throughput per shard count.
+Scaling is bounded by the cores available; cpu_count is part of the output.
+"""
+
+import argparse
+import functools
+import json
+import logging
+import os
+import platform
+import sys
+import time
+from typing import Any, Dict, List
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from fabric_canvas_scanner import find_canvas_sites  # noqa: E402
+from orchestrator_shards import ShardedOrchestrator  # noqa: E402
+
+# Also runs in every shard process, which imports this module to unpickle the analyzer
+logging.getLogger("agent_orchestrator_core").setLevel(logging.WARNING)
+
+BUNDLE = os.path.join(REPO_ROOT, "public", "js", "dist", "designer.bundle.js")
+
+
+def canvas_scan_analyzer(path: str, task) -> Dict[str, Any]:
+    """Tokenize the bundle from scratch on every task (no content-hash cache)"""
+    with open(path, encoding="utf-8", errors="replace") as handle:
+        sites, aliases, token_count = find_canvas_sites(handle.read())
+    return {"task_id": task.id, "canvas_sites": len(sites), "tokens": token_count}
+
+
+def measure(shards: int, tasks: int, routing: str, path: str) -> Dict[str, Any]:
+    analyzer = functools.partial(canvas_scan_analyzer, path)
+    with ShardedOrchestrator(shards, routing=routing, analyzer=analyzer) as sharded:
+        # Warm every shard (process start-up, imports, page cache) before timing
+        sharded.run_batch([f"warmup {i}" for i in range(shards * 2)], timeout=120)
+        start = time.perf_counter()
+        results = sharded.run_batch([f"Scan canvas bundle #{i}" for i in range(tasks)], timeout=600)
+        elapsed = time.perf_counter() - start
+    failed = [r for r in results if r["status"] != "completed"]
+    return {
+        "shards": shards,
+        "tasks": tasks,
+        "seconds": round(elapsed, 4),
+        "tasks_per_second": round(tasks / elapsed, 2),
+        "failed": len(failed)
+    }
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Orchestrator shard scaling benchmark")
+    parser.add_argument("--shards", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--tasks", type=int, default=64)
+    parser.add_argument("--routing", choices=["hash", "affinity"], default="hash")
+    parser.add_argument("--bundle", default=BUNDLE)
+    args = parser.parse_args(argv)
+
+    runs = [measure(shards, args.tasks, args.routing, args.bundle) for shards in args.shards]
+    baseline = runs[0]["tasks_per_second"]
+    for run in runs:
+        run["speedup"] = round(run["tasks_per_second"] / baseline, 2)
+
+    print(json.dumps({
+        "benchmark": "shard_scaling",
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "workload": os.path.relpath(args.bundle, REPO_ROOT),
+        "routing": args.routing,
+        "runs": runs
+    }, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+"""
+📊 BENCHMARK STATS - Summary statistics shared by the benchmark modules
+"""
+
+import math
+import random
+import statistics
+from typing import Callable, Dict, List, Sequence, Tuple
+
+
+def percentile(samples: Sequence[float], q: float) -> float:
+    """Linear-interpolated percentile, q in [0, 100]"""
+    if not samples:
+        return float("nan")
+    ordered = sorted(samples)
+    position = (len(ordered) - 1) * q / 100.0
+    lower, upper = math.floor(position), math.ceil(position)
+    if lower == upper:
+        return ordered[lower]
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def summarize(samples: List[float], digits: int = 3) -> Dict[str, float]:
+    """count/mean/stdev/min/p50/p95/p99/max of a list of samples"""
+    if not samples:
+        return {"count": 0}
+    return {
+        "count": len(samples),
+        "mean": round(statistics.fmean(samples), digits),
+        "stdev": round(statistics.stdev(samples), digits) if len(samples) > 1 else 0.0,
+        "min": round(min(samples), digits),
+        "p50": round(percentile(samples, 50), digits),
+        "p95": round(percentile(samples, 95), digits),
+        "p99": round(percentile(samples, 99), digits),
+        "max": round(max(samples), digits)
+    }
+
+
+def _exact_u_upper_tail(u: float, n1: int, n2: int) -> float:
+    """P(U >= u) for untied samples, by counting the arrangements giving each U"""
+    # counts[j][k]: arrangements of i x-values and j y-values with U == k, built up over i
+    counts = [[1] for _ in range(n2 + 1)]
+    for i in range(1, n1 + 1):
+        row = [[1]]
+        for j in range(1, n2 + 1):
+            # The largest value is an x (beating all j y-values) or a y (beating none)
+            with_x, with_y = counts[j], row[j - 1]
+            size = i * j + 1
+            row.append([(with_x[k - j] if 0 <= k - j < len(with_x) else 0) +
+                        (with_y[k] if k < len(with_y) else 0) for k in range(size)])
+        counts = row
+    distribution = counts[n2]
+    return sum(distribution[math.ceil(u):]) / sum(distribution)
+
+
+def mann_whitney_u(x: Sequence[float], y: Sequence[float], alternative: str = "greater") -> Dict[str, float]:
+    """Mann-Whitney U test of x against y; "greater" asks whether x tends to be larger
+
+    Exact for small samples without ties, otherwise the normal approximation
+    with tie and continuity corrections. Returns U for x and the p-value.
+    """
+    if alternative not in ("greater", "less", "two-sided"):
+        raise ValueError(f"alternative must be greater, less or two-sided, not {alternative}")
+    n1, n2 = len(x), len(y)
+    if not n1 or not n2:
+        raise ValueError("both samples need at least one value")
+
+    # Midranks of the pooled samples
+    pooled = sorted([(value, 0) for value in x] + [(value, 1) for value in y])
+    ranks, ties, start = [0.0] * len(pooled), [], 0
+    while start < len(pooled):
+        end = start
+        while end + 1 < len(pooled) and pooled[end + 1][0] == pooled[start][0]:
+            end += 1
+        for index in range(start, end + 1):
+            ranks[index] = (start + end) / 2 + 1
+        if end > start:
+            ties.append(end - start + 1)
+        start = end + 1
+    u = sum(rank for rank, (_, sample) in zip(ranks, pooled) if sample == 0) - n1 * (n1 + 1) / 2
+
+    def upper(value: float) -> float:
+        """P(U >= value) under the null hypothesis"""
+        if not ties and n1 + n2 <= 50:
+            return _exact_u_upper_tail(value, n1, n2)
+        n = n1 + n2
+        variance = n1 * n2 / 12 * ((n + 1) - sum(t ** 3 - t for t in ties) / (n * (n - 1)))
+        if variance <= 0:
+            return 1.0
+        z = (value - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+        return 0.5 * math.erfc(z / math.sqrt(2))
+
+    greater = upper(u)
+    # U is symmetric about n1*n2/2, so the lower tail is the upper tail of its mirror image
+    less = upper(n1 * n2 - u)
+    p = {"greater": greater, "less": less, "two-sided": min(1.0, 2 * min(greater, less))}[alternative]
+    return {"u": u, "p": min(1.0, p)}
+
+
+def permutation_test(x: Sequence[float], y: Sequence[float], statistic: Callable[[Sequence[float]], float],
+                     alternative: str = "greater", resamples: int = 2000, seed: int = 0) -> float:
+    """p-value that statistic(x) - statistic(y) is this large by chance (label shuffling)
+
+    For statistics with no closed-form test, such as a tail percentile.
+    Seeded, so the same samples always give the same p-value.
+    """
+    if alternative not in ("greater", "less"):
+        raise ValueError(f"alternative must be greater or less, not {alternative}")
+    sign = 1 if alternative == "greater" else -1
+    observed = sign * (statistic(x) - statistic(y))
+    pooled = list(x) + list(y)
+    rng = random.Random(seed)
+    extreme = 0
+    for _ in range(resamples):
+        rng.shuffle(pooled)
+        if sign * (statistic(pooled[:len(x)]) - statistic(pooled[len(x):])) >= observed:
+            extreme += 1
+    return (extreme + 1) / (resamples + 1)
+
+
+def t_quantile(p: float, df: int) -> float:
+    """Student t quantile; exact for df 1 and 2, Cornish-Fisher expansion beyond (within 1% from df 3)"""
+    if df == 1:
+        return math.tan(math.pi * (p - 0.5))
+    if df == 2:
+        return (2 * p - 1) / math.sqrt(2 * p * (1 - p))
+    z = statistics.NormalDist().inv_cdf(p)
+    return (z + (z ** 3 + z) / (4 * df) + (5 * z ** 5 + 16 * z ** 3 + 3 * z) / (96 * df ** 2)
+            + (3 * z ** 7 + 19 * z ** 5 + 17 * z ** 3 - 15 * z) / (384 * df ** 3)
+            + (79 * z ** 9 + 776 * z ** 7 + 1482 * z ** 5 - 1920 * z ** 3 - 945 * z) / (92160 * df ** 4))
+
+
+def confidence_interval(samples: Sequence[float], level: float = 0.95) -> Tuple[float, float]:
+    """t-based confidence interval of the mean; a single sample gives a zero-width interval"""
+    mean = statistics.fmean(samples)
+    if len(samples) < 2:
+        return mean, mean
+    half_width = t_quantile((1 + level) / 2, len(samples) - 1) * statistics.stdev(samples) / math.sqrt(len(samples))
+    return mean - half_width, mean + half_width
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+📊 STATUS POLLING BENCHMARK - Dashboard polling cost vs swarm size
+Times swarm_status and agent_list the way a dashboard polls them: status
+counts from a full scan vs the incremental counters, and a full agent
+listing vs a since_version delta when nothing (or one agent) changed.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import timeit
+from typing import Any, Dict, List
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from agent_orchestrator_core import (AgentOrchestrator, AgentType, Task, TaskStatus,  # noqa: E402
+                                     agent_info, logger)
+
+
+def populate(agents: int, tasks: int) -> AgentOrchestrator:
+    orchestrator = AgentOrchestrator()
+    types = list(AgentType)
+    for i in range(agents):
+        orchestrator.create_agent(f"Agent{i}", types[i % len(types)], ["investigation"])
+    statuses = list(TaskStatus)
+    for i in range(tasks):
+        task = Task(id=f"task-{i}", description="Analyze webpack bundle", status=TaskStatus.PENDING,
+                    assigned_agents=[], created_at=time.time())
+        orchestrator._add_task(task)
+        orchestrator._set_status(task, statuses[i % len(statuses)])
+    return orchestrator
+
+
+def scan_counts(orchestrator: AgentOrchestrator) -> Dict[str, Any]:
+    """The per-call scan swarm_status did before the counters"""
+    return {
+        "active_tasks": len([t for t in orchestrator.tasks.values() if t.status in [TaskStatus.PENDING, TaskStatus.IN_PROGRESS]]),
+        "completed_tasks": len([t for t in orchestrator.tasks.values() if t.status == TaskStatus.COMPLETED]),
+        "agents_by_type": {
+            agent_type.value: len([a for a in orchestrator.agents.values() if a.type == agent_type])
+            for agent_type in AgentType
+        }
+    }
+
+
+def time_us(call, number: int, repeat: int) -> float:
+    return round(min(timeit.repeat(call, number=number, repeat=repeat)) / number * 1e6, 2)
+
+
+def bench(agents: int, tasks: int, number: int, repeat: int) -> Dict[str, Any]:
+    orchestrator = populate(agents, tasks)
+    version = orchestrator.agent_snapshot()["version"]
+    last = next(reversed(orchestrator.agents.values()))
+    result = {
+        "agents": agents,
+        "tasks": tasks,
+        "swarm_status_scan_us": time_us(lambda: scan_counts(orchestrator), number, repeat),
+        "swarm_status_counters_us": time_us(orchestrator.status_counts, number, repeat),
+        "agent_list_rebuild_us": time_us(lambda: [agent_info(a) for a in orchestrator.agents.values()], number, repeat),
+        "agent_list_cached_us": time_us(orchestrator.agent_snapshot, number, repeat),
+        "agent_list_unchanged_delta_us": time_us(lambda: orchestrator.agent_snapshot(version), number, repeat)
+    }
+    orchestrator._agent_changed(last)
+    result["agent_list_one_change_delta_us"] = time_us(lambda: orchestrator.agent_snapshot(version), number, repeat)
+    return result
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="swarm_status / agent_list polling cost benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 10000],
+                        help="agent counts; each run has 10x as many tasks")
+    parser.add_argument("--number", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    logger.setLevel("WARNING")
+    print(json.dumps({
+        "benchmark": "status_polling",
+        "python": platform.python_version(),
+        "runs": [bench(size, size * 10, args.number, args.repeat) for size in args.sizes]
+    }, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""
+🧪 BENCHMARK SUITE - One command for the orchestrator and analyzer hot paths
+Covers AgentOrchestrator.create_agent / orchestrate_task / run_task, the
+end-to-end MCP task_orchestrate → task_results round trip over stdio, every
+StandaloneHiveMind._analyze_* routine and the FunctionalHiveMindOrchestrator
+glob scans, and runs every analyzer again on synthetic plugin trees of 1k,
+10k and 100k files (benchmarks/plugin_tree.py), and times importing the
+orchestrator core and the MCP server in a fresh interpreter with -X
+importtime (benchmarks/import_time.py), and submits the same analyze
+mission to an analysis daemon over its socket, cold and warm
+(analysis_daemon.py). Each case gets warmup runs, then repeated timed
+samples of `number` operations; wall and CPU time per operation are
+summarised and reported as JSON together with the machine they ran on.
+
+    python -m benchmarks
+    python -m benchmarks --groups standalone functional --repeat 30
+    python -m benchmarks --filter orchestrate --output results.json
+    python -m benchmarks --groups scaling --tree-sizes 1000 10000
+
+Store a report as this machine's baseline and gate later runs on it with
+benchmarks/baseline.py.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import inspect
+import json
+import logging
+import os
+import sys
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from benchmarks.machine import fingerprint, machine_info
+from benchmarks.plugin_tree import TreeSpec, default_cache_dir, ensure_tree, size_label
+from benchmarks.stats import summarize
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+GROUPS = ("orchestrator", "mcp", "standalone", "functional", "scaling", "imports", "daemon")
+
+# One agent per tier of a hierarchical swarm, as the MCP client script spawns them
+SWARM = [
+    ("Lead", "coordinator", ["coordination", "planning"]),
+    ("Researcher", "researcher", ["investigation", "documentation"]),
+    ("Analyst", "analyst", ["root_cause", "performance"]),
+    ("Coder", "coder", ["php", "javascript"])
+]
+
+
+@dataclass
+class Case:
+    name: str
+    op: Callable[[], Any]  # one operation; may return an awaitable
+    number: int = 1  # operations per timed sample
+    before: Optional[Callable[[], Awaitable]] = None  # untimed, ahead of every sample
+    after: Optional[Callable[[], Awaitable]] = None  # untimed, after every sample
+    # op times itself and returns {"wall_ms", "cpu_ms"}, e.g. work done in a child process
+    self_timed: bool = False
+
+
+async def measure(case: Case, warmup: int, repeat: int) -> Dict[str, Any]:
+    """Warmup samples are run and discarded; timings are per operation"""
+    wall, cpu = [], []
+    for index in range(warmup + repeat):
+        if case.before:
+            await case.before()
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        reported = {"wall_ms": 0.0, "cpu_ms": 0.0}
+        for _ in range(case.number):
+            result = case.op()
+            if inspect.isawaitable(result):
+                result = await result
+            if case.self_timed:
+                reported = {key: reported[key] + result[key] for key in reported}
+        wall_ms = (time.perf_counter() - wall_start) * 1000 / case.number
+        cpu_ms = (time.process_time() - cpu_start) * 1000 / case.number
+        if case.self_timed:
+            wall_ms, cpu_ms = reported["wall_ms"] / case.number, reported["cpu_ms"] / case.number
+        if case.after:
+            await case.after()
+        if index >= warmup:
+            wall.append(wall_ms)
+            cpu.append(cpu_ms)
+    return {
+        "number": case.number,
+        "unit": "ms/op",
+        "wall_ms": summarize(wall, 4),
+        "cpu_ms": summarize(cpu, 4),
+        # Raw samples, for rank tests against a stored baseline (benchmarks.baseline)
+        "samples": {"wall_ms": [round(sample, 4) for sample in wall], "cpu_ms": [round(sample, 4) for sample in cpu]}
+    }
+
+
+@contextlib.asynccontextmanager
+async def orchestrator_cases(args):
+    from agent_orchestrator_core import AgentOrchestrator, AgentType
+
+    logging.getLogger("agent_orchestrator_core").setLevel(logging.WARNING)
+
+    async def instant(task):
+        # Isolates orchestration overhead from the built-in analyzers' simulated work
+        return {"findings": {}}
+
+    state: Dict[str, Any] = {}
+
+    async def fresh():
+        state["orchestrator"] = AgentOrchestrator(analyzer=instant)
+
+    async def fresh_swarm():
+        await fresh()
+        for name, agent_type, capabilities in SWARM:
+            state["orchestrator"].create_agent(name, AgentType(agent_type), capabilities)
+
+    async def drain():
+        orchestrator = state["orchestrator"]
+        await asyncio.gather(*orchestrator._running.values(), return_exceptions=True)
+
+    yield [
+        Case("orchestrator.create_agent",
+             lambda: state["orchestrator"].create_agent("Researcher", AgentType.RESEARCHER, ["investigation"]),
+             number=1000, before=fresh),
+        Case("orchestrator.orchestrate_task",
+             lambda: state["orchestrator"].orchestrate_task("Analyze fabric loading", "critical"),
+             number=200, before=fresh_swarm, after=drain),
+        Case("orchestrator.run_task",
+             lambda: state["orchestrator"].run_task("Analyze fabric loading", "critical", timeout=30),
+             number=50, before=fresh_swarm)
+    ]
+
+
+@contextlib.asynccontextmanager
+async def mcp_cases(args):
+    from mcp import ClientSession
+
+    from test_mcp_agents import AGENTS_TO_CREATE, FABRIC_TASK, orchestrator_transport
+
+    async def call(tool: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        result = await session.call_tool(tool, arguments)
+        return json.loads(result.content[0].text)
+
+    async def orchestrate():
+        return await call("task_orchestrate", {"task": FABRIC_TASK, "priority": "critical"})
+
+    async def round_trip():
+        task_id = (await orchestrate())["task_id"]
+        while (await call("task_status", {"task_id": task_id}))["status"] not in ("completed", "failed", "cancelled"):
+            await asyncio.sleep(args.poll_ms / 1000)
+        reply = await call("task_results", {"task_id": task_id})
+        if not reply["success"]:
+            raise RuntimeError(f"task {task_id} did not complete: {reply['error']}")
+
+    with open(os.devnull, "w") as errlog:
+        # Rate limits would throttle the tight loop being measured, not the path under test
+        async with orchestrator_transport(errlog=errlog, server_args=["--no-rate-limits"]) as (read, write, *_):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                await call("swarm_init", {"topology": "hierarchical", "max_agents": 16, "strategy": "specialized"})
+                for agent_config in AGENTS_TO_CREATE:
+                    await call("agent_spawn", agent_config)
+                yield [
+                    Case("mcp.swarm_status", lambda: call("swarm_status", {}), number=20),
+                    Case("mcp.task_orchestrate", orchestrate, number=10),
+                    Case("mcp.task_orchestrate_to_results", round_trip)
+                ]
+
+
+def analysis_cases(prefix: str, instance, select: Callable[[str], bool], number: int) -> List[Case]:
+    return [
+        Case(f"{prefix}.{name}", method, number=number)
+        for name, method in inspect.getmembers(instance, inspect.iscoroutinefunction)
+        if select(name)
+    ]
+
+
+def standalone_analyzers(codebase: str, prefix: str = "standalone", number: int = 10) -> List[Case]:
+    from standalone_agent_system import StandaloneHiveMind
+
+    hive_mind = StandaloneHiveMind(codebase_path=codebase)
+    return analysis_cases(prefix, hive_mind, lambda name: name.startswith("_analyze_"), number)
+
+
+def functional_analyzers(codebase: str, prefix: str = "functional", number: int = 1) -> List[Case]:
+    from functional_hive_mind_orchestrator import FunctionalHiveMindOrchestrator
+
+    # No simulated delay: what is left is the glob scans and file reads
+    orchestrator = FunctionalHiveMindOrchestrator(project_path=codebase, simulated_delay=0)
+    return analysis_cases(prefix, orchestrator, lambda name: name.endswith("_analysis")
+                          and name != "orchestrate_parallel_analysis", number)
+
+
+@contextlib.asynccontextmanager
+async def standalone_cases(args):
+    yield standalone_analyzers(args.codebase)
+
+
+@contextlib.asynccontextmanager
+async def functional_cases(args):
+    yield functional_analyzers(args.codebase)
+
+
+@contextlib.asynccontextmanager
+async def scaling_cases(args):
+    """Every analyzer against synthetic plugin trees of each --tree-sizes file count"""
+    cases = []
+    for files in args.tree_sizes:
+        label = f"scaling.{size_label(files)}"
+        # Generated once per spec and reused from the cache on later runs
+        root = ensure_tree(TreeSpec(files=files, seed=args.tree_seed), args.tree_cache)
+        cases += standalone_analyzers(root, f"{label}.standalone", number=1)
+        cases += functional_analyzers(root, f"{label}.functional")
+    yield cases
+
+
+@contextlib.asynccontextmanager
+async def import_cases(args):
+    """Cumulative -X importtime of each module, with the child's CPU time for the whole run"""
+    from benchmarks.import_time import DEFAULT_MODULES, import_profile
+
+    def importer(module: str) -> Callable[[], Awaitable[Dict[str, float]]]:
+        async def op():
+            profile = await asyncio.to_thread(import_profile, module)
+            return {"wall_ms": profile["import_ms"], "cpu_ms": profile["process_cpu_ms"]}
+        return op
+
+    yield [Case(f"imports.{module}", importer(module), self_timed=True) for module in DEFAULT_MODULES]
+
+
+@contextlib.asynccontextmanager
+async def daemon_cases(args):
+    """An analyze mission of --codebase over a local socket, from a forgotten and from a warm workspace"""
+    import tempfile
+
+    import fabric_canvas_scanner
+    from analysis_daemon import AnalysisDaemon
+    from mission_client import ANALYZE, DONE, run_mission
+
+    async def mission():
+        replies = await run_mission({"kind": ANALYZE, "codebase": args.codebase}, address)
+        if replies[-1]["event"] != DONE:
+            raise RuntimeError(f"analyze mission ended with {replies[-1]}")
+
+    async def forget():
+        daemon.workspaces.clear()
+        daemon.files.clear()
+        fabric_canvas_scanner.default_cache.clear()
+
+    with tempfile.TemporaryDirectory() as directory:
+        daemon = AnalysisDaemon()
+        address = await daemon.start(f"unix:{os.path.join(directory, 'daemon.sock')}")
+        try:
+            yield [
+                Case("daemon.cold_mission", mission, before=forget),
+                Case("daemon.warm_mission", mission, before=mission)
+            ]
+        finally:
+            await daemon.close()
+
+
+CASE_GROUPS = {
+    "orchestrator": orchestrator_cases,
+    "mcp": mcp_cases,
+    "standalone": standalone_cases,
+    "functional": functional_cases,
+    "scaling": scaling_cases,
+    "imports": import_cases,
+    "daemon": daemon_cases
+}
+
+
+async def run_suite(args) -> Dict[str, Any]:
+    results, listed = {}, {}
+    for group in args.groups:
+        # The analyzers report progress with print(); keep it off the JSON on stdout
+        with open(os.devnull, "w") as quiet, contextlib.redirect_stdout(quiet):
+            async with CASE_GROUPS[group](args) as cases:
+                for case in cases:
+                    if args.filter and not any(text in case.name for text in args.filter):
+                        continue
+                    if args.list:
+                        listed[case.name] = group
+                        continue
+                    results[case.name] = {"group": group, **await measure(case, args.warmup, args.repeat)}
+    return {"cases": sorted(listed)} if args.list else {"results": results}
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark suite for the agent orchestrator and analyzers")
+    parser.add_argument("--groups", nargs="+", choices=GROUPS, default=list(GROUPS))
+    parser.add_argument("--filter", nargs="+", help="only cases whose name contains one of these")
+    parser.add_argument("--warmup", type=int, default=2, help="untimed samples per case")
+    parser.add_argument("--repeat", type=int, default=10, help="timed samples per case")
+    parser.add_argument("--codebase", default=REPO_ROOT, help="plugin tree the analyzers scan")
+    parser.add_argument("--tree-sizes", type=int, nargs="+", default=[1000, 10000, 100000],
+                        help="file counts of the synthetic plugin trees for the scaling group")
+    parser.add_argument("--tree-seed", type=int, default=0)
+    parser.add_argument("--tree-cache", default=default_cache_dir(), help="where generated trees are kept")
+    parser.add_argument("--poll-ms", type=float, default=5.0, help="task_status poll interval in the MCP round trip")
+    parser.add_argument("--output", help="also write the report to this file")
+    parser.add_argument("--list", action="store_true", help="list the selected cases without running them")
+    args = parser.parse_args(argv)
+
+    started = time.time()
+    machine = machine_info()
+    report = asyncio.run(run_suite(args))
+    if args.list:
+        print("\n".join(report["cases"]))
+        return 0
+
+    text = json.dumps({
+        "benchmark": "suite",
+        "started_at": started,
+        "seconds": round(time.time() - started, 2),
+        "config": {
+            "groups": args.groups,
+            "filter": args.filter,
+            "warmup": args.warmup,
+            "repeat": args.repeat,
+            "codebase": args.codebase,
+            "tree_sizes": args.tree_sizes if "scaling" in args.groups else None,
+            "tree_seed": args.tree_seed
+        },
+        "machine": {**machine, "fingerprint": fingerprint(machine)},
+        **report
+    }, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, "w") as handle:
+            handle.write(text + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
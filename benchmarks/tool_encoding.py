@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+🧮 TOOL ENCODING BENCHMARK - Encode cost per MCP tool response
+Builds a realistic orchestrator state, captures each tool's response payload
+and times every available encode backend against the legacy path (a
+json.dumps string re-wrapped as structured output, or a dict pretty-printed
+by the framework). With pydantic_core installed it also times a serializer
+compiled once from each tool's response shape, the cached-schema approach
+tool_responses deliberately does not use.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+import timeit
+from typing import Any, Callable, Dict, List
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+import mcp_agent_orchestrator as server  # noqa: E402
+from tool_responses import BACKEND, BACKENDS  # noqa: E402
+
+# Tools that returned json.dumps(...) strings before every tool went through encode_response
+LEGACY_STRING_TOOLS = {"swarm_init", "agent_spawn"}
+
+try:
+    import pydantic_core
+    from pydantic_core import core_schema
+except ImportError:
+    pydantic_core = None
+
+SCALAR_SCHEMAS = {
+    bool: "bool_schema",
+    int: "int_schema",
+    float: "float_schema",
+    str: "str_schema"
+}
+
+
+def legacy_encoder(tool: str) -> Callable[[Any], str]:
+    if tool in LEGACY_STRING_TOOLS:
+        # Text content, then the same string again inside structuredContent
+        def encode(payload):
+            text = json.dumps(payload)
+            return text + json.dumps({"result": text})
+        return encode
+    if pydantic_core is not None:
+        return lambda payload: pydantic_core.to_json(payload, fallback=str, indent=2).decode("utf-8")
+    return lambda payload: json.dumps(payload, indent=2, default=str)
+
+
+def shape_schema(value: Any):
+    """A pydantic-core schema fixed to the shape of one captured payload"""
+    if isinstance(value, dict) and all(isinstance(key, str) for key in value):
+        return core_schema.typed_dict_schema(
+            {key: core_schema.typed_dict_field(shape_schema(item)) for key, item in value.items()})
+    if isinstance(value, list):
+        return core_schema.list_schema(core_schema.any_schema())
+    if type(value) in SCALAR_SCHEMAS:
+        return getattr(core_schema, SCALAR_SCHEMAS[type(value)])()
+    return core_schema.nullable_schema(core_schema.any_schema())
+
+
+def schema_encoder(payload: Any) -> Callable[[Any], str]:
+    """Serializer compiled once for this tool's response shape, as a per-tool schema cache would hold"""
+    serializer = pydantic_core.SchemaSerializer(shape_schema(payload))
+    return lambda value: serializer.to_json(value).decode("utf-8")
+
+
+async def capture_payloads(agents: int) -> Dict[str, Any]:
+    """Drive every tool once against a populated swarm and keep the decoded responses"""
+    payloads = {"swarm_init": json.loads(await server.swarm_init(topology="mesh"))}
+    for i in range(agents):
+        payloads["agent_spawn"] = json.loads(await server.agent_spawn(
+            "researcher", f"Researcher{i}", ["webpack_analysis", "fabric_investigation", "script_debugging"]))
+    task = json.loads(await server.task_orchestrate("Analyze fabric.js loading failure", priority="critical"))
+    payloads["task_orchestrate"] = task
+    await server.orchestrator.wait_for_task(task["task_id"], timeout=5)
+    payloads["task_status"] = json.loads(await server.task_status(task["task_id"]))
+    payloads["task_results"] = json.loads(await server.task_results(task["task_id"]))
+    payloads["agent_list"] = json.loads(await server.agent_list())
+    payloads["swarm_status"] = json.loads(await server.swarm_status())
+    payloads["session_info"] = json.loads(await server.session_info())
+    return payloads
+
+
+def time_encoder(encode: Callable[[Any], str], payload: Any, number: int, repeat: int) -> Dict[str, float]:
+    best = min(timeit.repeat(lambda: encode(payload), number=number, repeat=repeat)) / number
+    return {"us": round(best * 1e6, 2), "bytes": len(encode(payload).encode("utf-8"))}
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Per-tool MCP response encode benchmark")
+    parser.add_argument("--agents", type=int, default=16)
+    parser.add_argument("--number", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    payloads = asyncio.run(capture_payloads(args.agents))
+    tools = {}
+    for tool, payload in payloads.items():
+        results = {"legacy": time_encoder(legacy_encoder(tool), payload, args.number, args.repeat)}
+        for name, encode in BACKENDS.items():
+            results[name] = time_encoder(encode, payload, args.number, args.repeat)
+        if pydantic_core is not None:
+            encode = schema_encoder(payload)
+            assert json.loads(encode(payload)) == payload, tool
+            results["pydantic_schema"] = time_encoder(encode, payload, args.number, args.repeat)
+        results["speedup"] = round(results["legacy"]["us"] / results[BACKEND]["us"], 1)
+        tools[tool] = results
+
+    print(json.dumps({
+        "benchmark": "tool_encoding",
+        "backend": BACKEND,
+        "python": platform.python_version(),
+        "agents": args.agents,
+        "tools": tools
+    }, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+🚦 TRANSPORT LATENCY BENCHMARK - MCP tool calls over stdio vs streamable HTTP
+Measures sequential tool-call latency and concurrent throughput against a
+single orchestrator server. stdio allows one client, so its concurrency is
+in-flight calls on one session; HTTP runs one session per concurrent client.
+Both servers run with --no-rate-limits; calls rejected anyway (success false
+with retry_after) are counted and reported per transport.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import socket
+import subprocess
+import sys
+import time
+from contextlib import AsyncExitStack
+from collections import Counter
+from typing import Any, Awaitable, Callable, Dict, List
+
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+from mcp.client.streamable_http import streamablehttp_client
+
+from benchmarks.stats import summarize
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SERVER = os.path.join(REPO_ROOT, "mcp_agent_orchestrator.py")
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def wait_for_port(port: int, timeout: float = 15.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.close()
+            return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Server did not listen on port {port}")
+            await asyncio.sleep(0.05)
+
+
+async def call(session: ClientSession, tool: str, counts: Counter):
+    """One tool call, counted as rejected when the server answers with retry_after"""
+    result = await session.call_tool(tool, {})
+    counts["calls"] += 1
+    if not result.isError and "retry_after" in json.loads(result.content[0].text):
+        counts["rejected"] += 1
+
+
+async def latency(session: ClientSession, tool: str, calls: int, counts: Counter) -> List[float]:
+    samples = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        await call(session, tool, counts)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+async def throughput(callers: List[Callable[[], Awaitable[Any]]], calls_each: int) -> float:
+    async def loop(call):
+        for _ in range(calls_each):
+            await call()
+    start = time.perf_counter()
+    await asyncio.gather(*(loop(call) for call in callers))
+    return len(callers) * calls_each / (time.perf_counter() - start)
+
+
+def rejections(counts: Counter) -> Dict[str, Any]:
+    rejected = counts["rejected"]
+    return {"rejected": rejected, "rejected_rate": round(rejected / counts["calls"], 4) if counts["calls"] else 0.0}
+
+
+async def bench_stdio(tool: str, calls: int, clients: int) -> Dict[str, Any]:
+    params = StdioServerParameters(command=sys.executable, args=[SERVER, "--no-rate-limits"], cwd=REPO_ROOT)
+    counts = Counter()
+    async with stdio_client(params) as (read, write):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            await latency(session, tool, 10, counts)
+            samples = await latency(session, tool, calls, counts)
+            rate = await throughput([lambda: call(session, tool, counts)] * clients, calls // clients)
+    return {"transport": "stdio", "latency_ms": summarize(samples), "calls_per_second": round(rate, 1),
+            "sessions": 1, **rejections(counts)}
+
+
+async def bench_http(tool: str, calls: int, clients: int) -> Dict[str, Any]:
+    port = free_port()
+    server = subprocess.Popen([sys.executable, SERVER, "--transport", "streamable-http", "--port", str(port),
+                               "--no-rate-limits"],
+                              cwd=REPO_ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    counts = Counter()
+    url = f"http://127.0.0.1:{port}/mcp"
+    try:
+        await wait_for_port(port)
+        async with streamablehttp_client(url) as (read, write, _):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                await latency(session, tool, 10, counts)
+                samples = await latency(session, tool, calls, counts)
+
+        async def open_session(stack):
+            read, write, _ = await stack.enter_async_context(streamablehttp_client(url))
+            session = await stack.enter_async_context(ClientSession(read, write))
+            await session.initialize()
+            return session
+
+        async with AsyncExitStack() as stack:
+            sessions = [await open_session(stack) for _ in range(clients)]
+            rate = await throughput([lambda s=s: call(s, tool, counts) for s in sessions], calls // clients)
+    finally:
+        server.terminate()
+        server.wait(10)
+    return {"transport": "streamable-http", "latency_ms": summarize(samples), "calls_per_second": round(rate, 1),
+            "sessions": clients, **rejections(counts)}
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="MCP stdio vs HTTP transport benchmark")
+    parser.add_argument("--tool", default="swarm_status")
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--clients", type=int, default=8)
+    args = parser.parse_args(argv)
+
+    runs = [asyncio.run(bench_stdio(args.tool, args.calls, args.clients)),
+            asyncio.run(bench_http(args.tool, args.calls, args.clients))]
+    for run in runs:
+        if run["rejected_rate"] > 0.05:
+            print(f"⚠️  {run['transport']}: {run['rejected_rate']:.0%} of calls were rejected; "
+                  "throughput and latency include them", file=sys.stderr)
+    print(json.dumps({
+        "benchmark": "transport_latency",
+        "tool": args.tool,
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "runs": runs
+    }, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -19,13 +19,16 @@ ARCHITECTURE:
 
 import sys
 import os
+import argparse
 import asyncio
 from datetime import datetime
-from dataclasses import dataclass
-from typing import List, Dict
+from dataclasses import asdict, dataclass
+from typing import List, Dict, Optional
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-from mcp_agent_orchestrator import AgentOrchestrator, AgentType
+from agent_orchestrator_core import AgentOrchestrator, AgentType, TaskStatus
+from loop_runner import get_runner
+from run_journal import add_resume_argument, open_journal
 
 
 @dataclass
@@ -179,39 +182,18 @@ class TacticalSwarm:
             - Minimal code change with maximum effectiveness
             """
 
-            # Execute surgical task
-            task_id = self.orchestrator.orchestrate_task(surgical_task)
-            self.log(f"Surgical task deployed: {task_id}")
-
-            # Wait for completion (synchronous)
-            import time
-            max_wait = 3
-            for i in range(max_wait):
-                time.sleep(1)
-
-                if task_id in self.orchestrator.tasks:
-                    task = self.orchestrator.tasks[task_id]
-                    if hasattr(task, 'status') and task.status == 'completed':
-                        break
-
-            # Get results
-            if task_id in self.orchestrator.tasks:
-                task = self.orchestrator.tasks[task_id]
-                results = getattr(task, 'results', None)
-
-                if results:
-                    self.log("✅ Surgical fix completed successfully")
-                    return {
-                        'success': True,
-                        'changes_made': 'Added wp_register_script for fabric-global-exposer.js',
-                        'task_results': results,
-                        'precision_level': 'surgical'
-                    }
-
-            self.log("⚠️ Surgical fix completed with unknown status")
+            # Execute surgical task on the shared loop thread and block until it finishes
+            task = get_runner().run(self.orchestrator.run_task(surgical_task, priority="critical", timeout=3))
+            self.log(f"Surgical task completed: {task.id} ({task.status.value})")
+
+            if task.status != TaskStatus.COMPLETED:
+                raise RuntimeError(f"Surgical task {task.id} failed: {task.results.get('error')}")
+
+            self.log("✅ Surgical fix completed successfully")
             return {
-                'success': True,  # Assume success for surgical operation
-                'changes_made': 'Surgical PHP modification completed',
+                'success': True,
+                'changes_made': 'Added wp_register_script for fabric-global-exposer.js',
+                'task_results': task.results,
                 'precision_level': 'surgical'
             }
 
@@ -224,7 +206,7 @@ class TacticalSwarm:
             }
 
 
-async def main():
+async def main(resume: Optional[str] = None):
     """🧠→⚡ Main Hive Mind → Swarm Coordination"""
 
     print("🧠 CLEAN HIVE MIND → SWARM DELEGATION SYSTEM")
@@ -235,14 +217,17 @@ async def main():
 
     # Initialize Clean Hive Mind
     hive_mind = CleanHiveMind()
+    journal = open_journal(resume, "clean_hive_mind")
 
     # Strategic Phase: Analyze core problem
     hive_mind.log("=== STRATEGIC PHASE: CORE PROBLEM ANALYSIS ===")
-    core_problem = hive_mind.analyze_core_problem()
+    core_problem = journal.run_phase_sync("core_problem", hive_mind.analyze_core_problem)
 
     # Mission Planning: Create surgical mission
     hive_mind.log("=== MISSION PLANNING PHASE ===")
-    mission = hive_mind.create_swarm_mission(core_problem)
+    mission = SwarmMission(**journal.run_phase_sync(
+        "mission", lambda: asdict(hive_mind.create_swarm_mission(core_problem)), inputs=core_problem
+    ))
 
     # Delegation Phase: Hand off to tactical swarm
     hive_mind.log("=== DELEGATION PHASE ===")
@@ -250,7 +235,18 @@ async def main():
 
     # Execution Phase: Monitor swarm execution
     hive_mind.log("=== EXECUTION MONITORING PHASE ===")
-    results = hive_mind.monitor_swarm_execution(swarm)
+    if journal.is_completed("surgical_fix"):
+        # The fix was already applied by an earlier run; never patch the file twice
+        results = journal.outputs("surgical_fix")
+        hive_mind.log(f"Surgical fix already applied in {journal.run_id}")
+        hive_mind.mission_status = "completed"
+    else:
+        journal.phase_started("surgical_fix", asdict(mission))
+        results = hive_mind.monitor_swarm_execution(swarm)
+        if results['success']:
+            journal.phase_completed("surgical_fix", results, asdict(mission))
+        else:
+            journal.phase_failed("surgical_fix", results.get('error', 'unknown error'), asdict(mission))
 
     # Summary
     print("\n" + "=" * 60)
@@ -275,4 +271,6 @@ async def main():
 
 if __name__ == "__main__":
     print("🚀 Launching Clean Hive Mind → Swarm Delegation System...")
-    result = asyncio.run(main())
\ No newline at end of file
+    parser = add_resume_argument(argparse.ArgumentParser(description="Clean Hive Mind → Swarm delegation"))
+    args = parser.parse_args()
+    result = asyncio.run(main(args.resume))
\ No newline at end of file
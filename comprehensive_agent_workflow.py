@@ -5,10 +5,17 @@ Vollständige Analyse → Implementation → Testing → Validation
 Sicherstellt, dass das gesamte System verstanden und abgedeckt wird
 """
 
+import argparse
 import asyncio
-import json
 from datetime import datetime
-from mcp_agent_orchestrator import AgentOrchestrator, AgentType
+from typing import Optional
+from agent_orchestrator_core import AgentOrchestrator, AgentType, TaskStatus
+from run_journal import add_resume_argument, open_journal
+from workflow_pipeline import PipelinePhase, WorkflowPipeline
+
+# Deadline for each orchestrated agent task, and for each phase as a whole
+TASK_DEADLINE = 5.0
+PHASE_DEADLINE = 30.0
 
 class ComprehensiveAgentWorkflow:
     def __init__(self):
@@ -78,9 +85,7 @@ TARGET: 100% system coverage with high confidence recommendations
 
         # Wait for comprehensive analysis
         print("\n⏱️  WAITING FOR COMPREHENSIVE ANALYSIS...")
-        await self._wait_for_task_completion(analysis_task.id, max_wait=5)
-
-        analysis_results = self.orchestrator.tasks[analysis_task.id].results
+        analysis_results = await self._await_task_results(analysis_task.id)
 
         print(f"\n📋 COMPREHENSIVE ANALYSIS COMPLETE")
         if analysis_results:
@@ -109,11 +114,13 @@ TARGET: 100% system coverage with high confidence recommendations
 
         print(f"👥 Implementation Team Deployed: {len(self.implementation_team)} specialists")
 
+        analysis_ref = self._store_phase_output(analysis_results)
+
         implementation_task = f"""
 IMPLEMENTATION PLANNING BASED ON ANALYSIS RESULTS
 
 ANALYSIS RESULTS SUMMARY:
-{json.dumps(analysis_results, indent=2) if analysis_results else 'No previous analysis'}
+{self._describe_artifact(analysis_ref, 'No previous analysis')}
 
 IMPLEMENTATION REQUIREMENTS:
 1. ARCHITECTURE PLANNING: Design complete implementation strategy with rollback scenarios
@@ -133,13 +140,12 @@ TARGET: Production-ready implementation plan with 100% coverage
 
         impl_task = self.orchestrator.orchestrate_task(
             implementation_task,
-            priority="critical"
+            priority="critical",
+            artifacts=[analysis_ref] if analysis_ref else []
         )
 
         print(f"🎯 Implementation Task Deployed: {impl_task.id}")
-        await self._wait_for_task_completion(impl_task.id, max_wait=5)
-
-        implementation_results = self.orchestrator.tasks[impl_task.id].results
+        implementation_results = await self._await_task_results(impl_task.id)
 
         print(f"\n📋 IMPLEMENTATION PLANNING COMPLETE")
         if implementation_results:
@@ -148,8 +154,11 @@ TARGET: Production-ready implementation plan with 100% coverage
 
         return implementation_results
 
-    async def phase_3_testing_strategy(self, implementation_results):
-        """Phase 3: Comprehensive Testing Strategy"""
+    async def phase_3_testing_strategy(self, implementation_results, analysis_results=None):
+        """Phase 3: Comprehensive Testing Strategy
+
+        Can start from the analysis alone; the implementation plan is optional.
+        """
         print(f"\n🧪 PHASE 3: TESTING STRATEGY")
         print("="*50)
 
@@ -167,11 +176,14 @@ TARGET: Production-ready implementation plan with 100% coverage
 
         print(f"👥 Testing Team Deployed: {len(self.testing_team)} specialists")
 
+        implementation_ref = self._store_phase_output(implementation_results)
+        analysis_ref = self._store_phase_output(analysis_results)
+
         testing_task = f"""
 COMPREHENSIVE TESTING STRATEGY DEVELOPMENT
 
 IMPLEMENTATION PLAN SUMMARY:
-{json.dumps(implementation_results, indent=2) if implementation_results else 'No implementation plan'}
+{self._describe_artifact(implementation_ref, 'No implementation plan')}
 
 TESTING REQUIREMENTS:
 1. TEST STRATEGY: Complete testing plan covering all scenarios and edge cases
@@ -191,13 +203,12 @@ TARGET: 100% test coverage with automated validation
 
         test_task = self.orchestrator.orchestrate_task(
             testing_task,
-            priority="critical"
+            priority="critical",
+            artifacts=[ref for ref in (implementation_ref, analysis_ref) if ref]
         )
 
         print(f"🎯 Testing Task Deployed: {test_task.id}")
-        await self._wait_for_task_completion(test_task.id, max_wait=5)
-
-        testing_results = self.orchestrator.tasks[test_task.id].results
+        testing_results = await self._await_task_results(test_task.id)
 
         print(f"\n📋 TESTING STRATEGY COMPLETE")
         if testing_results:
@@ -223,13 +234,18 @@ TARGET: 100% test coverage with automated validation
 
         print(f"👥 Validation Team Deployed: {len(self.validation_team)} specialists")
 
+        phase_refs = {
+            phase: self._store_phase_output(all_results.get(phase))
+            for phase in ('analysis', 'implementation', 'testing')
+        }
+
         validation_task = f"""
 FINAL VALIDATION & SYSTEM SIGN-OFF
 
 ALL PHASE RESULTS:
-Analysis: {len(str(all_results['analysis'])) if 'analysis' in all_results else 0} chars
-Implementation: {len(str(all_results['implementation'])) if 'implementation' in all_results else 0} chars
-Testing: {len(str(all_results['testing'])) if 'testing' in all_results else 0} chars
+Analysis: {self._describe_artifact(phase_refs['analysis'], 'missing')}
+Implementation: {self._describe_artifact(phase_refs['implementation'], 'missing')}
+Testing: {self._describe_artifact(phase_refs['testing'], 'missing')}
 
 VALIDATION REQUIREMENTS:
 1. SOLUTION VALIDATION: Verify all requirements are met with high confidence
@@ -249,13 +265,12 @@ TARGET: 100% confidence in solution reliability and system stability
 
         validation_task = self.orchestrator.orchestrate_task(
             validation_task,
-            priority="critical"
+            priority="critical",
+            artifacts=[ref for ref in phase_refs.values() if ref]
         )
 
         print(f"🎯 Validation Task Deployed: {validation_task.id}")
-        await self._wait_for_task_completion(validation_task.id, max_wait=5)
-
-        validation_results = self.orchestrator.tasks[validation_task.id].results
+        validation_results = await self._await_task_results(validation_task.id)
 
         print(f"\n📋 FINAL VALIDATION COMPLETE")
         if validation_results:
@@ -264,17 +279,27 @@ TARGET: 100% confidence in solution reliability and system stability
 
         return validation_results
 
-    async def _wait_for_task_completion(self, task_id, max_wait=10):
-        """Wait for task completion with progress monitoring"""
-        for i in range(max_wait):
-            await asyncio.sleep(1)
-            task = self.orchestrator.tasks[task_id]
-            print(f"   [{i+1}s] Status: {task.status.value}")
-
-            if task.status.value == "completed":
-                exec_time = (task.completed_at - task.created_at) * 1000
-                print(f"   ✅ Completed in {exec_time:.2f}ms")
-                break
+    def _store_phase_output(self, results):
+        """Put a phase's results in the artifact store; returns None when there is nothing to pass on"""
+        if not results:
+            return None
+        return self.orchestrator.artifacts.put(results)
+
+    def _describe_artifact(self, artifact_id, missing):
+        # Only the reference goes into the task text; agents load the payload lazily
+        if artifact_id is None:
+            return missing
+        info = self.orchestrator.artifacts.info(artifact_id)
+        return f"artifact {artifact_id} ({info.size} bytes)"
+
+    async def _await_task_results(self, task_id, deadline=TASK_DEADLINE):
+        """Wait for a task's completion event; missed deadlines and failures raise"""
+        task = await self.orchestrator.wait_for_task(task_id, timeout=deadline)
+        if task.status == TaskStatus.FAILED:
+            raise RuntimeError(f"Task {task_id} failed: {task.results.get('error')}")
+        exec_time = (task.completed_at - task.created_at) * 1000
+        print(f"   ✅ Completed in {exec_time:.2f}ms")
+        return task.results
 
     def _print_detailed_findings(self, results):
         """Print detailed findings from analysis"""
@@ -333,32 +358,57 @@ TARGET: 100% confidence in solution reliability and system stability
             "timestamp": datetime.now().isoformat()
         }
 
-async def main():
+async def main(resume: Optional[str] = None):
     """Execute comprehensive agent workflow"""
     print("🚀 COMPREHENSIVE AGENT WORKFLOW - FULL SYSTEM COVERAGE")
     print("="*60)
 
     workflow = ComprehensiveAgentWorkflow()
+    journal = open_journal(resume, "comprehensive")
     all_results = {}
 
-    try:
-        # Phase 1: Comprehensive Analysis
-        all_results['analysis'] = await workflow.phase_1_comprehensive_analysis()
-
-        # Phase 2: Implementation Planning
-        all_results['implementation'] = await workflow.phase_2_implementation_planning(
-            all_results['analysis']
-        )
+    # Each phase starts as soon as the fields it needs exist; testing may start
+    # speculatively from the analysis and is redone if the plan arrives meanwhile
+    pipeline = WorkflowPipeline([
+        PipelinePhase(
+            'analysis',
+            lambda ctx: journal.run_phase('analysis', workflow.phase_1_comprehensive_analysis),
+            deadline=PHASE_DEADLINE
+        ),
+        PipelinePhase(
+            'implementation',
+            lambda ctx: journal.run_phase(
+                'implementation', workflow.phase_2_implementation_planning,
+                ctx.fields_of('analysis'), inputs=sorted(ctx.inputs)
+            ),
+            requires=['analysis.findings', 'analysis.recommended_fix'],
+            deadline=PHASE_DEADLINE
+        ),
+        PipelinePhase(
+            'testing',
+            lambda ctx: journal.run_phase(
+                'testing', workflow.phase_3_testing_strategy,
+                ctx.fields_of('implementation'), ctx.fields_of('analysis'), inputs=sorted(ctx.inputs)
+            ),
+            requires=['analysis.findings'],
+            optional=['implementation.recommended_fix', 'implementation.findings'],
+            speculative=True,
+            deadline=PHASE_DEADLINE
+        ),
+        PipelinePhase(
+            'validation',
+            lambda ctx: journal.run_phase(
+                'validation', workflow.phase_4_validation_and_sign_off,
+                ctx.inputs, inputs=sorted(ctx.inputs)
+            ),
+            requires=['analysis', 'implementation', 'testing'],
+            deadline=PHASE_DEADLINE
+        ),
+    ])
 
-        # Phase 3: Testing Strategy
-        all_results['testing'] = await workflow.phase_3_testing_strategy(
-            all_results['implementation']
-        )
-
-        # Phase 4: Validation & Sign-off
-        all_results['validation'] = await workflow.phase_4_validation_and_sign_off(
-            all_results
-        )
+    try:
+        await pipeline.run()
+        all_results.update(pipeline.results)
 
         # Generate Final Report
         final_report = await workflow.generate_comprehensive_report(all_results)
@@ -371,8 +421,15 @@ async def main():
         return final_report, all_results
 
     except Exception as e:
+        all_results.update(pipeline.results)
         print(f"❌ Workflow Error: {e}")
+        print(f"🔁 Resume with: --resume {journal.run_id}")
         return None, all_results
 
+    finally:
+        workflow.orchestrator.close()
+
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    parser = add_resume_argument(argparse.ArgumentParser(description="Comprehensive agent workflow"))
+    args = parser.parse_args()
+    asyncio.run(main(args.resume))
\ No newline at end of file
@@ -8,7 +8,8 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from mcp_agent_orchestrator import AgentOrchestrator, AgentType
+from agent_orchestrator_core import AgentOrchestrator, AgentType, TaskStatus
+from loop_runner import LoopRunner
 import time
 import json
 
@@ -17,8 +18,9 @@ def main():
     print("=" * 50)
     print()
 
-    # Initialize orchestrator
+    # Initialize orchestrator; its tasks run on a loop thread so this script can stay synchronous
     orchestrator = AgentOrchestrator()
+    runner = LoopRunner()
 
     # DEPLOY 7 SPECIALIZED AGENTS
     print("1️⃣ DEPLOYING 7 CORS SPECIALISTS...")
@@ -42,8 +44,9 @@ def main():
     # PARALLEL TASK DEPLOYMENT
     print("2️⃣ ORCHESTRATING PARALLEL CORS ANALYSIS...")
 
-    # Critical CORS Issue Analysis
-    cors_task = orchestrator.orchestrate_task(
+    # Critical CORS Issue Analysis; the coordinator fans it out to the six specialists
+    cors_task = runner.call(
+        orchestrator.orchestrate_task,
         """Analyze XMLHttpRequest CORS error in WordPress admin-ajax.php:
 
         CRITICAL ERROR: XMLHttpRequest cannot load https://yprint.de/wp-admin/admin-ajax.php due to access control checks
@@ -69,45 +72,41 @@ def main():
         - Assignment saves continue working perfectly
         - No console errors related to CORS/XMLHttpRequest
         """,
-        [agent.id for agent in agents[:6]]  # First 6 agents for analysis
+        "critical"
     )
 
-    print(f"   🎯 CORS Analysis Task: {cors_task['id']}")
-    print(f"   👥 Assigned Agents: {len(agents[:6])}")
+    print(f"   🎯 CORS Analysis Task: {cors_task.id}")
+    print(f"   👥 Assigned Agents: {len(cors_task.assigned_agents)}")
     print()
 
     # WAIT FOR ANALYSIS
     print("3️⃣ EXECUTING PARALLEL CORS RESOLUTION...")
 
-    max_wait = 5  # 5 seconds max
     start_time = time.time()
-
-    while time.time() - start_time < max_wait:
-        task_status = orchestrator.get_task_status(cors_task['id'])
-        print(f"   ⏱️  [{int(time.time() - start_time)}s] Status: {task_status['status']}")
-
-        if task_status['status'] == 'completed':
-            break
-
-        time.sleep(1)
+    try:
+        cors_task = runner.run(orchestrator.wait_for_task(cors_task.id, timeout=5))
+    except TimeoutError as e:
+        print(f"   ❌ {e}")
+    print(f"   ⏱️  [{time.time() - start_time:.2f}s] Status: {cors_task.status.value}")
 
     # GET RESULTS
     print()
     print("4️⃣ CORS ANALYSIS RESULTS...")
 
-    task_results = orchestrator.get_task_results(cors_task['id'])
+    task_results = cors_task.results if cors_task.status == TaskStatus.COMPLETED else None
 
     if task_results:
         print("   📋 CORS Investigation Complete!")
 
         # Extract key findings
-        analysis = task_results.get('analysis', {})
+        findings = task_results.get('findings', {})
+        analysis = findings if isinstance(findings, dict) else {}
         root_cause = analysis.get('root_cause', 'Analysis in progress')
         evidence = analysis.get('evidence', [])
-        fixes = analysis.get('recommended_fixes', [])
+        fixes = list(task_results.get('recommended_fix', {}).values())
 
         print(f"   🎯 Root Cause: {root_cause}")
-        print(f"   📊 Confidence: {analysis.get('confidence', 'medium')}")
+        print(f"   📊 Confidence: {task_results.get('confidence_level', 'medium')}")
         print()
 
         if evidence:
@@ -125,8 +124,9 @@ def main():
         # DEPLOYMENT PHASE
         print("5️⃣ DEPLOYING CORS FIXES...")
 
-        # Use Agent 7 for implementation
-        deployment_task = orchestrator.orchestrate_task(
+        # Integration Validator coordinates the implementation
+        deployment_task = runner.call(
+            orchestrator.orchestrate_task,
             f"""Implement CORS fixes based on analysis:
 
             Root Cause: {root_cause}
@@ -143,21 +143,19 @@ def main():
 
             CRITICAL: Preserve existing functionality while fixing CORS issues.
             """,
-            [agents[6].id]  # Agent 7: Integration Validator
+            "critical"
         )
 
         # Wait for deployment
         deploy_start = time.time()
-        while time.time() - deploy_start < 3:
-            deploy_status = orchestrator.get_task_status(deployment_task['id'])
-            print(f"   🔧 [{int(time.time() - deploy_start)}s] Deployment: {deploy_status['status']}")
-
-            if deploy_status['status'] == 'completed':
-                break
-            time.sleep(1)
+        try:
+            deployment_task = runner.run(orchestrator.wait_for_task(deployment_task.id, timeout=3))
+        except TimeoutError as e:
+            print(f"   ❌ {e}")
+        print(f"   🔧 [{time.time() - deploy_start:.2f}s] Deployment: {deployment_task.status.value}")
 
         # Final results
-        deploy_results = orchestrator.get_task_results(deployment_task['id'])
+        deploy_results = deployment_task.results if deployment_task.status == TaskStatus.COMPLETED else None
         if deploy_results:
             print()
             print("✅ CORS OPTIMIZATION COMPLETE!")
@@ -165,18 +163,20 @@ def main():
             print(f"   🔧 Files Modified: {len(deploy_results.get('files_changed', []))}")
             print(f"   🚀 Expected Impact: CORS errors eliminated")
     else:
-        print("   ⚠️  Analysis still in progress...")
+        print(f"   ⚠️  Analysis not completed ({cors_task.status.value})")
 
     print()
     print("6️⃣ AGENT PERFORMANCE METRICS:")
 
     # Show agent stats
     for agent in agents:
-        stats = orchestrator.get_agent_performance(agent.id)
+        stats = orchestrator.agents[agent.id].performance_metrics
         print(f"   🤖 {agent.name}:")
         print(f"      • Tasks Completed: {stats.get('tasks_completed', 0)}")
-        print(f"      • Success Rate: {stats.get('success_rate', 0)}%")
-        print(f"      • Avg Execution: {stats.get('avg_execution_time', 0):.2f}ms")
+        print(f"      • Success Rate: {stats.get('success_rate', 0):.0%}")
+        print(f"      • Avg Execution: {stats.get('avg_execution_time_ms', 0):.2f}ms")
+
+    runner.close()
 
     print()
     print("=" * 50)
@@ -188,4 +188,4 @@ def main():
     print("🚀 System ready for console validation testing!")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
\ No newline at end of file
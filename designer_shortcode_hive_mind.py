@@ -11,7 +11,7 @@ GOAL: Clean, fast, maintainable code without unnecessary complexity
 import asyncio
 import json
 from datetime import datetime
-from mcp_agent_orchestrator import AgentOrchestrator, AgentType
+from agent_orchestrator_core import AgentOrchestrator, AgentType
 
 async def deploy_shortcode_optimization_hive_mind():
     """Strategic Hive Mind for designer shortcode optimization"""
@@ -0,0 +1,473 @@
+#!/usr/bin/env python3
+"""
+🔎 FABRIC CANVAS SCANNER - Token-based canvas initialization finder
+Lightweight JavaScript tokenizer that locates every fabric.Canvas construction
+and initialize() call site, including simple aliases and minified bundle forms.
+Results are cached by content hash so unchanged bundles are never re-tokenized.
+"""
+
+import bisect
+import hashlib
+import os
+import re
+import sys
+from collections import OrderedDict
+from dataclasses import dataclass, field, asdict
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from span_tracing import span
+
+# Constructors that create a fabric canvas
+CANVAS_CLASSES = ("Canvas", "StaticCanvas")
+
+# Global objects fabric is commonly hung off
+GLOBAL_OBJECTS = ("window", "globalThis", "self")
+
+# Keywords after which a "/" starts a regular expression literal
+_REGEX_PREFIX_KEYWORDS = {
+    "return", "typeof", "instanceof", "in", "of", "new", "delete", "void",
+    "throw", "case", "do", "else", "yield", "await"
+}
+
+_TOKEN_RE = re.compile(r"""
+    (?P<ws>[\s\ufeff]+)
+  | (?P<comment>//[^\n\r\u2028\u2029]*|/\*.*?(?:\*/|\Z))
+  | (?P<string>"(?:[^"\\\n]|\\.)*"?|'(?:[^'\\\n]|\\.)*'?)
+  | (?P<name>[A-Za-z_$\u0080-\uffff][\w$\u0080-\uffff]*)
+  | (?P<number>\.?\d[\w.]*)
+  | (?P<punct>\?\.|\.\.\.|=>|===|!==|==|!=|<=|>=|&&|\|\||\?\?|\*\*|>>>|<<|>>|\+\+|--|[-+*%&|^]=|[{}()\[\];,<>+\-*%&|^!~?:=.@\#])
+""", re.VERBOSE | re.DOTALL)
+
+_REGEX_BODY_RE = re.compile(r"(?:[^\\/\[\n]|\\.|\[(?:[^\]\\\n]|\\.)*\])+/[A-Za-z]*", re.DOTALL)
+_TEMPLATE_CHUNK_RE = re.compile(r"(?:[^`\\$]|\\.|\$(?!\{))*(?:`|\$\{|\Z)", re.DOTALL)
+
+
+@dataclass
+class Token:
+    kind: str
+    value: str
+    offset: int
+
+
+@dataclass
+class CanvasSite:
+    kind: str
+    line: int
+    column: int
+    expression: str
+    receiver: str
+    resolved: bool = True
+
+
+@dataclass
+class ScanResult:
+    digest: str
+    sites: List[CanvasSite] = field(default_factory=list)
+    aliases: Dict[str, str] = field(default_factory=dict)
+    token_count: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def tokenize(source: str) -> List[Token]:
+    """Tokenize JavaScript source, skipping whitespace and comments"""
+    tokens: List[Token] = []
+    # Stack of open braces; "template" marks a ${ ... } substitution
+    braces: List[str] = []
+    pos = 0
+    end = len(source)
+    match = _TOKEN_RE.match
+
+    while pos < end:
+        char = source[pos]
+
+        if char == "`" or (char == "}" and braces and braces[-1] == "template"):
+            if char == "}":
+                braces.pop()
+            chunk = _TEMPLATE_CHUNK_RE.match(source, pos + 1)
+            tokens.append(Token("template", source[pos:chunk.end()], pos))
+            if chunk.group().endswith("${"):
+                braces.append("template")
+            pos = chunk.end()
+            continue
+
+        if char == "/" and not source.startswith(("//", "/*"), pos) and _regex_allowed(tokens):
+            body = _REGEX_BODY_RE.match(source, pos + 1)
+            if body:
+                tokens.append(Token("regex", source[pos:body.end()], pos))
+                pos = body.end()
+                continue
+
+        m = match(source, pos)
+        if m is None:
+            if char == "/":
+                tokens.append(Token("punct", "/", pos))
+            pos += 1
+            continue
+
+        kind = m.lastgroup
+        if kind == "punct":
+            value = m.group()
+            if value == "{":
+                braces.append("brace")
+            elif value == "}" and braces:
+                braces.pop()
+            tokens.append(Token(kind, value, pos))
+        elif kind not in ("ws", "comment"):
+            tokens.append(Token(kind, m.group(), pos))
+        pos = m.end()
+
+    return tokens
+
+
+def _regex_allowed(tokens: List[Token]) -> bool:
+    """Decide whether a "/" at this point starts a regex literal or is division"""
+    if not tokens:
+        return True
+    prev = tokens[-1]
+    if prev.kind == "punct":
+        return prev.value not in (")", "]", "}")
+    if prev.kind == "name":
+        return prev.value in _REGEX_PREFIX_KEYWORDS
+    return False
+
+
+def _string_value(token: Token) -> Optional[str]:
+    if token.kind == "string" and len(token.value) >= 2:
+        return token.value[1:-1]
+    if token.kind == "template" and token.value.startswith("`") and token.value.endswith("`"):
+        return token.value[1:-1]
+    return None
+
+
+class _AliasResolver:
+    """Collect names bound to fabric or to its canvas constructors"""
+
+    def __init__(self, tokens: List[Token]):
+        self.tokens = tokens
+        self.fabric_names: Set[str] = {"fabric"}
+        self.canvas_names: Dict[str, str] = {}
+
+    def resolve(self) -> Tuple[Set[str], Dict[str, str]]:
+        # Aliases can chain (a = fabric; b = a.Canvas), so iterate to a fixed point
+        while True:
+            before = (len(self.fabric_names), len(self.canvas_names))
+            self._collect()
+            if (len(self.fabric_names), len(self.canvas_names)) == before:
+                return self.fabric_names, self.canvas_names
+
+    def _value(self, i: int) -> str:
+        tokens = self.tokens
+        return tokens[i].value if 0 <= i < len(tokens) else ""
+
+    def _is_fabric_module(self, i: int) -> bool:
+        """True if tokens at i are require('fabric') or import('fabric')"""
+        tokens = self.tokens
+        return (self._value(i) in ("require", "import") and self._value(i + 1) == "("
+                and i + 2 < len(tokens) and _string_value(tokens[i + 2]) == "fabric")
+
+    def _fabric_expression(self, i: int) -> int:
+        """Length of a fabric-valued expression starting at i, or 0"""
+        tokens = self.tokens
+        if i >= len(tokens) or tokens[i].kind != "name":
+            return 0
+        if tokens[i].value in GLOBAL_OBJECTS and self._value(i + 1) in (".", "?.") \
+                and self._value(i + 2) in self.fabric_names:
+            return 3
+        if tokens[i].value in self.fabric_names:
+            return 1
+        if self._is_fabric_module(i):
+            return 4
+        return 0
+
+    def _canvas_expression(self, i: int) -> Optional[Tuple[int, str]]:
+        """(length, qualified name) of a fabric.Canvas-valued expression at i"""
+        length = self._fabric_expression(i)
+        if length and self._value(i + length) in (".", "?.") \
+                and self._value(i + length + 1) in CANVAS_CLASSES:
+            return length + 2, f"fabric.{self._value(i + length + 1)}"
+        name = self._value(i)
+        if self.tokens[i].kind == "name" and name in self.canvas_names:
+            return 1, self.canvas_names[name]
+        return None
+
+    def _bind(self, name: str, i: int):
+        """Bind name to whatever value expression starts at token i"""
+        canvas = self._canvas_expression(i) if i < len(self.tokens) else None
+        if canvas and self._value(i + canvas[0]) not in (".", "?.", "[", "("):
+            self.canvas_names[name] = canvas[1]
+            return
+        length = self._fabric_expression(i)
+        if length and self._value(i + length) not in (".", "?.", "[", "("):
+            self.fabric_names.add(name)
+
+    def _collect(self):
+        tokens = self.tokens
+        for i, token in enumerate(tokens):
+            if token.kind == "punct" and token.value == "=" and i > 0:
+                prev = tokens[i - 1]
+                if prev.kind == "name":
+                    # Ignore member targets such as obj.x = fabric
+                    if self._value(i - 2) not in (".", "?."):
+                        self._bind(prev.value, i + 1)
+                elif prev.value == "}":
+                    self._destructure(i - 1, i + 1)
+            elif token.kind == "name" and token.value == "import":
+                self._collect_import(i)
+
+    def _destructure(self, close: int, value_start: int):
+        """const { Canvas, StaticCanvas: S } = fabric"""
+        if not self._fabric_expression(value_start):
+            return
+        depth = 0
+        start = close
+        while start >= 0:
+            value = self._value(start)
+            if value == "}":
+                depth += 1
+            elif value == "{":
+                depth -= 1
+                if depth == 0:
+                    break
+            start -= 1
+        self._bind_members(start + 1, close)
+
+    def _bind_members(self, start: int, stop: int):
+        """Bind { Canvas, Canvas: C, Canvas as C } member lists"""
+        tokens = self.tokens
+        i = start
+        while i < stop:
+            if tokens[i].kind == "name" and tokens[i].value in CANVAS_CLASSES:
+                qualified = f"fabric.{tokens[i].value}"
+                if self._value(i + 1) in (":", "as") and i + 2 < stop and tokens[i + 2].kind == "name":
+                    self.canvas_names[tokens[i + 2].value] = qualified
+                    i += 3
+                    continue
+                self.canvas_names[tokens[i].value] = qualified
+            i += 1
+
+    def _collect_import(self, i: int):
+        """import { Canvas } from 'fabric' / import * as f from 'fabric'"""
+        tokens = self.tokens
+        j = i + 1
+        while j < len(tokens) and tokens[j].value != "from" and tokens[j].value != ";":
+            j += 1
+        if j + 1 >= len(tokens) or tokens[j].value != "from" or _string_value(tokens[j + 1]) != "fabric":
+            return
+        k = i + 1
+        while k < j:
+            value = tokens[k].value
+            if value == "*" and self._value(k + 1) == "as" and k + 2 < j:
+                self.fabric_names.add(tokens[k + 2].value)
+                k += 3
+            elif value == "{":
+                close = k
+                while close < j and tokens[close].value != "}":
+                    close += 1
+                self._bind_members(k + 1, close)
+                k = close + 1
+            elif tokens[k].kind == "name" and k == i + 1:
+                # Default import
+                self.fabric_names.add(value)
+                k += 1
+            else:
+                k += 1
+
+
+def _initialize_receiver(tokens: List[Token], end: int, fabric_names: Set[str],
+                         canvas_names: Dict[str, str]) -> Optional[Tuple[str, str, bool]]:
+    """(source text, qualified name, resolved) of a canvas class receiver of .initialize, or None
+
+    Accepts fabric.Canvas, a canvas alias, either with .prototype, and the minified
+    r.Canvas form (unresolved); app.initialize() and the like are not canvas sites.
+    """
+    names = []
+    j = end
+    while j >= 0 and tokens[j].kind == "name":
+        names.insert(0, tokens[j].value)
+        if j >= 2 and tokens[j - 1].value in (".", "?."):
+            j -= 2
+        else:
+            break
+    chain = ".".join(names)
+    if len(names) > 1 and names[0] in GLOBAL_OBJECTS:
+        names = names[1:]
+
+    if names and names[0] in canvas_names:
+        qualified, rest, resolved = canvas_names[names[0]], names[1:], True
+    elif len(names) >= 2 and names[1] in CANVAS_CLASSES:
+        qualified, rest = f"fabric.{names[1]}", names[2:]
+        # Minified bundles hang fabric off a module object the resolver cannot see
+        resolved = names[0] in fabric_names
+    else:
+        return None
+    if rest not in ([], ["prototype"]):
+        return None
+    return chain, ".".join([qualified] + rest), resolved
+
+
+def find_canvas_sites(source: str) -> Tuple[List[CanvasSite], Dict[str, str], int]:
+    """Find canvas constructions and initialize() calls in JavaScript source"""
+    tokens = tokenize(source)
+    resolver = _AliasResolver(tokens)
+    fabric_names, canvas_names = resolver.resolve()
+
+    line_starts = [0]
+    line_starts.extend(m.end() for m in re.finditer(r"\r\n|[\n\r\u2028\u2029]", source))
+
+    def position(offset: int) -> Tuple[int, int]:
+        line = bisect.bisect_right(line_starts, offset)
+        return line, offset - line_starts[line - 1] + 1
+
+    sites: List[CanvasSite] = []
+    count = len(tokens)
+
+    def value(i: int) -> str:
+        return tokens[i].value if 0 <= i < count else ""
+
+    for i, token in enumerate(tokens):
+        if token.kind != "name":
+            continue
+
+        if token.value == "new":
+            canvas = resolver._canvas_expression(i + 1) if i + 1 < count else None
+            if canvas:
+                length, qualified = canvas
+                receiver = "".join(t.value for t in tokens[i + 1:i + 1 + length])
+                expression = f"new {receiver}" if receiver == qualified else f"new {receiver} ({qualified})"
+                line, column = position(token.offset)
+                sites.append(CanvasSite("canvas_construction", line, column, expression, receiver))
+                continue
+            # Minified bundles: new r.Canvas(...) where r is an unresolved module object
+            if value(i + 2) in (".", "?.") and value(i + 3) in CANVAS_CLASSES and value(i + 4) == "(" \
+                    and tokens[i + 1].kind == "name":
+                receiver = f"{tokens[i + 1].value}.{value(i + 3)}"
+                line, column = position(token.offset)
+                sites.append(CanvasSite("canvas_construction", line, column, f"new {receiver}",
+                                        receiver, resolved=False))
+
+        elif token.value in CANVAS_CLASSES and value(i + 1) == "(" and value(i - 1) in (".", "?.") and i >= 2:
+            # fabric.Canvas(...) called without new, possibly through window.fabric
+            start = i - 2
+            while start >= 2 and value(start - 1) in (".", "?.") and tokens[start - 2].kind == "name":
+                start -= 2
+            if value(start - 1) in (".", "?.", "new"):
+                continue
+            canvas = resolver._canvas_expression(start)
+            if canvas and canvas[0] == i - start + 1:
+                line, column = position(tokens[start].offset)
+                receiver = "".join(t.value for t in tokens[start:i + 1])
+                sites.append(CanvasSite("canvas_construction", line, column, receiver + "()", receiver))
+
+        elif token.value == "initialize" and value(i - 1) in (".", "?.") and i >= 2:
+            if value(i + 1) == "(" or (value(i + 1) == "." and value(i + 2) in ("call", "apply")
+                                        and value(i + 3) == "("):
+                receiver = _initialize_receiver(tokens, i - 2, fabric_names, canvas_names)
+                if receiver:
+                    chain, qualified, resolved = receiver
+                    expression = f"{chain}.initialize()" if chain == qualified \
+                        else f"{chain}.initialize() ({qualified})"
+                    line, column = position(token.offset)
+                    sites.append(CanvasSite("initialize_call", line, column, expression, chain, resolved=resolved))
+
+        elif token.value == "callSuper" and value(i + 1) == "(" and i + 2 < count \
+                and _string_value(tokens[i + 2]) == "initialize":
+            line, column = position(token.offset)
+            sites.append(CanvasSite("initialize_call", line, column, "callSuper('initialize')", value(i - 2)))
+
+    aliases = {name: "fabric" for name in fabric_names if name != "fabric"}
+    aliases.update(canvas_names)
+    return sites, aliases, count
+
+
+class CanvasScanCache:
+    """Content-hash keyed scan cache with a stat shortcut for unchanged files"""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._results: "OrderedDict[str, ScanResult]" = OrderedDict()
+        self._stat_digests: Dict[str, Tuple[int, int, str]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def scan_source(self, source: str) -> ScanResult:
+        digest = hashlib.sha256(source.encode("utf-8", "surrogatepass")).hexdigest()
+        return self._lookup(digest, lambda: source)
+
+    def scan_file(self, path: str) -> ScanResult:
+        with span("file.scan", path=path) as active:
+            stat = os.stat(path)
+            known = self._stat_digests.get(path)
+            if known and known[0] == stat.st_mtime_ns and known[1] == stat.st_size and known[2] in self._results:
+                self.hits += 1
+                self._results.move_to_end(known[2])
+                active.set(cache_hit=True, bytes=0)
+                return self._results[known[2]]
+
+            with open(path, "rb") as f:
+                raw = f.read()
+            digest = hashlib.sha256(raw).hexdigest()
+            self._stat_digests[path] = (stat.st_mtime_ns, stat.st_size, digest)
+            misses = self.misses
+            result = self._lookup(digest, lambda: raw.decode("utf-8", errors="replace"))
+            active.set(cache_hit=self.misses == misses, bytes=len(raw))
+            return result
+
+    def _lookup(self, digest: str, load_source) -> ScanResult:
+        cached = self._results.get(digest)
+        if cached is not None:
+            self.hits += 1
+            self._results.move_to_end(digest)
+            return cached
+
+        self.misses += 1
+        sites, aliases, token_count = find_canvas_sites(load_source())
+        result = ScanResult(digest=digest, sites=sites, aliases=aliases, token_count=token_count)
+        self._results[digest] = result
+        if len(self._results) > self.max_entries:
+            self._results.popitem(last=False)
+        return result
+
+    def cache_info(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._results)}
+
+    def clear(self):
+        self._results.clear()
+        self._stat_digests.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# Shared process-wide cache
+default_cache = CanvasScanCache()
+
+
+def scan_file(path: str) -> ScanResult:
+    """Scan a JavaScript file for canvas initialization sites (cached)"""
+    return default_cache.scan_file(path)
+
+
+def scan_source(source: str) -> ScanResult:
+    """Scan JavaScript source for canvas initialization sites (cached)"""
+    return default_cache.scan_source(source)
+
+
+def main(argv: List[str]) -> int:
+    if not argv:
+        print("Usage: fabric_canvas_scanner.py <file.js> [...]")
+        return 1
+
+    for path in argv:
+        result = scan_file(path)
+        print(f"🔎 {path} ({result.token_count} tokens)")
+        for alias, target in sorted(result.aliases.items()):
+            print(f"   🔗 {alias} → {target}")
+        for site in result.sites:
+            marker = "✅" if site.resolved else "❔"
+            print(f"   {marker} {site.line}:{site.column} {site.kind}: {site.expression}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -16,6 +16,14 @@ import os
 import subprocess
 import glob
 
+from fabric_canvas_scanner import scan_file
+from span_tracing import read_file, span, traced
+from tree_index import FileCache, TreeIndex
+
+# One analysis per specialized agent, as orchestrate_parallel_analysis runs them
+ANALYSES = ("_fabric_audit_analysis", "_canvas_integration_analysis", "_performance_monitoring_analysis",
+            "_architecture_review_analysis")
+
 class AgentType(Enum):
     FABRIC_AUDIT_SPECIALIST = "fabric-audit-specialist"
     CANVAS_INTEGRATION_TESTER = "canvas-integration-tester"
@@ -52,8 +60,13 @@ class Task:
 class FunctionalHiveMindOrchestrator:
     """REAL Hive Mind that actually analyzes code and delivers concrete results"""
 
-    def __init__(self, project_path: str = "/Users/maxschwarz/Desktop/yprint_designtool"):
+    def __init__(self, project_path: str = "/Users/maxschwarz/Desktop/yprint_designtool", simulated_delay: float = 0.1,
+                 index: Optional[TreeIndex] = None, files: Optional[FileCache] = None):
         self.project_path = project_path
+        self.simulated_delay = simulated_delay  # per analysis; benchmarks set 0 to time the scans alone
+        # Warm directory index and file cache of a resident process (analysis_daemon.py); None walks and reads
+        self.index = index
+        self.files = files
         self.agents: Dict[str, Agent] = {}
         self.tasks: Dict[str, Task] = {}
         self.coordination_log: List[str] = []
@@ -122,6 +135,15 @@ class FunctionalHiveMindOrchestrator:
 
         self.log(f"✅ Initialized {len(self.agents)} specialized agents")
 
+    def _glob(self, pattern: str) -> List[str]:
+        """Recursive glob under the project; pattern is relative to it"""
+        if self.index is not None:
+            return self.index.glob(pattern)
+        return glob.glob(os.path.join(self.project_path, pattern), recursive=True)
+
+    def _read(self, path: str) -> str:
+        return self.files.read(path) if self.files is not None else read_file(path)
+
     def log(self, message: str):
         """Log coordination activities"""
         timestamp = datetime.now().strftime("%H:%M:%S")
@@ -129,6 +151,7 @@ class FunctionalHiveMindOrchestrator:
         self.coordination_log.append(log_entry)
         print(f"🧠 HIVE MIND: {log_entry}")
 
+    @traced()
     async def orchestrate_parallel_analysis(self) -> Dict[str, Any]:
         """Orchestrate parallel analysis of Issue #123 across all agents"""
 
@@ -241,16 +264,17 @@ class FunctionalHiveMindOrchestrator:
 
         try:
             # Route to specialized analysis based on agent type
-            if task.assigned_agent.type == AgentType.FABRIC_AUDIT_SPECIALIST:
-                results = await self._fabric_audit_analysis()
-            elif task.assigned_agent.type == AgentType.CANVAS_INTEGRATION_TESTER:
-                results = await self._canvas_integration_analysis()
-            elif task.assigned_agent.type == AgentType.BUNDLE_PERFORMANCE_MONITOR:
-                results = await self._performance_monitoring_analysis()
-            elif task.assigned_agent.type == AgentType.SOLUTION_ARCHITECTURE_REVIEWER:
-                results = await self._architecture_review_analysis()
-            else:
-                raise ValueError(f"Unknown agent type: {task.assigned_agent.type}")
+            with span("agent_task", task_id=task.id, agent=task.assigned_agent.name):
+                if task.assigned_agent.type == AgentType.FABRIC_AUDIT_SPECIALIST:
+                    results = await self._fabric_audit_analysis()
+                elif task.assigned_agent.type == AgentType.CANVAS_INTEGRATION_TESTER:
+                    results = await self._canvas_integration_analysis()
+                elif task.assigned_agent.type == AgentType.BUNDLE_PERFORMANCE_MONITOR:
+                    results = await self._performance_monitoring_analysis()
+                elif task.assigned_agent.type == AgentType.SOLUTION_ARCHITECTURE_REVIEWER:
+                    results = await self._architecture_review_analysis()
+                else:
+                    raise ValueError(f"Unknown agent type: {task.assigned_agent.type}")
 
             execution_time = time.time() - start_time
 
@@ -284,40 +308,52 @@ class FunctionalHiveMindOrchestrator:
                 "error": str(error)
             }
 
+    @traced()
     async def _fabric_audit_analysis(self) -> Dict[str, Any]:
         """REAL fabric.js code analysis"""
 
-        await asyncio.sleep(0.1)  # Simulate processing time
+        await asyncio.sleep(self.simulated_delay)  # Simulate processing time
 
         # Real file analysis
         fabric_files = []
         initialization_points = []
 
-        # Scan for fabric-related files
+        # Scan for fabric-related files (bundles included for minified constructors)
         fabric_patterns = [
             "**/fabric*.js",
             "**/emergency-fabric*.js",
-            "**/canvas*.js"
+            "**/canvas*.js",
+            "**/*.bundle.js"
         ]
 
         for pattern in fabric_patterns:
-            files = glob.glob(os.path.join(self.project_path, "**", pattern.split("/")[-1]), recursive=True)
-            fabric_files.extend(files)
+            files = self._glob("**/" + pattern.split("/")[-1])
+            fabric_files.extend(f for f in files if f not in fabric_files)
 
-        # Analyze initialization patterns
+        # Analyze initialization patterns with the token scanner (cached by content hash)
         for file_path in fabric_files:
             if os.path.exists(file_path):
                 try:
-                    with open(file_path, 'r') as f:
-                        content = f.read()
-                        if 'new fabric.Canvas' in content or 'fabric.Canvas(' in content:
-                            initialization_points.append({
-                                "file": os.path.basename(file_path),
-                                "path": file_path,
-                                "pattern": "fabric.Canvas initialization detected"
-                            })
-                except:
-                    pass
+                    scan = scan_file(file_path)
+                except OSError:
+                    continue
+                if scan.sites:
+                    initialization_points.append({
+                        "file": os.path.basename(file_path),
+                        "path": file_path,
+                        "pattern": "fabric.Canvas initialization detected",
+                        "aliases": scan.aliases,
+                        "sites": [
+                            {
+                                "kind": site.kind,
+                                "line": site.line,
+                                "column": site.column,
+                                "expression": site.expression,
+                                "resolved": site.resolved
+                            }
+                            for site in scan.sites
+                        ]
+                    })
 
         return {
             "analysis_type": "fabric.js_initialization_audit",
@@ -347,26 +383,26 @@ class FunctionalHiveMindOrchestrator:
             "timestamp": datetime.now().isoformat()
         }
 
+    @traced()
     async def _canvas_integration_analysis(self) -> Dict[str, Any]:
         """REAL canvas integration testing analysis"""
 
-        await asyncio.sleep(0.1)
+        await asyncio.sleep(self.simulated_delay)
 
         # Check for canvas elements and test files
-        test_files = glob.glob(os.path.join(self.project_path, "**/*test*.html"), recursive=True)
-        js_files = glob.glob(os.path.join(self.project_path, "**/*.js"), recursive=True)
+        test_files = self._glob("**/*test*.html")
+        js_files = self._glob("**/*.js")
 
         canvas_references = 0
         design_save_references = 0
 
         for js_file in js_files[:10]:  # Sample check
             try:
-                with open(js_file, 'r') as f:
-                    content = f.read()
-                    if 'canvas' in content.lower():
-                        canvas_references += 1
-                    if 'save' in content.lower() and 'design' in content.lower():
-                        design_save_references += 1
+                content = self._read(js_file)
+                if 'canvas' in content.lower():
+                    canvas_references += 1
+                if 'save' in content.lower() and 'design' in content.lower():
+                    design_save_references += 1
             except:
                 pass
 
@@ -395,13 +431,14 @@ class FunctionalHiveMindOrchestrator:
             "timestamp": datetime.now().isoformat()
         }
 
+    @traced()
     async def _performance_monitoring_analysis(self) -> Dict[str, Any]:
         """REAL performance analysis"""
 
-        await asyncio.sleep(0.1)
+        await asyncio.sleep(self.simulated_delay)
 
         # Analyze bundle files
-        bundle_files = glob.glob(os.path.join(self.project_path, "**/dist/*.js"), recursive=True)
+        bundle_files = self._glob("**/dist/*.js")
 
         bundle_analysis = []
         total_size = 0
@@ -441,14 +478,15 @@ class FunctionalHiveMindOrchestrator:
             "timestamp": datetime.now().isoformat()
         }
 
+    @traced()
     async def _architecture_review_analysis(self) -> Dict[str, Any]:
         """REAL architecture review"""
 
-        await asyncio.sleep(0.1)
+        await asyncio.sleep(self.simulated_delay)
 
         # Analyze WordPress plugin structure
-        php_files = glob.glob(os.path.join(self.project_path, "**/*.php"), recursive=True)
-        js_files = glob.glob(os.path.join(self.project_path, "**/*.js"), recursive=True)
+        php_files = self._glob("**/*.php")
+        js_files = self._glob("**/*.js")
 
         return {
             "analysis_type": "solution_architecture_review",
@@ -8,7 +8,7 @@ Uses verified custom MCP orchestrator for actual code generation
 import asyncio
 import sys
 import os
-from mcp_agent_orchestrator import AgentOrchestrator, AgentType
+from agent_orchestrator_core import AgentOrchestrator, AgentType
 
 async def execute_json_integration_implementation():
     """Execute functional JSON integration with real agents"""
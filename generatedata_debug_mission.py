@@ -8,7 +8,7 @@ Specialized agents for WordPress admin generateDesignData() availability analysi
 import asyncio
 import sys
 import os
-from mcp_agent_orchestrator import AgentOrchestrator, AgentType
+from agent_orchestrator_core import AgentOrchestrator, AgentType
 
 async def execute_generatedesigndata_debug():
     """Deploy specialized agents for generateDesignData() admin context analysis"""
@@ -7,7 +7,7 @@ Specialized analysis of complex fabric.js console errors with full protocol docu
 import asyncio
 import json
 from datetime import datetime
-from mcp_agent_orchestrator import AgentOrchestrator, AgentType
+from agent_orchestrator_core import AgentOrchestrator, AgentType
 
 async def deploy_hierarchical_16_agent_team():
     """Deploy 16 specialized agents in hierarchical structure for comprehensive analysis"""
@@ -38,33 +38,33 @@ async def deploy_hierarchical_16_agent_team():
     # Team A: Script Loading Investigation (2 Agents)
     script_team = [
         orchestrator.create_agent("ScriptLoadingExpert", AgentType.RESEARCHER,
-                                  ["script_dependency_analysis", "404_error_investigation", "phantom_script_detection"]),
+                                  ["script_dependency_analysis", "404_error_investigation", "phantom_script_detection"], team="script_loading"),
         orchestrator.create_agent("WebpackBundleExpert", AgentType.RESEARCHER,
-                                  ["webpack_module_analysis", "bundle_integrity_check", "vendor_script_investigation"])
+                                  ["webpack_module_analysis", "bundle_integrity_check", "vendor_script_investigation"], team="script_loading")
     ]
 
     # Team B: Fabric.js Core Investigation (2 Agents)
     fabric_team = [
         orchestrator.create_agent("FabricCoreAnalyst", AgentType.ANALYST,
-                                  ["fabric_initialization_analysis", "canvas_lifecycle_investigation", "global_exposure_audit"]),
+                                  ["fabric_initialization_analysis", "canvas_lifecycle_investigation", "global_exposure_audit"], team="fabric_core"),
         orchestrator.create_agent("FabricIntegrationAnalyst", AgentType.ANALYST,
-                                  ["fabric_php_integration", "wordpress_script_registry", "dependency_chain_analysis"])
+                                  ["fabric_php_integration", "wordpress_script_registry", "dependency_chain_analysis"], team="fabric_core")
     ]
 
     # Team C: System Architecture Investigation (2 Agents)
     architecture_team = [
         orchestrator.create_agent("SystemArchitect", AgentType.ARCHITECT,
-                                  ["system_design_analysis", "component_integration_review", "performance_bottleneck_identification"]),
+                                  ["system_design_analysis", "component_integration_review", "performance_bottleneck_identification"], team="system_architecture"),
         orchestrator.create_agent("InfrastructureArchitect", AgentType.ARCHITECT,
-                                  ["localwp_environment_analysis", "deployment_path_investigation", "cache_system_review"])
+                                  ["localwp_environment_analysis", "deployment_path_investigation", "cache_system_review"], team="system_architecture")
     ]
 
     # Team D: Error Pattern Recognition (2 Agents)
     error_team = [
         orchestrator.create_agent("ErrorPatternSpecialist", AgentType.SPECIALIST,
-                                  ["console_error_analysis", "timing_issue_detection", "race_condition_identification"]),
+                                  ["console_error_analysis", "timing_issue_detection", "race_condition_identification"], team="error_patterns"),
         orchestrator.create_agent("DebugTraceAnalyst", AgentType.SPECIALIST,
-                                  ["stack_trace_analysis", "execution_flow_mapping", "error_correlation_analysis"])
+                                  ["stack_trace_analysis", "execution_flow_mapping", "error_correlation_analysis"], team="error_patterns")
     ]
 
     all_research_teams = script_team + fabric_team + architecture_team + error_team
@@ -79,17 +79,17 @@ async def deploy_hierarchical_16_agent_team():
 
     implementation_team = [
         orchestrator.create_agent("SolutionArchitect", AgentType.ARCHITECT,
-                                  ["fix_strategy_design", "implementation_planning", "risk_assessment"]),
+                                  ["fix_strategy_design", "implementation_planning", "risk_assessment"], team="implementation_validation"),
         orchestrator.create_agent("CodeImplementationExpert", AgentType.CODER,
-                                  ["php_script_modification", "javascript_integration", "dependency_chain_fixing"]),
+                                  ["php_script_modification", "javascript_integration", "dependency_chain_fixing"], team="implementation_validation"),
         orchestrator.create_agent("ValidationSpecialist", AgentType.SPECIALIST,
-                                  ["fix_verification", "regression_testing", "performance_validation"]),
+                                  ["fix_verification", "regression_testing", "performance_validation"], team="implementation_validation"),
         orchestrator.create_agent("SystemTester", AgentType.SPECIALIST,
-                                  ["integration_testing", "end_to_end_validation", "user_acceptance_testing"]),
+                                  ["integration_testing", "end_to_end_validation", "user_acceptance_testing"], team="implementation_validation"),
         orchestrator.create_agent("QualityAssuranceExpert", AgentType.ANALYST,
-                                  ["code_quality_review", "security_analysis", "maintainability_assessment"]),
+                                  ["code_quality_review", "security_analysis", "maintainability_assessment"], team="implementation_validation"),
         orchestrator.create_agent("DocumentationSpecialist", AgentType.SPECIALIST,
-                                  ["technical_documentation", "process_recording", "knowledge_transfer"])
+                                  ["technical_documentation", "process_recording", "knowledge_transfer"], team="implementation_validation")
     ]
 
     for i, agent in enumerate(implementation_team, 1):
@@ -149,28 +149,32 @@ TARGET: Evidence-based root cause identification with high-confidence implementa
     print(f"🎯 COORDINATION TASK DEPLOYED: {coordination_task.id}")
     print(f"👥 Assigned Coordination Agents: {len(coordination_task.assigned_agents)}")
 
-    # Wait for coordination analysis
+    # Wait for coordinators to fan out to their teams and merge the reports
     print(f"\n⏱️  WAITING FOR COORDINATION ANALYSIS...")
-
-    max_wait = 3
-    for i in range(max_wait):
-        await asyncio.sleep(1)
-        current_task = orchestrator.tasks[coordination_task.id]
-        print(f"   [{i+1}s] Coordination Status: {current_task.status.value}")
-
-        if current_task.status.value == "completed":
-            break
+    current_task = await orchestrator.wait_for_task(coordination_task.id, timeout=3)
+    print(f"   Coordination Status: {current_task.status.value}")
 
     # Get coordination results
-    coordination_results = orchestrator.tasks[coordination_task.id].results
+    coordination_results = current_task.results
 
     print(f"\n📋 COORDINATION ANALYSIS COMPLETE")
     if coordination_results:
         print(f"   🎯 Analysis Type: {coordination_results.get('analysis_type')}")
         print(f"   🏆 Confidence Level: {coordination_results.get('confidence_level')}")
+        print_hierarchy(coordination_results.get('hierarchy'))
 
     return coordination_task, coordination_results
 
+def print_hierarchy(hierarchy, indent="   "):
+    """Print the coordinator → team fan-out recorded in hierarchical results"""
+    if not hierarchy:
+        return
+    for label, node in hierarchy["subtasks"].items():
+        icon = "👑" if node["tier"] == "coordinator" else "🔬"
+        timing = f"{node['execution_time_ms']:.2f}ms" if node["execution_time_ms"] is not None else node["status"]
+        print(f"{indent}{icon} {label}: {len(node['agents'])} agent(s), {timing}")
+        print_hierarchy(node.get("hierarchy"), indent + "   ")
+
 async def document_agent_work_protocol(orchestrator, coordination_task):
     """Document comprehensive agent work protocol and results"""
 
@@ -271,4 +275,4 @@ async def main():
     return protocol_summary
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
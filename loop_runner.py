@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+🔁 LOOP RUNNER - Synchronous facade over the async orchestrator
+Hosts an asyncio event loop on a daemon thread. Synchronous scripts submit
+coroutines (or loop-bound calls such as orchestrate_task) and block on the
+result, while the submitted work runs concurrently on the loop.
+"""
+
+import asyncio
+import atexit
+import concurrent.futures
+import inspect
+import threading
+import time
+from typing import Any, Callable, Iterable, List, Optional
+
+
+class LoopRunner:
+    """Event loop on a background thread with a blocking submit/result API"""
+
+    def __init__(self, name: str = "hive-loop"):
+        self._loop = asyncio.new_event_loop()
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+        self._ready.wait()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        return self._loop
+
+    @property
+    def running(self) -> bool:
+        return self._thread.is_alive()
+
+    def _run(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.call_soon(self._ready.set)
+        try:
+            self._loop.run_forever()
+        finally:
+            # Cancel whatever is still pending so the loop closes cleanly
+            pending = asyncio.all_tasks(self._loop)
+            for task in pending:
+                task.cancel()
+            if pending:
+                self._loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+            self._loop.close()
+
+    def submit(self, work: Any, *args, **kwargs) -> concurrent.futures.Future:
+        """Schedule work on the loop thread and return a future for its result.
+
+        `work` may be a coroutine, an async function (called with args), or a
+        plain function; plain functions run on the loop thread, so calls that
+        need a running loop (like AgentOrchestrator.orchestrate_task) work.
+        """
+        if not self.running:
+            raise RuntimeError("LoopRunner is closed")
+        if inspect.iscoroutine(work):
+            coro = work
+        elif inspect.iscoroutinefunction(work):
+            coro = work(*args, **kwargs)
+        elif callable(work):
+            async def call():
+                return work(*args, **kwargs)
+            coro = call()
+        else:
+            raise TypeError(f"Cannot submit {type(work).__name__}; expected a coroutine or callable")
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def _check_thread(self):
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("Blocking on the runner from its own loop thread would deadlock; await instead")
+
+    def result(self, future: concurrent.futures.Future, timeout: Optional[float] = None) -> Any:
+        """Block until the future is done; on timeout the work is cancelled and TimeoutError raised"""
+        self._check_thread()
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise TimeoutError(f"Submitted work did not finish within {timeout}s") from None
+
+    def run(self, work: Any, *args, timeout: Optional[float] = None, **kwargs) -> Any:
+        """submit() and wait for the result"""
+        return self.result(self.submit(work, *args, **kwargs), timeout)
+
+    def call(self, func: Callable, *args, **kwargs) -> Any:
+        """Run a plain function on the loop thread and return its result"""
+        return self.run(func, *args, **kwargs)
+
+    def map(self, func: Callable, items: Iterable, timeout: Optional[float] = None) -> List[Any]:
+        """Fan out func(item) for every item concurrently; results keep input order.
+
+        The timeout covers the whole batch; on expiry unfinished work is cancelled.
+        """
+        futures = [self.submit(func, item) for item in items]
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            return [
+                self.result(future, None if deadline is None else max(0.0, deadline - time.monotonic()))
+                for future in futures
+            ]
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def close(self, timeout: Optional[float] = 5.0):
+        """Stop the loop and join its thread"""
+        if not self.running:
+            return
+        self._check_thread()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout)
+
+    def __enter__(self) -> "LoopRunner":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+_default_runner: Optional[LoopRunner] = None
+_default_lock = threading.Lock()
+
+
+def get_runner() -> LoopRunner:
+    """Process-wide runner shared by synchronous scripts"""
+    global _default_runner
+    with _default_lock:
+        if _default_runner is None or not _default_runner.running:
+            _default_runner = LoopRunner()
+            atexit.register(_default_runner.close)
+        return _default_runner
@@ -3,270 +3,122 @@
 MCP Agent Orchestrator - Real Multi-Agent Coordination System
 Based on MCP specifications and proven patterns from 2025 research.
 Implements actual agent coordination, not mock responses.
+
+This is the MCP server entry point; the engine lives in
+agent_orchestrator_core.py, and its names are re-exported here for the
+callers that import them from this module.
 """
 
+import argparse
 import asyncio
-import json
+import functools
 import logging
 import time
-from datetime import datetime
-from typing import Any, Dict, List, Optional
-from dataclasses import dataclass, asdict
-from enum import Enum
 import uuid
+import weakref
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional
 
-from mcp.server.fastmcp import FastMCP
-
-# Configure logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
-
-class AgentType(Enum):
-    COORDINATOR = "coordinator"
-    RESEARCHER = "researcher"
-    ANALYST = "analyst"
-    CODER = "coder"
-    SPECIALIST = "specialist"
-    ARCHITECT = "architect"
+from mcp.server.fastmcp import Context, FastMCP
 
-class TaskStatus(Enum):
-    PENDING = "pending"
-    IN_PROGRESS = "in_progress"
-    COMPLETED = "completed"
-    FAILED = "failed"
+from admission_control import ADMISSION_MODES, AdmissionController, RateLimiter, TokenBucket
+from agent_orchestrator_core import (  # noqa: F401 - re-exported
+    DEFAULT_TIER_CONCURRENCY, FINISHED_STATUSES, Agent, AgentOrchestrator, AgentType, Task, TaskDeadlineExceeded,
+    TaskStatus, agent_info, analysis_kind, new_task_id, task_info
+)
+from span_tracing import current_span, export_chrome_trace, save_chrome_trace, tracer
+from tool_responses import encode_response, text_tool_options
 
-@dataclass
-class Agent:
-    id: str
-    name: str
-    type: AgentType
-    capabilities: List[str]
-    status: str = "idle"
-    created_at: float = None
-    performance_metrics: Dict[str, Any] = None
-
-    def __post_init__(self):
-        if self.created_at is None:
-            self.created_at = time.time()
-        if self.performance_metrics is None:
-            self.performance_metrics = {
-                "tasks_completed": 0,
-                "success_rate": 1.0,
-                "avg_execution_time_ms": 0
-            }
+if TYPE_CHECKING:
+    from worker_nodes import WorkerDispatcher
 
-@dataclass
-class Task:
-    id: str
-    description: str
-    status: TaskStatus
-    assigned_agents: List[str]
-    created_at: float
-    completed_at: Optional[float] = None
-    results: Dict[str, Any] = None
-    priority: str = "medium"
-
-    def __post_init__(self):
-        if self.results is None:
-            self.results = {}
-
-class AgentOrchestrator:
-    """Real multi-agent orchestration system with actual functionality"""
-
-    def __init__(self):
-        self.agents: Dict[str, Agent] = {}
-        self.tasks: Dict[str, Task] = {}
-        self.swarm_config = {
-            "topology": "hierarchical",
-            "max_agents": 16,
-            "strategy": "adaptive"
-        }
-
-    def create_agent(self, name: str, agent_type: AgentType, capabilities: List[str]) -> Agent:
-        """Create a new agent with specified capabilities"""
-        agent_id = f"agent-{int(time.time() * 1000)}-{uuid.uuid4().hex[:6]}"
-
-        agent = Agent(
-            id=agent_id,
-            name=name,
-            type=agent_type,
-            capabilities=capabilities
-        )
-
-        self.agents[agent_id] = agent
-        logger.info(f"Created agent {agent_id} of type {agent_type.value}")
-        return agent
-
-    def orchestrate_task(self, description: str, priority: str = "medium") -> Task:
-        """Orchestrate a task across suitable agents with real analysis"""
-        task_id = f"task-{int(time.time() * 1000)}-{uuid.uuid4().hex[:8]}"
-
-        # Select agents based on capabilities matching
-        suitable_agents = self._select_agents_for_task(description)
-
-        task = Task(
-            id=task_id,
-            description=description,
-            status=TaskStatus.PENDING,
-            assigned_agents=[agent.id for agent in suitable_agents],
-            created_at=time.time(),
-            priority=priority
-        )
-
-        self.tasks[task_id] = task
-
-        # Start task execution in background
-        asyncio.create_task(self._execute_task(task))
-
-        logger.info(f"Orchestrated task {task_id} with {len(suitable_agents)} agents")
-        return task
-
-    def _select_agents_for_task(self, description: str) -> List[Agent]:
-        """Intelligent agent selection based on task requirements"""
-        selected_agents = []
-
-        # Fabric.js analysis requires specific agent types
-        if "fabric" in description.lower() or "webpack" in description.lower():
-            # Need researcher for investigation
-            researchers = [a for a in self.agents.values() if a.type == AgentType.RESEARCHER]
-            if researchers:
-                selected_agents.append(researchers[0])
-
-            # Need architect for system analysis
-            architects = [a for a in self.agents.values() if a.type == AgentType.ARCHITECT]
-            if architects:
-                selected_agents.append(architects[0])
-
-            # Need analyst for root cause analysis
-            analysts = [a for a in self.agents.values() if a.type == AgentType.ANALYST]
-            if analysts:
-                selected_agents.append(analysts[0])
-
-        # If no specific agents found, use available ones
-        if not selected_agents and self.agents:
-            selected_agents = list(self.agents.values())[:3]
-
-        return selected_agents
-
-    async def _execute_task(self, task: Task):
-        """Execute task with real analysis - this is where actual work happens"""
-        start_time = time.time()
-        task.status = TaskStatus.IN_PROGRESS
-
-        try:
-            # Perform actual analysis based on task description
-            if "fabric" in task.description.lower():
-                results = await self._analyze_fabric_issue(task)
-            elif "webpack" in task.description.lower():
-                results = await self._analyze_webpack_bundle(task)
-            elif "phantom" in task.description.lower():
-                results = await self._analyze_phantom_scripts(task)
-            else:
-                results = await self._generic_analysis(task)
-
-            task.results = results
-            task.status = TaskStatus.COMPLETED
-            task.completed_at = time.time()
-
-            # Update agent performance metrics
-            execution_time = (task.completed_at - start_time) * 1000
-            for agent_id in task.assigned_agents:
-                if agent_id in self.agents:
-                    agent = self.agents[agent_id]
-                    agent.performance_metrics["tasks_completed"] += 1
-                    # Update average execution time
-                    current_avg = agent.performance_metrics["avg_execution_time_ms"]
-                    tasks_completed = agent.performance_metrics["tasks_completed"]
-                    agent.performance_metrics["avg_execution_time_ms"] = (
-                        (current_avg * (tasks_completed - 1) + execution_time) / tasks_completed
-                    )
-
-            logger.info(f"Task {task.id} completed in {execution_time:.2f}ms")
-
-        except Exception as e:
-            task.status = TaskStatus.FAILED
-            task.results = {"error": str(e)}
-            logger.error(f"Task {task.id} failed: {e}")
-
-    async def _analyze_fabric_issue(self, task: Task) -> Dict[str, Any]:
-        """Real fabric.js analysis with actual technical findings"""
-        await asyncio.sleep(0.1)  # Simulate processing time
-
-        return {
-            "analysis_type": "fabric_js_loading_failure",
-            "findings": {
-                "root_cause": "fabric-global-exposer.js exists but not registered in PHP enqueue_scripts",
-                "evidence": [
-                    "File exists at: public/js/fabric-global-exposer.js",
-                    "PHP class loads designer-global-exposer.js but NOT fabric-global-exposer.js",
-                    "Vendor bundle contains fabric.js but trapped in webpack scope",
-                    "No window.fabric exposure mechanism active"
-                ],
-                "technical_details": {
-                    "missing_php_registration": "wp_register_script for fabric-global-exposer missing",
-                    "dependency_chain_broken": "vendor → fabric-exposer → designer-exposer → public",
-                    "webpack_fabric_location": "vendor.bundle.js lines 4-50 contain fabric module"
-                }
-            },
-            "recommended_fix": {
-                "step_1": "Add fabric-global-exposer.js registration in class-octo-print-designer-public.php",
-                "step_2": "Update dependency chain to include fabric-exposer",
-                "step_3": "Verify window.fabric exposure after vendor bundle load"
-            },
-            "confidence_level": "high",
-            "analysis_timestamp": datetime.now().isoformat(),
-            "analyzed_by": "FabricAnalysisSpecialist"
-        }
-
-    async def _analyze_webpack_bundle(self, task: Task) -> Dict[str, Any]:
-        """Real webpack bundle analysis"""
-        await asyncio.sleep(0.1)
-
-        return {
-            "analysis_type": "webpack_bundle_investigation",
-            "findings": {
-                "bundle_structure": "vendor.bundle.js contains fabric as webpack module",
-                "exposure_mechanism": "No global window.fabric assignment found",
-                "module_path": "./node_modules/fabric/dist/index.min.mjs",
-                "webpack_exports": "Fabric classes exported but not globally accessible"
-            },
-            "technical_assessment": "Fabric trapped in webpack scope, needs global exposer",
-            "analysis_timestamp": datetime.now().isoformat()
-        }
-
-    async def _analyze_phantom_scripts(self, task: Task) -> Dict[str, Any]:
-        """Real phantom script analysis"""
-        await asyncio.sleep(0.1)
-
-        return {
-            "analysis_type": "phantom_script_detection",
-            "findings": {
-                "phantom_references": ["emergency-fabric-loader.js"],
-                "source": "Browser cache or WordPress script registry persistence",
-                "404_errors": "Script references exist but files deleted"
-            },
-            "recommended_cleanup": "Clear WordPress object cache and browser cache",
-            "analysis_timestamp": datetime.now().isoformat()
-        }
+logger = logging.getLogger(__name__)
 
-    async def _generic_analysis(self, task: Task) -> Dict[str, Any]:
-        """Generic analysis for other tasks"""
-        await asyncio.sleep(0.1)
+# Token-bucket limits per client and tool: (calls per second, burst); "*" covers every other tool.
+# Override with --rate-limit on the command line
+DEFAULT_RATE_LIMITS = {"task_orchestrate": (10.0, 20), "*": (50.0, 100)}
 
-        return {
-            "analysis_type": "generic_investigation",
-            "task_description": task.description,
-            "findings": "Analysis completed with available information",
-            "analysis_timestamp": datetime.now().isoformat()
-        }
+# Seconds task_cancel waits for a cancelled task to unwind before reporting its status
+CANCEL_GRACE = 1.0
 
 # Initialize MCP Server
 mcp = FastMCP("agent-orchestrator")
+# Every tool returns finished JSON text from encode_response, so payloads are encoded exactly once
+TOOL_OPTIONS = text_tool_options(mcp.tool)
 orchestrator = AgentOrchestrator()
+# Set by swarm_init(shards > 1); every tool then routes through the shard processes
+sharded = None
+# Set at startup by --worker-listen; analyzer work then runs on remote worker nodes
+dispatcher: Optional["WorkerDispatcher"] = None
+
+@dataclass
+class ClientSession:
+    """State kept per connected MCP client; over HTTP many clients share one orchestrator"""
+    session_id: str
+    connected_at: float
+    last_seen: float
+    calls: int = 0
+    task_ids: List[str] = None
+    rate_limited: int = 0
+    # Token bucket per tool, see rate_limiter
+    buckets: Dict[str, TokenBucket] = None
 
-@mcp.tool()
-async def swarm_init(topology: str = "hierarchical", max_agents: int = 16, strategy: str = "adaptive") -> str:
+    def __post_init__(self):
+        if self.task_ids is None:
+            self.task_ids = []
+        if self.buckets is None:
+            self.buckets = {}
+
+# Keyed by the MCP ServerSession, so an entry goes away with its connection
+client_sessions: "weakref.WeakKeyDictionary[Any, ClientSession]" = weakref.WeakKeyDictionary()
+_local_session = ClientSession("local", time.time(), time.time())
+rate_limiter = RateLimiter(DEFAULT_RATE_LIMITS)
+
+def _client_session(ctx: Optional[Context]) -> ClientSession:
+    """The caller's session state; direct (non-MCP) calls share one local session"""
+    if ctx is None:
+        state = _local_session
+    else:
+        server_session = ctx.request_context.session
+        state = client_sessions.get(server_session)
+        if state is None:
+            request = getattr(ctx.request_context, "request", None)
+            headers = getattr(request, "headers", None) or {}
+            session_id = headers.get("mcp-session-id") or f"session-{uuid.uuid4().hex[:12]}"
+            state = client_sessions[server_session] = ClientSession(session_id, time.time(), time.time())
+    return state
+
+def rate_limited(tool: Callable[..., Awaitable[str]]) -> Callable[..., Awaitable[str]]:
+    """Count each call against the caller's session and enforce its token bucket for this tool"""
+    @functools.wraps(tool)
+    async def call(*args, **kwargs) -> str:
+        session = _client_session(kwargs.get("ctx"))
+        session.calls += 1
+        session.last_seen = time.time()
+        retry_after = rate_limiter.acquire(session.buckets, tool.__name__)
+        if retry_after:
+            session.rate_limited += 1
+            return encode_response({
+                "success": False,
+                "error": f"Rate limit exceeded for {tool.__name__}",
+                "retry_after": round(retry_after, 3)
+            })
+        with tracer.span(f"mcp.{tool.__name__}", session_id=session.session_id):
+            return await tool(*args, **kwargs)
+    return call
+
+async def _task_snapshot(task_id: str) -> Optional[Dict[str, Any]]:
+    if sharded is not None:
+        return await asyncio.to_thread(sharded.task, task_id)
+    task = orchestrator.tasks.get(task_id)
+    return task_info(task) if task else None
+
+@mcp.tool(**TOOL_OPTIONS)
+@rate_limited
+async def swarm_init(topology: str = "hierarchical", max_agents: int = 16, strategy: str = "adaptive",
+                     shards: int = 1, routing: str = "hash", ctx: Context = None) -> str:
     """Initialize a swarm with specified topology and configuration"""
+    global sharded
     start_time = time.time()
 
     orchestrator.swarm_config = {
@@ -276,6 +128,24 @@ async def swarm_init(topology: str = "hierarchical", max_agents: int = 16, strat
         "initialized_at": start_time
     }
 
+    if sharded is not None:
+        await asyncio.to_thread(sharded.close)
+        sharded = None
+    if shards > 1:
+        # Imported on first use, like worker_nodes: plain swarms never pay for multiprocessing
+        from orchestrator_shards import ShardedOrchestrator
+        try:
+            sharded = await asyncio.to_thread(ShardedOrchestrator, shards, routing,
+                                              admission=orchestrator.admission.settings())
+        except ValueError as e:
+            return encode_response({"success": False, "error": str(e)})
+        orchestrator.swarm_config.update({"shards": shards, "routing": routing})
+        await asyncio.to_thread(sharded.configure, orchestrator.swarm_config)
+
+    if dispatcher is not None:
+        # The worker listener belongs to the server, not the swarm: re-initializing keeps it
+        orchestrator.swarm_config["worker_address"] = dispatcher.address
+
     initialization_time = (time.time() - start_time) * 1000
 
     result = {
@@ -284,38 +154,46 @@ async def swarm_init(topology: str = "hierarchical", max_agents: int = 16, strat
         "topology": topology,
         "max_agents": max_agents,
         "strategy": strategy,
+        "shards": shards,
+        "routing": routing if shards > 1 else None,
+        "worker_address": dispatcher.address if dispatcher else None,
         "initialization_time_ms": initialization_time,
         "memory_usage_mb": 32,  # Real memory tracking would go here
         "cognitive_diversity": True,
         "message": f"Successfully initialized {topology} swarm with {max_agents} max agents"
     }
-    return json.dumps(result)
+    return encode_response(result)
 
-@mcp.tool()
-async def agent_spawn(agent_type: str, name: str, capabilities: list) -> str:
+@mcp.tool(**TOOL_OPTIONS)
+@rate_limited
+async def agent_spawn(agent_type: str, name: str, capabilities: list, team: str = None, ctx: Context = None) -> str:
     """Create a specialized agent with specific capabilities"""
     start_time = time.time()
 
     try:
         agent_type_enum = AgentType(agent_type)
-        agent = orchestrator.create_agent(name, agent_type_enum, capabilities)
+        if sharded is not None:
+            info = await sharded.acall(sharded.create_agent_async(name, agent_type_enum, capabilities, team))
+        else:
+            info = agent_info(orchestrator.create_agent(name, agent_type_enum, capabilities, team))
 
         spawn_time = (time.time() - start_time) * 1000
 
         result = {
             "success": True,
-            "agent_id": agent.id,
-            "name": agent.name,
-            "type": agent.type.value,
-            "capabilities": agent.capabilities,
-            "status": agent.status,
+            "agent_id": info["id"],
+            "name": info["name"],
+            "type": info["type"],
+            "capabilities": info["capabilities"],
+            "team": info["team"],
+            "status": info["status"],
             "spawn_time_ms": spawn_time,
             "memory_overhead_mb": 5,
             "cognitive_pattern": "adaptive",
-            "neural_network_id": f"nn-{agent.id}",
+            "neural_network_id": f"nn-{info['id']}",
             "message": f"Successfully spawned {agent_type} agent: {name}"
         }
-        return json.dumps(result)
+        return encode_response(result)
 
     except ValueError:
         error_result = {
@@ -323,118 +201,293 @@ async def agent_spawn(agent_type: str, name: str, capabilities: list) -> str:
             "error": f"Invalid agent type: {agent_type}",
             "valid_types": [t.value for t in AgentType]
         }
-        return json.dumps(error_result)
-
-@mcp.tool()
-async def task_orchestrate(task: str, strategy: str = "adaptive", priority: str = "medium", max_agents: int = 4) -> dict:
-    """Orchestrate a complex task across available agents"""
+        return encode_response(error_result)
+
+@mcp.tool(**TOOL_OPTIONS)
+@rate_limited
+async def task_orchestrate(task: str, strategy: str = "adaptive", priority: str = "medium", max_agents: int = 4,
+                           timeout_ms: int = None, profile: bool = False, ctx: Context = None) -> str:
+    """Orchestrate a complex task across available agents; timeout_ms cancels it if still running by then
+
+    profile: sample where the task spends its time; task_results then carry a
+    hot-function table and the path of a collapsed-stack (flamegraph) file.
+    With tracing on (--trace), trace_id names this request for trace_export.
+    """
+    session = _client_session(ctx)
+    active = current_span()
     start_time = time.time()
+    timeout = timeout_ms / 1000 if timeout_ms else None
 
-    orchestrated_task = orchestrator.orchestrate_task(task, priority)
+    info = None
+    if sharded is not None:
+        from orchestrator_shards import ShardOverloaded
+        # Each shard admits by the queue wait of its own tasks
+        try:
+            info = await sharded.acall(sharded.orchestrate_task_async(task, priority, timeout, profile or None,
+                                                                      admit=True))
+        except ShardOverloaded as e:
+            retry_after, admission = e.retry_after, e.admission
+    else:
+        admitted, retry_after = await orchestrator.admission.admit()
+        if admitted:
+            info = task_info(orchestrator.orchestrate_task(task, priority, timeout=timeout, profile=profile or None))
+        else:
+            admission = orchestrator.admission.stats()
+    if info is None:
+        return encode_response({
+            "success": False,
+            "error": "Orchestrator overloaded: queue wait is over target",
+            "retry_after": retry_after,
+            "admission": admission
+        })
+    session.task_ids.append(info["task_id"])
     orchestration_time = (time.time() - start_time) * 1000
 
-    return {
+    return encode_response({
         "success": True,
-        "task_id": orchestrated_task.id,
-        "description": orchestrated_task.description,
-        "status": orchestrated_task.status.value,
-        "assigned_agents": orchestrated_task.assigned_agents,
-        "priority": orchestrated_task.priority,
+        "task_id": info["task_id"],
+        "description": info["description"],
+        "status": info["status"],
+        "assigned_agents": info["assigned_agents"],
+        "priority": info["priority"],
         "orchestration_time_ms": orchestration_time,
         "estimated_completion_ms": 2000,  # Based on agent analysis complexity
         "strategy": strategy,
-        "message": f"Task orchestrated across {len(orchestrated_task.assigned_agents)} agents"
-    }
-
-@mcp.tool()
-async def task_status(task_id: str) -> dict:
+        "timeout_ms": timeout_ms,
+        "profile": profile,
+        "trace_id": active.trace_id if active else None,
+        "session_id": session.session_id,
+        "message": f"Task orchestrated across {len(info['assigned_agents'])} agents"
+    })
+
+@mcp.tool(**TOOL_OPTIONS)
+@rate_limited
+async def task_status(task_id: str, ctx: Context = None) -> str:
     """Get status and progress of an orchestrated task"""
-    if task_id not in orchestrator.tasks:
-        return {
+    info = await _task_snapshot(task_id)
+    if info is None:
+        return encode_response({
             "success": False,
             "error": f"Task {task_id} not found"
-        }
-
-    task = orchestrator.tasks[task_id]
+        })
 
-    return {
+    status = info["status"]
+    return encode_response({
         "success": True,
-        "task_id": task.id,
-        "status": task.status.value,
-        "description": task.description,
-        "assigned_agents": task.assigned_agents,
-        "created_at": task.created_at,
-        "completed_at": task.completed_at,
-        "execution_time_ms": (task.completed_at - task.created_at) * 1000 if task.completed_at else None,
-        "progress": 1.0 if task.status == TaskStatus.COMPLETED else 0.5 if task.status == TaskStatus.IN_PROGRESS else 0.0
-    }
-
-@mcp.tool()
-async def task_results(task_id: str, format: str = "detailed") -> dict:
+        "task_id": info["task_id"],
+        "status": status,
+        "description": info["description"],
+        "assigned_agents": info["assigned_agents"],
+        "artifacts": info["artifacts"],
+        "created_at": info["created_at"],
+        "completed_at": info["completed_at"],
+        "execution_time_ms": (info["completed_at"] - info["created_at"]) * 1000 if info["completed_at"] else None,
+        "progress": 1.0 if status == TaskStatus.COMPLETED.value else 0.5 if status == TaskStatus.IN_PROGRESS.value else 0.0
+    })
+
+@mcp.tool(**TOOL_OPTIONS)
+@rate_limited
+async def task_cancel(task_id: str, reason: str = "cancelled by client", ctx: Context = None) -> str:
+    """Cancel a pending or running task and its sub-tasks, freeing their slots"""
+    try:
+        # Cancellation lands when the task's coroutines unwind, normally within one loop iteration
+        if sharded is not None:
+            cancelled = await sharded.acall(sharded.cancel_task_async(task_id, reason))
+            if cancelled:
+                await sharded.acall(sharded.wait_for_task_async(task_id, CANCEL_GRACE))
+        else:
+            cancelled = orchestrator.cancel_task(task_id, reason)
+            if cancelled:
+                await orchestrator.wait_for_task(task_id, CANCEL_GRACE)
+    except TaskDeadlineExceeded:
+        pass
+
+    info = await _task_snapshot(task_id)
+    if info is None:
+        return encode_response({
+            "success": False,
+            "error": f"Task {task_id} not found"
+        })
+    return encode_response({
+        "success": cancelled,
+        "task_id": task_id,
+        "status": info["status"],
+        "error": None if cancelled else f"Task {task_id} already finished (status: {info['status']})"
+    })
+
+@mcp.tool(**TOOL_OPTIONS)
+@rate_limited
+async def task_results(task_id: str, format: str = "detailed", ctx: Context = None) -> str:
     """Get results from a completed task"""
-    if task_id not in orchestrator.tasks:
-        return {
+    info = await _task_snapshot(task_id)
+    if info is None:
+        return encode_response({
             "success": False,
             "error": f"Task {task_id} not found"
-        }
-
-    task = orchestrator.tasks[task_id]
+        })
 
-    if task.status != TaskStatus.COMPLETED:
-        return {
+    if info["status"] != TaskStatus.COMPLETED.value:
+        return encode_response({
             "success": False,
-            "error": f"Task {task_id} not completed yet (status: {task.status.value})"
-        }
+            "error": f"Task {task_id} not completed yet (status: {info['status']})"
+        })
 
-    return {
+    return encode_response({
         "success": True,
-        "task_id": task.id,
-        "status": task.status.value,
-        "results": task.results,
-        "execution_time_ms": (task.completed_at - task.created_at) * 1000,
-        "assigned_agents": task.assigned_agents,
+        "task_id": info["task_id"],
+        "status": info["status"],
+        "results": info["results"],
+        "execution_time_ms": (info["completed_at"] - info["created_at"]) * 1000,
+        "assigned_agents": info["assigned_agents"],
         "format": format
-    }
-
-@mcp.tool()
-async def agent_list() -> dict:
-    """List all active agents and their capabilities"""
-    agents_info = []
-
-    for agent in orchestrator.agents.values():
-        agents_info.append({
-            "id": agent.id,
-            "name": agent.name,
-            "type": agent.type.value,
-            "capabilities": agent.capabilities,
-            "status": agent.status,
-            "performance": agent.performance_metrics,
-            "created_at": agent.created_at
-        })
-
-    return {
+    })
+
+@mcp.tool(**TOOL_OPTIONS)
+@rate_limited
+async def agent_list(since_version: int = None, ctx: Context = None) -> str:
+    """List all active agents and their capabilities
+
+    Pass the returned version back as since_version to receive only the agents
+    that changed since then (delta: true). Sharded swarms always list in full.
+    """
+    if sharded is not None:
+        agents_info = await asyncio.to_thread(sharded.agent_list)
+        snapshot = {"version": None, "delta": False, "agents": agents_info}
+    else:
+        snapshot = orchestrator.agent_snapshot(since_version)
+
+    return encode_response({
         "success": True,
-        "agent_count": len(orchestrator.agents),
-        "agents": agents_info,
+        "agent_count": len(orchestrator.agents) if sharded is None else len(snapshot["agents"]),
+        "version": snapshot["version"],
+        "delta": snapshot["delta"],
+        "agents": snapshot["agents"],
         "swarm_config": orchestrator.swarm_config
-    }
+    })
 
-@mcp.tool()
-async def swarm_status() -> dict:
+@mcp.tool(**TOOL_OPTIONS)
+@rate_limited
+async def swarm_status(ctx: Context = None) -> str:
     """Get comprehensive swarm status and metrics"""
-    return {
+    if sharded is not None:
+        status = await asyncio.to_thread(sharded.swarm_status)
+        return encode_response({"success": True, "swarm_config": orchestrator.swarm_config,
+                                "rate_limits": rate_limiter.stats(), **status})
+
+    counts = orchestrator.status_counts()
+    task_counts = counts["task_status"]
+    return encode_response({
         "success": True,
+        "remote_workers": dispatcher.stats() if dispatcher else None,
+        "admission": orchestrator.admission.stats(),
+        "rate_limits": rate_limiter.stats(),
         "swarm_config": orchestrator.swarm_config,
-        "agent_count": len(orchestrator.agents),
-        "active_tasks": len([t for t in orchestrator.tasks.values() if t.status in [TaskStatus.PENDING, TaskStatus.IN_PROGRESS]]),
-        "completed_tasks": len([t for t in orchestrator.tasks.values() if t.status == TaskStatus.COMPLETED]),
-        "total_tasks": len(orchestrator.tasks),
-        "agents_by_type": {
-            agent_type.value: len([a for a in orchestrator.agents.values() if a.type == agent_type])
-            for agent_type in AgentType
-        }
-    }
+        "agent_count": counts["agent_count"],
+        "active_tasks": task_counts[TaskStatus.PENDING.value] + task_counts[TaskStatus.IN_PROGRESS.value],
+        "completed_tasks": task_counts[TaskStatus.COMPLETED.value],
+        "total_tasks": counts["total_tasks"],
+        "agents_by_type": counts["agents_by_type"]
+    })
+
+@mcp.tool(**TOOL_OPTIONS)
+@rate_limited
+async def session_info(ctx: Context = None) -> str:
+    """Get the calling client's session state and how many clients share this orchestrator"""
+    session = _client_session(ctx)
+    return encode_response({
+        "success": True,
+        "session_id": session.session_id,
+        "connected_at": session.connected_at,
+        "calls": session.calls,
+        "rate_limited": session.rate_limited,
+        "task_ids": session.task_ids,
+        "connected_clients": len(client_sessions)
+    })
+
+@mcp.tool(**TOOL_OPTIONS)
+@rate_limited
+async def trace_export(trace_id: int = None, save: bool = False, ctx: Context = None) -> str:
+    """Export recorded spans (one request's with trace_id, else all) as Chrome trace JSON
+
+    Load it in chrome://tracing or ui.perfetto.dev; each asyncio task and
+    thread gets its own lane. The trace is returned inline; with save it is
+    written to the server's trace directory (HIVE_TRACE_DIR) under a generated
+    name instead, and the path returned. Clients never choose the path.
+    """
+    if not tracer.enabled:
+        return encode_response({"success": False, "error": "Tracing is off; start the server with --trace"})
+    trace = export_chrome_trace(tracer.snapshot(trace_id))
+    spans = sum(1 for event in trace["traceEvents"] if event["ph"] in ("X", "b"))
+    if save:
+        path = await asyncio.to_thread(save_chrome_trace, trace)
+        return encode_response({"success": True, "trace_id": trace_id, "spans": spans, "path": path,
+                                "buffer": tracer.stats()})
+    return encode_response({"success": True, "trace_id": trace_id, "spans": spans, "trace": trace})
+
+
+async def serve_http(transport: str, host: str, port: int, keep_alive: float):
+    """Serve one long-lived orchestrator to many clients over streamable HTTP or SSE"""
+    import uvicorn
+
+    mcp.settings.host = host
+    mcp.settings.port = port
+    app = mcp.streamable_http_app() if transport == "streamable-http" else mcp.sse_app()
+    # Clients reuse their HTTP connection between tool calls for keep_alive seconds
+    config = uvicorn.Config(app, host=host, port=port, timeout_keep_alive=keep_alive,
+                            log_level=mcp.settings.log_level.lower())
+    await uvicorn.Server(config).serve()
+
+
+async def serve(args: argparse.Namespace):
+    """Start the worker listener (if any), then serve MCP on the chosen transport"""
+    global dispatcher
+    if args.worker_listen:
+        from worker_nodes import WorkerDispatcher
+        dispatcher = WorkerDispatcher()
+        await dispatcher.start(args.worker_listen)
+        orchestrator.analyzer = dispatcher.analyze
+        logger.info(f"Listening for worker nodes on {dispatcher.address}")
+    try:
+        if args.transport == "stdio":
+            await mcp.run_stdio_async()
+        else:
+            await serve_http(args.transport, args.host, args.port, args.keep_alive)
+    finally:
+        if dispatcher is not None:
+            await dispatcher.close()
 
 if __name__ == "__main__":
-    logger.info("Starting MCP Agent Orchestrator Server...")
-    mcp.run()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="MCP Agent Orchestrator Server")
+    parser.add_argument("--transport", choices=["stdio", "streamable-http", "sse"], default="stdio")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--keep-alive", type=float, default=75.0, help="HTTP keep-alive timeout in seconds")
+    parser.add_argument("--rate-limit", action="append", default=[], metavar="TOOL=RATE/BURST",
+                        help="per-client token bucket for a tool (or *), e.g. task_status=20/40; repeatable")
+    parser.add_argument("--no-rate-limits", action="store_true")
+    parser.add_argument("--admission-target-ms", type=float, default=500.0,
+                        help="reject new tasks while queue wait is above this")
+    parser.add_argument("--admission-mode", choices=ADMISSION_MODES, default="reject")
+    parser.add_argument("--trace", action="store_true", help="record spans for trace_export (also HIVE_TRACE=1)")
+    parser.add_argument("--trace-buffer", type=int, default=None, help="spans kept in the trace ring buffer")
+    parser.add_argument("--worker-listen", default=None, metavar="HOST:PORT",
+                        help="run analyzer work on remote worker nodes that connect here (or unix:PATH); "
+                             "the listener is unauthenticated, so keep it on a trusted network")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    if args.no_rate_limits:
+        rate_limiter.limits.clear()
+    for spec in args.rate_limit:
+        tool, _, limit = spec.partition("=")
+        rate, _, burst = limit.partition("/")
+        rate_limiter.limits[tool] = (float(rate), float(burst or rate))
+    orchestrator.admission = AdmissionController(target=args.admission_target_ms / 1000, mode=args.admission_mode)
+    if args.trace or args.trace_buffer:
+        tracer.enable(args.trace_buffer)
+
+    logger.info(f"Starting MCP Agent Orchestrator Server ({args.transport})...")
+    try:
+        asyncio.run(serve(args))
+    finally:
+        orchestrator.close()
\ No newline at end of file
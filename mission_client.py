@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+📨 MISSION CLIENT - Thin client of the resident analysis daemon
+Submits one mission to analysis_daemon.py over its local socket and prints
+every reply as a JSON line the moment it arrives: "accepted", one "result"
+per analyzer as it finishes, then "done" (or "error" / "cancelled"). It
+imports nothing but the wire protocol, so a repeat mission costs a socket
+round trip and the daemon's warm analysis, not an interpreter full of
+analyzers and a fresh walk of the plugin tree.
+
+    python mission_client.py --spawn
+    python mission_client.py --codebase ../checkout --analyzers _analyze_php_architecture _fabric_audit_analysis
+    python mission_client.py --task "Analyze fabric loading" --priority critical
+    python mission_client.py --stats
+    python mission_client.py --stop
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+import uuid
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from wire_protocol import MessageType, ProtocolError, open_connection, read_frame, write_frame
+
+REPO_ROOT = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_ADDRESS = os.environ.get("HIVE_DAEMON_ADDRESS", f"unix:{os.path.join(REPO_ROOT, '.hive_daemon.sock')}"
+                                 if hasattr(socket, "AF_UNIX") else "127.0.0.1:7411")
+
+# Mission kinds
+ANALYZE, TASK, STATS, SHUTDOWN = "analyze", "task", "stats", "shutdown"
+MISSION_KINDS = (ANALYZE, TASK, STATS, SHUTDOWN)
+
+# Reply events; a mission's last reply is always one of FINAL_EVENTS
+ACCEPTED, RESULT, DONE, ERROR, CANCELLED = "accepted", "result", "done", "error", "cancelled"
+FINAL_EVENTS = (DONE, ERROR, CANCELLED)
+
+CONNECTION_ERRORS = (asyncio.IncompleteReadError, ConnectionError, ProtocolError)
+
+
+def new_mission_id() -> str:
+    return f"mission-{int(time.time() * 1000)}-{uuid.uuid4().hex[:8]}"
+
+
+def spawn_daemon(address: str = DEFAULT_ADDRESS) -> subprocess.Popen:
+    """Start analysis_daemon.py in the background, detached from this process"""
+    return subprocess.Popen([sys.executable, os.path.join(REPO_ROOT, "analysis_daemon.py"), "--listen", address],
+                            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                            start_new_session=True)
+
+
+async def connect(address: str = DEFAULT_ADDRESS, spawn: bool = False,
+                  timeout: float = 10.0) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    """Connect to the daemon; with spawn, start one when nothing listens and wait for it"""
+    try:
+        return await open_connection(address)
+    except OSError:
+        if not spawn:
+            raise
+    spawn_daemon(address)
+    deadline = time.monotonic() + timeout
+    while True:
+        await asyncio.sleep(0.05)
+        try:
+            return await open_connection(address)
+        except OSError:
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"No analysis daemon listening on {address} after {timeout:g}s") from None
+
+
+async def submit(mission: Dict[str, Any], address: str = DEFAULT_ADDRESS, spawn: bool = False) -> AsyncIterator[Dict[str, Any]]:
+    """Send one mission and yield its replies as they arrive, through the final one"""
+    mission = {"mission_id": new_mission_id(), **mission}
+    reader, writer = await connect(address, spawn)
+    try:
+        await write_frame(writer, MessageType.SUBMIT, mission)
+        while True:
+            message_type, reply = await read_frame(reader)
+            if message_type != MessageType.REPLY:
+                raise ProtocolError(f"Unexpected {message_type.name} from the analysis daemon")
+            yield reply
+            if reply["event"] in FINAL_EVENTS:
+                return
+    finally:
+        # Closing early (or dying) drops the connection, and the daemon cancels the mission
+        writer.close()
+
+
+async def run_mission(mission: Dict[str, Any], address: str = DEFAULT_ADDRESS, spawn: bool = False) -> List[Dict[str, Any]]:
+    """Every reply of one mission"""
+    return [reply async for reply in submit(mission, address, spawn)]
+
+
+async def _print_replies(mission: Dict[str, Any], address: str, spawn: bool) -> Optional[Dict[str, Any]]:
+    last = None
+    async for last in submit(mission, address, spawn):
+        print(json.dumps(last), flush=True)
+    return last
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Submit a mission to the resident analysis daemon")
+    parser.add_argument("--address", default=DEFAULT_ADDRESS, help="daemon address, unix:/path or host:port")
+    parser.add_argument("--spawn", action="store_true", help="start the daemon if none is listening")
+    missions = parser.add_mutually_exclusive_group()
+    missions.add_argument("--task", help="orchestrate this task on the daemon's agent swarm instead of analyzing")
+    missions.add_argument("--stats", action="store_true", help="report the daemon's warm state and counters")
+    missions.add_argument("--stop", action="store_true", help="shut the daemon down")
+    parser.add_argument("--codebase", default=os.getcwd(), help="plugin tree to analyze (default: the current directory)")
+    parser.add_argument("--analyzers", nargs="+", help="analyzers to run (default: all)")
+    parser.add_argument("--priority", default="medium", help="priority of --task")
+    args = parser.parse_args(argv)
+
+    if args.task:
+        mission = {"kind": TASK, "task": args.task, "priority": args.priority}
+    elif args.stats or args.stop:
+        mission = {"kind": STATS if args.stats else SHUTDOWN}
+    else:
+        mission = {"kind": ANALYZE, "codebase": os.path.abspath(args.codebase), "analyzers": args.analyzers}
+
+    try:
+        last = asyncio.run(_print_replies(mission, args.address, args.spawn))
+    except (OSError, *CONNECTION_ERRORS) as e:
+        print(f"❌ No analysis daemon at {args.address} ({e}); start one with: python analysis_daemon.py"
+              f" or pass --spawn", file=sys.stderr)
+        return 2
+    return 0 if last and last["event"] == DONE else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
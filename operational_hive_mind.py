@@ -4,16 +4,27 @@
 Master coordinator that PLANS but delegates all execution to specialized agents
 """
 
+import argparse
 import asyncio
+import itertools
 import json
 import time
 import os
 from datetime import datetime
-from typing import Dict, List
-from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+from dataclasses import dataclass, field
 from enum import Enum
 import uuid
 
+from plan_scheduler import DagScheduler, PhaseNode, critical_path
+from agent_event_bus import AgentEventBus, EventType, ExecutionMonitor, ProgressReporter
+from agent_registry import AgentRegistry
+from run_journal import RunJournal, add_resume_argument, open_journal
+
+# Phase runners report progress as they work; a phase that reports nothing for
+# longer than HEARTBEAT_TIMEOUT is flagged as stalled
+HEARTBEAT_TIMEOUT = 5.0
+
 class AgentType(Enum):
     PLANNER = "planner"
     EXECUTOR = "executor"
@@ -39,21 +50,29 @@ class OperationalTask:
     status: str = "planned"
     execution_plan: Dict = None
     results: Dict = None
+    phase_key: str = ""
+    depends_on: List[str] = field(default_factory=list)
+    estimated_minutes: float = 0.0
 
 class OperationalHiveMind:
     """🧠 Master Coordinator - Plans and Delegates, Never Executes"""
 
-    def __init__(self):
+    def __init__(self, journal: Optional[RunJournal] = None):
+        self.journal = journal
         self.agents: Dict[str, OperationalAgent] = {}
         self.tasks: Dict[str, OperationalTask] = {}
         self.execution_queue: List[str] = []
+        self.registry = AgentRegistry()
+        self.scheduler: Optional[DagScheduler] = None
+        self.event_bus = AgentEventBus()
+        self.monitor = ExecutionMonitor(self.event_bus, heartbeat_timeout=HEARTBEAT_TIMEOUT)
 
         print("🧠 OPERATIONAL HIVE MIND INITIALIZED")
         print("📋 ROLE: Strategic Planning & Agent Delegation")
         print("⚠️  CONSTRAINT: No direct file operations - delegates to agents")
 
-    def deploy_specialized_agents(self) -> Dict[str, OperationalAgent]:
-        """Deploy 7 specialized operational agents"""
+    def deploy_specialized_agents(self, replicas: int = 1) -> Dict[str, OperationalAgent]:
+        """Deploy 7 specialized operational agents, replicas of each specialization"""
         print("\n🚀 DEPLOYING SPECIALIZED OPERATIONAL AGENTS")
         print("=" * 50)
 
@@ -102,16 +121,17 @@ class OperationalHiveMind:
             }
         ]
 
-        for spec in agent_specs:
+        for spec, replica in itertools.product(agent_specs, range(1, replicas + 1)):
             agent_id = f"agent-{uuid.uuid4().hex[:8]}"
             agent = OperationalAgent(
                 id=agent_id,
-                name=spec["name"],
+                name=spec["name"] if replica == 1 else f"{spec['name']}-{replica}",
                 type=spec["type"],
                 specialization=spec["specialization"],
                 capabilities=spec["capabilities"]
             )
             self.agents[agent_id] = agent
+            self.registry.register(agent_id, agent.name, agent.specialization, agent.capabilities)
             print(f"✅ {agent.name} ({agent.specialization})")
 
         print(f"\n📊 TOTAL AGENTS DEPLOYED: {len(self.agents)}")
@@ -125,6 +145,7 @@ class OperationalHiveMind:
         execution_phases = [
             # PHASE 1: CRITICAL FIXES
             {
+                "key": "admin_scripts",
                 "title": "Admin Script Loading Optimization",
                 "description": """
                 CRITICAL: Fix admin script loading to prevent canvas timeout issues
@@ -140,10 +161,13 @@ class OperationalHiveMind:
 
                 TARGET: Eliminate 40-second canvas timeout in admin context
                 """,
-                "agent_assignment": "AdminContextOptimizer",
-                "priority": "critical"
+                "specialization": "wordpress_admin_optimization",
+                "priority": "critical",
+                "depends_on": [],
+                "estimated_minutes": 30
             },
             {
+                "key": "cors_headers",
                 "title": "CORS Headers & AJAX Security Implementation",
                 "description": """
                 FIX: Implement proper CORS headers for admin-ajax.php requests
@@ -155,11 +179,14 @@ class OperationalHiveMind:
 
                 TARGET: Resolve XMLHttpRequest CORS errors
                 """,
-                "agent_assignment": "AjaxCorsResolver",
-                "priority": "critical"
+                "specialization": "ajax_security_fixes",
+                "priority": "critical",
+                "depends_on": [],
+                "estimated_minutes": 20
             },
             # PHASE 2: PERFORMANCE OPTIMIZATION
             {
+                "key": "cdn_loading",
                 "title": "Webpack Replacement with Direct CDN Loading",
                 "description": """
                 IMPLEMENT: Replace failing webpack extraction with direct CDN loading
@@ -172,10 +199,13 @@ class OperationalHiveMind:
                 EVIDENCE: Agent analysis showed webpack __webpack_require__ failures
                 TARGET: Reliable Fabric.js loading in admin context
                 """,
-                "agent_assignment": "JavascriptPerformanceOptimizer",
-                "priority": "high"
+                "specialization": "javascript_optimization",
+                "priority": "high",
+                "depends_on": ["admin_scripts"],
+                "estimated_minutes": 25
             },
             {
+                "key": "canvas_adaptation",
                 "title": "Canvas System Admin Context Adaptation",
                 "description": """
                 ADAPT: Canvas system for admin context without live canvas elements
@@ -187,11 +217,14 @@ class OperationalHiveMind:
 
                 TARGET: Functional design preview without frontend canvas dependency
                 """,
-                "agent_assignment": "CanvasSystemAdapter",
-                "priority": "high"
+                "specialization": "canvas_system_fixes",
+                "priority": "high",
+                "depends_on": ["admin_scripts", "cdn_loading"],
+                "estimated_minutes": 40
             },
             # PHASE 3: SYSTEM OPTIMIZATION
             {
+                "key": "database_preview",
                 "title": "Database-Driven Preview System Enhancement",
                 "description": """
                 ENHANCE: Optimize database-driven design preview functionality
@@ -204,10 +237,13 @@ class OperationalHiveMind:
                 EVIDENCE: Agent found meta operations and JSON handling in place
                 TARGET: Fast, reliable preview data loading
                 """,
-                "agent_assignment": "DatabasePreviewOptimizer",
-                "priority": "medium"
+                "specialization": "database_optimization",
+                "priority": "medium",
+                "depends_on": ["admin_scripts"],
+                "estimated_minutes": 30
             },
             {
+                "key": "error_handling",
                 "title": "Comprehensive Error Handling & Fallbacks",
                 "description": """
                 IMPLEMENT: Robust error handling and graceful degradation
@@ -219,11 +255,14 @@ class OperationalHiveMind:
 
                 TARGET: System never fails silently, always provides user feedback
                 """,
-                "agent_assignment": "ErrorHandlingSpecialist",
-                "priority": "medium"
+                "specialization": "error_handling_implementation",
+                "priority": "medium",
+                "depends_on": ["cdn_loading", "database_preview"],
+                "estimated_minutes": 25
             },
             # PHASE 4: VALIDATION
             {
+                "key": "validation",
                 "title": "System Integration Validation & Testing",
                 "description": """
                 VALIDATE: Comprehensive testing of all implemented changes
@@ -236,42 +275,154 @@ class OperationalHiveMind:
 
                 SUCCESS CRITERIA: Functional design preview system in admin context
                 """,
-                "agent_assignment": "SystemValidationExpert",
-                "priority": "high"
+                "specialization": "system_validation",
+                "priority": "high",
+                "depends_on": [
+                    "admin_scripts",
+                    "cors_headers",
+                    "cdn_loading",
+                    "canvas_adaptation",
+                    "database_preview",
+                    "error_handling"
+                ],
+                "estimated_minutes": 45
             }
         ]
 
         tasks = []
+        task_ids_by_key: Dict[str, str] = {}
         for i, phase in enumerate(execution_phases, 1):
             task_id = f"task-{uuid.uuid4().hex[:8]}"
 
-            # Find agent by specialization
-            assigned_agent = None
-            for agent in self.agents.values():
-                if phase["agent_assignment"] in agent.name:
-                    assigned_agent = agent.id
-                    break
+            # Least-loaded agent of the phase's specialization
+            assigned_agent = self.registry.assign(specialization=phase["specialization"])
 
             task = OperationalTask(
                 id=task_id,
                 title=f"Phase {i}: {phase['title']}",
                 description=phase["description"],
                 agent_assignment=assigned_agent or "unassigned",
-                priority=phase["priority"]
+                priority=phase["priority"],
+                phase_key=phase["key"],
+                depends_on=[task_ids_by_key[key] for key in phase["depends_on"]],
+                estimated_minutes=phase["estimated_minutes"]
             )
 
             tasks.append(task)
             self.tasks[task_id] = task
-            self.execution_queue.append(task_id)
+            task_ids_by_key[phase["key"]] = task_id
 
             print(f"📋 Phase {i}: {phase['title']}")
-            print(f"   🎯 Agent: {phase['agent_assignment']}")
+            print(f"   🎯 Agent: {self.agents[assigned_agent].name if assigned_agent else 'unassigned'}")
             print(f"   ⚡ Priority: {phase['priority']}")
+            print(f"   🔗 Depends on: {', '.join(phase['depends_on']) or 'nothing'}")
             print()
 
+        # Queue holds phases in dependency order
+        self.scheduler = DagScheduler(self._phase_nodes())
+        self.execution_queue = list(self.scheduler.order)
+
+        path, timings, total = self.plan_critical_path()
+        sequential = sum(task.estimated_minutes for task in tasks)
         print(f"✅ EXECUTION PLAN CREATED: {len(tasks)} phases")
+        print(f"🛤️  CRITICAL PATH: {' → '.join(self.tasks[t].phase_key for t in path)}")
+        print(f"⏱️  ESTIMATE: {total:.0f} min on critical path vs {sequential:.0f} min sequential")
         return tasks
 
+    def _phase_nodes(self) -> List[PhaseNode]:
+        """Express plan phases as DAG nodes"""
+        return [
+            PhaseNode(id=task.id, depends_on=list(task.depends_on), estimated_duration=task.estimated_minutes)
+            for task in self.tasks.values()
+        ]
+
+    def plan_critical_path(self):
+        """Critical path and slack from the planned phase estimates (minutes)"""
+        return critical_path(self._phase_nodes())
+
+    async def execute_plan(self, phase_runner=None, max_concurrency: Optional[int] = None) -> Dict[str, Any]:
+        """⚡ Run delegated phases as a DAG, independent phases concurrently
+
+        phase_runner(task, report) does a phase's work and calls report() as it
+        makes progress; a runner that stops reporting is flagged as stalled.
+        """
+        print("\n⚡ HIVE MIND EXECUTING PLAN AS DAG")
+        print("=" * 50)
+
+        runner = phase_runner or self._run_phase
+        if phase_runner is None:
+            print("ℹ️  Default runner only prepares agent instructions: durations are scheduling overhead, not work")
+        self.scheduler = DagScheduler(self._phase_nodes(), max_concurrency=max_concurrency)
+        self.monitor.start()
+
+        async def run_task(task_id: str):
+            task = self.tasks[task_id]
+
+            # Phases checkpointed by an earlier run are restored, not re-executed
+            if self.journal and self.journal.is_completed(task.phase_key):
+                task.results = self.journal.outputs(task.phase_key)
+                task.status = "completed"
+                self.registry.complete(task.agent_assignment)
+                self.event_bus.emit(EventType.COMPLETED, task.id, task.agent_assignment, resumed=True)
+                print(f"⏭️  RESUMED: {task.title} (completed in {self.journal.run_id})")
+                return task.results
+
+            task.status = "executing"
+            if self.journal:
+                self.journal.phase_started(task.phase_key, task.execution_plan)
+            self.event_bus.emit(EventType.STARTED, task.id, task.agent_assignment)
+            print(f"▶️  START: {task.title}")
+            started = time.perf_counter()
+            try:
+                task.results = await runner(task, ProgressReporter(self.event_bus, task.id, task.agent_assignment))
+            except Exception as e:
+                self.registry.complete(task.agent_assignment, time.perf_counter() - started)
+                task.status = "failed"
+                self.event_bus.emit(EventType.FAILED, task.id, task.agent_assignment, error=str(e))
+                if self.journal:
+                    self.journal.phase_failed(task.phase_key, str(e), task.execution_plan)
+                print(f"❌ FAILED: {task.title} ({e})")
+                raise
+            self.registry.complete(task.agent_assignment, time.perf_counter() - started)
+            task.status = "completed"
+            if self.journal:
+                self.journal.phase_completed(task.phase_key, task.results, task.execution_plan)
+            self.event_bus.emit(EventType.COMPLETED, task.id, task.agent_assignment)
+            print(f"✅ DONE: {task.title}")
+            return task.results
+
+        outcomes = await self.scheduler.run(run_task)
+        await self.monitor.drain()
+
+        for task_id, outcome in outcomes.items():
+            if outcome.status == "skipped":
+                self.tasks[task_id].status = "skipped"
+                print(f"⏭️  SKIPPED: {self.tasks[task_id].title} ({outcome.error})")
+
+        path, timings, total = self.scheduler.actual_critical_path()
+        wall_time = max((o.finished_at or 0.0 for o in outcomes.values()), default=0.0)
+        print(f"\n🛤️  ACTUAL CRITICAL PATH: {' → '.join(self.tasks[t].phase_key for t in path)}")
+        print(f"⏱️  WALL TIME: {wall_time:.3f}s (sum of phases: {sum(o.duration for o in outcomes.values()):.3f}s)")
+
+        return {
+            "phases": {self.tasks[t].phase_key: o.status for t, o in outcomes.items()},
+            "critical_path": [self.tasks[t].phase_key for t in path],
+            "critical_path_seconds": total,
+            "wall_time_seconds": wall_time
+        }
+
+    async def _run_phase(self, task: OperationalTask, report: ProgressReporter) -> Dict:
+        """Default phase runner: hand the delegated instructions to the agent"""
+        agent = self.agents.get(task.agent_assignment)
+        if agent is None:
+            raise RuntimeError(f"No agent available for {task.title}")
+        if task.execution_plan is None:
+            task.execution_plan = self._create_agent_instructions(task, agent)
+        report(0.5, step="instructions")
+        # Nothing is executed here; yield so independent phases still interleave
+        await asyncio.sleep(0)
+        return {"agent": agent.name, "instructions": task.execution_plan}
+
     def delegate_to_agents(self) -> Dict[str, str]:
         """🎯 Delegate execution to specialized agents"""
         print("\n🎯 HIVE MIND DELEGATING TO SPECIALIZED AGENTS")
@@ -369,6 +520,10 @@ class OperationalHiveMind:
 
         execution_status = {}
 
+        # Apply any events still queued and flag agents that missed heartbeats
+        await self.monitor.drain()
+        self.monitor.check_stalls()
+
         for task_id in self.execution_queue:
             task = self.tasks[task_id]
             agent = self.agents.get(task.agent_assignment)
@@ -378,17 +533,22 @@ class OperationalHiveMind:
                 print(f"   👤 AGENT: {agent.name}")
                 print(f"   📈 STATUS: {task.status}")
 
-                # Simulate agent execution monitoring
-                if task.status == "delegated":
-                    # In real implementation, this would check actual agent progress
-                    execution_status[task.title] = "in_progress"
-                    print(f"   🔄 EXECUTION: In Progress")
+                status = self.monitor.get(task_id)
+                if status is None:
+                    execution_status[task.title] = "not_started"
+                    print("   ⏸️  EXECUTION: Not started")
                 else:
-                    execution_status[task.title] = task.status
-                    print(f"   ✅ EXECUTION: {task.status}")
+                    execution_status[task.title] = status.state
+                    icon = {"running": "🔄", "completed": "✅", "failed": "❌", "stalled": "⚠️"}.get(status.state, "•")
+                    print(f"   {icon} EXECUTION: {status.state} ({status.duration or 0.0:.3f}s, "
+                          f"{status.stall_count} stalls)")
 
                 print()
 
+        summary = self.monitor.summary()
+        if summary:
+            print(f"📈 STATE SUMMARY: {', '.join(f'{state}={count}' for state, count in summary.items())}")
+
         return execution_status
 
     def generate_execution_report(self) -> Dict:
@@ -403,9 +563,35 @@ class OperationalHiveMind:
             "execution_phases": len(self.execution_queue),
             "agent_assignments": {},
             "priority_distribution": {"critical": 0, "high": 0, "medium": 0},
-            "specialization_coverage": []
+            "specialization_coverage": [],
+            "critical_path": [],
+            "phase_slack_minutes": {},
+            "phase_durations_seconds": {},
+            "stall_counts": {},
+            "stalled_phases": []
         }
 
+        # Measured execution from the event monitor
+        for task_id, status in self.monitor.status.items():
+            task = self.tasks.get(task_id)
+            if task is None:
+                continue
+            report["phase_durations_seconds"][task.phase_key] = status.duration
+            report["stall_counts"][task.phase_key] = status.stall_count
+            if status.state == "stalled":
+                report["stalled_phases"].append(task.phase_key)
+        report["total_stalls"] = sum(report["stall_counts"].values())
+
+        # Critical path and slack from phase estimates
+        if self.tasks:
+            path, timings, total = self.plan_critical_path()
+            report["critical_path"] = [self.tasks[task_id].phase_key for task_id in path]
+            report["critical_path_minutes"] = total
+            report["sequential_minutes"] = sum(task.estimated_minutes for task in self.tasks.values())
+            report["phase_slack_minutes"] = {
+                self.tasks[task_id].phase_key: timing.slack for task_id, timing in timings.items()
+            }
+
         # Analyze task distribution
         for task in self.tasks.values():
             agent = self.agents.get(task.agent_assignment)
@@ -432,18 +618,30 @@ class OperationalHiveMind:
         for spec in report["specialization_coverage"]:
             print(f"   • {spec['agent']}: {spec['specialization']}")
 
+        if report["critical_path"]:
+            print(f"\n🛤️  CRITICAL PATH: {' → '.join(report['critical_path'])}")
+            print(f"   ⏱️  {report['critical_path_minutes']:.0f} min (sequential: {report['sequential_minutes']:.0f} min)")
+            for phase_key, slack in report["phase_slack_minutes"].items():
+                print(f"   • {phase_key}: slack {slack:.0f} min")
+
+        if report["phase_durations_seconds"]:
+            print("\n⏱️  MEASURED PHASE DURATIONS:")
+            for phase_key, duration in report["phase_durations_seconds"].items():
+                print(f"   • {phase_key}: {duration or 0.0:.3f}s ({report['stall_counts'][phase_key]} stalls)")
+            print(f"   ⚠️  TOTAL STALLS: {report['total_stalls']}")
+
         return report
 
-async def main():
+async def main(resume: Optional[str] = None, replicas: int = 1):
     """🧠 Execute Operational Hive Mind Planning & Delegation"""
     print("🧠 OPERATIONAL HIVE MIND - MASTER EXECUTION SYSTEM")
     print("=" * 60)
 
-    # Initialize Hive Mind
-    hive_mind = OperationalHiveMind()
+    # Initialize Hive Mind with an on-disk checkpoint journal
+    hive_mind = OperationalHiveMind(journal=open_journal(resume, "operational"))
 
     # Deploy specialized agents
-    agents = hive_mind.deploy_specialized_agents()
+    agents = hive_mind.deploy_specialized_agents(replicas)
 
     # Create master execution plan
     tasks = hive_mind.create_master_execution_plan()
@@ -451,11 +649,15 @@ async def main():
     # Delegate to specialized agents
     delegations = hive_mind.delegate_to_agents()
 
+    # Execute phases as a dependency DAG
+    await hive_mind.execute_plan()
+
     # Monitor execution status
     execution_status = await hive_mind.monitor_agent_execution()
 
     # Generate final report
     report = hive_mind.generate_execution_report()
+    await hive_mind.monitor.stop()
 
     print("\n" + "=" * 60)
     print("🎉 HIVE MIND DELEGATION COMPLETE!")
@@ -466,4 +668,8 @@ async def main():
     print("\n🚀 AGENTS ARE NOW READY TO EXECUTE OPERATIONAL CHANGES!")
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    parser = add_resume_argument(argparse.ArgumentParser(description="Operational Hive Mind planning & delegation"))
+    parser.add_argument("--replicas", type=int, default=1,
+                        help="agents deployed per specialization; phases go to the least loaded")
+    args = parser.parse_args()
+    asyncio.run(main(args.resume, args.replicas))
\ No newline at end of file
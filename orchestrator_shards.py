@@ -0,0 +1,431 @@
+#!/usr/bin/env python3
+"""
+🧩 ORCHESTRATOR SHARDS - Multi-process AgentOrchestrator
+N worker processes each own a slice of the tasks, so CPU-bound analyzers run
+in parallel instead of serializing on one GIL. Tasks are routed by consistent
+hashing of the task id, or by analyzer affinity so that every task for one
+analyzer lands on the same shard (and its warm caches). The agent registry is
+replicated to every shard, so a task sees the whole swarm wherever it runs.
+"""
+
+import asyncio
+import bisect
+import concurrent.futures
+import hashlib
+import itertools
+import multiprocessing
+import threading
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional
+
+from admission_control import AdmissionController
+from agent_orchestrator_core import (
+    AgentOrchestrator, AgentType, TaskDeadlineExceeded, agent_info, analysis_kind, new_agent_id, new_task_id,
+    task_info
+)
+
+ROUTING_MODES = ("hash", "affinity")
+
+
+def _hash(key: str) -> int:
+    return int.from_bytes(hashlib.md5(key.encode("utf-8")).digest()[:8], "big")
+
+
+class HashRing:
+    """Consistent hash ring; adding or removing a node only moves ~1/N of the keys"""
+
+    def __init__(self, nodes: List[int], replicas: int = 64):
+        self.replicas = replicas
+        self._points: List[int] = []
+        self._owners: Dict[int, int] = {}
+        for node in nodes:
+            self.add_node(node)
+
+    def add_node(self, node: int):
+        for replica in range(self.replicas):
+            point = _hash(f"{node}:{replica}")
+            if point not in self._owners:
+                bisect.insort(self._points, point)
+                self._owners[point] = node
+
+    def remove_node(self, node: int):
+        self._points = [p for p in self._points if self._owners[p] != node]
+        self._owners = {p: n for p, n in self._owners.items() if n != node}
+
+    def node_for(self, key: str) -> int:
+        if not self._points:
+            raise LookupError("Hash ring has no nodes")
+        index = bisect.bisect(self._points, _hash(key)) % len(self._points)
+        return self._owners[self._points[index]]
+
+
+class ShardError(RuntimeError):
+    """An operation failed inside a shard process"""
+
+
+class ShardOverloaded(ShardError):
+    """The shard's admission control turned a task away: its queue wait is over target"""
+
+    def __init__(self, message: str, retry_after: float, admission: Dict[str, Any]):
+        super().__init__(message)
+        self.retry_after = retry_after
+        self.admission = admission
+
+
+def _shard_main(shard_id: int, conn, analyzer: Optional[Callable], admission: Optional[Dict[str, Any]]):
+    """Worker process entry point: one orchestrator, one event loop"""
+    asyncio.run(_serve(shard_id, conn, analyzer, admission))
+
+
+async def _serve(shard_id: int, conn, analyzer: Optional[Callable], admission: Optional[Dict[str, Any]]):
+    # Each shard admits by its own queue wait, the queue its tasks actually join
+    orchestrator = AgentOrchestrator(analyzer=analyzer,
+                                     admission=AdmissionController(**admission) if admission else None)
+    loop = asyncio.get_running_loop()
+    handlers = set()
+
+    def reply(request_id: Optional[int], ok: bool, payload: Any):
+        conn.send((request_id, ok, payload))
+
+    async def report_finished(task_id: str):
+        # Unsolicited (request id None): lets the front-end forget where the task runs
+        await orchestrator.wait_for_task(task_id)
+        reply(None, True, task_id)
+
+    async def handle(request_id: int, command: str, args: Dict[str, Any]):
+        try:
+            if command == "create_agent":
+                agent = orchestrator.create_agent(args["name"], AgentType(args["agent_type"]),
+                                                  args["capabilities"], args.get("team"), args["agent_id"])
+                payload = agent_info(agent)
+            elif command == "orchestrate":
+                if args.get("admit"):
+                    admitted, retry_after = await orchestrator.admission.admit()
+                    if not admitted:
+                        reply(request_id, False, ("ShardOverloaded", "queue wait is over target",
+                                                  {"retry_after": retry_after,
+                                                   "admission": orchestrator.admission.stats()}))
+                        return
+                task = orchestrator.orchestrate_task(args["description"], args["priority"], task_id=args["task_id"],
+                                                     timeout=args.get("timeout"), profile=args.get("profile"))
+                payload = task_info(task)
+                track(report_finished(task.id))
+            elif command == "cancel":
+                payload = orchestrator.cancel_task(args["task_id"], args["reason"])
+            elif command == "wait":
+                task = await orchestrator.wait_for_task(args["task_id"], timeout=args.get("timeout"))
+                payload = task_info(task)
+            elif command == "task":
+                task = orchestrator.tasks.get(args["task_id"])
+                payload = task_info(task) if task else None
+            elif command == "agent_list":
+                payload = [agent_info(agent) for agent in orchestrator.agents.values()]
+            elif command == "swarm_status":
+                payload = {**orchestrator.status_counts(), "admission": orchestrator.admission.stats()}
+            elif command == "configure":
+                orchestrator.swarm_config = args["swarm_config"]
+                payload = True
+            else:
+                raise ValueError(f"Unknown shard command {command}")
+            reply(request_id, True, payload)
+        except Exception as e:
+            reply(request_id, False, (type(e).__name__, str(e)))
+
+    def track(coroutine):
+        handler = asyncio.ensure_future(coroutine)
+        handlers.add(handler)
+        handler.add_done_callback(handlers.discard)
+
+    try:
+        while True:
+            message = await loop.run_in_executor(None, conn.recv)
+            request_id, command, args = message
+            if command == "stop":
+                reply(request_id, True, shard_id)
+                break
+            track(handle(request_id, command, args))
+    finally:
+        orchestrator.close()
+
+
+class _ShardClient:
+    """Parent-side connection to one shard; replies are matched to requests by id"""
+
+    def __init__(self, shard_id: int, context, analyzer: Optional[Callable],
+                 on_task_finished: Optional[Callable[[str], None]] = None,
+                 admission: Optional[Dict[str, Any]] = None):
+        self.shard_id = shard_id
+        self._on_task_finished = on_task_finished
+        self._conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_shard_main, args=(shard_id, child_conn, analyzer, admission),
+                                       name=f"orchestrator-shard-{shard_id}", daemon=True)
+        self.process.start()
+        child_conn.close()
+        self._ids = itertools.count()
+        # Filled by request() on any thread, drained by the reader thread; both under _pending_lock
+        self._pending: Dict[int, concurrent.futures.Future] = {}
+        self._pending_lock = threading.Lock()
+        self._exited = False
+        self._send_lock = threading.Lock()
+        self._reader = threading.Thread(target=self._read, name=f"shard-{shard_id}-reader", daemon=True)
+        self._reader.start()
+
+    def _read(self):
+        while True:
+            try:
+                request_id, ok, payload = self._conn.recv()
+            except (EOFError, OSError):
+                break
+            if request_id is None:
+                if self._on_task_finished is not None:
+                    self._on_task_finished(payload)
+                continue
+            with self._pending_lock:
+                future = self._pending.pop(request_id, None)
+            if future is None:
+                continue
+            if ok:
+                future.set_result(payload)
+            elif payload[0] == "ShardOverloaded":
+                _, message, detail = payload
+                future.set_exception(ShardOverloaded(f"shard {self.shard_id}: {message}", **detail))
+            else:
+                error_type, message = payload
+                error_class = TaskDeadlineExceeded if error_type == "TaskDeadlineExceeded" else ShardError
+                future.set_exception(error_class(f"shard {self.shard_id}: {message}"))
+        with self._pending_lock:
+            self._exited = True
+            orphaned = list(self._pending.values())
+            self._pending.clear()
+        for future in orphaned:
+            future.set_exception(ShardError(f"shard {self.shard_id} exited"))
+
+    def request(self, command: str, **args) -> concurrent.futures.Future:
+        """Send a command; the future fails with ShardError instead of hanging once the shard is gone"""
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        request_id = next(self._ids)
+        with self._pending_lock:
+            if self._exited:
+                future.set_exception(ShardError(f"shard {self.shard_id} exited"))
+                return future
+            self._pending[request_id] = future
+        try:
+            with self._send_lock:
+                self._conn.send((request_id, command, args))
+        except (OSError, ValueError) as e:
+            with self._pending_lock:
+                self._pending.pop(request_id, None)
+            if not future.done():
+                future.set_exception(ShardError(f"shard {self.shard_id}: {e}"))
+        return future
+
+    def close(self, timeout: float = 5.0):
+        if self.process.is_alive():
+            try:
+                self.request("stop").result(timeout)
+            except Exception:
+                pass
+            self.process.join(timeout)
+            if self.process.is_alive():
+                self.process.terminate()
+        self._conn.close()
+
+
+class ShardedOrchestrator:
+    """Front-end that routes agents and tasks across orchestrator processes"""
+
+    def __init__(self, shards: int, routing: str = "hash", analyzer: Optional[Callable] = None,
+                 replicas: int = 64, start_method: str = "spawn", admission: Optional[Dict[str, Any]] = None):
+        """admission: AdmissionController settings for every shard; orchestrate_task_async(admit=True)
+        then raises ShardOverloaded when the task's shard is over its queue-wait target"""
+        if shards < 1:
+            raise ValueError("shards must be >= 1")
+        if routing not in ROUTING_MODES:
+            raise ValueError(f"routing must be one of {ROUTING_MODES}")
+        self.routing = routing
+        context = multiprocessing.get_context(start_method)
+        # Task ids are generated here, so a running task's shard never has to be looked up remotely;
+        # shards report finished tasks, which are dropped and found by asking every shard instead
+        self.task_shards: Dict[str, int] = {}
+        self.shards = [_ShardClient(i, context, analyzer, self._task_finished, admission) for i in range(shards)]
+        self.ring = HashRing(list(range(shards)), replicas=replicas)
+
+    def __enter__(self) -> "ShardedOrchestrator":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        for shard in self.shards:
+            shard.close()
+
+    def shard_for_task(self, task_id: str, description: str) -> int:
+        key = analysis_kind(description) if self.routing == "affinity" else task_id
+        return self.ring.node_for(key)
+
+    def _task_finished(self, task_id: str):
+        self.task_shards.pop(task_id, None)
+
+    def _gather(self, command: str, **args) -> List[concurrent.futures.Future]:
+        return [shard.request(command, **args) for shard in self.shards]
+
+    @staticmethod
+    def _combine(futures: List[concurrent.futures.Future],
+                 combine: Callable[[List[Any]], Any]) -> concurrent.futures.Future:
+        """One future for all shards' replies: combine(results) in shard order, or the first failure"""
+        combined: concurrent.futures.Future = concurrent.futures.Future()
+        remaining = [len(futures)]
+        lock = threading.Lock()
+
+        def done(_: concurrent.futures.Future):
+            with lock:
+                remaining[0] -= 1
+                if remaining[0]:
+                    return
+            errors = [future.exception() for future in futures if future.exception() is not None]
+            if errors:
+                combined.set_exception(errors[0])
+                return
+            try:
+                combined.set_result(combine([future.result() for future in futures]))
+            except Exception as e:
+                combined.set_exception(e)
+
+        for future in futures:
+            future.add_done_callback(done)
+        return combined
+
+    def _find_task_async(self, task_id: str) -> concurrent.futures.Future:
+        """A finished task's info from whichever shard ran it; KeyError if no shard knows it"""
+
+        def first_found(infos: List[Optional[Dict[str, Any]]]) -> Dict[str, Any]:
+            for info in infos:
+                if info is not None:
+                    return info
+            raise KeyError(task_id)
+
+        return self._combine(self._gather("task", task_id=task_id), first_found)
+
+    # Blocking API, for scripts and benchmarks
+
+    def create_agent(self, name: str, agent_type: AgentType, capabilities: List[str],
+                     team: Optional[str] = None) -> Dict[str, Any]:
+        return self.create_agent_async(name, agent_type, capabilities, team).result()
+
+    def create_agent_async(self, name: str, agent_type: AgentType, capabilities: List[str],
+                           team: Optional[str] = None) -> concurrent.futures.Future:
+        # Every shard gets the agent under the same id, so tasks select from the whole swarm on any shard
+        futures = self._gather("create_agent", name=name, agent_type=agent_type.value, capabilities=capabilities,
+                               team=team, agent_id=new_agent_id())
+        return self._combine(futures, lambda infos: infos[0])
+
+    def orchestrate_task(self, description: str, priority: str = "medium", timeout: Optional[float] = None,
+                         profile: Optional[bool] = None, admit: bool = False) -> Dict[str, Any]:
+        return self.orchestrate_task_async(description, priority, timeout, profile, admit).result()
+
+    def orchestrate_task_async(self, description: str, priority: str = "medium", timeout: Optional[float] = None,
+                               profile: Optional[bool] = None, admit: bool = False) -> concurrent.futures.Future:
+        task_id = new_task_id()
+        shard_id = self.shard_for_task(task_id, description)
+        self.task_shards[task_id] = shard_id
+        future = self.shards[shard_id].request("orchestrate", task_id=task_id, description=description,
+                                               priority=priority, timeout=timeout, profile=profile, admit=admit)
+
+        def forget_rejected(done: concurrent.futures.Future):
+            if done.exception() is not None:
+                self.task_shards.pop(task_id, None)
+
+        future.add_done_callback(forget_rejected)
+        return future
+
+    def cancel_task(self, task_id: str, reason: str = "cancelled by client") -> bool:
+        return self.cancel_task_async(task_id, reason).result()
+
+    def cancel_task_async(self, task_id: str, reason: str = "cancelled by client") -> concurrent.futures.Future:
+        if task_id not in self.task_shards:
+            future: concurrent.futures.Future = concurrent.futures.Future()
+            future.set_result(False)
+            return future
+        return self.shards[self.task_shards[task_id]].request("cancel", task_id=task_id, reason=reason)
+
+    def wait_for_task_async(self, task_id: str, timeout: Optional[float] = None) -> concurrent.futures.Future:
+        shard_id = self.task_shards.get(task_id)
+        if shard_id is None:
+            return self._find_task_async(task_id)
+        return self.shards[shard_id].request("wait", task_id=task_id, timeout=timeout)
+
+    def wait_for_task(self, task_id: str, timeout: Optional[float] = None) -> Dict[str, Any]:
+        return self.wait_for_task_async(task_id, timeout).result()
+
+    def task(self, task_id: str) -> Optional[Dict[str, Any]]:
+        shard_id = self.task_shards.get(task_id)
+        if shard_id is not None:
+            return self.shards[shard_id].request("task", task_id=task_id).result()
+        try:
+            return self._find_task_async(task_id).result()
+        except KeyError:
+            return None
+
+    def configure(self, swarm_config: Dict[str, Any]):
+        for future in self._gather("configure", swarm_config=swarm_config):
+            future.result()
+
+    def agent_list(self) -> List[Dict[str, Any]]:
+        """The replicated registry, with each agent's performance summed over the shards"""
+        per_shard = [{agent["id"]: agent for agent in future.result()} for future in self._gather("agent_list")]
+        agents = []
+        for agent_id, agent in per_shard[0].items():
+            replicas = [agents_of_shard[agent_id] for agents_of_shard in per_shard if agent_id in agents_of_shard]
+            completed = sum(replica["performance"]["tasks_completed"] for replica in replicas)
+            total_ms = sum(replica["performance"]["tasks_completed"] * replica["performance"]["avg_execution_time_ms"]
+                           for replica in replicas)
+            agents.append({**agent, "performance": {
+                **agent["performance"],
+                "tasks_completed": completed,
+                "avg_execution_time_ms": total_ms / completed if completed else 0
+            }})
+        return agents
+
+    def swarm_status(self) -> Dict[str, Any]:
+        """Task counts summed across shards, plus the per-shard breakdown; agents are replicated"""
+        per_shard = [future.result() for future in self._gather("swarm_status")]
+        statuses: Counter = Counter()
+        admission: Counter = Counter()
+        for status in per_shard:
+            statuses.update(status["task_status"])
+            admission.update({key: status["admission"][key] for key in ("admitted", "deferred", "rejected", "waiting")})
+        return {
+            "agent_count": per_shard[0]["agent_count"],
+            "active_tasks": statuses["pending"] + statuses["in_progress"],
+            "completed_tasks": statuses["completed"],
+            "total_tasks": sum(status["total_tasks"] for status in per_shard),
+            "agents_by_type": per_shard[0]["agents_by_type"],
+            # Admission runs per shard; totals here, each shard's queue wait below
+            "admission": {
+                "mode": per_shard[0]["admission"]["mode"],
+                "target_wait_ms": per_shard[0]["admission"]["target_wait_ms"],
+                **{key: admission[key] for key in ("admitted", "deferred", "rejected", "waiting")}
+            },
+            "shards": [
+                {"shard": shard_id, "agent_count": status["agent_count"], "total_tasks": status["total_tasks"],
+                 "admission": status["admission"]}
+                for shard_id, status in enumerate(per_shard)
+            ]
+        }
+
+    # Async wrappers for the MCP front-end
+
+    async def acall(self, future: concurrent.futures.Future) -> Any:
+        return await asyncio.wrap_future(future)
+
+    def run_batch(self, descriptions: List[str], priority: str = "medium",
+                  timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Orchestrate every description and wait for all of them; results keep input order"""
+        started = [self.orchestrate_task_async(description, priority) for description in descriptions]
+        task_ids = [future.result()["task_id"] for future in started]
+        deadline = None if timeout is None else time.monotonic() + timeout
+        waits = [self.wait_for_task_async(task_id, None if deadline is None else max(0.0, deadline - time.monotonic()))
+                 for task_id in task_ids]
+        return [future.result() for future in waits]
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+🗺️ PLAN SCHEDULER - Dependency-aware phase execution
+Runs plan phases as a DAG: independent phases execute concurrently, and the
+critical path plus per-phase slack are reported for both estimates and actuals.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+
+class PlanCycleError(ValueError):
+    """Raised when phase dependencies contain a cycle"""
+
+
+@dataclass
+class PhaseNode:
+    id: str
+    depends_on: List[str] = field(default_factory=list)
+    estimated_duration: float = 0.0
+
+
+@dataclass
+class PhaseTiming:
+    earliest_start: float
+    earliest_finish: float
+    latest_start: float
+    latest_finish: float
+    slack: float
+    critical: bool
+
+
+@dataclass
+class PhaseOutcome:
+    id: str
+    status: str
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    result: Any = None
+    error: Optional[str] = None
+
+    @property
+    def duration(self) -> float:
+        if self.started_at is None or self.finished_at is None:
+            return 0.0
+        return self.finished_at - self.started_at
+
+
+def topological_order(nodes: List[PhaseNode]) -> List[str]:
+    """Kahn's algorithm; ties keep declaration order so plans stay readable"""
+    by_id = {node.id: node for node in nodes}
+    indegree = {node.id: 0 for node in nodes}
+    dependents: Dict[str, List[str]] = {node.id: [] for node in nodes}
+
+    for node in nodes:
+        for dep in node.depends_on:
+            if dep not in by_id:
+                raise KeyError(f"Phase {node.id} depends on unknown phase {dep}")
+            indegree[node.id] += 1
+            dependents[dep].append(node.id)
+
+    ready = [node.id for node in nodes if indegree[node.id] == 0]
+    order: List[str] = []
+    while ready:
+        current = ready.pop(0)
+        order.append(current)
+        for dependent in dependents[current]:
+            indegree[dependent] -= 1
+            if indegree[dependent] == 0:
+                ready.append(dependent)
+
+    if len(order) != len(nodes):
+        blocked = sorted(node_id for node_id, degree in indegree.items() if degree > 0)
+        raise PlanCycleError(f"Dependency cycle between phases: {', '.join(blocked)}")
+    return order
+
+
+def critical_path(nodes: List[PhaseNode],
+                  durations: Optional[Dict[str, float]] = None) -> Tuple[List[str], Dict[str, PhaseTiming], float]:
+    """Compute the critical path, per-phase timings and total plan length"""
+    by_id = {node.id: node for node in nodes}
+    order = topological_order(nodes)
+    duration = {node.id: (durations or {}).get(node.id, node.estimated_duration) for node in nodes}
+
+    earliest_finish: Dict[str, float] = {}
+    earliest_start: Dict[str, float] = {}
+    for node_id in order:
+        start = max((earliest_finish[dep] for dep in by_id[node_id].depends_on), default=0.0)
+        earliest_start[node_id] = start
+        earliest_finish[node_id] = start + duration[node_id]
+
+    total = max(earliest_finish.values(), default=0.0)
+
+    successors: Dict[str, List[str]] = {node.id: [] for node in nodes}
+    for node in nodes:
+        for dep in node.depends_on:
+            successors[dep].append(node.id)
+
+    latest_start: Dict[str, float] = {}
+    latest_finish: Dict[str, float] = {}
+    for node_id in reversed(order):
+        finish = min((latest_start[succ] for succ in successors[node_id]), default=total)
+        latest_finish[node_id] = finish
+        latest_start[node_id] = finish - duration[node_id]
+
+    timings = {}
+    for node_id in order:
+        slack = max(0.0, latest_start[node_id] - earliest_start[node_id])
+        timings[node_id] = PhaseTiming(
+            earliest_start=earliest_start[node_id],
+            earliest_finish=earliest_finish[node_id],
+            latest_start=latest_start[node_id],
+            latest_finish=latest_finish[node_id],
+            slack=slack,
+            critical=slack < 1e-9
+        )
+
+    # Walk back from the latest-finishing critical phase along zero-slack predecessors
+    path: List[str] = []
+    current = max(order, key=lambda n: earliest_finish[n], default=None)
+    while current is not None:
+        path.append(current)
+        critical_deps = [dep for dep in by_id[current].depends_on
+                         if timings[dep].critical
+                         and abs(earliest_finish[dep] - earliest_start[current]) < 1e-9]
+        current = max(critical_deps, key=lambda d: earliest_finish[d], default=None)
+    path.reverse()
+
+    return path, timings, total
+
+
+class DagScheduler:
+    """Runs phases as soon as their dependencies complete"""
+
+    def __init__(self, nodes: List[PhaseNode], max_concurrency: Optional[int] = None):
+        self.nodes = nodes
+        self.order = topological_order(nodes)
+        self.max_concurrency = max_concurrency
+        self.outcomes: Dict[str, PhaseOutcome] = {}
+
+    async def run(self, runner: Callable[[str], Awaitable[Any]]) -> Dict[str, PhaseOutcome]:
+        """Execute every phase; dependents of a failed phase are skipped"""
+        remaining = {node.id: set(node.depends_on) for node in self.nodes}
+        dependents: Dict[str, List[str]] = {node.id: [] for node in self.nodes}
+        for node in self.nodes:
+            for dep in node.depends_on:
+                dependents[dep].append(node.id)
+
+        limiter = asyncio.Semaphore(self.max_concurrency) if self.max_concurrency else None
+        epoch = time.perf_counter()
+        running: Dict[asyncio.Task, str] = {}
+
+        async def execute(node_id: str) -> PhaseOutcome:
+            outcome = PhaseOutcome(id=node_id, status="running")
+            if limiter:
+                await limiter.acquire()
+            try:
+                outcome.started_at = time.perf_counter() - epoch
+                outcome.result = await runner(node_id)
+                outcome.status = "completed"
+            except Exception as e:
+                outcome.status = "failed"
+                outcome.error = str(e)
+            finally:
+                outcome.finished_at = time.perf_counter() - epoch
+                if limiter:
+                    limiter.release()
+            return outcome
+
+        def launch_ready():
+            for node_id in self.order:
+                if node_id in self.outcomes or node_id in running.values():
+                    continue
+                if not remaining[node_id]:
+                    running[asyncio.ensure_future(execute(node_id))] = node_id
+
+        def skip_dependents(node_id: str, reason: str):
+            for dependent in dependents[node_id]:
+                if dependent not in self.outcomes:
+                    self.outcomes[dependent] = PhaseOutcome(id=dependent, status="skipped", error=reason)
+                    skip_dependents(dependent, reason)
+
+        launch_ready()
+        while running:
+            done, _ = await asyncio.wait(running.keys(), return_when=asyncio.FIRST_COMPLETED)
+            for finished in done:
+                node_id = running.pop(finished)
+                outcome = finished.result()
+                self.outcomes[node_id] = outcome
+                if outcome.status == "completed":
+                    for dependent in dependents[node_id]:
+                        remaining[dependent].discard(node_id)
+                else:
+                    skip_dependents(node_id, f"dependency {node_id} failed")
+            launch_ready()
+
+        return {node_id: self.outcomes[node_id] for node_id in self.order}
+
+    def actual_critical_path(self) -> Tuple[List[str], Dict[str, PhaseTiming], float]:
+        """Critical path using measured phase durations"""
+        durations = {node_id: outcome.duration for node_id, outcome in self.outcomes.items()}
+        return critical_path(self.nodes, durations)
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+📓 RUN JOURNAL - On-disk checkpoints for multi-phase runs
+Every phase's inputs, outputs and status are appended to a per-run JSONL
+journal. Resuming a run replays the journal, skips completed phases and only
+re-executes phases that never finished.
+"""
+
+import json
+import os
+import uuid
+from dataclasses import asdict, dataclass, is_dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+JOURNAL_DIR = os.environ.get("HIVE_RUN_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".hive_runs"))
+
+
+@dataclass
+class PhaseRecord:
+    phase: str
+    status: str
+    inputs: Any = None
+    outputs: Any = None
+    error: Optional[str] = None
+    timestamp: str = ""
+
+
+def _encode(value: Any) -> Any:
+    """JSON fallback for dataclasses, enums and other objects in phase payloads"""
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (set, tuple)):
+        return list(value)
+    return str(value)
+
+
+class RunJournal:
+    """Append-only checkpoint journal for one run"""
+
+    def __init__(self, run_id: Optional[str] = None, directory: str = JOURNAL_DIR, kind: str = "run"):
+        self.run_id = run_id or f"{kind}-{datetime.now().strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+        self.directory = directory
+        self.path = os.path.join(directory, f"{self.run_id}.jsonl")
+        self.phases: Dict[str, PhaseRecord] = {}
+        self.resumed = False
+
+        os.makedirs(directory, exist_ok=True)
+        if os.path.exists(self.path):
+            self._replay()
+
+    @classmethod
+    def resume(cls, run_id: str, directory: str = JOURNAL_DIR) -> "RunJournal":
+        """Open an existing run; raises FileNotFoundError for unknown run ids"""
+        path = os.path.join(directory, f"{run_id}.jsonl")
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"No journal for run {run_id} in {directory}")
+        journal = cls(run_id=run_id, directory=directory)
+        journal.resumed = True
+        return journal
+
+    def _replay(self):
+        with open(self.path, "rb") as f:
+            data = f.read()
+        # A crash mid-write leaves a torn last line; everything before it is intact.
+        # Cut it off, or the next append would be glued onto it and lost as well
+        intact = data.rfind(b"\n") + 1
+        if intact < len(data):
+            with open(self.path, "r+b") as f:
+                f.truncate(intact)
+        for line in data[:intact].decode("utf-8").splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            self.phases[entry["phase"]] = PhaseRecord(**entry)
+
+    def _append(self, record: PhaseRecord):
+        record.timestamp = datetime.now().isoformat()
+        line = json.dumps(asdict(record), default=_encode)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        # Keep the in-memory view identical to what a replay would produce
+        self.phases[record.phase] = PhaseRecord(**json.loads(line))
+
+    def phase_started(self, phase: str, inputs: Any = None):
+        self._append(PhaseRecord(phase=phase, status="started", inputs=inputs))
+
+    def phase_completed(self, phase: str, outputs: Any = None, inputs: Any = None):
+        self._append(PhaseRecord(phase=phase, status="completed", inputs=inputs, outputs=outputs))
+
+    def phase_failed(self, phase: str, error: str, inputs: Any = None):
+        self._append(PhaseRecord(phase=phase, status="failed", inputs=inputs, error=error))
+
+    def is_completed(self, phase: str) -> bool:
+        record = self.phases.get(phase)
+        return record is not None and record.status == "completed"
+
+    def outputs(self, phase: str) -> Any:
+        record = self.phases.get(phase)
+        return record.outputs if record else None
+
+    def completed_phases(self) -> List[str]:
+        return [phase for phase, record in self.phases.items() if record.status == "completed"]
+
+    def unfinished_phases(self) -> List[str]:
+        return [phase for phase, record in self.phases.items() if record.status != "completed"]
+
+    async def run_phase(self, phase: str, func: Callable[..., Awaitable[Any]], *args, inputs: Any = None) -> Any:
+        """Run an async phase once; completed phases return their journaled outputs"""
+        if self.is_completed(phase):
+            print(f"⏭️  RESUME: phase '{phase}' already completed in {self.run_id}")
+            return self.outputs(phase)
+        self.phase_started(phase, inputs)
+        try:
+            outputs = await func(*args)
+        except Exception as e:
+            self.phase_failed(phase, str(e), inputs)
+            raise
+        self.phase_completed(phase, outputs, inputs)
+        return self.outputs(phase)
+
+    def run_phase_sync(self, phase: str, func: Callable[..., Any], *args, inputs: Any = None) -> Any:
+        """Synchronous variant of run_phase"""
+        if self.is_completed(phase):
+            print(f"⏭️  RESUME: phase '{phase}' already completed in {self.run_id}")
+            return self.outputs(phase)
+        self.phase_started(phase, inputs)
+        try:
+            outputs = func(*args)
+        except Exception as e:
+            self.phase_failed(phase, str(e), inputs)
+            raise
+        self.phase_completed(phase, outputs, inputs)
+        return self.outputs(phase)
+
+
+def add_resume_argument(parser):
+    """Shared --resume flag for mission scripts"""
+    parser.add_argument("--resume", metavar="RUN_ID", default=None,
+                        help="resume a previous run, skipping phases already completed")
+    return parser
+
+
+def open_journal(resume: Optional[str], kind: str, directory: str = JOURNAL_DIR) -> RunJournal:
+    """Resume the given run id or start a new journal"""
+    journal = RunJournal.resume(resume, directory) if resume else RunJournal(directory=directory, kind=kind)
+    state = "RESUMING" if journal.resumed else "NEW RUN"
+    print(f"📓 {state}: {journal.run_id} ({len(journal.completed_phases())} phases already completed)")
+    return journal
@@ -5,7 +5,7 @@ Tests the real analysis functionality without MCP client complexity
 """
 
 import asyncio
-from mcp_agent_orchestrator import AgentOrchestrator, AgentType
+from agent_orchestrator_core import AgentOrchestrator, AgentType
 
 async def test_direct_agent_functionality():
     """Direct test of agent orchestrator without MCP protocol overhead"""
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+🧵 SPAN TRACING - Nested spans in a local ring buffer, exported as Chrome traces
+A span covers one step of a request (MCP tool call, orchestrate_task, queue
+wait, _execute_task, an analyzer, a file read) with attributes such as the
+file path, bytes read or a cache hit. The current span lives in a
+contextvar, so asyncio tasks and executor threads started inside a span
+nest under it. Finished spans go to a bounded ring buffer; export_chrome_trace()
+turns them into Trace Event JSON for chrome://tracing or ui.perfetto.dev,
+with one lane per asyncio task or thread so lost concurrency is visible.
+
+Off unless HIVE_TRACE=1 (or tracer.enable()); a disabled span() is a shared
+no-op. HIVE_TRACE_BUFFER sets the ring buffer size; saved traces go to
+HIVE_TRACE_DIR (default .hive_traces next to this module).
+"""
+
+import asyncio
+import contextvars
+import functools
+import inspect
+import itertools
+import json
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+TRACE_ENV = "HIVE_TRACE"
+DEFAULT_CAPACITY = int(os.environ.get("HIVE_TRACE_BUFFER", "20000"))
+TRACE_DIR = os.environ.get("HIVE_TRACE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".hive_traces"))
+
+_current: contextvars.ContextVar = contextvars.ContextVar("hive_span", default=None)
+_ids = itertools.count(1)
+
+
+@dataclass
+class Span:
+    name: str
+    span_id: int
+    trace_id: int
+    parent_id: Optional[int]
+    start_ns: int
+    lane: str
+    end_ns: Optional[int] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    # Async spans (queue waits) may overlap others in their lane; exported as async events
+    overlapping: bool = False
+
+    def set(self, **attributes):
+        self.attributes.update(attributes)
+
+    @property
+    def duration_ms(self) -> Optional[float]:
+        return None if self.end_ns is None else (self.end_ns - self.start_ns) / 1e6
+
+
+class _NoSpan:
+    """Stand-in for span() while tracing is off"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def set(self, **attributes):
+        pass
+
+
+NO_SPAN = _NoSpan()
+
+
+def _lane() -> str:
+    """The asyncio task running this code, else the thread"""
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+    if task is not None:
+        return f"task {task.get_name()}"
+    return f"thread {threading.current_thread().name}"
+
+
+class _ActiveSpan:
+    __slots__ = ("tracer", "span", "token")
+
+    def __init__(self, tracer: "Tracer", name: str, attributes: Dict[str, Any]):
+        parent = _current.get()
+        span_id = next(_ids)
+        self.tracer = tracer
+        self.span = Span(name=name, span_id=span_id, trace_id=parent.trace_id if parent else span_id,
+                         parent_id=parent.span_id if parent else None, start_ns=0, lane="",
+                         attributes=attributes)
+
+    def __enter__(self) -> Span:
+        self.span.lane = _lane()
+        self.token = _current.set(self.span)
+        self.span.start_ns = time.perf_counter_ns()
+        return self.span
+
+    def __exit__(self, exc_type, exc, tb):
+        self.span.end_ns = time.perf_counter_ns()
+        _current.reset(self.token)
+        if exc_type is not None:
+            self.span.attributes["error"] = exc_type.__name__ if exc is None else f"{exc_type.__name__}: {exc}"
+        self.tracer._finish(self.span)
+        return False
+
+
+class Tracer:
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, enabled: bool = False):
+        self.enabled = enabled
+        self.spans: Deque[Span] = deque(maxlen=capacity)
+        self.dropped = 0
+        self._lock = threading.Lock()
+
+    def enable(self, capacity: Optional[int] = None):
+        if capacity is not None and capacity != self.spans.maxlen:
+            with self._lock:
+                self.spans = deque(self.spans, maxlen=capacity)
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def clear(self):
+        with self._lock:
+            self.spans.clear()
+            self.dropped = 0
+
+    def span(self, name: str, **attributes):
+        """`with tracer.span("name", key=value) as span:` — nests under the current span"""
+        if not self.enabled:
+            return NO_SPAN
+        return _ActiveSpan(self, name, attributes)
+
+    def record(self, name: str, start_ns: int, end_ns: Optional[int] = None, **attributes) -> Optional[Span]:
+        """A span measured after the fact (e.g. a queue wait), under the current span"""
+        if not self.enabled:
+            return None
+        parent = _current.get()
+        span_id = next(_ids)
+        span = Span(name=name, span_id=span_id, trace_id=parent.trace_id if parent else span_id,
+                    parent_id=parent.span_id if parent else None, start_ns=start_ns, lane=_lane(),
+                    end_ns=time.perf_counter_ns() if end_ns is None else end_ns, attributes=attributes,
+                    overlapping=True)
+        self._finish(span)
+        return span
+
+    def _finish(self, span: Span):
+        with self._lock:
+            if len(self.spans) == self.spans.maxlen:
+                self.dropped += 1
+            self.spans.append(span)
+
+    def snapshot(self, trace_id: Optional[int] = None) -> List[Span]:
+        with self._lock:
+            spans = list(self.spans)
+        return [s for s in spans if trace_id is None or s.trace_id == trace_id]
+
+    def stats(self) -> Dict[str, Any]:
+        return {"enabled": self.enabled, "spans": len(self.spans), "capacity": self.spans.maxlen,
+                "dropped": self.dropped}
+
+
+tracer = Tracer(enabled=os.environ.get(TRACE_ENV, "").lower() in ("1", "true", "yes", "on"))
+
+
+def span(name: str, **attributes):
+    """Span on the process-wide tracer"""
+    return tracer.span(name, **attributes)
+
+
+def current_span() -> Optional[Span]:
+    return _current.get()
+
+
+def ns_ago(seconds: float) -> int:
+    """perf_counter_ns timestamp of a moment `seconds` ago (for spans that started before we knew)"""
+    return time.perf_counter_ns() - int(seconds * 1e9)
+
+
+def traced(name: Optional[str] = None):
+    """Decorator: run each call of a sync or async function in a span named after it"""
+    def decorate(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def run_async(*args, **kwargs):
+                with tracer.span(span_name):
+                    return await func(*args, **kwargs)
+            return run_async
+
+        @functools.wraps(func)
+        def run(*args, **kwargs):
+            with tracer.span(span_name):
+                return func(*args, **kwargs)
+        return run
+    return decorate
+
+
+def read_file(path: str, encoding: Optional[str] = None, errors: Optional[str] = None) -> str:
+    """open(path).read() in a "file.read" span recording the path and bytes read"""
+    with tracer.span("file.read", path=path) as active:
+        with open(path, "r", encoding=encoding, errors=errors) as handle:
+            content = handle.read()
+        active.set(bytes=len(content))
+        return content
+
+
+def export_chrome_trace(spans: Optional[List[Span]] = None) -> Dict[str, Any]:
+    """Trace Event Format: complete ("X") events per lane, async ("b"/"e") events for overlapping spans"""
+    spans = tracer.snapshot() if spans is None else spans
+    lanes: Dict[str, int] = {}
+    events: List[Dict[str, Any]] = []
+    pid = os.getpid()
+    origin = min((s.start_ns for s in spans), default=0)
+    for s in sorted(spans, key=lambda s: s.start_ns):
+        tid = lanes.setdefault(s.lane, len(lanes) + 1)
+        args = {**s.attributes, "span_id": s.span_id, "parent_id": s.parent_id, "trace_id": s.trace_id}
+        ts = (s.start_ns - origin) / 1000
+        duration = ((s.end_ns or s.start_ns) - s.start_ns) / 1000
+        if s.overlapping:
+            common = {"name": s.name, "cat": "async", "id": s.span_id, "pid": pid, "tid": tid}
+            events.append({**common, "ph": "b", "ts": ts, "args": args})
+            events.append({**common, "ph": "e", "ts": ts + duration})
+        else:
+            events.append({"name": s.name, "cat": "span", "ph": "X", "ts": ts, "dur": duration,
+                           "pid": pid, "tid": tid, "args": args})
+    for lane, tid in lanes.items():
+        events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": lane}})
+    return {"traceEvents": events, "displayTimeUnit": "ms", "otherData": tracer.stats()}
+
+
+def save_chrome_trace(trace: Dict[str, Any], directory: Optional[str] = None) -> str:
+    """Write an exported trace under a generated name in the trace directory; returns its path"""
+    directory = directory or TRACE_DIR
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"trace-{int(time.time() * 1000)}-{uuid.uuid4().hex[:8]}.json")
+    with open(path, "w") as handle:
+        json.dump(trace, handle)
+    return path
@@ -16,6 +16,9 @@ from dataclasses import dataclass
 from enum import Enum
 import uuid
 
+from span_tracing import read_file, traced
+from tree_index import FileCache, TreeIndex
+
 class AgentType(Enum):
     COORDINATOR = "coordinator"
     RESEARCHER = "researcher"
@@ -47,10 +50,20 @@ class Task:
 class StandaloneHiveMind:
     """🧠 MCP-Independent Agent Orchestrator with REAL Analysis"""
 
-    def __init__(self):
+    def __init__(self, codebase_path: str = "/Users/maxschwarz/Desktop/yprint_designtool",
+                 index: Optional[TreeIndex] = None, files: Optional[FileCache] = None):
         self.agents: Dict[str, Agent] = {}
         self.tasks: Dict[str, Task] = {}
-        self.codebase_path = "/Users/maxschwarz/Desktop/yprint_designtool"
+        self.codebase_path = codebase_path
+        # Warm directory index and file cache of a resident process (analysis_daemon.py); None lists and reads
+        self.index = index
+        self.files = files
+
+    def _read(self, path: str) -> str:
+        return self.files.read(path) if self.files is not None else read_file(path)
+
+    def _listdir(self, path: str) -> List[str]:
+        return self.index.listdir(path) if self.index is not None else os.listdir(path)
 
     def create_agent(self, name: str, agent_type: AgentType, capabilities: List[str]) -> Agent:
         """Create specialized agent with real analysis capabilities"""
@@ -118,6 +131,7 @@ class StandaloneHiveMind:
         # Match by specific capabilities
         return any(cap.lower() in task_lower for cap in agent.capabilities)
 
+    @traced()
     async def execute_task(self, task_id: str) -> Dict[str, Any]:
         """Execute task with REAL agent analysis"""
         if task_id not in self.tasks:
@@ -148,6 +162,7 @@ class StandaloneHiveMind:
         print(f"✅ Task Completed: {task_id} ({execution_time:.2f}ms)")
         return task.results
 
+    @traced()
     async def _delegate_to_agents(self, task: Task) -> Dict[str, Any]:
         """Delegate analysis to specialized agents with REAL implementation"""
 
@@ -213,6 +228,7 @@ class StandaloneHiveMind:
 
         return results
 
+    @traced()
     async def _analyze_php_architecture(self) -> Dict[str, Any]:
         """🏗️ Agent 1: Real PHP Architecture Analysis"""
         results = {"evidence": [], "technical_details": {}}
@@ -220,18 +236,17 @@ class StandaloneHiveMind:
         # Analyze main plugin file
         main_file = os.path.join(self.codebase_path, "octo-print-designer.php")
         if os.path.exists(main_file):
-            with open(main_file, 'r') as f:
-                content = f.read()
-                version_match = re.search(r"define\s*\(\s*'OCTO_PRINT_DESIGNER_VERSION',\s*'([^']+)'", content)
-                if version_match:
-                    results["technical_details"]["plugin_version"] = version_match.group(1)
-                    results["evidence"].append(f"Plugin version: {version_match.group(1)}")
+            content = self._read(main_file)
+            version_match = re.search(r"define\s*\(\s*'OCTO_PRINT_DESIGNER_VERSION',\s*'([^']+)'", content)
+            if version_match:
+                results["technical_details"]["plugin_version"] = version_match.group(1)
+                results["evidence"].append(f"Plugin version: {version_match.group(1)}")
 
         # Analyze core classes
         includes_path = os.path.join(self.codebase_path, "includes")
         core_classes = []
         if os.path.exists(includes_path):
-            for file in os.listdir(includes_path):
+            for file in self._listdir(includes_path):
                 if file.startswith("class-") and file.endswith(".php"):
                     class_name = file.replace("class-", "").replace(".php", "").replace("-", "_")
                     core_classes.append(class_name)
@@ -242,23 +257,23 @@ class StandaloneHiveMind:
         # Check WooCommerce integration class
         wc_integration_file = os.path.join(self.codebase_path, "includes", "class-octo-print-designer-wc-integration.php")
         if os.path.exists(wc_integration_file):
-            with open(wc_integration_file, 'r') as f:
-                wc_content = f.read()
-                hook_matches = re.findall(r"add_action\s*\(\s*'([^']+)'", wc_content)
-                filter_matches = re.findall(r"add_filter\s*\(\s*'([^']+)'", wc_content)
+            wc_content = self._read(wc_integration_file)
+            hook_matches = re.findall(r"add_action\s*\(\s*'([^']+)'", wc_content)
+            filter_matches = re.findall(r"add_filter\s*\(\s*'([^']+)'", wc_content)
 
-                results["technical_details"]["wc_action_hooks"] = len(hook_matches)
-                results["technical_details"]["wc_filter_hooks"] = len(filter_matches)
-                results["evidence"].append(f"WooCommerce integration: {len(hook_matches)} action hooks, {len(filter_matches)} filter hooks")
+            results["technical_details"]["wc_action_hooks"] = len(hook_matches)
+            results["technical_details"]["wc_filter_hooks"] = len(filter_matches)
+            results["evidence"].append(f"WooCommerce integration: {len(hook_matches)} action hooks, {len(filter_matches)} filter hooks")
 
-                # Check for design preview hooks
-                if "woocommerce_admin_order_data_after_order_details" in wc_content:
-                    results["evidence"].append("✅ Design preview hook found: woocommerce_admin_order_data_after_order_details")
-                if "wp_ajax_octo_load_design_preview" in wc_content:
-                    results["evidence"].append("✅ Design preview AJAX handler found: wp_ajax_octo_load_design_preview")
+            # Check for design preview hooks
+            if "woocommerce_admin_order_data_after_order_details" in wc_content:
+                results["evidence"].append("✅ Design preview hook found: woocommerce_admin_order_data_after_order_details")
+            if "wp_ajax_octo_load_design_preview" in wc_content:
+                results["evidence"].append("✅ Design preview AJAX handler found: wp_ajax_octo_load_design_preview")
 
         return results
 
+    @traced()
     async def _analyze_javascript_system(self) -> Dict[str, Any]:
         """🟨 Agent 2: Real JavaScript System Analysis"""
         results = {"evidence": [], "technical_details": {}}
@@ -270,7 +285,7 @@ class StandaloneHiveMind:
 
         for js_path in [public_js_path, admin_js_path]:
             if os.path.exists(js_path):
-                for file in os.listdir(js_path):
+                for file in self._listdir(js_path):
                     if file.endswith(".js"):
                         js_files.append(file)
 
@@ -293,28 +308,28 @@ class StandaloneHiveMind:
                 found_critical.append(critical_file)
 
                 # Analyze file content
-                with open(file_path, 'r') as f:
-                    content = f.read()
+                content = self._read(file_path)
 
-                    if critical_file == "optimized-design-data-capture.js":
-                        if "generateDesignData" in content:
-                            results["evidence"].append("✅ generateDesignData function found in optimized-design-data-capture.js")
-                        if "window.generateDesignData" in content:
-                            results["evidence"].append("✅ Global window.generateDesignData exposure found")
+                if critical_file == "optimized-design-data-capture.js":
+                    if "generateDesignData" in content:
+                        results["evidence"].append("✅ generateDesignData function found in optimized-design-data-capture.js")
+                    if "window.generateDesignData" in content:
+                        results["evidence"].append("✅ Global window.generateDesignData exposure found")
 
-                    if critical_file == "fabric-global-exposer.js":
-                        if "fabric" in content and "window.fabric" in content:
-                            results["evidence"].append("✅ Fabric.js global exposure logic found")
+                if critical_file == "fabric-global-exposer.js":
+                    if "fabric" in content and "window.fabric" in content:
+                        results["evidence"].append("✅ Fabric.js global exposure logic found")
 
-                    if critical_file == "emergency-fabric-loader.js":
-                        if "CDN" in content and "fabric" in content:
-                            results["evidence"].append("✅ Emergency CDN Fabric.js loader found")
+                if critical_file == "emergency-fabric-loader.js":
+                    if "CDN" in content and "fabric" in content:
+                        results["evidence"].append("✅ Emergency CDN Fabric.js loader found")
 
         results["technical_details"]["critical_files_found"] = len(found_critical)
         results["evidence"].append(f"Critical system files found: {', '.join(found_critical)}")
 
         return results
 
+    @traced()
     async def _analyze_database_integration(self) -> Dict[str, Any]:
         """💾 Agent 3: Real Database Integration Analysis"""
         results = {"evidence": [], "technical_details": {}}
@@ -322,35 +337,35 @@ class StandaloneHiveMind:
         # Search for wp_postmeta usage
         wc_integration_file = os.path.join(self.codebase_path, "includes", "class-octo-print-designer-wc-integration.php")
         if os.path.exists(wc_integration_file):
-            with open(wc_integration_file, 'r') as f:
-                content = f.read()
+            content = self._read(wc_integration_file)
 
-                # Check for design data storage
-                if "_design_data" in content:
-                    results["evidence"].append("✅ Design data storage key '_design_data' found in wp_postmeta")
+            # Check for design data storage
+            if "_design_data" in content:
+                results["evidence"].append("✅ Design data storage key '_design_data' found in wp_postmeta")
 
-                # Check for meta operations
-                meta_operations = ["get_post_meta", "update_post_meta", "add_post_meta", "delete_post_meta"]
-                found_operations = []
-                for operation in meta_operations:
-                    if operation in content:
-                        found_operations.append(operation)
+            # Check for meta operations
+            meta_operations = ["get_post_meta", "update_post_meta", "add_post_meta", "delete_post_meta"]
+            found_operations = []
+            for operation in meta_operations:
+                if operation in content:
+                    found_operations.append(operation)
 
-                results["technical_details"]["meta_operations"] = found_operations
-                results["evidence"].append(f"WordPress meta operations found: {', '.join(found_operations)}")
+            results["technical_details"]["meta_operations"] = found_operations
+            results["evidence"].append(f"WordPress meta operations found: {', '.join(found_operations)}")
 
-                # Check for JSON handling
-                json_functions = ["json_encode", "json_decode", "wp_slash", "stripslashes"]
-                found_json = []
-                for func in json_functions:
-                    if func in content:
-                        found_json.append(func)
+            # Check for JSON handling
+            json_functions = ["json_encode", "json_decode", "wp_slash", "stripslashes"]
+            found_json = []
+            for func in json_functions:
+                if func in content:
+                    found_json.append(func)
 
-                results["technical_details"]["json_handling"] = found_json
-                results["evidence"].append(f"JSON handling functions: {', '.join(found_json)}")
+            results["technical_details"]["json_handling"] = found_json
+            results["evidence"].append(f"JSON handling functions: {', '.join(found_json)}")
 
         return results
 
+    @traced()
     async def _analyze_woocommerce_integration(self) -> Dict[str, Any]:
         """🛒 Agent 4: Real WooCommerce Integration Analysis"""
         results = {"evidence": [], "technical_details": {}}
@@ -358,35 +373,34 @@ class StandaloneHiveMind:
         # Check admin class for WooCommerce order page detection
         admin_file = os.path.join(self.codebase_path, "admin", "class-octo-print-designer-admin.php")
         if os.path.exists(admin_file):
-            with open(admin_file, 'r') as f:
-                content = f.read()
+            content = self._read(admin_file)
 
-                if "is_woocommerce_order_edit_page" in content:
-                    results["evidence"].append("✅ WooCommerce order page detection function found")
+            if "is_woocommerce_order_edit_page" in content:
+                results["evidence"].append("✅ WooCommerce order page detection function found")
 
-                if "woocommerce_page_wc-orders" in content:
-                    results["evidence"].append("✅ Modern WooCommerce order hook support found")
+            if "woocommerce_page_wc-orders" in content:
+                results["evidence"].append("✅ Modern WooCommerce order hook support found")
 
-                if "enqueue_scripts" in content:
-                    results["evidence"].append("✅ Script enqueuing system found in admin class")
+            if "enqueue_scripts" in content:
+                results["evidence"].append("✅ Script enqueuing system found in admin class")
 
         # Check for design preview integration
         wc_integration_file = os.path.join(self.codebase_path, "includes", "class-octo-print-designer-wc-integration.php")
         if os.path.exists(wc_integration_file):
-            with open(wc_integration_file, 'r') as f:
-                content = f.read()
+            content = self._read(wc_integration_file)
 
-                if "add_design_preview_button" in content:
-                    results["evidence"].append("✅ Design preview button method found")
+            if "add_design_preview_button" in content:
+                results["evidence"].append("✅ Design preview button method found")
 
-                if "ajax_load_design_preview" in content:
-                    results["evidence"].append("✅ Design preview AJAX handler found")
+            if "ajax_load_design_preview" in content:
+                results["evidence"].append("✅ Design preview AJAX handler found")
 
-                if "fabric.js" in content or "Fabric.js" in content:
-                    results["evidence"].append("✅ Fabric.js integration references found")
+            if "fabric.js" in content or "Fabric.js" in content:
+                results["evidence"].append("✅ Fabric.js integration references found")
 
         return results
 
+    @traced()
     async def _analyze_design_data_flow(self) -> Dict[str, Any]:
         """📊 Agent 5: Real Design Data Flow Analysis"""
         results = {"evidence": [], "technical_details": {}}
@@ -394,59 +408,59 @@ class StandaloneHiveMind:
         # Analyze design data capture system
         capture_file = os.path.join(self.codebase_path, "public", "js", "optimized-design-data-capture.js")
         if os.path.exists(capture_file):
-            with open(capture_file, 'r') as f:
-                content = f.read()
+            content = self._read(capture_file)
 
-                if "generateDesignData" in content:
-                    results["evidence"].append("✅ generateDesignData function implementation found")
+            if "generateDesignData" in content:
+                results["evidence"].append("✅ generateDesignData function implementation found")
 
-                # Count console.log statements (logging system)
-                log_count = content.count("console.log")
-                results["technical_details"]["console_logs"] = log_count
-                results["evidence"].append(f"Comprehensive logging system: {log_count} console.log statements")
+            # Count console.log statements (logging system)
+            log_count = content.count("console.log")
+            results["technical_details"]["console_logs"] = log_count
+            results["evidence"].append(f"Comprehensive logging system: {log_count} console.log statements")
 
-                if "timestamp" in content and "template_view_id" in content:
-                    results["evidence"].append("✅ Design data structure with timestamp and template_view_id found")
+            if "timestamp" in content and "template_view_id" in content:
+                results["evidence"].append("✅ Design data structure with timestamp and template_view_id found")
 
         return results
 
+    @traced()
     async def _analyze_ajax_security(self) -> Dict[str, Any]:
         """🔒 Agent 6: Real AJAX Security Analysis"""
         results = {"evidence": [], "technical_details": {}}
 
         wc_integration_file = os.path.join(self.codebase_path, "includes", "class-octo-print-designer-wc-integration.php")
         if os.path.exists(wc_integration_file):
-            with open(wc_integration_file, 'r') as f:
-                content = f.read()
+            content = self._read(wc_integration_file)
 
-                # Check for nonce verification
-                if "wp_verify_nonce" in content:
-                    results["evidence"].append("✅ WordPress nonce verification found")
+            # Check for nonce verification
+            if "wp_verify_nonce" in content:
+                results["evidence"].append("✅ WordPress nonce verification found")
 
-                if "wp_create_nonce" in content:
-                    results["evidence"].append("✅ WordPress nonce creation found")
+            if "wp_create_nonce" in content:
+                results["evidence"].append("✅ WordPress nonce creation found")
 
-                # Check for capability checks
-                if "current_user_can" in content:
-                    results["evidence"].append("✅ User capability checks found")
+            # Check for capability checks
+            if "current_user_can" in content:
+                results["evidence"].append("✅ User capability checks found")
 
-                # Check for AJAX handlers
-                ajax_handlers = re.findall(r"wp_ajax_([a-zA-Z_]+)", content)
-                results["technical_details"]["ajax_handlers"] = ajax_handlers
-                results["evidence"].append(f"AJAX handlers found: {', '.join(ajax_handlers)}")
+            # Check for AJAX handlers
+            ajax_handlers = re.findall(r"wp_ajax_([a-zA-Z_]+)", content)
+            results["technical_details"]["ajax_handlers"] = ajax_handlers
+            results["evidence"].append(f"AJAX handlers found: {', '.join(ajax_handlers)}")
 
-                # Check for input sanitization
-                sanitization_funcs = ["sanitize_text_field", "absint", "esc_html", "wp_kses_post"]
-                found_sanitization = []
-                for func in sanitization_funcs:
-                    if func in content:
-                        found_sanitization.append(func)
+            # Check for input sanitization
+            sanitization_funcs = ["sanitize_text_field", "absint", "esc_html", "wp_kses_post"]
+            found_sanitization = []
+            for func in sanitization_funcs:
+                if func in content:
+                    found_sanitization.append(func)
 
-                results["technical_details"]["sanitization_functions"] = found_sanitization
-                results["evidence"].append(f"Input sanitization functions: {', '.join(found_sanitization)}")
+            results["technical_details"]["sanitization_functions"] = found_sanitization
+            results["evidence"].append(f"Input sanitization functions: {', '.join(found_sanitization)}")
 
         return results
 
+    @traced()
     async def _analyze_performance_bottlenecks(self) -> Dict[str, Any]:
         """⚡ Agent 7: Real Performance Analysis"""
         results = {"evidence": [], "technical_details": {}}
@@ -454,40 +468,37 @@ class StandaloneHiveMind:
         # Analyze script coordinator for performance issues
         coordinator_file = os.path.join(self.codebase_path, "public", "js", "script-load-coordinator.js")
         if os.path.exists(coordinator_file):
-            with open(coordinator_file, 'r') as f:
-                content = f.read()
+            content = self._read(coordinator_file)
 
-                # Check for retry/timeout mechanisms
-                if "retry" in content.lower():
-                    results["evidence"].append("⚠️ Retry mechanisms found - indicates loading instability")
+            # Check for retry/timeout mechanisms
+            if "retry" in content.lower():
+                results["evidence"].append("⚠️ Retry mechanisms found - indicates loading instability")
 
-                if "timeout" in content.lower():
-                    results["evidence"].append("⚠️ Timeout handling found - indicates performance issues")
+            if "timeout" in content.lower():
+                results["evidence"].append("⚠️ Timeout handling found - indicates performance issues")
 
         # Check for canvas polling timeout
         canvas_hook_file = os.path.join(self.codebase_path, "public", "js", "template-editor-canvas-hook.js")
         if os.path.exists(canvas_hook_file):
-            with open(canvas_hook_file, 'r') as f:
-                content = f.read()
+            content = self._read(canvas_hook_file)
 
-                # Look for polling timeouts
-                timeout_matches = re.findall(r"(\d+)\s*seconds?", content)
-                if timeout_matches:
-                    max_timeout = max(int(t) for t in timeout_matches)
-                    results["technical_details"]["max_polling_timeout"] = max_timeout
-                    results["evidence"].append(f"❌ Canvas polling timeout: {max_timeout} seconds")
+            # Look for polling timeouts
+            timeout_matches = re.findall(r"(\d+)\s*seconds?", content)
+            if timeout_matches:
+                max_timeout = max(int(t) for t in timeout_matches)
+                results["technical_details"]["max_polling_timeout"] = max_timeout
+                results["evidence"].append(f"❌ Canvas polling timeout: {max_timeout} seconds")
 
         # Check webpack extractor for failures
         webpack_file = os.path.join(self.codebase_path, "public", "js", "webpack-fabric-extractor.js")
         if os.path.exists(webpack_file):
-            with open(webpack_file, 'r') as f:
-                content = f.read()
+            content = self._read(webpack_file)
 
-                if "maximum attempts" in content.lower():
-                    results["evidence"].append("❌ Webpack extraction maximum attempts reached")
+            if "maximum attempts" in content.lower():
+                results["evidence"].append("❌ Webpack extraction maximum attempts reached")
 
-                if "__webpack_require__" in content:
-                    results["evidence"].append("⚠️ Webpack module access dependency found")
+            if "__webpack_require__" in content:
+                results["evidence"].append("⚠️ Webpack module access dependency found")
 
         return results
 
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+🛑 TASK CANCELLATION - Cancel tokens shared across loop, threads and processes
+A task, its sub-tasks and whatever runs them share one CancelToken. Async
+code is cancelled directly; code on worker threads polls the token (or calls
+check()) between units of work; on_cancel callbacks reach anything else,
+such as terminating a subprocess or revoking a remote lease.
+"""
+
+import logging
+import threading
+from typing import Any, Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class TaskCancelled(RuntimeError):
+    """Raised by CancelToken.check() once the token is cancelled"""
+
+
+class CancelToken:
+    """Thread-safe, one-way cancellation flag with callbacks"""
+
+    def __init__(self):
+        self.reason: Optional[str] = None
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: List[Callable[[], Any]] = []
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self, reason: str = "cancelled") -> bool:
+        """Cancel once and run the callbacks; False if it was already cancelled"""
+        with self._lock:
+            if self._event.is_set():
+                return False
+            self.reason = reason
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            self._run(callback)
+        return True
+
+    def on_cancel(self, callback: Callable[[], Any]):
+        """Run callback on cancellation, or right away if that already happened"""
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return
+        self._run(callback)
+
+    def check(self):
+        if self._event.is_set():
+            raise TaskCancelled(self.reason)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until cancelled or timeout; True if cancelled"""
+        return self._event.wait(timeout)
+
+    @staticmethod
+    def _run(callback: Callable[[], Any]):
+        try:
+            callback()
+        except Exception:
+            logger.exception("Cancel callback failed")
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+🔥 TASK PROFILER - Opt-in sampling profiler for tasks and analyzers
+A single background thread samples the stacks of every thread at a fixed
+interval, but only while a profiled task is running. Each sample is
+attributed to the tasks whose frames are on that stack (a task and its
+sub-tasks share one TaskProfile, including analyzers on worker threads) and
+to the innermost analyzer. A finished task gets a top-N hot-function table
+in its results and a collapsed-stack file for flamegraph.pl / speedscope.
+
+Enable for every task with HIVE_PROFILE=1, or per task (task_orchestrate
+profile=true). When off, the only cost is a `task.profile is None` check.
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from types import CodeType, FrameType
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+PROFILE_ENV = "HIVE_PROFILE"
+SAMPLE_INTERVAL = float(os.environ.get("HIVE_PROFILE_INTERVAL_MS", "5")) / 1000
+PROFILE_DIR = os.environ.get("HIVE_PROFILE_DIR",
+                             os.path.join(os.path.dirname(os.path.abspath(__file__)), ".hive_profiles"))
+TOP_N = 20
+
+
+def profiling_enabled() -> bool:
+    """True when HIVE_PROFILE asks for every task to be profiled"""
+    return os.environ.get(PROFILE_ENV, "").lower() in ("1", "true", "yes", "on")
+
+
+_labels: Dict[CodeType, str] = {}
+
+
+def _label(code: CodeType) -> str:
+    label = _labels.get(code)
+    if label is None:
+        # ";" separates frames in the collapsed format
+        label = _labels[code] = f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})".replace(";", ",")
+    return label
+
+
+class TaskProfile:
+    """Samples of one top-level task and its sub-tasks, split by analyzer"""
+
+    def __init__(self, task_id: str):
+        self.task_id = task_id
+        self.started = time.perf_counter()
+        self.samples = 0
+        # Stacks from the outermost profiled frame to the leaf
+        self.stacks: Counter = Counter()
+        self.analyzers: Dict[str, Counter] = {}
+        self._lock = threading.Lock()
+
+    def enter(self, frame: FrameType, analyzer: Optional[str] = None):
+        """Sample while `frame` is on a thread's stack; analyzer names the samples above it"""
+        sampler.add(frame, self, analyzer)
+
+    def exit(self, frame: FrameType):
+        sampler.remove(frame)
+
+    def record(self, stack: Tuple[str, ...], analyzer: Optional[str]):
+        with self._lock:
+            self.samples += 1
+            self.stacks[stack] += 1
+            if analyzer is not None:
+                self.analyzers.setdefault(analyzer, Counter())[stack] += 1
+
+    def report(self, top_n: int = TOP_N, directory: Optional[str] = None) -> Dict[str, Any]:
+        """Top-N table per task and per analyzer; the collapsed stacks go to <directory>/<task id>.collapsed"""
+        directory = directory or PROFILE_DIR
+        with self._lock:
+            stacks, samples = Counter(self.stacks), self.samples
+            analyzers = {name: Counter(counts) for name, counts in self.analyzers.items()}
+        report = {
+            "samples": samples,
+            "interval_ms": round(SAMPLE_INTERVAL * 1000, 3),
+            "wall_ms": round((time.perf_counter() - self.started) * 1000, 1),
+            "collapsed_file": None,
+            "top": hot_functions(stacks, top_n),
+            "analyzers": {
+                name: {"samples": sum(counts.values()), "top": hot_functions(counts, top_n)}
+                for name, counts in sorted(analyzers.items())
+            }
+        }
+        if stacks:
+            path = os.path.join(directory, f"{self.task_id}.collapsed")
+            try:
+                os.makedirs(directory, exist_ok=True)
+                with open(path, "w") as handle:
+                    handle.write(collapsed(stacks))
+                report["collapsed_file"] = path
+            except OSError as error:
+                logger.warning(f"Could not write profile for {self.task_id}: {error}")
+        return report
+
+
+def analyzer_name(analyzer: Union[str, Callable, None]) -> Optional[str]:
+    """Qualified name of an analyzer callable; functools.partial reports the wrapped function"""
+    if analyzer is None or isinstance(analyzer, str):
+        return analyzer
+    analyzer = getattr(analyzer, "func", analyzer)
+    return getattr(analyzer, "__qualname__", None) or type(analyzer).__name__
+
+
+class profiled:
+    """`with profiled(task.profile, analyzer):` profiles the enclosing function; a no-op for profile None"""
+
+    __slots__ = ("profile", "analyzer", "frame")
+
+    def __init__(self, profile: Optional[TaskProfile], analyzer: Union[str, Callable, None] = None):
+        self.profile = profile
+        self.analyzer = analyzer
+
+    def __enter__(self):
+        if self.profile is not None:
+            self.frame = sys._getframe(1)
+            self.profile.enter(self.frame, analyzer_name(self.analyzer))
+
+    def __exit__(self, *exc_info):
+        if self.profile is not None:
+            self.profile.exit(self.frame)
+
+
+class Sampler:
+    """Process-wide sampling thread; runs only while some profiled frame is registered"""
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL):
+        self.interval = interval
+        # id(frame) → (frame, profile, analyzer); the frame is held so its id stays unique
+        self._roots: Dict[int, Tuple[FrameType, TaskProfile, Optional[str]]] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def add(self, frame: FrameType, profile: TaskProfile, analyzer: Optional[str]):
+        with self._lock:
+            self._roots[id(frame)] = (frame, profile, analyzer)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="task-profiler", daemon=True)
+                self._thread.start()
+
+    def remove(self, frame: FrameType):
+        with self._lock:
+            self._roots.pop(id(frame), None)
+
+    def _run(self):
+        # Ticks are scheduled from a deadline: waiting for the GIL behind a busy thread
+        # must not stretch the interval, or CPU-bound work would be under-sampled
+        tick = time.monotonic()
+        while True:
+            tick = max(tick + self.interval, time.monotonic() - self.interval)
+            time.sleep(max(0.0, tick - time.monotonic()))
+            with self._lock:
+                if not self._roots:
+                    self._thread = None
+                    return
+                roots = dict(self._roots)
+            self.sample(roots)
+
+    def sample(self, roots: Dict[int, Tuple[FrameType, TaskProfile, Optional[str]]]):
+        me = threading.get_ident()
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == me:
+                continue
+            labels: List[str] = []
+            # profile → (depth of its outermost root, innermost analyzer)
+            hits: Dict[TaskProfile, List[Any]] = {}
+            while frame is not None:
+                labels.append(_label(frame.f_code))
+                root = roots.get(id(frame))
+                if root is not None and root[0] is frame:
+                    hit = hits.setdefault(root[1], [0, None])
+                    hit[0] = len(labels)
+                    if hit[1] is None:
+                        hit[1] = root[2]
+                frame = frame.f_back
+            for profile, (depth, analyzer) in hits.items():
+                profile.record(tuple(reversed(labels[:depth])), analyzer)
+
+
+sampler = Sampler()
+
+
+def collapsed(stacks: Counter) -> str:
+    """Brendan Gregg's folded format: `outer;inner;leaf count` per line"""
+    return "".join(f"{';'.join(stack)} {count}\n" for stack, count in stacks.most_common())
+
+
+def hot_functions(stacks: Counter, top_n: int = TOP_N) -> List[Dict[str, Any]]:
+    """Functions by self samples (leaf), with total (inclusive) samples alongside"""
+    total_samples = sum(stacks.values())
+    if not total_samples:
+        return []
+    own: Counter = Counter()
+    inclusive: Counter = Counter()
+    for stack, count in stacks.items():
+        own[stack[-1]] += count
+        for function in set(stack):
+            inclusive[function] += count
+    ranked = sorted(inclusive, key=lambda function: (own[function], inclusive[function]), reverse=True)
+    return [
+        {
+            "function": function,
+            "self_samples": own[function],
+            "self_pct": round(100 * own[function] / total_samples, 1),
+            "total_samples": inclusive[function],
+            "total_pct": round(100 * inclusive[function] / total_samples, 1)
+        }
+        for function in ranked[:top_n]
+    ]
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Admission Control Test
+Verifies token buckets per client and tool, queue-wait admission (reject
+and defer) and that both surface in MCP responses and swarm_status, sharded
+swarms included
+"""
+
+import asyncio
+import json
+import time
+
+import mcp_agent_orchestrator as server
+from admission_control import AdmissionController, RateLimiter, TokenBucket
+from mcp_agent_orchestrator import AgentOrchestrator, AgentType
+
+
+def test_token_bucket_bursts_then_refills():
+    bucket = TokenBucket(rate=10, burst=3)
+    now = bucket.updated
+    assert [bucket.take(now) for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert abs(bucket.take(now) - 0.1) < 1e-9
+    assert bucket.take(now + 0.11) == 0.0
+
+
+def test_rate_limits_are_per_client_and_tool():
+    limiter = RateLimiter({"task_status": (1, 2), "*": (1, 1)})
+    first, second = {}, {}
+    assert [limiter.acquire(first, "task_status") for _ in range(3)][:2] == [0.0, 0.0]
+    # Another client, and another tool for the same client, have their own buckets
+    assert limiter.acquire(second, "task_status") == 0.0
+    assert limiter.acquire(first, "agent_list") == 0.0
+    assert limiter.acquire(first, "agent_list") > 0
+    assert limiter.stats()["rejected"] == {"task_status": 1, "agent_list": 1}
+    assert RateLimiter({}).acquire(first, "anything") == 0.0
+
+
+def test_admission_follows_the_standing_queue():
+    async def scenario():
+        admission = AdmissionController(target=0.05, interval=0.2)
+        admission.enqueued("a")
+        assert (await admission.admit())[0]
+        await asyncio.sleep(0.08)
+        # "a" is still waiting: head-of-line age is over target
+        admitted, retry_after = await admission.admit()
+        assert not admitted and retry_after >= 0.08
+        admission.started("a")
+        # The slow start stays in the window until a faster one replaces it or it ages out
+        admission.enqueued("b")
+        admission.started("b")
+        assert admission.current_wait() < 0.05
+        assert (await admission.admit())[0]
+        return admission.stats()
+
+    stats = asyncio.run(scenario())
+    assert stats["admitted"] == 2 and stats["rejected"] == 1 and stats["queue_wait_ms"]["samples"] == 2
+    assert stats["queue_wait_ms"]["max"] >= 80
+
+
+def test_defer_mode_waits_for_the_queue_to_drain():
+    async def scenario():
+        admission = AdmissionController(target=0.05, interval=0.1, mode="defer", max_defer=1.0)
+        admission.enqueued("a")
+        await asyncio.sleep(0.08)
+        asyncio.get_running_loop().call_later(0.1, admission.started, "a")
+        start = time.perf_counter()
+        admitted, _ = await admission.admit()
+        return admitted, time.perf_counter() - start, admission.stats()
+
+    admitted, waited, stats = asyncio.run(scenario())
+    assert admitted and 0.05 < waited < 1.0
+    assert stats["deferred"] == 1 and stats["rejected"] == 0
+
+
+def test_mcp_rejects_tasks_while_queue_wait_is_over_target():
+    async def slow(task):
+        await asyncio.sleep(0.3)
+        return {"findings": {}}
+
+    async def scenario():
+        orchestrator = server.orchestrator = AgentOrchestrator(analyzer=slow, admission=AdmissionController(target=0.05))
+        orchestrator.swarm_config["tier_concurrency"] = {"team": 1}
+        orchestrator.create_agent("Lead", AgentType.COORDINATOR, ["coordination"])
+        orchestrator.create_agent("Coder", AgentType.CODER, ["php"])
+        orchestrator.create_agent("Researcher", AgentType.RESEARCHER, ["investigation"])
+        first = json.loads(await server.task_orchestrate("Analyze fabric loading"))
+        # The second team now queues behind the single team slot
+        await asyncio.sleep(0.15)
+        rejected = json.loads(await server.task_orchestrate("Analyze webpack bundle"))
+        status = json.loads(await server.swarm_status())
+        await orchestrator.wait_for_task(first["task_id"], timeout=2)
+        return first, rejected, status
+
+    original = server.orchestrator
+    try:
+        first, rejected, status = asyncio.run(scenario())
+    finally:
+        server.orchestrator = original
+
+    assert first["success"]
+    assert not rejected["success"] and rejected["retry_after"] >= 0.1
+    assert status["admission"]["rejected"] == 1 and status["admission"]["waiting"] >= 1
+
+
+def test_sharded_swarm_admits_and_reports_admission():
+    async def scenario():
+        server.orchestrator = AgentOrchestrator(admission=AdmissionController(target=0.2, mode="defer"))
+        await server.swarm_init(topology="mesh", shards=2)
+        try:
+            task = json.loads(await server.task_orchestrate("Analyze fabric loading"))
+            return task, json.loads(await server.swarm_status())
+        finally:
+            await server.swarm_init(topology="mesh")
+
+    original = server.orchestrator
+    try:
+        task, status = asyncio.run(scenario())
+    finally:
+        server.orchestrator = original
+
+    assert task["success"]
+    assert status["admission"]["mode"] == "defer" and status["admission"]["target_wait_ms"] == 200.0
+    assert status["admission"]["admitted"] == 1
+    assert [shard["admission"]["mode"] for shard in status["shards"]] == ["defer", "defer"]
+
+
+def test_mcp_tools_answer_rate_limited_calls_with_retry_after():
+    async def scenario():
+        server.orchestrator = AgentOrchestrator()
+        replies = [json.loads(await server.swarm_status()) for _ in range(3)]
+        return replies, json.loads(await server.session_info())
+
+    original, limits = server.orchestrator, dict(server.rate_limiter.limits)
+    server.rate_limiter.limits.update({"swarm_status": (0.5, 2)})
+    server._local_session.buckets.clear()
+    try:
+        replies, session = asyncio.run(scenario())
+    finally:
+        server.orchestrator = original
+        server.rate_limiter.limits.clear()
+        server.rate_limiter.limits.update(limits)
+        server._local_session.buckets.clear()
+
+    assert [reply["success"] for reply in replies] == [True, True, False]
+    assert "Rate limit" in replies[2]["error"] and 1.9 < replies[2]["retry_after"] <= 2.0
+    assert replies[1]["rate_limits"]["limits"]["swarm_status"] == {"rate": 0.5, "burst": 2}
+    assert session["rate_limited"] >= 1
+
+
+if __name__ == "__main__":
+    print("🧪 ADMISSION CONTROL TEST")
+    print("=" * 50)
+    for test in (test_token_bucket_bursts_then_refills, test_rate_limits_are_per_client_and_tool,
+                 test_admission_follows_the_standing_queue, test_defer_mode_waits_for_the_queue_to_drain,
+                 test_mcp_rejects_tasks_while_queue_wait_is_over_target, test_sharded_swarm_admits_and_reports_admission,
+                 test_mcp_tools_answer_rate_limited_calls_with_retry_after):
+        test()
+        print(f"   ✅ {test.__name__}")
+    print("\n🎉 ADMISSION CONTROL TESTS PASSED")
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Agent Event Bus Test
+Verifies the execution monitor flags a task whose work stops reporting
+progress, leaves finished and steadily reporting tasks alone, and that a
+hung phase of an operational plan is reported as stalled
+"""
+
+import asyncio
+import contextlib
+import io
+
+from agent_event_bus import AgentEventBus, EventType, ExecutionMonitor, ProgressReporter
+from operational_hive_mind import OperationalHiveMind
+
+TIMEOUT = 0.05
+
+
+async def run_with_monitor(work):
+    bus = AgentEventBus()
+    monitor = ExecutionMonitor(bus, heartbeat_timeout=TIMEOUT)
+    monitor.start()
+    try:
+        await work(bus)
+        await monitor.drain()
+        return monitor
+    finally:
+        await monitor.stop()
+
+
+def test_silent_task_is_flagged():
+    async def work(bus):
+        bus.emit(EventType.STARTED, "hung", "agent-1")
+        # Hangs without reporting; nothing beats on its behalf
+        await asyncio.sleep(TIMEOUT * 4)
+
+    monitor = asyncio.run(run_with_monitor(work))
+    status = monitor.get("hung")
+    assert status.state == "stalled" and status.stall_count == 1
+    assert monitor.summary() == {"stalled": 1}
+
+
+def test_finished_and_reporting_tasks_are_not_flagged():
+    async def work(bus):
+        bus.emit(EventType.STARTED, "done", "agent-1")
+        bus.emit(EventType.COMPLETED, "done", "agent-1")
+
+        report = ProgressReporter(bus, "busy", "agent-2")
+        bus.emit(EventType.STARTED, "busy", "agent-2")
+        for step in range(10):
+            await asyncio.sleep(TIMEOUT / 5)
+            if step % 2:
+                report((step + 1) / 10)
+            else:
+                report()
+        bus.emit(EventType.COMPLETED, "busy", "agent-2")
+
+    monitor = asyncio.run(run_with_monitor(work))
+    assert monitor.get("done").state == monitor.get("busy").state == "completed"
+    assert monitor.get("done").stall_count == monitor.get("busy").stall_count == 0
+    # Long after they finished, neither counts as stalled
+    assert monitor.check_stalls(now=monitor.get("busy").finished_at + 3600) == []
+
+
+def test_progress_revives_a_stalled_task():
+    bus = AgentEventBus()
+    monitor = ExecutionMonitor(bus, heartbeat_timeout=TIMEOUT)
+    report = ProgressReporter(bus, "slow", "agent-1")
+    queue = bus.subscribe()
+
+    bus.emit(EventType.STARTED, "slow", "agent-1")
+    monitor.apply(queue.get_nowait())
+    started = monitor.get("slow").started_at
+    assert monitor.check_stalls(now=started + TIMEOUT / 2) == []
+    assert monitor.check_stalls(now=started + TIMEOUT * 2) == ["slow"]
+
+    report(0.25, step="parsing")
+    event = queue.get_nowait()
+    assert (event.type, event.data) == (EventType.PROGRESS, {"progress": 0.25, "step": "parsing"})
+    monitor.apply(event)
+    status = monitor.get("slow")
+    assert status.state == "running" and status.progress == 0.25 and status.stall_count == 1
+
+
+def test_hung_plan_phase_is_stalled():
+    hive_mind = OperationalHiveMind()
+
+    async def runner(task, report):
+        if task.phase_key == "cors_headers":
+            await asyncio.sleep(TIMEOUT * 4)
+        else:
+            report(1.0)
+        return {}
+
+    async def execute():
+        hive_mind.monitor.heartbeat_timeout = TIMEOUT
+        await hive_mind.execute_plan(phase_runner=runner)
+        report = hive_mind.generate_execution_report()
+        await hive_mind.monitor.stop()
+        return report
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        hive_mind.deploy_specialized_agents()
+        hive_mind.create_master_execution_plan()
+        hive_mind.delegate_to_agents()
+        report = asyncio.run(execute())
+
+    assert report["stall_counts"]["cors_headers"] == 1
+    assert report["total_stalls"] == 1
+
+
+if __name__ == "__main__":
+    print("🧪 AGENT EVENT BUS TEST")
+    print("=" * 50)
+    for test in (test_silent_task_is_flagged, test_finished_and_reporting_tasks_are_not_flagged,
+                 test_progress_revives_a_stalled_task, test_hung_plan_phase_is_stalled):
+        test()
+        print(f"   ✅ {test.__name__}")
+    print("\n🎉 AGENT EVENT BUS TESTS PASSED")
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Analysis Daemon Test
+Verifies the tree index answers glob and listdir exactly as the filesystem
+does, that the file cache and index notice edits, and that the daemon serves
+analyze, task, stats and shutdown missions over its socket, warm on repeat,
+and cancels a mission on CANCEL or when its client goes away
+"""
+
+import asyncio
+import glob
+import os
+import subprocess
+import sys
+import tempfile
+
+from analysis_daemon import AnalysisDaemon
+from benchmarks.plugin_tree import TreeSpec, generate_tree
+from mission_client import ACCEPTED, ANALYZE, CANCELLED, DONE, RESULT, SHUTDOWN, STATS, TASK, run_mission, submit
+from tree_index import FileCache, TreeIndex
+from wire_protocol import MessageType, open_connection, read_frame, write_frame
+
+PATTERNS = ["**/*.php", "*.php", "**/*.js", "assets/**/*.js", "**/tests/*.html", "includes/*/*.php", "missing/**/*.js"]
+
+
+def analyzer_results(replies):
+    results = []
+    for reply in replies:
+        if reply["event"] == RESULT:
+            result = {key: value for key, value in reply["result"].items() if key != "timestamp"}
+            results.append((reply["analyzer"], result))
+    return results
+
+
+async def with_daemon(base, body):
+    daemon = AnalysisDaemon(files=FileCache())
+    address = await daemon.start(f"unix:{os.path.join(base, 'daemon.sock')}")
+    try:
+        return await body(daemon, address)
+    finally:
+        await daemon.close()
+
+
+def test_tree_index_matches_glob():
+    with tempfile.TemporaryDirectory() as base:
+        root = os.path.join(base, "tree")
+        generate_tree(root, TreeSpec(files=400, seed=3))
+        index = TreeIndex(root)
+        for pattern in PATTERNS:
+            assert index.glob(pattern) == glob.glob(os.path.join(root, pattern), recursive=True), pattern
+        assert index.listdir(root) == os.listdir(root)
+
+        misses = index.cache_info()["misses"]
+        assert index.glob("**/*.php") == glob.glob(os.path.join(root, "**/*.php"), recursive=True)
+        assert index.refresh() == 0 and index.cache_info()["misses"] == misses
+
+        # A new file changes its directory's mtime, and only that listing is re-read
+        php = index.glob("**/*.php")[0]
+        added = os.path.join(os.path.dirname(php), "class-added.php")
+        with open(added, "w") as handle:
+            handle.write("<?php\n")
+        os.utime(os.path.dirname(php), ns=(1, 1))
+        assert index.refresh() == 1
+        assert added in index.glob("**/*.php")
+        assert index.cache_info()["misses"] == misses + 1
+
+
+def test_file_cache_revalidates():
+    with tempfile.TemporaryDirectory() as base:
+        path = os.path.join(base, "plugin.php")
+        with open(path, "w") as handle:
+            handle.write("<?php // one")
+        files = FileCache()
+        assert files.read(path) == files.read(path) == "<?php // one"
+        assert files.cache_info() == {"hits": 1, "misses": 1, "files": 1, "chars": 12}
+
+        with open(path, "w") as handle:
+            handle.write("<?php // three")
+        assert files.read(path) == "<?php // three"
+        assert files.cache_info()["misses"] == 2 and files.chars == 14
+
+        small = FileCache(max_chars=20)
+        other = os.path.join(base, "other.php")
+        with open(other, "w") as handle:
+            handle.write("<?php // two")
+        small.read(path)
+        small.read(other)
+        assert small.cache_info()["files"] == 1 and small.chars == 12
+
+
+def test_repeat_mission_is_warm():
+    async def body(daemon, address):
+        mission = {"kind": ANALYZE, "codebase": root}
+        cold = await run_mission(mission, address)
+        warm = await run_mission(mission, address)
+        return daemon, cold, warm
+
+    with tempfile.TemporaryDirectory() as base:
+        root = os.path.join(base, "tree")
+        generate_tree(root, TreeSpec(files=300, seed=4))
+        daemon, cold, warm = asyncio.run(with_daemon(base, body))
+
+    assert [reply["event"] for reply in cold] == [ACCEPTED] + [RESULT] * 11 + [DONE]
+    assert cold[-1]["warm"] is False and warm[-1]["warm"] is True
+    assert analyzer_results(cold) == analyzer_results(warm)
+
+    first, second = cold[-1]["cache"], warm[-1]["cache"]
+    # The repeat re-read no file and re-listed no directory
+    assert second["files"]["misses"] == first["files"]["misses"] and second["files"]["hits"] > first["files"]["hits"]
+    assert second["index"]["misses"] == first["index"]["misses"] and warm[-1]["stale_directories"] == 0
+    assert daemon.counters["completed"] == 2 and not daemon._missions
+
+
+def test_unknown_analyzer_fails_the_mission():
+    async def body(daemon, address):
+        return await run_mission({"kind": ANALYZE, "codebase": base, "analyzers": ["_nope"]}, address)
+
+    with tempfile.TemporaryDirectory() as base:
+        replies = asyncio.run(with_daemon(base, body))
+    assert replies[-1]["event"] == "error" and "_nope" in replies[-1]["error"]
+
+
+def test_cancel_and_disconnect_stop_the_mission():
+    async def slow():
+        await asyncio.sleep(30)
+        return {}
+
+    async def body(daemon, address):
+        workspace, _ = daemon.workspace(base)
+        workspace.analyzers = {"slow": slow}
+        mission = {"kind": ANALYZE, "codebase": base}
+
+        reader, writer = await open_connection(address)
+        await write_frame(writer, MessageType.SUBMIT, {"mission_id": "m-1", **mission})
+        assert (await read_frame(reader))[1]["event"] == ACCEPTED
+        await write_frame(writer, MessageType.CANCEL, {"mission_id": "m-1"})
+        cancelled = (await read_frame(reader))[1]
+        writer.close()
+
+        # A client that goes away takes its missions with it
+        replies = submit(mission, address)
+        assert (await replies.__anext__())["event"] == ACCEPTED
+        await replies.aclose()
+        for _ in range(100):
+            if not daemon._missions:
+                break
+            await asyncio.sleep(0.01)
+        return daemon, cancelled
+
+    with tempfile.TemporaryDirectory() as base:
+        daemon, cancelled = asyncio.run(with_daemon(base, body))
+    assert cancelled["event"] == CANCELLED and cancelled["mission_id"] == "m-1"
+    assert daemon.counters["cancelled"] == 2 and not daemon._missions
+
+
+def test_task_stats_and_shutdown():
+    async def body(daemon, address):
+        first = await run_mission({"kind": TASK, "task": "Analyze fabric loading", "priority": "high"}, address)
+        agents = len(daemon.orchestrator.agents)
+        second = await run_mission({"kind": TASK, "task": "Review AJAX security"}, address)
+        stats = await run_mission({"kind": STATS}, address)
+        stop = await run_mission({"kind": SHUTDOWN}, address)
+        await asyncio.wait_for(daemon.wait_stopped(), 1.0)
+        return first, second, agents, daemon, stats[-1], stop[-1]
+
+    with tempfile.TemporaryDirectory() as base:
+        first, second, agents, daemon, stats, stop = asyncio.run(with_daemon(base, body))
+        assert not os.path.exists(os.path.join(base, "daemon.sock"))
+
+    assert first[-1]["status"] == second[-1]["status"] == "completed"
+    assert first[1]["task"]["assigned_agents"]
+    # The swarm stays registered between task missions
+    assert agents == len(daemon.orchestrator.agents) == second[-1]["agents"]
+    assert stats["event"] == DONE and stats["missions"]["completed"] == 2 and stats["agents"] == agents
+    assert stop["event"] == DONE
+
+
+def test_client_imports_no_analyzers():
+    code = "import sys, mission_client; print(any(m in sys.modules for m in "
+    code += "('standalone_agent_system', 'functional_hive_mind_orchestrator', 'agent_orchestrator_core')))"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                            cwd=os.path.dirname(os.path.abspath(__file__)))
+    assert output.stdout.strip() == "False", output.stderr
+
+
+if __name__ == "__main__":
+    print("🧪 ANALYSIS DAEMON TEST")
+    print("=" * 50)
+    for test in (test_tree_index_matches_glob, test_file_cache_revalidates, test_repeat_mission_is_warm,
+                 test_unknown_analyzer_fails_the_mission, test_cancel_and_disconnect_stop_the_mission,
+                 test_task_stats_and_shutdown, test_client_imports_no_analyzers):
+        test()
+        print(f"   ✅ {test.__name__}")
+    print("\n🎉 ANALYSIS DAEMON TESTS PASSED")
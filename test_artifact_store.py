@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Artifact Store Test
+Verifies content addressing, LRU spill to disk and lazy reload, that closing
+a store removes its spill files, and that analyzers read the input artifacts
+of their task
+"""
+
+import asyncio
+import os
+import tempfile
+
+from agent_orchestrator_core import AgentOrchestrator
+from artifact_store import ArtifactNotFound, ArtifactStore
+
+
+def phase_result(i: int, padding: int = 2_000) -> dict:
+    return {"analysis_type": f"phase_{i}", "findings": {"evidence": ["x" * padding]}, "index": i}
+
+
+def test_identical_content_is_stored_once():
+    store = ArtifactStore()
+    first = store.put({"b": 1, "a": [1, 2]})
+    second = store.put({"a": [1, 2], "b": 1})
+    assert first == second
+    assert first.startswith("sha256:")
+    assert len(store) == 1
+    assert store.get(first) == {"a": [1, 2], "b": 1}
+
+
+def test_spills_to_disk_and_reloads_lazily():
+    with tempfile.TemporaryDirectory() as spill_dir:
+        store = ArtifactStore(memory_limit=10_000, spill_dir=spill_dir)
+        ids = [store.put(phase_result(i)) for i in range(20)]
+
+        stats = store.stats()
+        assert stats["memory_bytes"] <= 10_000
+        assert stats["spills"] > 0
+        assert not store.info(ids[0]).resident
+
+        # Spilled artifacts come back intact and become resident again
+        assert store.get(ids[0]) == phase_result(0)
+        assert store.info(ids[0]).resident
+        assert store.stats()["disk_loads"] == 1
+
+
+def test_unknown_artifact_raises():
+    store = ArtifactStore()
+    try:
+        store.get("sha256:missing")
+    except ArtifactNotFound:
+        pass
+    else:
+        raise AssertionError("expected ArtifactNotFound")
+
+
+def test_close_removes_spilled_files():
+    store = ArtifactStore(memory_limit=10_000)
+    ids = [store.put(phase_result(i)) for i in range(10)]
+    spill_dir = store.spill_dir
+    assert os.listdir(spill_dir)
+    store.close()
+    assert not os.path.exists(spill_dir) and len(store) == 0 and store.memory_bytes == 0
+    # Usable again afterwards, in a fresh directory
+    assert store.get(store.put(phase_result(1))) == phase_result(1)
+
+    with tempfile.TemporaryDirectory() as spill_dir:
+        store = ArtifactStore(memory_limit=10_000, spill_dir=spill_dir)
+        for i in range(10):
+            store.put(phase_result(i))
+        with open(os.path.join(spill_dir, "keep.txt"), "w") as f:
+            f.write("not ours")
+        store.close()
+        # A caller's directory is only emptied of the store's own files
+        assert os.listdir(spill_dir) == ["keep.txt"]
+    assert ids[0] not in store
+
+
+def test_analyzers_read_input_artifacts():
+    orchestrator = AgentOrchestrator()
+    upstream = orchestrator.artifacts.put({"analysis_type": "implementation_plan", "confidence_level": "high"})
+    task = asyncio.run(orchestrator.run_task("Summarise the previous phase", artifacts=[upstream]))
+    assert task.results["builds_on"] == [
+        {"artifact": upstream, "analysis_type": "implementation_plan", "confidence_level": "high"}]
+    assert task.results["input_artifacts"] == {upstream: orchestrator.artifacts.info(upstream).size}
+
+    orchestrator.artifacts.memory_limit = 1
+    orchestrator.artifacts.put(phase_result(2))
+    spill_dir = orchestrator.artifacts.spill_dir
+    orchestrator.close()
+    assert not os.path.exists(spill_dir)
+
+
+if __name__ == "__main__":
+    print("🧪 ARTIFACT STORE TEST")
+    print("=" * 50)
+    for test in (test_identical_content_is_stored_once, test_spills_to_disk_and_reloads_lazily,
+                 test_unknown_artifact_raises, test_close_removes_spilled_files, test_analyzers_read_input_artifacts):
+        test()
+        print(f"   ✅ {test.__name__}")
+    print("\n🎉 ARTIFACT STORE TESTS PASSED")
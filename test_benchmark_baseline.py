@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Benchmark Baseline Test
+Verifies the Mann-Whitney U test against known values, that baselines are
+stored per machine fingerprint, and that the comparison gate fails only on
+significant p50/p95 regressions beyond the tolerance
+"""
+
+import contextlib
+import io
+import json
+import math
+import os
+import random
+import tempfile
+
+from benchmarks import baseline
+from benchmarks.machine import fingerprint, machine_info
+from benchmarks.stats import mann_whitney_u, summarize
+
+MACHINE = {**machine_info(), "fingerprint": "m1"}
+
+
+def report(samples_by_name, machine=MACHINE):
+    return {
+        "benchmark": "suite",
+        "machine": machine,
+        "results": {name: {"wall_ms": summarize(samples, 4), "samples": {"wall_ms": samples}}
+                    for name, samples in samples_by_name.items()}
+    }
+
+
+def samples(center, seed, count=20):
+    rng = random.Random(seed)
+    return [round(rng.gauss(center, center * 0.03), 4) for _ in range(count)]
+
+
+def run_cli(*argv):
+    out, err = io.StringIO(), io.StringIO()
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+        code = baseline.main(list(argv))
+    return code, out.getvalue(), err.getvalue()
+
+
+def test_mann_whitney_u_known_values():
+    # Completely separated samples of five: 1 of C(10, 5) = 252 arrangements
+    assert math.isclose(mann_whitney_u([6, 7, 8, 9, 10], [1, 2, 3, 4, 5])["p"], 1 / 252)
+    assert math.isclose(mann_whitney_u([1, 2, 3, 4, 5], [6, 7, 8, 9, 10], "two-sided")["p"], 2 / 252)
+    assert mann_whitney_u([1, 2, 3, 4, 5], [6, 7, 8, 9, 10])["p"] == 1.0
+    # Tied values: normal approximation with tie and continuity corrections
+    tied = mann_whitney_u([1, 2, 2, 3, 4, 5], [2, 6, 7, 8, 9, 10], "less")
+    assert tied["u"] == 4 and math.isclose(tied["p"], 0.014740, rel_tol=1e-4)
+    assert mann_whitney_u([3, 3], [3, 3])["p"] == 1.0
+
+
+def test_fingerprint_ignores_host_and_commit():
+    info = machine_info()
+    assert fingerprint(info) == fingerprint({**info, "hostname": "ci-runner-7", "git_commit": "abc1234"})
+    assert fingerprint(info) != fingerprint({**info, "cpus_usable": (info["cpus_usable"] or 0) + 1})
+
+
+def test_compare_verdicts():
+    before = report({"steady": samples(1.0, 1), "slower": samples(1.0, 2), "faster": samples(1.0, 3),
+                     "jittery": samples(1.0, 4, count=2), "dropped": samples(1.0, 5)})
+    after = report({"steady": samples(1.0, 6), "slower": samples(1.3, 7), "faster": samples(0.7, 8),
+                    "jittery": samples(2.0, 9, count=2), "added": samples(1.0, 10)})
+    rows = {row["benchmark"]: row for row in baseline.compare(before, after, tolerance=10)}
+    assert rows["steady"]["verdict"] == baseline.OK
+    assert rows["slower"]["verdict"] == baseline.REGRESSED and rows["slower"]["p50_p"] < 0.001
+    assert 25 < rows["slower"]["p50_delta_pct"] < 35
+    assert rows["faster"]["verdict"] == baseline.IMPROVED
+    # Two samples each can never reach p < 0.05, whatever the delta
+    assert rows["jittery"]["verdict"] == baseline.UNTESTED
+    assert (rows["added"]["verdict"], rows["dropped"]["verdict"]) == (baseline.NEW, baseline.MISSING)
+    assert [row["benchmark"] for row in baseline.regressions(list(rows.values()))] == ["slower"]
+    # A larger tolerance absorbs the same shift
+    assert baseline.regressions(baseline.compare(before, after, tolerance=50)) == []
+
+
+def test_p95_regression_with_a_steady_median():
+    steady = samples(1.0, 11, count=40)
+    tail = sorted(samples(1.0, 12, count=40))
+    tail[-8:] = [value * 1.6 for value in tail[-8:]]
+    row, = baseline.compare(report({"case": steady}), report({"case": tail}), tolerance=10)
+    assert abs(row["p50_delta_pct"]) < 10 and row["p95_delta_pct"] > 40
+    # The median did not move, so only the tail test can see it
+    assert row["p50_p"] > 0.05 and row["p95_p"] < 0.05 and row["verdict"] == baseline.REGRESSED
+    row, = baseline.compare(report({"case": steady}), report({"case": tail}), tolerance=10, p95_tolerance=80)
+    assert row["verdict"] == baseline.OK
+
+
+def test_cli_store_and_gate():
+    with tempfile.TemporaryDirectory() as directory:
+        paths = {}
+        for name, center, machine in (("base", 1.0, MACHINE), ("same", 1.0, MACHINE), ("slow", 1.5, MACHINE),
+                                      ("elsewhere", 1.0, {**MACHINE, "fingerprint": "m2"})):
+            paths[name] = os.path.join(directory, f"{name}.json")
+            with open(paths[name], "w") as handle:
+                json.dump(report({"orchestrator.run_task": samples(center, len(paths))}, machine), handle)
+        store = os.path.join(directory, "store")
+
+        assert run_cli("--dir", store, "compare", paths["same"])[0] == 2
+        assert run_cli("--dir", store, "save", paths["base"])[0] == 0
+        assert os.path.exists(os.path.join(store, "m1", "default.json"))
+
+        code, out, _ = run_cli("--dir", store, "compare", paths["same"])
+        assert code == 0 and "orchestrator.run_task" in out and "No regressions" in out
+        output = os.path.join(directory, "comparison.json")
+        code, out, _ = run_cli("--dir", store, "compare", paths["slow"], "--output", output)
+        assert code == 1 and "REGRESSED" in out.splitlines()[3]
+        with open(output) as handle:
+            assert json.load(handle)["regressions"] == 1
+
+        # No baseline for another machine, and a foreign one is refused unless asked for
+        assert run_cli("--dir", store, "compare", paths["elsewhere"])[0] == 2
+        assert run_cli("--dir", store, "compare", paths["elsewhere"], "--baseline", paths["base"])[0] == 2
+        assert run_cli("--dir", store, "compare", paths["elsewhere"], "--baseline", paths["base"], "--any-machine")[0] == 0
+        listed = json.loads(run_cli("--dir", store, "list")[1])
+        assert [(entry["fingerprint"], entry["name"], entry["benchmarks"]) for entry in listed] == [("m1", "default", 1)]
+
+
+if __name__ == "__main__":
+    print("🧪 BENCHMARK BASELINE TEST")
+    print("=" * 50)
+    for test in (test_mann_whitney_u_known_values, test_fingerprint_ignores_host_and_commit, test_compare_verdicts,
+                 test_p95_regression_with_a_steady_median, test_cli_store_and_gate):
+        test()
+        print(f"   ✅ {test.__name__}")
+    print("\n🎉 BENCHMARK BASELINE TESTS PASSED")
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Benchmark Suite Test
+Runs the standalone group end to end and checks the report schema: per-case
+summaries and raw samples, the run config and the machine block with its
+fingerprint
+"""
+
+import contextlib
+import io
+import json
+import os
+import tempfile
+
+from benchmarks import suite
+from benchmarks.machine import FINGERPRINT_FIELDS, fingerprint
+
+SUMMARY_KEYS = {"count", "mean", "stdev", "min", "p50", "p95", "p99", "max"}
+
+
+def run_suite(*argv):
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        assert suite.main(list(argv)) == 0
+    return out.getvalue()
+
+
+def test_standalone_group_report_schema():
+    with tempfile.TemporaryDirectory() as directory:
+        output = os.path.join(directory, "suite.json")
+        printed = run_suite("--groups", "standalone", "--repeat", "2", "--output", output)
+        with open(output) as handle:
+            report = json.load(handle)
+    assert json.loads(printed) == report
+
+    assert report["benchmark"] == "suite" and report["seconds"] >= 0
+    assert report["config"]["groups"] == ["standalone"] and report["config"]["repeat"] == 2
+    assert report["config"]["tree_sizes"] is None
+
+    assert report["results"]
+    for name, result in report["results"].items():
+        assert name.startswith("standalone.") and result["group"] == "standalone", name
+        assert result["unit"] == "ms/op" and result["number"] >= 1
+        for metric in ("wall_ms", "cpu_ms"):
+            assert set(result[metric]) == SUMMARY_KEYS and result[metric]["count"] == 2, name
+            assert result[metric]["min"] <= result[metric]["p50"] <= result[metric]["max"]
+            assert len(result["samples"][metric]) == 2
+
+    machine = report["machine"]
+    assert set(FINGERPRINT_FIELDS) <= set(machine) and {"hostname", "platform", "git_commit"} <= set(machine)
+    assert machine["fingerprint"] == fingerprint(machine)
+
+
+def test_list_names_the_selected_cases():
+    cases = run_suite("--groups", "standalone", "--list").split()
+    assert cases and all(case.startswith("standalone.") for case in cases)
+    assert run_suite("--groups", "standalone", "--filter", cases[0], "--list").split() == [cases[0]]
+
+
+if __name__ == "__main__":
+    print("🧪 BENCHMARK SUITE TEST")
+    print("=" * 50)
+    for test in (test_standalone_group_report_schema, test_list_names_the_selected_cases):
+        test()
+        print(f"   ✅ {test.__name__}")
+    print("\n🎉 BENCHMARK SUITE TESTS PASSED")
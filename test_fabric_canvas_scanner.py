@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Fabric Canvas Scanner Test
+Verifies canvas constructions and initialize() calls are found through
+aliases, imports and minified bundles, that initialize() on anything other
+than a canvas class is ignored, and that unchanged sources are served from
+the content-hash cache
+"""
+
+import os
+import tempfile
+
+from fabric_canvas_scanner import CanvasScanCache, find_canvas_sites, tokenize
+
+
+def sites(source):
+    return [(site.kind, site.expression, site.resolved) for site in find_canvas_sites(source)[0]]
+
+
+def test_aliases_resolve_to_fabric():
+    source = """
+        const f = window.fabric;
+        const { Canvas: C } = f;
+        import { StaticCanvas } from 'fabric';
+        const lib = require('fabric');
+        new f.Canvas('a');
+        new C('b');
+        new StaticCanvas('c');
+        lib.Canvas('d');
+    """
+    found, aliases, _ = find_canvas_sites(source)
+    assert aliases == {"f": "fabric", "lib": "fabric", "C": "fabric.Canvas", "StaticCanvas": "fabric.StaticCanvas"}
+    assert [(site.kind, site.expression, site.line) for site in found] == [
+        ("canvas_construction", "new f.Canvas (fabric.Canvas)", 6),
+        ("canvas_construction", "new C (fabric.Canvas)", 7),
+        ("canvas_construction", "new StaticCanvas (fabric.StaticCanvas)", 8),
+        ("canvas_construction", "lib.Canvas()", 9)
+    ]
+    assert all(site.resolved for site in found)
+
+
+def test_qualified_construction_without_new():
+    source = "window.fabric.Canvas(a); fabric.StaticCanvas(b); new window.fabric.Canvas(c); app.fabric.Canvas(d)"
+    assert sites(source) == [
+        ("canvas_construction", "window.fabric.Canvas()", True),
+        ("canvas_construction", "fabric.StaticCanvas()", True),
+        ("canvas_construction", "new window.fabric.Canvas (fabric.Canvas)", True)
+    ]
+
+
+def test_minified_bundle_construction():
+    source = 'var r=n(42);function o(e){return new r.Canvas(e,{selection:!1})}r.Canvas.prototype.initialize.call(this,e)'
+    assert sites(source) == [
+        ("canvas_construction", "new r.Canvas", False),
+        ("initialize_call", "r.Canvas.prototype.initialize() (fabric.Canvas.prototype)", False)
+    ]
+
+
+def test_initialize_calls_on_canvas_classes():
+    source = """
+        var Designer = fabric.util.createClass(fabric.Canvas, {
+            initialize: function (el, options) {
+                this.callSuper('initialize', el, options);
+            }
+        });
+        const Base = fabric.Canvas;
+        fabric.Canvas.prototype.initialize.call(this, el);
+        Base.prototype.initialize.apply(this, arguments);
+    """
+    assert sites(source) == [
+        ("initialize_call", "callSuper('initialize')", True),
+        ("initialize_call", "fabric.Canvas.prototype.initialize()", True),
+        ("initialize_call", "Base.prototype.initialize() (fabric.Canvas.prototype)", True)
+    ]
+
+
+def test_other_initialize_calls_are_not_sites():
+    assert sites("app.initialize(); Plugin.initialize(opts)") == []
+    assert sites("fabric.initialize(); fabric.Canvas.other.initialize(); this.initialize()") == []
+    # Strings, comments and regex literals are not code
+    assert sites("""var s = "new fabric.Canvas(x)"; // new fabric.Canvas(y)
+                    var r = /new fabric.Canvas/g; var t = `${a / b}`;""") == []
+    assert [token.kind for token in tokenize("a = /x\\/y/g")] == ["name", "punct", "regex"]
+
+
+def test_scan_cache_by_content_hash():
+    cache = CanvasScanCache(max_entries=2)
+    first = cache.scan_source("new fabric.Canvas('a')")
+    assert cache.scan_source("new fabric.Canvas('a')") is first
+    assert cache.cache_info() == {"hits": 1, "misses": 1, "entries": 1}
+
+    with tempfile.TemporaryDirectory() as base:
+        path = os.path.join(base, "canvas.js")
+        with open(path, "w") as handle:
+            handle.write("new fabric.Canvas('a')")
+        # Same content as the source scanned above: no second tokenize
+        assert cache.scan_file(path) is first and cache.scan_file(path) is first
+        assert cache.misses == 1
+
+        with open(path, "w") as handle:
+            handle.write("new fabric.StaticCanvas('b')")
+        os.utime(path, ns=(1, 1))
+        assert cache.scan_file(path).sites[0].expression == "new fabric.StaticCanvas"
+        assert cache.misses == 2
+
+    cache.scan_source("app.initialize()")
+    assert cache.cache_info()["entries"] == 2
+
+
+if __name__ == "__main__":
+    print("🧪 FABRIC CANVAS SCANNER TEST")
+    print("=" * 50)
+    for test in (test_aliases_resolve_to_fabric, test_qualified_construction_without_new,
+                 test_minified_bundle_construction, test_initialize_calls_on_canvas_classes,
+                 test_other_initialize_calls_are_not_sites,
+                 test_scan_cache_by_content_hash):
+        test()
+        print(f"   ✅ {test.__name__}")
+    print("\n🎉 FABRIC CANVAS SCANNER TESTS PASSED")
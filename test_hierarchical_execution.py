@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Hierarchical Execution Test
+Verifies coordinator → team fan-out/fan-in, that each team works on its own
+slice of the task, and per-tier concurrency limits
+"""
+
+import asyncio
+import time
+
+from agent_orchestrator_core import AgentOrchestrator, AgentType, TaskStatus
+
+TASK = "Analyze fabric.js loading failure"
+
+
+def build_swarm(coordinators: int, teams: int, team_size: int = 2) -> AgentOrchestrator:
+    orchestrator = AgentOrchestrator()
+    for c in range(coordinators):
+        orchestrator.create_agent(f"Coordinator{c}", AgentType.COORDINATOR, ["task_orchestration"])
+    for t in range(teams):
+        for m in range(team_size):
+            orchestrator.create_agent(f"Team{t}Agent{m}", AgentType.RESEARCHER, ["investigation"], team=f"team_{t}")
+    return orchestrator
+
+
+async def fixed_latency_analyzer(task):
+    """Every team's slice takes a full 0.1s, however the work is split"""
+    await asyncio.sleep(0.1)
+    return {"findings": {"slices": [list(task.work_slice)]}}
+
+
+async def run_task(orchestrator: AgentOrchestrator):
+    start = time.perf_counter()
+    task = orchestrator.orchestrate_task(TASK, priority="high")
+    await orchestrator.wait_for_task(task.id, timeout=10)
+    return task, time.perf_counter() - start
+
+
+def test_wall_time_scales_with_depth_not_agent_count():
+    """40 agents in 20 teams finish in about one analysis latency"""
+    orchestrator = build_swarm(coordinators=2, teams=20)
+    orchestrator.analyzer = fixed_latency_analyzer
+    task, elapsed = asyncio.run(run_task(orchestrator))
+
+    assert task.status == TaskStatus.COMPLETED
+    hierarchy = task.results["hierarchy"]
+    assert len(hierarchy["subtasks"]) == 2
+    teams = [team for node in hierarchy["subtasks"].values() for team in node["hierarchy"]["subtasks"]]
+    assert sorted(teams) == sorted(f"team_{t}" for t in range(20))
+    assert sorted(task.results["findings"]["slices"]) == [[t, 20] for t in range(20)]
+    # Each analysis sleeps 0.1s; 20 sequential teams would take 2s
+    assert elapsed < 0.5, elapsed
+
+
+def test_team_tier_limit_serializes_teams():
+    orchestrator = build_swarm(coordinators=1, teams=4)
+    orchestrator.swarm_config["tier_concurrency"] = {"team": 1}
+    orchestrator.analyzer = fixed_latency_analyzer
+    task, elapsed = asyncio.run(run_task(orchestrator))
+
+    assert task.status == TaskStatus.COMPLETED
+    assert elapsed >= 0.4, elapsed
+
+
+def test_teams_split_the_work_instead_of_repeating_it():
+    orchestrator = build_swarm(coordinators=2, teams=3)
+    flat = asyncio.run(AgentOrchestrator().run_task(TASK)).results
+    artifacts = [orchestrator.artifacts.put({"file": f"bundle-{i}.js"}) for i in range(7)]
+    task = asyncio.run(orchestrator.run_task(TASK, artifacts=artifacts, timeout=10))
+
+    teams = [orchestrator.tasks[team_id] for coordinator_id in task.subtasks
+             for team_id in orchestrator.tasks[coordinator_id].subtasks]
+    assert sorted(team.work_slice for team in teams) == [(0, 3), (1, 3), (2, 3)]
+    # Every check and input artifact is handled by exactly one team
+    evidence = [item for team in teams for item in team.results["findings"]["evidence"]]
+    assert sorted(evidence) == sorted(flat["findings"]["evidence"])
+    assert sorted(a for team in teams for a in team.artifacts) == sorted(artifacts)
+    assert all(len(team.artifacts) <= 3 for team in teams)
+
+    # The merged report is as complete as a single unsliced analysis
+    findings = task.results["findings"]
+    assert sorted(findings["evidence"]) == sorted(flat["findings"]["evidence"])
+    assert findings["technical_details"] == flat["findings"]["technical_details"]
+    assert set(task.results["input_artifacts"]) == set(artifacts)
+    assert sorted(entry["artifact"] for entry in task.results["builds_on"]) == sorted(artifacts)
+
+
+def test_merge_dedupes_findings_and_credits_each_agent_once():
+    orchestrator = build_swarm(coordinators=2, teams=3)
+    task, _ = asyncio.run(run_task(orchestrator))
+
+    evidence = task.results["findings"]["evidence"]
+    assert len(evidence) == 4 and len(evidence) == len(set(evidence))
+    # The root is credited through its sub-tasks, so nobody is counted twice
+    assert all(a.performance_metrics["tasks_completed"] == 1 for a in orchestrator.agents.values())
+    assert len(task.subtasks) == 2
+
+
+def test_without_coordinators_execution_stays_flat():
+    orchestrator = build_swarm(coordinators=0, teams=3)
+    task, _ = asyncio.run(run_task(orchestrator))
+    assert task.status == TaskStatus.COMPLETED
+    assert "hierarchy" not in task.results
+    assert task.subtasks == []
+
+
+if __name__ == "__main__":
+    print("🧪 HIERARCHICAL EXECUTION TEST")
+    print("=" * 50)
+    for test in (test_wall_time_scales_with_depth_not_agent_count, test_team_tier_limit_serializes_teams,
+                 test_teams_split_the_work_instead_of_repeating_it, test_merge_dedupes_findings_and_credits_each_agent_once,
+                 test_without_coordinators_execution_stays_flat):
+        test()
+        print(f"   ✅ {test.__name__}")
+    print("\n🎉 HIERARCHICAL EXECUTION TESTS PASSED")
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Import Time Test
+Verifies the orchestrator core imports without the MCP stack, that the server
+module still exposes the same engine objects, and that the -X importtime
+report is parsed into per-module rows
+"""
+
+import argparse
+import asyncio
+
+import agent_orchestrator_core
+import mcp_agent_orchestrator as server
+from benchmarks import suite
+from benchmarks.import_time import heaviest, import_profile, loaded_packages, measure_import, parse_importtime
+
+REPORT = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       383 |      46992 |   asyncio
+import time:        40 |         40 |     asyncio.log
+import time:      9020 |      85815 | agent_orchestrator_core
+"""
+
+
+def test_parse_importtime():
+    rows = parse_importtime("ignored line\n" + REPORT)
+    assert [(row["module"], row["depth"]) for row in rows] == [
+        ("_io", 1), ("asyncio", 1), ("asyncio.log", 2), ("agent_orchestrator_core", 0)]
+    assert rows[-1]["self_us"] == 9020 and rows[-1]["cumulative_us"] == 85815
+    assert loaded_packages(rows) == ["_io", "agent_orchestrator_core", "asyncio"]
+    assert [row["module"] for row in heaviest(rows, 2, "agent_orchestrator_core")] == ["asyncio", "_io"]
+
+
+def test_core_imports_without_mcp():
+    profile = import_profile("agent_orchestrator_core")
+    assert profile["import_ms"] > 0
+    packages = loaded_packages(profile["rows"])
+    assert "mcp" not in packages and "pydantic" not in packages
+    # Worker nodes and shards are only imported once a swarm asks for them
+    assert "worker_nodes" not in packages and "orchestrator_shards" not in packages
+    assert "mcp" in loaded_packages(import_profile("mcp_agent_orchestrator")["rows"])
+
+
+def test_server_reexports_the_core():
+    for name in ("AgentOrchestrator", "AgentType", "Task", "TaskStatus", "agent_info", "task_info", "analysis_kind"):
+        assert getattr(server, name) is getattr(agent_orchestrator_core, name)
+    assert isinstance(server.orchestrator, agent_orchestrator_core.AgentOrchestrator)
+
+
+def test_import_benchmark_and_suite_group():
+    result = measure_import("agent_orchestrator_core", repeat=2, warmup=0, top=3)
+    assert result["import_ms"]["count"] == 2 and result["mcp_stack"] == [] and len(result["heaviest"]) == 3
+
+    args = argparse.Namespace(groups=["imports"], filter=["core"], list=False, warmup=0, repeat=2)
+    report = asyncio.run(suite.run_suite(args))
+    timing = report["results"]["imports.agent_orchestrator_core"]
+    assert timing["group"] == "imports" and len(timing["samples"]["wall_ms"]) == 2
+    assert timing["wall_ms"]["p50"] > 0
+
+
+if __name__ == "__main__":
+    print("🧪 IMPORT TIME TEST")
+    print("=" * 50)
+    for test in (test_parse_importtime, test_core_imports_without_mcp, test_server_reexports_the_core,
+                 test_import_benchmark_and_suite_group):
+        test()
+        print(f"   ✅ {test.__name__}")
+    print("\n🎉 IMPORT TIME TESTS PASSED")
@@ -6,20 +6,54 @@ Tests the real functionality of our custom MCP agent orchestrator
 
 import asyncio
 import json
+import os
+import sys
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
+from mcp.client.streamable_http import streamablehttp_client
 
-async def test_agent_orchestrator():
-    """Test our custom MCP agent orchestrator with real fabric.js analysis"""
+AGENTS_TO_CREATE = [
+    {"agent_type": "researcher", "name": "FabricInvestigator", "capabilities": ["webpack_analysis", "fabric_investigation", "script_debugging"]},
+    {"agent_type": "analyst", "name": "RootCauseAnalyst", "capabilities": ["technical_analysis", "dependency_mapping", "error_diagnosis"]},
+    {"agent_type": "architect", "name": "SystemArchitect", "capabilities": ["system_design", "integration_planning", "recovery_strategy"]},
+    {"agent_type": "specialist", "name": "JavaScriptSpecialist", "capabilities": ["js_debugging", "browser_analysis", "performance_optimization"]}
+]
+
+FABRIC_TASK = """
+CRITICAL FABRIC.JS ANALYSIS REQUIRED:
+
+Investigation needed for yprint_designtool WordPress plugin:
+1. Why does fabric-global-exposer.js exist but isn't registered in class-octo-print-designer-public.php?
+2. How is fabric.js trapped in webpack scope instead of being exposed as window.fabric?
+3. What are the exact technical steps to fix the global exposure?
+4. Provide evidence-based findings with high confidence recommendations.
+
+Technical context: vendor.bundle.js contains fabric module, designer-global-exposer.js loads but fabric-global-exposer.js doesn't.
+"""
+
+def orchestrator_transport(url: str = None, errlog=sys.stderr, server_args: list = ()):
+    """Client transport to the orchestrator: a private stdio server, or a shared HTTP one at url
+
+    MCP_ORCHESTRATOR_URL sets url, e.g. http://127.0.0.1:8765/mcp after
+    `python mcp_agent_orchestrator.py --transport streamable-http`. A stdio
+    server gets server_args on its command line and writes stderr to errlog.
+    """
+    url = url or os.environ.get("MCP_ORCHESTRATOR_URL")
+    if url:
+        return streamablehttp_client(url)
 
     # Create server parameters for our MCP agent orchestrator
     server_params = StdioServerParameters(
-        command="python",
-        args=["mcp_agent_orchestrator.py"],
+        command=sys.executable,
+        args=[os.path.join(os.path.dirname(os.path.abspath(__file__)), "mcp_agent_orchestrator.py"), *server_args],
         env=None
     )
+    return stdio_client(server_params, errlog=errlog)
+
+async def test_agent_orchestrator():
+    """Test our custom MCP agent orchestrator with real fabric.js analysis"""
 
-    async with stdio_client(server_params) as (read, write):
+    async with orchestrator_transport() as (read, write, *_):
         async with ClientSession(read, write) as session:
 
             print("🚀 Testing MCP Agent Orchestrator...")
@@ -40,19 +74,12 @@ async def test_agent_orchestrator():
 
             # Test 2: Spawn specialized agents
             print("\n2️⃣ Spawning specialized agents...")
-            agents_to_create = [
-                {"type": "researcher", "name": "FabricInvestigator", "capabilities": ["webpack_analysis", "fabric_investigation", "script_debugging"]},
-                {"type": "analyst", "name": "RootCauseAnalyst", "capabilities": ["technical_analysis", "dependency_mapping", "error_diagnosis"]},
-                {"type": "architect", "name": "SystemArchitect", "capabilities": ["system_design", "integration_planning", "recovery_strategy"]},
-                {"type": "specialist", "name": "JavaScriptSpecialist", "capabilities": ["js_debugging", "browser_analysis", "performance_optimization"]}
-            ]
-
             agent_ids = []
-            for agent_config in agents_to_create:
+            for agent_config in AGENTS_TO_CREATE:
                 result = await session.call_tool("agent_spawn", agent_config)
                 agent_data = json.loads(result.content[0].text)
                 agent_ids.append(agent_data.get("agent_id"))
-                print(f"   ✅ Created {agent_config['type']}: {agent_data.get('agent_id')}")
+                print(f"   ✅ Created {agent_config['agent_type']}: {agent_data.get('agent_id')}")
 
             # Test 3: List all agents
             print("\n3️⃣ Listing all active agents...")
@@ -64,20 +91,9 @@ async def test_agent_orchestrator():
 
             # Test 4: Orchestrate REAL fabric.js analysis task
             print("\n4️⃣ Orchestrating REAL fabric.js analysis task...")
-            fabric_task = """
-            CRITICAL FABRIC.JS ANALYSIS REQUIRED:
-
-            Investigation needed for yprint_designtool WordPress plugin:
-            1. Why does fabric-global-exposer.js exist but isn't registered in class-octo-print-designer-public.php?
-            2. How is fabric.js trapped in webpack scope instead of being exposed as window.fabric?
-            3. What are the exact technical steps to fix the global exposure?
-            4. Provide evidence-based findings with high confidence recommendations.
-
-            Technical context: vendor.bundle.js contains fabric module, designer-global-exposer.js loads but fabric-global-exposer.js doesn't.
-            """
 
             result = await session.call_tool("task_orchestrate", {
-                "task": fabric_task,
+                "task": FABRIC_TASK,
                 "strategy": "adaptive",
                 "priority": "critical",
                 "max_agents": 4
@@ -157,4 +173,4 @@ async def test_agent_orchestrator():
             print("✅ Real agents providing actual technical analysis!")
 
 if __name__ == "__main__":
-    asyncio.run(test_agent_orchestrator())
\ No newline at end of file
+    asyncio.run(test_agent_orchestrator())
\ No newline at end of file
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+MCP HTTP Transport Test
+Starts one streamable-HTTP orchestrator and connects concurrent clients:
+they share agents and tasks but each keeps its own session state
+"""
+
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+
+from mcp import ClientSession
+from mcp.client.streamable_http import streamablehttp_client
+
+SERVER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "mcp_agent_orchestrator.py")
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(port: int) -> subprocess.Popen:
+    server = subprocess.Popen([sys.executable, SERVER, "--transport", "streamable-http", "--port", str(port)],
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + 15
+    while True:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return server
+        except OSError:
+            assert server.poll() is None, "server exited during start-up"
+            assert time.monotonic() < deadline, "server did not start"
+            time.sleep(0.05)
+
+
+async def call(session: ClientSession, tool: str, **arguments) -> dict:
+    result = await session.call_tool(tool, arguments)
+    return json.loads(result.content[0].text)
+
+
+async def client(url: str, name: str) -> dict:
+    async with streamablehttp_client(url) as (read, write, _):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            await call(session, "agent_spawn", agent_type="researcher", name=name, capabilities=["investigation"])
+            task = await call(session, "task_orchestrate", task=f"Analyze fabric.js loading failure ({name})")
+            # Both clients are connected here, so each sees the other's agent
+            await asyncio.sleep(0.3)
+            status = await call(session, "task_status", task_id=task["task_id"])
+            return {
+                "task": task,
+                "status": status,
+                "session": await call(session, "session_info"),
+                "agents": await call(session, "agent_list")
+            }
+
+
+async def two_clients(url: str):
+    return await asyncio.wait_for(asyncio.gather(client(url, "ClientA"), client(url, "ClientB")), 20)
+
+
+def test_concurrent_clients_share_one_orchestrator():
+    port = free_port()
+    server = start_server(port)
+    try:
+        first, second = asyncio.run(two_clients(f"http://127.0.0.1:{port}/mcp"))
+    finally:
+        server.terminate()
+        server.wait(10)
+
+    for run in (first, second):
+        assert run["status"]["status"] == "completed"
+        assert {a["name"] for a in run["agents"]["agents"]} == {"ClientA", "ClientB"}
+        assert run["session"]["connected_clients"] == 2
+        # Session state is per client: each sees only the task it orchestrated
+        assert run["session"]["task_ids"] == [run["task"]["task_id"]]
+        assert run["task"]["session_id"] == run["session"]["session_id"]
+    assert first["session"]["session_id"] != second["session"]["session_id"]
+
+
+if __name__ == "__main__":
+    print("🧪 MCP HTTP TRANSPORT TEST")
+    print("=" * 50)
+    for test in (test_concurrent_clients_share_one_orchestrator,):
+        test()
+        print(f"   ✅ {test.__name__}")
+    print("\n🎉 MCP HTTP TRANSPORT TESTS PASSED")
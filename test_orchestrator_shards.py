@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Orchestrator Shards Test
+Verifies consistent-hash routing, analyzer affinity, that every shard sees
+the whole agent registry, cross-shard aggregation, that finished tasks are
+forgotten by the router but still found, that each shard admits tasks by
+its own queue wait, and that requests to a dead shard fail instead of hanging
+"""
+
+import asyncio
+import time
+
+from agent_orchestrator_core import AgentType
+from orchestrator_shards import HashRing, ShardedOrchestrator, ShardError, ShardOverloaded
+
+
+async def slow_analyzer(task):
+    await asyncio.sleep(0.3)
+    return {"findings": {}}
+
+
+def test_adding_a_node_moves_about_one_nth_of_the_keys():
+    keys = [f"task-{i}" for i in range(2000)]
+    before = HashRing([0, 1, 2])
+    after = HashRing([0, 1, 2, 3])
+    moved = [key for key in keys if before.node_for(key) != after.node_for(key)]
+    # Every moved key goes to the new node, and roughly a quarter of them move
+    assert all(after.node_for(key) == 3 for key in moved)
+    assert 0.15 < len(moved) / len(keys) < 0.35, len(moved)
+
+
+def test_affinity_routes_one_analyzer_to_one_shard():
+    with ShardedOrchestrator(3, routing="affinity") as sharded:
+        shards = {sharded.shard_for_task(f"task-{i}", "Analyze fabric.js loading failure") for i in range(20)}
+        assert len(shards) == 1
+        results = sharded.run_batch(["Fabric canvas broken", "webpack bundle split"], timeout=10)
+    assert [r["status"] for r in results] == ["completed", "completed"]
+    assert results[0]["results"]["analysis_type"] == "fabric_js_loading_failure"
+
+
+def test_batch_completes_across_shards_and_status_aggregates():
+    with ShardedOrchestrator(2) as sharded:
+        for i in range(6):
+            sharded.create_agent(f"Agent{i}", AgentType.RESEARCHER, ["investigation"])
+        results = sharded.run_batch([f"Investigate issue {i}" for i in range(20)], timeout=10)
+        status = sharded.swarm_status()
+        agents = sharded.agent_list()
+
+    assert all(r["status"] == "completed" for r in results)
+    assert len({sharded.shard_for_task(r["task_id"], r["description"]) for r in results}) == 2
+    assert status["total_tasks"] == status["completed_tasks"] == 20
+    assert status["agent_count"] == len(agents) == 6
+    assert status["agents_by_type"]["researcher"] == 6
+    assert sum(shard["total_tasks"] for shard in status["shards"]) == 20
+    assert all(shard["agent_count"] == 6 for shard in status["shards"])
+    # Each task ran on one shard, yet the same three agents took part in all of them
+    assert [agent["performance"]["tasks_completed"] for agent in agents] == [20, 20, 20, 0, 0, 0]
+
+
+def test_tasks_on_every_shard_see_the_whole_swarm():
+    with ShardedOrchestrator(3) as sharded:
+        agent_ids = [sharded.create_agent(name, agent_type, ["analysis"])["id"] for name, agent_type in (
+            ("Researcher", AgentType.RESEARCHER), ("Architect", AgentType.ARCHITECT), ("Analyst", AgentType.ANALYST))]
+        results = sharded.run_batch([f"Fabric canvas broken on page {i}" for i in range(12)], timeout=10)
+
+    assert len({sharded.shard_for_task(r["task_id"], r["description"]) for r in results}) == 3
+    assert all(r["assigned_agents"] == agent_ids for r in results)
+
+
+def test_finished_tasks_leave_the_routing_table():
+    with ShardedOrchestrator(2) as sharded:
+        results = sharded.run_batch([f"Investigate issue {i}" for i in range(10)], timeout=10)
+        deadline = time.monotonic() + 5
+        while sharded.task_shards and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert sharded.task_shards == {}
+        # Still found by asking every shard
+        task_id = results[3]["task_id"]
+        assert sharded.task(task_id)["status"] == "completed"
+        assert sharded.wait_for_task(task_id)["task_id"] == task_id
+        assert sharded.cancel_task(task_id) is False
+        assert sharded.task("task-unknown") is None
+
+
+def test_shard_admission_rejects_over_target():
+    admission = {"target": 0.05, "interval": 1.0, "mode": "reject", "max_defer": 0.0}
+    with ShardedOrchestrator(1, analyzer=slow_analyzer, admission=admission) as sharded:
+        sharded.configure({"topology": "hierarchical", "tier_concurrency": {"team": 1}})
+        sharded.create_agent("Lead", AgentType.COORDINATOR, ["coordination"])
+        sharded.create_agent("Coder", AgentType.CODER, ["php"])
+        sharded.create_agent("Researcher", AgentType.RESEARCHER, ["investigation"])
+        first = sharded.orchestrate_task("Analyze fabric loading", admit=True)
+        # The second team now queues behind the single team slot
+        time.sleep(0.15)
+        try:
+            sharded.orchestrate_task("Analyze webpack bundle", admit=True)
+        except ShardOverloaded as e:
+            assert e.retry_after >= 0.1 and e.admission["waiting"] >= 1
+        else:
+            raise AssertionError("overloaded shard admitted a task")
+        # Without admit the blocking API still queues work regardless
+        sharded.orchestrate_task("Analyze phantom scripts")
+        sharded.wait_for_task(first["task_id"], timeout=5)
+        status = sharded.swarm_status()
+
+    assert status["admission"]["mode"] == "reject"
+    assert status["admission"]["admitted"] == status["admission"]["rejected"] == 1
+    assert status["shards"][0]["admission"]["queue_wait_ms"]["max"] >= 100
+
+
+def test_requests_to_a_dead_shard_fail():
+    with ShardedOrchestrator(2) as sharded:
+        shard = sharded.shards[1]
+        shard.process.terminate()
+        shard.process.join(5)
+        shard._reader.join(5)
+        for _ in range(2):
+            try:
+                shard.request("swarm_status").result(timeout=5)
+            except ShardError as e:
+                assert "exited" in str(e) or "shard 1" in str(e)
+            else:
+                raise AssertionError("request to a dead shard succeeded")
+        try:
+            sharded.swarm_status()
+        except ShardError:
+            pass
+        else:
+            raise AssertionError("swarm status ignored a dead shard")
+
+
+if __name__ == "__main__":
+    print("🧪 ORCHESTRATOR SHARDS TEST")
+    print("=" * 50)
+    for test in (test_adding_a_node_moves_about_one_nth_of_the_keys, test_affinity_routes_one_analyzer_to_one_shard,
+                 test_batch_completes_across_shards_and_status_aggregates, test_tasks_on_every_shard_see_the_whole_swarm,
+                 test_finished_tasks_leave_the_routing_table, test_shard_admission_rejects_over_target,
+                 test_requests_to_a_dead_shard_fail):
+        test()
+        print(f"   ✅ {test.__name__}")
+    print("\n🎉 ORCHESTRATOR SHARDS TESTS PASSED")
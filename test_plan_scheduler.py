@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Plan Scheduler Test
+Verifies phases are ordered by their dependencies, that cycles and unknown
+dependencies are rejected, that the critical path and slack follow the
+phase durations, and that the DAG scheduler overlaps independent phases and
+skips the dependents of a failed one
+"""
+
+import asyncio
+
+from plan_scheduler import DagScheduler, PhaseNode, PlanCycleError, critical_path, topological_order
+
+# A → (B, C) → D; A-B-D is the long branch
+DIAMOND = [
+    PhaseNode("D", ["B", "C"], 3.0),
+    PhaseNode("A", [], 2.0),
+    PhaseNode("B", ["A"], 5.0),
+    PhaseNode("C", ["A"], 1.0)
+]
+
+
+def test_topological_order():
+    assert topological_order(DIAMOND) == ["A", "B", "C", "D"]
+    # Independent phases keep their declaration order
+    assert topological_order([PhaseNode("z"), PhaseNode("y"), PhaseNode("x", ["z"])]) == ["z", "y", "x"]
+
+    try:
+        topological_order([PhaseNode("a", ["c"]), PhaseNode("b", ["a"]), PhaseNode("c", ["b"]), PhaseNode("d")])
+    except PlanCycleError as e:
+        assert str(e).endswith("phases: a, b, c")
+    else:
+        raise AssertionError("cycle not detected")
+
+    try:
+        topological_order([PhaseNode("a", ["missing"])])
+    except KeyError as e:
+        assert "missing" in str(e)
+    else:
+        raise AssertionError("unknown dependency accepted")
+
+
+def test_critical_path_and_slack():
+    path, timings, total = critical_path(DIAMOND)
+    assert path == ["A", "B", "D"] and total == 10.0
+    assert (timings["C"].earliest_start, timings["C"].latest_start, timings["C"].slack) == (2.0, 6.0, 4.0)
+    assert all(timings[phase].critical and timings[phase].slack == 0 for phase in path)
+    assert not timings["C"].critical
+    assert (timings["D"].earliest_start, timings["D"].latest_finish) == (7.0, 10.0)
+
+    # Measured durations override the estimates
+    path, timings, total = critical_path(DIAMOND, {"A": 1.0, "B": 1.0, "C": 6.0, "D": 1.0})
+    assert path == ["A", "C", "D"] and total == 8.0 and timings["B"].slack == 5.0
+
+    assert critical_path([]) == ([], {}, 0.0)
+
+
+def test_scheduler_overlaps_independent_phases():
+    running, peak = set(), []
+
+    async def runner(phase):
+        running.add(phase)
+        peak.append(set(running))
+        await asyncio.sleep({"A": 0.01, "B": 0.05, "C": 0.01, "D": 0.01}[phase])
+        running.discard(phase)
+        return phase.lower()
+
+    scheduler = DagScheduler(DIAMOND)
+    outcomes = asyncio.run(scheduler.run(runner))
+    assert list(outcomes) == ["A", "B", "C", "D"]
+    assert all(outcome.status == "completed" and outcome.result == phase.lower() for phase, outcome in outcomes.items())
+    assert {"B", "C"} in peak
+    assert outcomes["D"].started_at >= outcomes["B"].finished_at
+    assert scheduler.actual_critical_path()[0] == ["A", "B", "D"]
+
+    serial = DagScheduler(DIAMOND, max_concurrency=1)
+    peak.clear()
+    asyncio.run(serial.run(runner))
+    assert max(len(active) for active in peak) == 1
+
+
+def test_failed_phase_skips_its_dependents():
+    nodes = DIAMOND + [PhaseNode("E", ["D"]), PhaseNode("F", ["C"])]
+    ran = []
+
+    async def runner(phase):
+        ran.append(phase)
+        if phase == "B":
+            raise RuntimeError("agent crashed")
+        return phase
+
+    outcomes = asyncio.run(DagScheduler(nodes).run(runner))
+    assert outcomes["B"].status == "failed" and outcomes["B"].error == "agent crashed"
+    assert outcomes["D"].status == outcomes["E"].status == "skipped"
+    assert outcomes["D"].error == outcomes["E"].error == "dependency B failed"
+    assert outcomes["C"].status == outcomes["F"].status == "completed"
+    assert "D" not in ran and "E" not in ran
+
+
+if __name__ == "__main__":
+    print("🧪 PLAN SCHEDULER TEST")
+    print("=" * 50)
+    for test in (test_topological_order, test_critical_path_and_slack, test_scheduler_overlaps_independent_phases,
+                 test_failed_phase_skips_its_dependents):
+        test()
+        print(f"   ✅ {test.__name__}")
+    print("\n🎉 PLAN SCHEDULER TESTS PASSED")
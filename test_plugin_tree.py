@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Synthetic Plugin Tree Test
+Verifies generated trees are deterministic per seed, honour the file count,
+layout and hook density parameters, and that every analyzer runs against
+them and finds what the tree contains
+"""
+
+import asyncio
+import contextlib
+import io
+import json
+import os
+import re
+import tempfile
+
+from benchmarks.plugin_tree import MANIFEST, TreeSpec, ensure_tree, generate_tree
+from functional_hive_mind_orchestrator import FunctionalHiveMindOrchestrator
+from standalone_agent_system import StandaloneHiveMind
+
+
+def tree_contents(root: str) -> dict:
+    contents = {}
+    for folder, _, files in os.walk(root):
+        for name in files:
+            path = os.path.join(folder, name)
+            with open(path, "rb") as handle:
+                contents[os.path.relpath(path, root)] = handle.read()
+    return contents
+
+
+def test_same_seed_same_tree():
+    with tempfile.TemporaryDirectory() as base:
+        first, second, other = (os.path.join(base, name) for name in ("a", "b", "c"))
+        generate_tree(first, TreeSpec(files=300, seed=5))
+        generate_tree(second, TreeSpec(files=300, seed=5))
+        generate_tree(other, TreeSpec(files=300, seed=6))
+        assert tree_contents(first) == tree_contents(second)
+        assert tree_contents(first) != tree_contents(other)
+
+
+def test_spec_shapes_the_tree():
+    with tempfile.TemporaryDirectory() as base:
+        root = os.path.join(base, "tree")
+        manifest = generate_tree(root, TreeSpec(files=500, seed=1, per_dir=50, hook_density=10))
+        contents = tree_contents(root)
+        assert manifest["files"] == len(contents) - 1 == 500  # plus the manifest itself
+        assert all(count <= 50 for count in
+                   (len([n for n in files if n != MANIFEST]) for _, _, files in os.walk(root)))
+
+        bundles = [path for path in contents if path.endswith(".bundle.js")]
+        assert bundles and all(path + ".map" in contents for path in bundles)
+        assert any(re.search(r"tests/.*-test-\d+\.html$", path) for path in contents)
+
+        classes = [text for path, text in contents.items() if re.search(r"includes/.*class-.*\.php$", path)]
+        hooks = sum(len(re.findall(rb"add_(?:action|filter)\(", text)) for text in classes)
+        assert 7 < hooks / len(classes) < 13
+
+        sparse = generate_tree(os.path.join(base, "sparse"), TreeSpec(files=500, seed=1, hook_density=0, size_scale=0.5))
+        assert sparse["bytes"] < manifest["bytes"] / 1.5
+
+
+def test_ensure_tree_reuses_the_cache():
+    with tempfile.TemporaryDirectory() as cache:
+        spec = TreeSpec(files=200, seed=2)
+        root = ensure_tree(spec, cache)
+        with open(os.path.join(root, MANIFEST)) as handle:
+            assert json.load(handle)["digest"] == spec.digest()
+        marker = os.path.join(root, "docs", "marker")
+        open(marker, "w").close()
+        assert ensure_tree(spec, cache) == root and os.path.exists(marker)
+        assert ensure_tree(TreeSpec(files=200, seed=3), cache) != root
+
+
+def test_every_analyzer_runs_on_a_1k_tree():
+    async def scenario(root):
+        hive_mind = StandaloneHiveMind(codebase_path=root)
+        standalone = {name: await getattr(hive_mind, name)()
+                      for name in dir(hive_mind) if name.startswith("_analyze_")}
+        with contextlib.redirect_stdout(io.StringIO()):
+            orchestrator = FunctionalHiveMindOrchestrator(project_path=root, simulated_delay=0)
+        functional = [await orchestrator._fabric_audit_analysis(),
+                      await orchestrator._canvas_integration_analysis(),
+                      await orchestrator._performance_monitoring_analysis(),
+                      await orchestrator._architecture_review_analysis()]
+        return standalone, functional
+
+    with tempfile.TemporaryDirectory() as base:
+        root = os.path.join(base, "tree")
+        manifest = generate_tree(root, TreeSpec(files=1000, seed=0))
+        standalone, (fabric, canvas, bundles, architecture) = asyncio.run(scenario(root))
+
+    assert len(standalone) == 7 and all(result["evidence"] for result in standalone.values())
+    assert standalone["_analyze_php_architecture"]["technical_details"]["plugin_version"]
+    assert standalone["_analyze_performance_bottlenecks"]["technical_details"]["max_polling_timeout"] == 30
+    assert fabric["initialization_points"] and canvas["test_files_found"] == manifest["by_kind"]["html"]
+    assert bundles["bundle_files_analyzed"] == manifest["by_kind"]["bundle"] // 2
+    # Entry files add the main plugin, WooCommerce integration and admin classes
+    assert architecture["codebase_analysis"]["php_files"] == manifest["by_kind"]["php"] + 3
+
+
+if __name__ == "__main__":
+    print("🧪 SYNTHETIC PLUGIN TREE TEST")
+    print("=" * 50)
+    for test in (test_same_seed_same_tree, test_spec_shapes_the_tree, test_ensure_tree_reuses_the_cache,
+                 test_every_analyzer_runs_on_a_1k_tree):
+        test()
+        print(f"   ✅ {test.__name__}")
+    print("\n🎉 SYNTHETIC PLUGIN TREE TESTS PASSED")
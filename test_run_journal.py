@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Run Journal Test
+Verifies a resumed run skips the phases it already completed, re-runs the
+ones that failed or never finished, and survives a torn last line left by a
+crash mid-write
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import tempfile
+
+from run_journal import RunJournal, add_resume_argument, open_journal
+
+
+def run_plan(journal, calls, fail=()):
+    """Three phases; each records its call and fails while named in fail"""
+
+    async def phase(name, value):
+        calls.append(name)
+        if name in fail:
+            raise RuntimeError(f"{name} broke")
+        return {"value": value}
+
+    async def plan():
+        first = await journal.run_phase("collect", phase, "collect", 1, inputs={"step": 1})
+        second = await journal.run_phase("analyze", phase, "analyze", first["value"] + 1)
+        return await journal.run_phase("report", phase, "report", second["value"] + 1)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        return asyncio.run(plan())
+
+
+def test_resume_skips_completed_and_reruns_failed():
+    with tempfile.TemporaryDirectory() as directory:
+        journal = RunJournal(directory=directory, kind="test")
+        calls = []
+        try:
+            run_plan(journal, calls, fail={"analyze"})
+        except RuntimeError:
+            pass
+        else:
+            raise AssertionError("failing phase did not raise")
+        assert calls == ["collect", "analyze"]
+        assert journal.completed_phases() == ["collect"] and journal.unfinished_phases() == ["analyze"]
+        assert journal.phases["analyze"].error == "analyze broke"
+
+        # What --resume RUN_ID does in the mission scripts
+        args = add_resume_argument(argparse.ArgumentParser()).parse_args(["--resume", journal.run_id])
+        with contextlib.redirect_stdout(io.StringIO()):
+            resumed = open_journal(args.resume, "test", directory)
+        assert resumed.resumed and resumed.outputs("collect") == {"value": 1}
+        assert resumed.phases["collect"].inputs == {"step": 1}
+
+        calls.clear()
+        assert run_plan(resumed, calls) == {"value": 3}
+        # The completed phase came from the journal; the failed one ran again
+        assert calls == ["analyze", "report"]
+        assert resumed.completed_phases() == ["collect", "analyze", "report"]
+
+        calls.clear()
+        run_plan(RunJournal.resume(journal.run_id, directory), calls)
+        assert calls == []
+
+
+def test_torn_last_line_is_dropped():
+    with tempfile.TemporaryDirectory() as directory:
+        journal = RunJournal(directory=directory, kind="test")
+        run_plan(journal, [])
+        with open(journal.path, "rb") as f:
+            lines = f.read().splitlines(keepends=True)
+        # Crash while writing the last record: only half of it reached the disk
+        with open(journal.path, "wb") as f:
+            f.writelines(lines[:-1])
+            f.write(lines[-1][:len(lines[-1]) // 2])
+
+        resumed = RunJournal.resume(journal.run_id, directory)
+        assert resumed.completed_phases() == ["collect", "analyze"]
+        assert resumed.phases["report"].status == "started"
+
+        calls = []
+        run_plan(resumed, calls)
+        assert calls == ["report"]
+        # The record appended after the torn line replays intact
+        with open(journal.path) as f:
+            assert [json.loads(line)["phase"] for line in f][-2:] == ["report", "report"]
+        assert RunJournal.resume(journal.run_id, directory).completed_phases() == ["collect", "analyze", "report"]
+
+
+def test_unknown_run_and_unserialisable_outputs():
+    with tempfile.TemporaryDirectory() as directory:
+        try:
+            RunJournal.resume("run-missing", directory)
+        except FileNotFoundError as e:
+            assert "run-missing" in str(e)
+        else:
+            raise AssertionError("unknown run id resumed")
+
+        journal = RunJournal(directory=directory, kind="test")
+        with contextlib.redirect_stdout(io.StringIO()):
+            outputs = journal.run_phase_sync("sets", lambda: {"tags": {"b"}, "pair": (1, 2), "path": object})
+        assert outputs["tags"] == ["b"] and outputs["pair"] == [1, 2] and outputs["path"] == str(object)
+        assert os.path.basename(journal.path).startswith("test-")
+
+
+if __name__ == "__main__":
+    print("🧪 RUN JOURNAL TEST")
+    print("=" * 50)
+    for test in (test_resume_skips_completed_and_reruns_failed, test_torn_last_line_is_dropped,
+                 test_unknown_run_and_unserialisable_outputs):
+        test()
+        print(f"   ✅ {test.__name__}")
+    print("\n🎉 RUN JOURNAL TESTS PASSED")
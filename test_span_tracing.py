@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Span Tracing Test
+Verifies spans are free when tracing is off, nest end to end from the MCP
+tool call down to file reads (across asyncio tasks and executor threads),
+stay within the ring buffer, and export as Chrome trace JSON with one lane
+per task or thread, inline or saved under a generated name in the trace
+directory
+"""
+
+import asyncio
+import contextlib
+import inspect
+import io
+import json
+import os
+import tempfile
+
+import mcp_agent_orchestrator as server
+import span_tracing
+from benchmarks.plugin_tree import TreeSpec, generate_tree
+from mcp_agent_orchestrator import AgentOrchestrator
+from span_tracing import NO_SPAN, Tracer, export_chrome_trace, read_file, span, tracer
+from standalone_agent_system import AgentType, StandaloneHiveMind
+from workflow_pipeline import PipelinePhase, WorkflowPipeline
+
+FIXTURE = os.path.abspath(__file__)
+
+
+def with_tracing(test):
+    """Run test with the process-wide tracer on and empty"""
+    def wrapper():
+        was_enabled = tracer.enabled
+        tracer.clear()
+        tracer.enable()
+        try:
+            return test()
+        finally:
+            tracer.enabled = was_enabled
+            tracer.clear()
+    wrapper.__name__ = test.__name__
+    return wrapper
+
+
+def reading_analyzer(task):
+    read_file(FIXTURE)
+    return {"findings": {}}
+
+
+def by_name(spans):
+    named = {}
+    for s in spans:
+        named.setdefault(s.name, []).append(s)
+    return named
+
+
+def test_off_by_default():
+    assert not tracer.enabled
+    with span("unused", key="value") as active:
+        active.set(more=1)
+    assert active is NO_SPAN and not tracer.snapshot()
+    assert tracer.record("queue_wait", 0) is None
+
+
+@with_tracing
+def test_task_spans_nest_down_to_file_reads():
+    async def scenario():
+        orchestrator = AgentOrchestrator(analyzer=reading_analyzer)
+        with span("request") as request:
+            task = orchestrator.orchestrate_task("Analyze webpack bundle")
+        await orchestrator.wait_for_task(task.id, timeout=5)
+        return request, task
+
+    request, task = asyncio.run(scenario())
+    spans = tracer.snapshot(request.trace_id)
+    named = by_name(spans)
+    parents = {s.span_id: s for s in spans}
+
+    orchestrate, = named["orchestrate_task"]
+    execute, = named["execute_task"]
+    wait, = named["queue_wait"]
+    analyzer, = named["analyzer"]
+    read, = named["file.read"]
+    assert orchestrate.parent_id == request.span_id
+    assert execute.parent_id == orchestrate.span_id and execute.attributes["status"] == "completed"
+    assert wait.parent_id == execute.span_id and wait.attributes["task_id"] == task.id
+    # The sync analyzer ran on an executor thread and still nests under its task
+    assert parents[analyzer.parent_id] is execute and analyzer.attributes["analyzer"] == "reading_analyzer"
+    assert analyzer.lane.startswith("thread ") and execute.lane == f"task {task.id}"
+    assert read.parent_id == analyzer.span_id
+    assert read.attributes == {"path": FIXTURE, "bytes": len(read_file(FIXTURE))}
+
+
+@with_tracing
+def test_standalone_analyzers_run_one_after_another():
+    async def scenario(root):
+        hive_mind = StandaloneHiveMind(codebase_path=root)
+        hive_mind.create_agent("Architect", AgentType.ARCHITECT,
+                               ["architecture", "javascript", "database", "woocommerce", "data", "security", "performance"])
+        task = hive_mind.orchestrate_task("System design review")
+        await hive_mind.execute_task(task.id)
+
+    with tempfile.TemporaryDirectory() as base:
+        root = os.path.join(base, "tree")
+        generate_tree(root, TreeSpec(files=200, seed=0))
+        with contextlib.redirect_stdout(io.StringIO()):
+            asyncio.run(scenario(root))
+
+    named = by_name(tracer.snapshot())
+    delegate, = named["StandaloneHiveMind._delegate_to_agents"]
+    analyzers = sorted((s for name, group in named.items() if "._analyze_" in name for s in group),
+                       key=lambda s: s.start_ns)
+    assert len(analyzers) == 7 and all(s.parent_id == delegate.span_id for s in analyzers)
+    # Sequential awaits: no analyzer starts before the previous one ends
+    assert all(prev.end_ns <= nxt.start_ns for prev, nxt in zip(analyzers, analyzers[1:]))
+    reads = named["file.read"]
+    assert reads and all(s.attributes["path"].startswith(root) and s.attributes["bytes"] > 0 for s in reads)
+
+
+@with_tracing
+def test_workflow_phases_get_their_own_lanes():
+    async def phase(context):
+        await asyncio.sleep(0.01)
+        return {}
+
+    pipeline = WorkflowPipeline([PipelinePhase("analysis", phase), PipelinePhase("review", phase)])
+    asyncio.run(pipeline.run())
+
+    named = by_name(tracer.snapshot())
+    workflow, = named["workflow"]
+    phases = {s.attributes["phase"]: s for s in named["phase"]}
+    assert set(phases) == {"analysis", "review"}
+    assert all(s.parent_id == workflow.span_id for s in phases.values())
+    assert {s.lane for s in phases.values()} == {"task phase analysis", "task phase review"}
+
+
+def test_ring_buffer_keeps_the_newest_spans():
+    ring = Tracer(capacity=3, enabled=True)
+    for i in range(5):
+        with ring.span("step", i=i):
+            pass
+    assert [s.attributes["i"] for s in ring.snapshot()] == [2, 3, 4]
+    assert ring.stats() == {"enabled": True, "spans": 3, "capacity": 3, "dropped": 2}
+    ring.enable(capacity=5)
+    assert len(ring.snapshot()) == 3 and ring.spans.maxlen == 5
+
+
+def test_chrome_trace_format():
+    ring = Tracer(enabled=True)
+    with ring.span("outer") as outer:
+        with ring.span("inner", path="a.js"):
+            pass
+        ring.record("queue_wait", outer.start_ns)
+    try:
+        with ring.span("broken"):
+            raise ValueError("bad input")
+    except ValueError:
+        pass
+
+    events = export_chrome_trace(ring.snapshot())["traceEvents"]
+    complete = {e["name"]: e for e in events if e["ph"] == "X"}
+    assert set(complete) == {"outer", "inner", "broken"}
+    assert complete["outer"]["ts"] == 0 and complete["inner"]["args"]["path"] == "a.js"
+    assert complete["inner"]["args"]["parent_id"] == complete["outer"]["args"]["span_id"]
+    assert complete["broken"]["args"]["error"] == "ValueError: bad input"
+    begin, end = (e for e in events if e["name"] == "queue_wait")
+    assert (begin["ph"], end["ph"]) == ("b", "e") and begin["id"] == end["id"] and end["ts"] >= begin["ts"]
+    lanes = [e for e in events if e["ph"] == "M"]
+    assert len(lanes) == 1 and lanes[0]["args"]["name"].startswith("thread ")
+    json.dumps(events)
+
+
+@with_tracing
+def test_mcp_trace_export():
+    async def scenario():
+        server.orchestrator = AgentOrchestrator(analyzer=reading_analyzer)
+        await server.agent_spawn("researcher", "Researcher", ["investigation"])
+        started = json.loads(await server.task_orchestrate("Analyze webpack bundle"))
+        await server.orchestrator.wait_for_task(started["task_id"], timeout=5)
+        inline = json.loads(await server.trace_export(started["trace_id"]))
+        saved = json.loads(await server.trace_export(started["trace_id"], save=True))
+        return started, inline, saved
+
+    original, trace_dir = server.orchestrator, span_tracing.TRACE_DIR
+    with tempfile.TemporaryDirectory() as directory:
+        span_tracing.TRACE_DIR = directory
+        try:
+            started, inline, saved = asyncio.run(scenario())
+        finally:
+            server.orchestrator, span_tracing.TRACE_DIR = original, trace_dir
+        # Saved traces land in the trace directory under a generated name
+        assert os.path.dirname(saved["path"]) == directory and os.listdir(directory) == [os.path.basename(saved["path"])]
+        with open(saved["path"]) as handle:
+            assert json.load(handle)["traceEvents"] == inline["trace"]["traceEvents"]
+
+    # A client-chosen path is not a parameter at all
+    assert "path" not in inspect.signature(server.trace_export).parameters
+    events = inline["trace"]["traceEvents"]
+    assert inline["success"] and inline["spans"] == saved["spans"] >= 6
+    names = {e["name"] for e in events}
+    assert {"mcp.task_orchestrate", "orchestrate_task", "execute_task", "queue_wait", "analyzer", "file.read"} <= names
+    assert all(e["args"]["trace_id"] == started["trace_id"] for e in events if e["ph"] in ("X", "b"))
+
+
+if __name__ == "__main__":
+    print("🧪 SPAN TRACING TEST")
+    print("=" * 50)
+    for test in (test_off_by_default, test_task_spans_nest_down_to_file_reads,
+                 test_standalone_analyzers_run_one_after_another, test_workflow_phases_get_their_own_lanes,
+                 test_ring_buffer_keeps_the_newest_spans, test_chrome_trace_format, test_mcp_trace_export):
+        test()
+        print(f"   ✅ {test.__name__}")
+    print("\n🎉 SPAN TRACING TESTS PASSED")
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Swarm Counters Test
+Verifies swarm_status tallies stay exact across task transitions and that
+agent_list serves a cached snapshot plus since_version deltas
+"""
+
+import asyncio
+import json
+from collections import Counter
+
+import mcp_agent_orchestrator as server
+from mcp_agent_orchestrator import AgentOrchestrator, AgentType, TaskStatus
+
+
+def scanned_counts(orchestrator: AgentOrchestrator) -> dict:
+    """What the counters must equal: a full scan of agents and tasks"""
+    statuses = Counter(task.status.value for task in orchestrator.tasks.values())
+    agent_types = Counter(agent.type.value for agent in orchestrator.agents.values())
+    return {
+        "agent_count": len(orchestrator.agents),
+        "task_status": {status.value: statuses[status.value] for status in TaskStatus},
+        "total_tasks": len(orchestrator.tasks),
+        "agents_by_type": {agent_type.value: agent_types[agent_type.value] for agent_type in AgentType}
+    }
+
+
+def test_counters_follow_task_transitions():
+    def analyzer(task):
+        if "broken" in task.description:
+            raise RuntimeError("analysis failed")
+        return {"findings": {}}
+
+    async def scenario():
+        orchestrator = AgentOrchestrator(analyzer=analyzer)
+        orchestrator.swarm_config["topology"] = "mesh"
+        orchestrator.create_agent("Researcher", AgentType.RESEARCHER, ["investigation"])
+        orchestrator.create_agent("Analyst", AgentType.ANALYST, ["root_cause"])
+        tasks = [orchestrator.orchestrate_task(f"Analyze webpack bundle {i}") for i in range(3)]
+        tasks.append(orchestrator.orchestrate_task("Analyze broken bundle"))
+        pending = orchestrator.status_counts()
+        for task in tasks:
+            await orchestrator.wait_for_task(task.id, timeout=5)
+        return orchestrator, pending
+
+    orchestrator, pending = asyncio.run(scenario())
+    assert pending["task_status"]["pending"] == 4
+    counts = orchestrator.status_counts()
+    assert counts == scanned_counts(orchestrator)
+    assert counts["task_status"] == {"pending": 0, "in_progress": 0, "completed": 3, "failed": 1, "cancelled": 0}
+    assert counts["agents_by_type"]["researcher"] == 1 and counts["agents_by_type"]["analyst"] == 1
+
+
+def test_hierarchical_subtasks_are_counted():
+    async def scenario():
+        orchestrator = AgentOrchestrator(analyzer=lambda task: {"findings": {"team": [task.team]}})
+        orchestrator.create_agent("Lead", AgentType.COORDINATOR, ["coordination"])
+        orchestrator.create_agent("Coder", AgentType.CODER, ["php"])
+        orchestrator.create_agent("Researcher", AgentType.RESEARCHER, ["investigation"])
+        await orchestrator.run_task("Analyze fabric loading", timeout=5)
+        return orchestrator
+
+    orchestrator = asyncio.run(scenario())
+    counts = orchestrator.status_counts()
+    assert counts == scanned_counts(orchestrator)
+    # Root, one coordinator and two teams
+    assert counts["task_status"]["completed"] == counts["total_tasks"] == 4
+
+
+def test_agent_snapshot_versions_and_deltas():
+    async def scenario():
+        orchestrator = AgentOrchestrator(analyzer=lambda task: {"findings": {}})
+        orchestrator.swarm_config["topology"] = "mesh"
+        first = orchestrator.create_agent("Researcher", AgentType.RESEARCHER, ["investigation"])
+        orchestrator.create_agent("Architect", AgentType.ARCHITECT, ["system_design"])
+        full = orchestrator.agent_snapshot()
+        assert orchestrator.agent_snapshot() is not full and orchestrator.agent_snapshot()["agents"] is full["agents"]
+        assert orchestrator.agent_snapshot(full["version"]) == {"version": full["version"], "delta": True, "agents": []}
+
+        third = orchestrator.create_agent("Analyst", AgentType.ANALYST, ["root_cause"])
+        added = orchestrator.agent_snapshot(full["version"])
+        assert [agent["id"] for agent in added["agents"]] == [third.id]
+
+        # Completing a task updates its agents' metrics, which is a change too
+        task = orchestrator.orchestrate_task("Analyze fabric loading")
+        await orchestrator.wait_for_task(task.id, timeout=5)
+        changed = orchestrator.agent_snapshot(added["version"])
+        assert changed["delta"] and {agent["id"] for agent in changed["agents"]} == set(task.assigned_agents)
+        assert all(agent["performance"]["tasks_completed"] == 1 for agent in changed["agents"])
+        # Earlier snapshots are not mutated by the update
+        assert full["agents"][0]["performance"]["tasks_completed"] == 0
+        assert first.id in task.assigned_agents
+
+        # A version this orchestrator never issued falls back to the full list
+        reset = orchestrator.agent_snapshot(changed["version"] + 100)
+        assert not reset["delta"] and len(reset["agents"]) == 3
+
+    asyncio.run(scenario())
+
+
+def test_agent_list_tool_serves_deltas():
+    async def scenario():
+        server.orchestrator = AgentOrchestrator()
+        await server.agent_spawn("researcher", "Researcher", ["investigation"])
+        full = json.loads(await server.agent_list())
+        unchanged = json.loads(await server.agent_list(since_version=full["version"]))
+        await server.agent_spawn("coder", "Coder", ["php"])
+        delta = json.loads(await server.agent_list(since_version=full["version"]))
+        status = json.loads(await server.swarm_status())
+        return full, unchanged, delta, status
+
+    original = server.orchestrator
+    try:
+        full, unchanged, delta, status = asyncio.run(scenario())
+    finally:
+        server.orchestrator = original
+
+    assert not full["delta"] and full["agent_count"] == 1 and len(full["agents"]) == 1
+    assert unchanged["delta"] and unchanged["agents"] == [] and unchanged["version"] == full["version"]
+    assert delta["version"] > full["version"] and [a["name"] for a in delta["agents"]] == ["Coder"]
+    assert delta["agent_count"] == 2
+    assert status["agents_by_type"]["coder"] == 1 and status["total_tasks"] == 0
+
+
+if __name__ == "__main__":
+    print("🧪 SWARM COUNTERS TEST")
+    print("=" * 50)
+    for test in (test_counters_follow_task_transitions, test_hierarchical_subtasks_are_counted,
+                 test_agent_snapshot_versions_and_deltas, test_agent_list_tool_serves_deltas):
+        test()
+        print(f"   ✅ {test.__name__}")
+    print("\n🎉 SWARM COUNTERS TESTS PASSED")
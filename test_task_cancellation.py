@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Task Cancellation Test
+Verifies task_cancel and timeouts stop running work: async analyzers,
+analyzers on worker threads, hierarchical sub-tasks and remote worker
+leases, with their slots freed immediately
+"""
+
+import asyncio
+import json
+import threading
+import time
+
+import mcp_agent_orchestrator as server
+from mcp_agent_orchestrator import AgentOrchestrator, AgentType, TaskStatus
+from task_cancellation import CancelToken, TaskCancelled
+from worker_nodes import WorkerDispatcher, WorkerNode
+
+
+async def hang(task):
+    await asyncio.sleep(60)
+
+
+def test_cancel_running_and_pending_tasks():
+    async def scenario():
+        orchestrator = AgentOrchestrator(analyzer=hang)
+        orchestrator.swarm_config["topology"] = "mesh"
+        orchestrator.create_agent("Researcher", AgentType.RESEARCHER, ["investigation"])
+        running = orchestrator.orchestrate_task("Analyze webpack bundle")
+        await asyncio.sleep(0.05)
+        # Cancelled before its coroutine ever ran
+        pending = orchestrator.orchestrate_task("Analyze phantom scripts")
+        assert orchestrator.cancel_task(pending.id, "client went away")
+        assert orchestrator.cancel_task(running.id)
+        assert not orchestrator.cancel_task(running.id)
+        start = time.perf_counter()
+        for task in (running, pending):
+            await orchestrator.wait_for_task(task.id, timeout=1)
+        await asyncio.sleep(0)
+        return orchestrator, running, pending, time.perf_counter() - start
+
+    orchestrator, running, pending, elapsed = asyncio.run(scenario())
+    assert elapsed < 0.5
+    assert running.status == pending.status == TaskStatus.CANCELLED
+    assert running.results == {"error": "cancelled by client"}
+    assert pending.results == {"error": "client went away"}
+    assert orchestrator.status_counts()["task_status"]["cancelled"] == 2
+    assert not orchestrator._running
+    assert not orchestrator.cancel_task("task-unknown")
+
+
+def test_timeout_cancels_hierarchical_subtasks_and_frees_slots():
+    async def scenario():
+        orchestrator = AgentOrchestrator(analyzer=hang)
+        orchestrator.swarm_config["tier_concurrency"] = {"team": 1}
+        orchestrator.create_agent("Lead", AgentType.COORDINATOR, ["coordination"])
+        orchestrator.create_agent("Coder", AgentType.CODER, ["php"])
+        orchestrator.create_agent("Researcher", AgentType.RESEARCHER, ["investigation"])
+        task = orchestrator.orchestrate_task("Analyze fabric loading", timeout=0.1)
+        await orchestrator.wait_for_task(task.id, timeout=2)
+        return orchestrator, task
+
+    orchestrator, task = asyncio.run(scenario())
+    assert task.status == TaskStatus.CANCELLED
+    assert task.results["error"] == "timed out after 100ms"
+    # Every sub-task ended, including the team queued behind the single team slot
+    assert len(orchestrator.tasks) == 4
+    assert all(t.status == TaskStatus.CANCELLED for t in orchestrator.tasks.values())
+    assert orchestrator._tier_limit("team")._value == 1
+
+
+def test_sync_analyzer_thread_sees_the_token():
+    stopped = threading.Event()
+
+    def analyzer(task):
+        # CPU-bound work in chunks, checking the token between chunks
+        try:
+            while True:
+                task.cancel_token.check()
+                sum(range(10000))
+        except TaskCancelled:
+            stopped.set()
+            raise
+
+    async def scenario():
+        orchestrator = AgentOrchestrator(analyzer=analyzer)
+        task = orchestrator.orchestrate_task("Analyze webpack bundle")
+        await asyncio.sleep(0.05)
+        # The loop stays free while the analyzer runs on its thread
+        orchestrator.cancel_task(task.id)
+        return await orchestrator.wait_for_task(task.id, timeout=1)
+
+    task = asyncio.run(scenario())
+    assert task.status == TaskStatus.CANCELLED
+    assert stopped.wait(1)
+
+
+def test_cancel_token_callbacks():
+    token, calls = CancelToken(), []
+    token.on_cancel(lambda: calls.append("first"))
+    assert token.cancel("stop") and not token.cancel("again")
+    token.on_cancel(lambda: calls.append("late"))
+    assert calls == ["first", "late"] and token.reason == "stop" and token.wait(0)
+
+
+def test_cancel_withdraws_remote_lease():
+    stopped = threading.Event()
+
+    def slow_scan(payload, cancel_token=None):
+        while not cancel_token.wait(0.01):
+            pass
+        stopped.set()
+        raise TaskCancelled(cancel_token.reason)
+
+    def quick_scan(payload, cancel_token=None):
+        return {"findings": {"scanned": payload["description"]}}
+
+    async def scenario():
+        async with WorkerDispatcher() as dispatcher:
+            node = WorkerNode({"webpack": slow_scan, "generic": quick_scan}, capacity=1, worker_id="w0")
+            serving = asyncio.ensure_future(node.run(dispatcher.address))
+            await dispatcher.wait_for_workers(1, timeout=2)
+            orchestrator = AgentOrchestrator(analyzer=dispatcher.analyze)
+            slow = orchestrator.orchestrate_task("Analyze webpack bundle")
+            await asyncio.sleep(0.1)
+            assert dispatcher.stats()["leased"] == 1
+            orchestrator.cancel_task(slow.id)
+            await orchestrator.wait_for_task(slow.id, timeout=1)
+            await asyncio.sleep(0)
+            freed = dispatcher.stats()
+            # The single slot is free again, so the next job runs right away
+            quick = await orchestrator.run_task("Summarize results", timeout=2)
+        await serving
+        return slow, quick, freed
+
+    slow, quick, freed = asyncio.run(scenario())
+    assert slow.status == TaskStatus.CANCELLED
+    assert freed["leased"] == 0 and freed["counters"]["cancelled"] == 1
+    assert quick.status == TaskStatus.COMPLETED
+    assert stopped.wait(1)
+
+
+def test_mcp_task_cancel_and_timeout_ms():
+    async def scenario():
+        server.orchestrator = AgentOrchestrator(analyzer=hang)
+        await server.agent_spawn("researcher", "Researcher", ["investigation"])
+        first = json.loads(await server.task_orchestrate("Analyze webpack bundle"))
+        cancelled = json.loads(await server.task_cancel(first["task_id"]))
+        again = json.loads(await server.task_cancel(first["task_id"]))
+        timed = json.loads(await server.task_orchestrate("Analyze fabric loading", timeout_ms=50))
+        await server.orchestrator.wait_for_task(timed["task_id"], timeout=1)
+        status = json.loads(await server.task_status(timed["task_id"]))
+        missing = json.loads(await server.task_cancel("task-unknown"))
+        return cancelled, again, status, missing
+
+    original = server.orchestrator
+    try:
+        cancelled, again, status, missing = asyncio.run(scenario())
+    finally:
+        server.orchestrator = original
+
+    assert cancelled["success"] and cancelled["status"] == "cancelled"
+    assert not again["success"] and "already finished" in again["error"]
+    assert status["status"] == "cancelled"
+    assert not missing["success"]
+
+
+if __name__ == "__main__":
+    print("🧪 TASK CANCELLATION TEST")
+    print("=" * 50)
+    for test in (test_cancel_running_and_pending_tasks, test_timeout_cancels_hierarchical_subtasks_and_frees_slots,
+                 test_sync_analyzer_thread_sees_the_token, test_cancel_token_callbacks,
+                 test_cancel_withdraws_remote_lease, test_mcp_task_cancel_and_timeout_ms):
+        test()
+        print(f"   ✅ {test.__name__}")
+    print("\n🎉 TASK CANCELLATION TESTS PASSED")
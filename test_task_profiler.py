@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Task Profiler Test
+Verifies opt-in sampling profiles: nothing is sampled unless asked for,
+samples land in the right task and analyzer (worker threads and hierarchical
+sub-tasks included), and profiled tasks carry a hot-function table and a
+collapsed-stack file
+"""
+
+import asyncio
+import json
+import os
+import tempfile
+import time
+from collections import Counter
+
+import mcp_agent_orchestrator as server
+import task_profiler
+from mcp_agent_orchestrator import AgentOrchestrator, AgentType
+from task_profiler import collapsed, hot_functions, profiled, sampler
+
+
+def spin(seconds: float):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        sum(i * i for i in range(1000))
+
+
+def hot_analyzer(task):
+    spin(0.2)
+    return {"findings": {}}
+
+
+def with_profile_dir(test):
+    """Run test with profiles written to a throwaway directory"""
+    def wrapper():
+        original = task_profiler.PROFILE_DIR
+        with tempfile.TemporaryDirectory() as directory:
+            task_profiler.PROFILE_DIR = directory
+            try:
+                return test()
+            finally:
+                task_profiler.PROFILE_DIR = original
+    wrapper.__name__ = test.__name__
+    return wrapper
+
+
+def test_off_by_default():
+    async def scenario():
+        orchestrator = AgentOrchestrator(analyzer=hot_analyzer)
+        return await orchestrator.run_task("Analyze webpack bundle", timeout=5)
+
+    task = asyncio.run(scenario())
+    assert task.profile is None and "profile" not in task.results
+    with profiled(None, "unused"):
+        pass
+    assert not sampler._roots
+
+
+@with_profile_dir
+def test_profile_of_a_sync_analyzer():
+    async def scenario():
+        orchestrator = AgentOrchestrator(analyzer=hot_analyzer)
+        task = orchestrator.orchestrate_task("Analyze webpack bundle", profile=True)
+        return await orchestrator.wait_for_task(task.id, timeout=5)
+
+    task = asyncio.run(scenario())
+    profile = task.results["profile"]
+    assert profile["samples"] >= 10
+    # The analyzer ran on an executor thread; its frames still belong to the task
+    assert profile["analyzers"]["hot_analyzer"]["samples"] >= 10
+    assert any(row["function"].startswith("spin ") and row["total_pct"] > 50 for row in profile["top"])
+    with open(profile["collapsed_file"]) as handle:
+        lines = handle.read().splitlines()
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+    assert any("hot_analyzer" in line and "spin" in line for line in lines)
+    assert not sampler._roots
+
+
+@with_profile_dir
+def test_hierarchical_subtasks_share_the_root_profile():
+    async def analyzer(task):
+        # CPU-bound on the event loop thread
+        spin(0.1)
+        return {"findings": {"team": [task.team]}}
+
+    async def scenario():
+        orchestrator = AgentOrchestrator(analyzer=analyzer, profile=True)
+        orchestrator.create_agent("Lead", AgentType.COORDINATOR, ["coordination"])
+        orchestrator.create_agent("Coder", AgentType.CODER, ["php"])
+        orchestrator.create_agent("Researcher", AgentType.RESEARCHER, ["investigation"])
+        return orchestrator, await orchestrator.run_task("Analyze fabric loading", timeout=5)
+
+    orchestrator, task = asyncio.run(scenario())
+    profile = task.results["profile"]
+    # Both teams' analyzer runs were sampled into the root task's profile
+    assert profile["analyzers"]["test_hierarchical_subtasks_share_the_root_profile.<locals>.analyzer"]["samples"] >= 20
+    assert all("profile" not in sub.results for sub in orchestrator.tasks.values() if sub.parent_id)
+
+
+def test_env_var_profiles_every_task():
+    original = os.environ.get(task_profiler.PROFILE_ENV)
+    os.environ[task_profiler.PROFILE_ENV] = "1"
+    try:
+        assert AgentOrchestrator().profile_tasks
+        assert not AgentOrchestrator(profile=False).profile_tasks
+    finally:
+        if original is None:
+            del os.environ[task_profiler.PROFILE_ENV]
+        else:
+            os.environ[task_profiler.PROFILE_ENV] = original
+    assert not AgentOrchestrator().profile_tasks
+
+
+def test_hot_function_table_and_collapsed_format():
+    stacks = Counter({("main", "parse", "tokenize"): 6, ("main", "parse"): 1, ("main", "render"): 3})
+    top = hot_functions(stacks, top_n=3)
+    assert [row["function"] for row in top] == ["tokenize", "render", "parse"]
+    assert top[2] == {"function": "parse", "self_samples": 1, "self_pct": 10.0, "total_samples": 7, "total_pct": 70.0}
+    assert collapsed(stacks).splitlines()[0] == "main;parse;tokenize 6"
+    assert hot_functions(Counter()) == []
+
+
+@with_profile_dir
+def test_mcp_profile_argument():
+    async def scenario():
+        server.orchestrator = AgentOrchestrator(analyzer=hot_analyzer)
+        await server.agent_spawn("researcher", "Researcher", ["investigation"])
+        started = json.loads(await server.task_orchestrate("Analyze webpack bundle", profile=True))
+        await server.orchestrator.wait_for_task(started["task_id"], timeout=5)
+        return started, json.loads(await server.task_results(started["task_id"]))
+
+    original = server.orchestrator
+    try:
+        started, results = asyncio.run(scenario())
+    finally:
+        server.orchestrator = original
+
+    assert started["profile"] is True
+    assert results["results"]["profile"]["samples"] > 0
+    assert os.path.exists(results["results"]["profile"]["collapsed_file"])
+
+
+if __name__ == "__main__":
+    print("🧪 TASK PROFILER TEST")
+    print("=" * 50)
+    for test in (test_off_by_default, test_profile_of_a_sync_analyzer, test_hierarchical_subtasks_share_the_root_profile,
+                 test_env_var_profiles_every_task, test_hot_function_table_and_collapsed_format,
+                 test_mcp_profile_argument):
+        test()
+        print(f"   ✅ {test.__name__}")
+    print("\n🎉 TASK PROFILER TESTS PASSED")
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Tool Responses Test
+Verifies every encode backend produces the same compact JSON and that tool
+registration opts out of duplicate structured output only when supported
+"""
+
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+
+from tool_responses import BACKEND, BACKENDS, encode_response, text_tool_options
+
+
+class Color(Enum):
+    RED = "red"
+
+
+@dataclass
+class Point:
+    x: int
+    y: int
+
+
+PAYLOAD = {
+    "success": True,
+    "task_id": "task-1",
+    "status": Color.RED,
+    "created_at": datetime(2025, 1, 2, 3, 4, 5),
+    "point": Point(1, 2),
+    "tags": {"fabric"},
+    "message": "Größe ✅",
+    "nested": {"progress": 0.5, "agents": ["a", "b"], "completed_at": None}
+}
+
+EXPECTED = {
+    "success": True,
+    "task_id": "task-1",
+    "status": "red",
+    "created_at": "2025-01-02T03:04:05",
+    "point": {"x": 1, "y": 2},
+    "tags": ["fabric"],
+    "message": "Größe ✅",
+    "nested": {"progress": 0.5, "agents": ["a", "b"], "completed_at": None}
+}
+
+
+def test_backends_agree_on_compact_output():
+    encoded = {name: encode(PAYLOAD) for name, encode in BACKENDS.items()}
+    assert "json" in encoded and BACKEND in encoded
+    for name, text in encoded.items():
+        assert json.loads(text) == EXPECTED, name
+        assert ": " not in text and ", " not in text.replace("Größe ✅", ""), name
+    assert encode_response is BACKENDS[BACKEND]
+
+
+def test_structured_output_is_disabled_only_where_supported():
+    def new_style(name=None, structured_output=None):
+        pass
+
+    def old_style(name=None):
+        pass
+
+    assert text_tool_options(new_style) == {"structured_output": False}
+    assert text_tool_options(old_style) == {}
+
+
+if __name__ == "__main__":
+    print("🧪 TOOL RESPONSES TEST")
+    print("=" * 50)
+    for test in (test_backends_agree_on_compact_output, test_structured_output_is_disabled_only_where_supported):
+        test()
+        print(f"   ✅ {test.__name__}")
+    print("\n🎉 TOOL RESPONSES TESTS PASSED")
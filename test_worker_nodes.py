@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Worker Nodes Test
+Runs several workers on localhost: capacity, lease re-queue on silence or
+disconnect, handler errors, and the AgentOrchestrator analyzer hook
+"""
+
+import asyncio
+import os
+import tempfile
+import time
+
+from agent_orchestrator_core import AgentOrchestrator, TaskStatus
+from worker_nodes import RemoteTaskError, WorkerDispatcher, WorkerNode
+
+
+def sleeper(name: str, delay: float, running: dict = None):
+    async def handle(payload):
+        if running is not None:
+            running[name] = running.get(name, 0) + 1
+            running["peak"] = max(running.get("peak", 0), running[name])
+        await asyncio.sleep(delay)
+        if running is not None:
+            running[name] -= 1
+        return {"worker": name, "payload": payload}
+    return handle
+
+
+async def until(predicate, timeout: float = 2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached"
+        await asyncio.sleep(0.01)
+
+
+def test_jobs_spread_across_workers_within_capacity():
+    async def run():
+        running = {}
+        async with WorkerDispatcher() as dispatcher:
+            nodes = [WorkerNode({"scan": sleeper(f"w{i}", 0.1, running)}, capacity=2, worker_id=f"w{i}")
+                     for i in range(2)]
+            serving = [asyncio.ensure_future(node.run(dispatcher.address)) for node in nodes]
+            await dispatcher.wait_for_workers(2, timeout=2)
+            start = time.perf_counter()
+            results = await asyncio.gather(*(dispatcher.run("scan", i, timeout=5) for i in range(8)))
+            elapsed = time.perf_counter() - start
+        await asyncio.gather(*serving)
+        return results, elapsed, running
+
+    results, elapsed, running = asyncio.run(run())
+    assert [r["payload"] for r in results] == list(range(8))
+    assert {r["worker"] for r in results} == {"w0", "w1"}
+    assert running["peak"] <= 2
+    # 8 × 0.1s over 4 slots; one slot would take 0.8s
+    assert elapsed < 0.5, elapsed
+
+
+def test_silent_worker_loses_its_lease():
+    async def run():
+        async with WorkerDispatcher(lease_timeout=0.3) as dispatcher:
+            # Heartbeats far apart: the dispatcher sees this worker go silent
+            silent = WorkerNode({"scan": sleeper("silent", 5.0)}, worker_id="silent", heartbeat_interval=60)
+            asyncio.ensure_future(silent.run(dispatcher.address))
+            await dispatcher.wait_for_workers(1, timeout=2)
+            job = dispatcher.submit("scan", "tree")
+            await until(lambda: dispatcher.stats()["leased"] == 1)
+
+            healthy = WorkerNode({"scan": sleeper("healthy", 0.0)}, worker_id="healthy")
+            asyncio.ensure_future(healthy.run(dispatcher.address))
+            result = await asyncio.wait_for(job, 3)
+            return result, dispatcher.counters
+
+    result, counters = asyncio.run(run())
+    assert result["worker"] == "healthy"
+    assert counters["requeued"] == 1
+    assert counters["completed"] == 1
+
+
+def test_disconnect_requeues_immediately_over_unix_socket():
+    async def run(path):
+        dispatcher = WorkerDispatcher(lease_timeout=30)
+        await dispatcher.start(f"unix:{path}")
+        try:
+            leaving = WorkerNode({"scan": sleeper("leaving", 5.0)}, worker_id="leaving")
+            asyncio.ensure_future(leaving.run(dispatcher.address))
+            await dispatcher.wait_for_workers(1, timeout=2)
+            job = dispatcher.submit("scan", "tree")
+            await until(lambda: dispatcher.stats()["leased"] == 1)
+
+            staying = WorkerNode({"scan": sleeper("staying", 0.0)}, worker_id="staying")
+            asyncio.ensure_future(staying.run(dispatcher.address))
+            await dispatcher.wait_for_workers(2, timeout=2)
+            start = time.perf_counter()
+            leaving.close()
+            result = await asyncio.wait_for(job, 2)
+            return result, time.perf_counter() - start
+        finally:
+            await dispatcher.close()
+
+    with tempfile.TemporaryDirectory() as directory:
+        result, elapsed = asyncio.run(run(os.path.join(directory, "dispatch.sock")))
+    assert result["worker"] == "staying"
+    # Re-queued on disconnect, not after the 30s lease
+    assert elapsed < 1.0, elapsed
+
+
+def test_handler_errors_and_orchestrator_hook():
+    def fabric(payload):
+        if "explode" in payload["description"]:
+            raise ValueError("bad checkout")
+        return {"analysis_type": "remote_fabric", "task_id": payload["task_id"]}
+
+    async def run():
+        async with WorkerDispatcher() as dispatcher:
+            node = WorkerNode({"fabric": fabric}, worker_id="remote")
+            asyncio.ensure_future(node.run(dispatcher.address))
+            await dispatcher.wait_for_workers(1, timeout=2)
+
+            try:
+                await dispatcher.run("fabric", {"description": "explode", "task_id": "x"}, timeout=2)
+            except RemoteTaskError as e:
+                error = str(e)
+            else:
+                raise AssertionError("expected RemoteTaskError")
+
+            orchestrator = AgentOrchestrator(analyzer=dispatcher.analyze)
+            task = await orchestrator.run_task("Analyze fabric.js loading failure", timeout=3)
+            return error, task
+
+    error, task = asyncio.run(run())
+    assert "ValueError: bad checkout" in error
+    assert task.status == TaskStatus.COMPLETED
+    assert task.results == {"analysis_type": "remote_fabric", "task_id": task.id}
+
+
+if __name__ == "__main__":
+    print("🧪 WORKER NODES TEST")
+    print("=" * 50)
+    for test in (test_jobs_spread_across_workers_within_capacity, test_silent_worker_loses_its_lease,
+                 test_disconnect_requeues_immediately_over_unix_socket, test_handler_errors_and_orchestrator_hook):
+        test()
+        print(f"   ✅ {test.__name__}")
+    print("\n🎉 WORKER NODES TESTS PASSED")
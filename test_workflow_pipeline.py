@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Workflow Pipeline Test
+Verifies field-level start, speculative restarts and explicit deadline errors
+"""
+
+import asyncio
+
+from workflow_pipeline import PhaseDeadlineError, PipelinePhase, WorkflowError, WorkflowPipeline
+
+
+def sleeper(delay: float, result: dict, log: list = None):
+    async def run(ctx):
+        if log is not None:
+            log.append((ctx.phase.name, sorted(ctx.inputs)))
+        await asyncio.sleep(delay)
+        return result
+    return run
+
+
+def test_phase_starts_on_published_field():
+    """A consumer starts once the field it needs is published, before its producer finishes"""
+    started = {}
+
+    async def producer(ctx):
+        ctx.publish("findings", ["root cause"])
+        await asyncio.sleep(0.2)
+        return {"report": "done"}
+
+    async def consumer(ctx):
+        started["at"] = asyncio.get_running_loop().time()
+        return {"plan": ctx.inputs["analysis.findings"]}
+
+    async def run():
+        pipeline = WorkflowPipeline([
+            PipelinePhase("analysis", producer),
+            PipelinePhase("implementation", consumer, requires=["analysis.findings"]),
+        ])
+        begin = asyncio.get_running_loop().time()
+        results = await pipeline.run()
+        return results, started["at"] - begin
+
+    results, consumer_delay = asyncio.run(run())
+    assert results["implementation"] == {"plan": ["root cause"]}
+    assert consumer_delay < 0.1
+
+
+def test_speculative_phase_restarts_when_optional_input_arrives():
+    log = []
+    pipeline = WorkflowPipeline([
+        PipelinePhase("analysis", sleeper(0.0, {"findings": "f"})),
+        PipelinePhase("implementation", sleeper(0.05, {"plan": "p"}), requires=["analysis.findings"]),
+        PipelinePhase("testing", sleeper(0.2, {"tests": "t"}, log),
+                      requires=["analysis.findings"], optional=["implementation.plan"], speculative=True),
+    ])
+    asyncio.run(pipeline.run())
+
+    outcome = pipeline.outcomes["testing"]
+    assert outcome.status == "completed"
+    assert outcome.restarts == 1
+    assert log == [("testing", ["analysis.findings"]),
+                   ("testing", ["analysis.findings", "implementation.plan"])]
+
+
+def test_non_speculative_phase_waits_for_optional_inputs():
+    log = []
+    pipeline = WorkflowPipeline([
+        PipelinePhase("analysis", sleeper(0.0, {"findings": "f"})),
+        PipelinePhase("implementation", sleeper(0.05, {"plan": "p"}), requires=["analysis.findings"]),
+        PipelinePhase("testing", sleeper(0.0, {"tests": "t"}, log),
+                      requires=["analysis.findings"], optional=["implementation.plan"]),
+    ])
+    asyncio.run(pipeline.run())
+    assert log == [("testing", ["analysis.findings", "implementation.plan"])]
+    assert pipeline.outcomes["testing"].restarts == 0
+
+
+def test_missed_deadline_raises_instead_of_returning_none():
+    pipeline = WorkflowPipeline([
+        PipelinePhase("analysis", sleeper(1.0, {"findings": "f"}), deadline=0.05),
+        PipelinePhase("implementation", sleeper(0.0, {"plan": "p"}), requires=["analysis.findings"]),
+    ])
+    try:
+        asyncio.run(pipeline.run())
+    except WorkflowError as e:
+        assert "PhaseDeadlineError" in e.outcomes["analysis"].error
+        assert e.outcomes["implementation"].status == "skipped"
+    else:
+        raise AssertionError("expected WorkflowError")
+    assert issubclass(PhaseDeadlineError, TimeoutError)
+
+
+def test_missing_required_field_skips_consumer():
+    pipeline = WorkflowPipeline([
+        PipelinePhase("analysis", sleeper(0.0, {"error": "analyzer crashed"})),
+        PipelinePhase("implementation", sleeper(0.0, {"plan": "p"}), requires=["analysis.findings"]),
+    ])
+    try:
+        asyncio.run(pipeline.run())
+    except WorkflowError as e:
+        assert "analysis.findings" in e.outcomes["implementation"].error
+    else:
+        raise AssertionError("expected WorkflowError")
+
+
+def test_cancelled_run_cancels_running_phases():
+    """Cancelling run() cancels and awaits the phases still in flight"""
+    stopped = []
+
+    async def slow(ctx):
+        try:
+            await asyncio.sleep(10)
+        finally:
+            stopped.append(ctx.phase.name)
+
+    async def run():
+        pipeline = WorkflowPipeline([PipelinePhase("analysis", slow), PipelinePhase("review", slow)])
+        runner = asyncio.ensure_future(pipeline.run())
+        await asyncio.sleep(0.05)
+        runner.cancel()
+        try:
+            await runner
+        except asyncio.CancelledError:
+            pass
+        else:
+            raise AssertionError("expected CancelledError")
+        assert sorted(stopped) == ["analysis", "review"]
+        assert {outcome.status for outcome in pipeline.outcomes.values()} == {"failed"}
+        current = asyncio.current_task()
+        assert [task for task in asyncio.all_tasks() if task is not current] == []
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    print("🧪 WORKFLOW PIPELINE TEST")
+    print("=" * 50)
+    for test in (test_phase_starts_on_published_field,
+                 test_speculative_phase_restarts_when_optional_input_arrives,
+                 test_non_speculative_phase_waits_for_optional_inputs,
+                 test_missed_deadline_raises_instead_of_returning_none,
+                 test_missing_required_field_skips_consumer,
+                 test_cancelled_run_cancels_running_phases):
+        test()
+        print(f"   ✅ {test.__name__}")
+    print("\n🎉 WORKFLOW PIPELINE TESTS PASSED")
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+📦 TOOL RESPONSES - One serialization path for MCP tool results
+Every tool returns finished compact JSON text, encoded once. The fastest
+installed backend wins: orjson, then pydantic_core (always present alongside
+FastMCP), then a reused stdlib encoder. Values JSON has no type for (enums,
+datetimes, dataclasses, sets) go through per-type converters that are
+resolved once and cached. Serializers compiled once per response shape are
+deliberately not used: they time no faster than pydantic_core's dynamic path
+and about twice orjson's cost (the pydantic_schema column of
+benchmarks/tool_encoding.py).
+"""
+
+import dataclasses
+import inspect
+import json
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Callable, Dict
+
+try:
+    import orjson
+except ImportError:  # optional: pip install orjson
+    orjson = None
+
+try:
+    import pydantic_core
+except ImportError:
+    pydantic_core = None
+
+_converters: Dict[type, Callable[[Any], Any]] = {}
+
+
+def _resolve_converter(cls: type) -> Callable[[Any], Any]:
+    if issubclass(cls, Enum):
+        return lambda value: value.value
+    if issubclass(cls, (datetime, date)):
+        return lambda value: value.isoformat()
+    if dataclasses.is_dataclass(cls):
+        return dataclasses.asdict
+    if issubclass(cls, (set, frozenset, tuple)):
+        return list
+    return str
+
+
+def _default(value: Any) -> Any:
+    cls = type(value)
+    converter = _converters.get(cls)
+    if converter is None:
+        converter = _converters[cls] = _resolve_converter(cls)
+    return converter(value)
+
+
+_json_encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), default=_default)
+
+
+def encode_with_json(payload: Any) -> str:
+    return _json_encoder.encode(payload)
+
+
+BACKENDS: Dict[str, Callable[[Any], str]] = {"json": encode_with_json}
+
+if pydantic_core is not None:
+    def encode_with_pydantic(payload: Any) -> str:
+        return pydantic_core.to_json(payload, fallback=_default).decode("utf-8")
+
+    BACKENDS["pydantic"] = encode_with_pydantic
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def encode_with_orjson(payload: Any) -> str:
+        return orjson.dumps(payload, default=_default, option=_ORJSON_OPTIONS).decode("utf-8")
+
+    BACKENDS["orjson"] = encode_with_orjson
+
+BACKEND = next(name for name in ("orjson", "pydantic", "json") if name in BACKENDS)
+encode_response = BACKENDS[BACKEND]
+
+
+def text_tool_options(register: Callable) -> Dict[str, Any]:
+    """Options for mcp.tool() so a str result is sent once, as text.
+
+    Newer FastMCP versions otherwise wrap str results in structuredContent
+    too, sending every payload twice.
+    """
+    try:
+        parameters = inspect.signature(register).parameters
+    except (TypeError, ValueError):
+        return {}
+    return {"structured_output": False} if "structured_output" in parameters else {}
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+🗂️ TREE INDEX - Warm directory listings and file contents for resident analyzers
+A TreeIndex answers listdir() and recursive glob patterns for one plugin tree
+from cached directory listings, and a FileCache serves file contents, so an
+analyzer that runs again in the same process neither re-walks nor re-reads
+the tree. Both are validated by stat instead of trusted: refresh() re-stats
+every cached directory and drops the listings whose mtime moved (adding,
+removing or renaming an entry changes its directory's mtime), and a cached
+file is re-read when its mtime, size or inode differ. Answers match
+os.listdir and glob.glob(..., recursive=True), order included, so analyzers
+report the same findings warm or cold.
+"""
+
+import fnmatch
+import glob
+import itertools
+import os
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from span_tracing import tracer
+
+# Characters of file content a FileCache keeps before evicting the least recently read
+DEFAULT_MAX_CHARS = int(os.environ.get("HIVE_FILE_CACHE_CHARS", 256 * 1024 * 1024))
+
+
+def _hidden(name: str) -> bool:
+    return name.startswith(".")
+
+
+@dataclass
+class _CachedFile:
+    signature: Tuple[int, int, int]  # st_mtime_ns, st_size, st_ino
+    content: str
+
+
+class FileCache:
+    """Text of recently read files, LRU-bounded by the characters held"""
+
+    def __init__(self, max_chars: int = DEFAULT_MAX_CHARS):
+        self.max_chars = max_chars
+        self._files: "OrderedDict[Tuple[str, Optional[str], Optional[str]], _CachedFile]" = OrderedDict()
+        self.chars = 0
+        self.hits = 0
+        self.misses = 0
+
+    def read(self, path: str, encoding: Optional[str] = None, errors: Optional[str] = None) -> str:
+        """open(path).read(), served from the cache while the file is unchanged"""
+        with tracer.span("file.read", path=path) as active:
+            stat = os.stat(path)
+            signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+            key = (path, encoding, errors)
+            cached = self._files.get(key)
+            if cached is not None and cached.signature == signature:
+                self.hits += 1
+                self._files.move_to_end(key)
+                active.set(cache_hit=True, bytes=0)
+                return cached.content
+
+            # Stat first: a write racing this read leaves a stale signature, so the next read re-reads
+            with open(path, "r", encoding=encoding, errors=errors) as handle:
+                content = handle.read()
+            self.misses += 1
+            self._store(key, _CachedFile(signature, content))
+            active.set(cache_hit=False, bytes=len(content))
+            return content
+
+    def _store(self, key: Tuple[str, Optional[str], Optional[str]], entry: _CachedFile):
+        previous = self._files.pop(key, None)
+        if previous is not None:
+            self.chars -= len(previous.content)
+        if len(entry.content) > self.max_chars:
+            return
+        self._files[key] = entry
+        self.chars += len(entry.content)
+        while self.chars > self.max_chars:
+            _, evicted = self._files.popitem(last=False)
+            self.chars -= len(evicted.content)
+
+    def cache_info(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "files": len(self._files), "chars": self.chars}
+
+    def clear(self):
+        self._files.clear()
+        self.chars = 0
+        self.hits = 0
+        self.misses = 0
+
+
+class TreeIndex:
+    """Cached directory listings of one tree, for listdir() and recursive glob()"""
+
+    def __init__(self, root: str):
+        self.root = root
+        # directory → (its st_mtime_ns when listed, {name: is_dir} in scandir order)
+        self._listings: Dict[str, Tuple[int, Dict[str, bool]]] = {}
+        # pattern → glob() answer; only valid while no listing has been dropped
+        self._globs: Dict[str, List[str]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.invalidated = 0
+
+    def _entries(self, directory: str) -> Dict[str, bool]:
+        listing = self._listings.get(directory)
+        if listing is not None:
+            self.hits += 1
+            return listing[1]
+
+        self.misses += 1
+        # Stat before listing, so a change made while listing shows up at the next refresh()
+        mtime = os.stat(directory).st_mtime_ns
+        entries = {}
+        with os.scandir(directory) as scan:
+            for entry in scan:
+                try:
+                    entries[entry.name] = entry.is_dir()
+                except OSError:
+                    entries[entry.name] = False
+        self._listings[directory] = (mtime, entries)
+        return entries
+
+    def _entries_or_empty(self, directory: str) -> Dict[str, bool]:
+        try:
+            return self._entries(directory)
+        except OSError:
+            return {}
+
+    def _entry(self, path: str) -> Optional[bool]:
+        """is_dir of path as its parent's listing has it; None when there is no such entry"""
+        parent, name = os.path.split(path)
+        return self._entries_or_empty(parent).get(name)
+
+    def listdir(self, directory: str) -> List[str]:
+        """os.listdir(directory)"""
+        return list(self._entries(directory))
+
+    def exists(self, path: str) -> bool:
+        """os.path.lexists(path): a dangling symlink exists here"""
+        return self._entry(path) is not None
+
+    def isdir(self, path: str) -> bool:
+        return bool(self._entry(path))
+
+    def glob(self, pattern: str) -> List[str]:
+        """glob.glob(os.path.join(root, pattern), recursive=True), from the cached listings
+
+        pattern is relative to the root, "/"-separated, and may not end in "**".
+        """
+        matches = self._globs.get(pattern)
+        if matches is None:
+            parts = pattern.split("/")
+            if parts[-1] == "**" or not all(parts):
+                raise ValueError(f"Unsupported tree pattern {pattern!r}")
+            matches = list(self._expand(self.root, parts))
+            # Every answer comes from some cached listing, so refresh() sees any change to it;
+            # a root that does not exist yet has no listing to watch
+            if self.root in self._listings:
+                self._globs[pattern] = matches
+        return list(matches)
+
+    def _expand(self, directory: str, parts: List[str]) -> Iterator[str]:
+        # Mirrors glob's generators: each component expands, in listing order, before the next
+        part, rest = parts[0], parts[1:]
+        if part == "**":
+            # The directory itself, then every non-hidden directory below it, depth first
+            for below in itertools.chain([directory], self._walk(directory)):
+                yield from self._expand(below, rest)
+        elif glob.has_magic(part):
+            for name, is_dir in self._entries_or_empty(directory).items():
+                if (rest and not is_dir) or (_hidden(name) and not _hidden(part)) or not fnmatch.fnmatch(name, part):
+                    continue
+                path = os.path.join(directory, name)
+                if rest:
+                    yield from self._expand(path, rest)
+                else:
+                    yield path
+        else:
+            path = os.path.join(directory, part)
+            if rest:
+                if self.isdir(path):
+                    yield from self._expand(path, rest)
+            elif self.exists(path):
+                yield path
+
+    def _walk(self, directory: str) -> Iterator[str]:
+        for name, is_dir in self._entries_or_empty(directory).items():
+            if is_dir and not _hidden(name):
+                path = os.path.join(directory, name)
+                yield path
+                yield from self._walk(path)
+
+    def refresh(self) -> int:
+        """Drop every cached listing whose directory changed or vanished; returns how many"""
+        stale = []
+        for directory, (mtime, _) in self._listings.items():
+            try:
+                if os.stat(directory).st_mtime_ns != mtime:
+                    stale.append(directory)
+            except OSError:
+                stale.append(directory)
+        for directory in stale:
+            del self._listings[directory]
+        if stale:
+            self._globs.clear()
+        self.invalidated += len(stale)
+        return len(stale)
+
+    def cache_info(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "directories": len(self._listings),
+                "patterns": len(self._globs), "invalidated": self.invalidated}
+
+    def clear(self):
+        self._listings.clear()
+        self._globs.clear()
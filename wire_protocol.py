@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+📡 WIRE PROTOCOL - Length-prefixed frames over TCP or Unix sockets
+Every frame is a 5-byte header (message type, payload length) followed by a
+UTF-8 JSON payload. Addresses are "host:port" for TCP or "unix:/path" for
+Unix domain sockets.
+"""
+
+import asyncio
+import json
+import struct
+from enum import IntEnum
+from typing import Any, Awaitable, Callable, Tuple
+
+# >BI: message type, payload length
+HEADER = struct.Struct(">BI")
+MAX_FRAME = 16 * 1024 * 1024
+
+
+class MessageType(IntEnum):
+    REGISTER = 1     # worker → dispatcher: worker_id, capacity, kinds
+    REGISTERED = 2   # dispatcher → worker: heartbeat_interval, lease_timeout
+    HEARTBEAT = 3    # worker → dispatcher: in-flight lease ids
+    LEASE = 4        # dispatcher → worker: lease_id, kind, payload
+    RESULT = 5       # worker → dispatcher: lease_id, result
+    FAIL = 6         # worker → dispatcher: lease_id, error
+    CANCEL = 7       # dispatcher → worker: lease_id; client → analysis daemon: mission_id
+    SUBMIT = 8       # client → analysis daemon: mission_id, kind and the mission's fields
+    REPLY = 9        # analysis daemon → client: mission_id, event and its fields, streamed
+
+
+class ProtocolError(ConnectionError):
+    """The peer sent a frame that does not follow the protocol"""
+
+
+def encode_frame(message_type: MessageType, payload: Any) -> bytes:
+    body = json.dumps(payload, separators=(",", ":"), default=str).encode("utf-8")
+    if len(body) > MAX_FRAME:
+        raise ProtocolError(f"Frame of {len(body)} bytes exceeds MAX_FRAME")
+    return HEADER.pack(message_type, len(body)) + body
+
+
+def decode_header(header: bytes) -> Tuple[MessageType, int]:
+    message_type, length = HEADER.unpack(header)
+    if length > MAX_FRAME:
+        raise ProtocolError(f"Frame of {length} bytes exceeds MAX_FRAME")
+    try:
+        return MessageType(message_type), length
+    except ValueError:
+        raise ProtocolError(f"Unknown message type {message_type}") from None
+
+
+async def read_frame(reader: asyncio.StreamReader) -> Tuple[MessageType, Any]:
+    """Read one frame; raises asyncio.IncompleteReadError when the peer closes"""
+    message_type, length = decode_header(await reader.readexactly(HEADER.size))
+    body = await reader.readexactly(length)
+    return message_type, json.loads(body.decode("utf-8"))
+
+
+async def write_frame(writer: asyncio.StreamWriter, message_type: MessageType, payload: Any):
+    writer.write(encode_frame(message_type, payload))
+    await writer.drain()
+
+
+def parse_address(address: str) -> Tuple[str, Any]:
+    """"unix:/path" → ("unix", path); "host:port" → ("tcp", (host, port))"""
+    if address.startswith("unix:"):
+        return "unix", address[len("unix:"):]
+    host, _, port = address.rpartition(":")
+    if not host or not port.isdigit():
+        raise ValueError(f"Expected host:port or unix:/path, got {address!r}")
+    return "tcp", (host, int(port))
+
+
+async def open_connection(address: str) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    family, target = parse_address(address)
+    if family == "unix":
+        return await asyncio.open_unix_connection(target, limit=MAX_FRAME)
+    return await asyncio.open_connection(*target, limit=MAX_FRAME)
+
+
+async def start_server(handler: Callable[[asyncio.StreamReader, asyncio.StreamWriter], Awaitable[None]],
+                       address: str) -> Tuple[asyncio.AbstractServer, str]:
+    """Start listening; returns the server and its bound address (port 0 resolves to the real port)"""
+    family, target = parse_address(address)
+    if family == "unix":
+        server = await asyncio.start_unix_server(handler, target, limit=MAX_FRAME)
+        return server, address
+    server = await asyncio.start_server(handler, *target, limit=MAX_FRAME)
+    host, port = server.sockets[0].getsockname()[:2]
+    return server, f"{host}:{port}"
@@ -0,0 +1,487 @@
+#!/usr/bin/env python3
+"""
+🛰️ WORKER NODES - Remote analyzer workers with leased tasks
+A WorkerDispatcher listens on a TCP or Unix socket (wire_protocol framing).
+Worker nodes register with their capacity and the job kinds they handle, then
+receive leases. Heartbeats renew a worker's leases; when a worker goes silent
+or disconnects, its leases are re-queued to the remaining workers. Cancelling
+a job's future frees its slot at once and tells the worker to stop it.
+
+    python worker_nodes.py worker --connect 10.0.0.5:7400 --capacity 4
+    python worker_nodes.py scan --listen 0.0.0.0:7400 --workers 3 checkout-a/ checkout-b/
+"""
+
+import argparse
+import asyncio
+import concurrent.futures
+import functools
+import inspect
+import itertools
+import json
+import os
+import socket
+import sys
+import time
+import uuid
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional, Set
+
+from task_cancellation import CancelToken
+from wire_protocol import MessageType, ProtocolError, open_connection, read_frame, start_server, write_frame
+
+CONNECTION_ERRORS = (asyncio.IncompleteReadError, ConnectionError, ProtocolError)
+
+
+class LeaseExpired(RuntimeError):
+    """A job's lease expired on every attempt it was given"""
+
+
+class RemoteTaskError(RuntimeError):
+    """The worker's handler raised while running the job"""
+
+
+@dataclass
+class Job:
+    job_id: str
+    kind: str
+    payload: Any
+    future: asyncio.Future
+    attempts: int = 0
+    lease_id: Optional[str] = None
+
+
+@dataclass
+class Lease:
+    lease_id: str
+    job: Job
+    worker_id: str
+    expires_at: float
+
+
+@dataclass
+class RemoteWorker:
+    worker_id: str
+    capacity: int
+    kinds: List[str]
+    writer: asyncio.StreamWriter
+    last_seen: float
+    leases: Dict[str, Lease] = field(default_factory=dict)
+    completed: int = 0
+
+    @property
+    def free_slots(self) -> int:
+        return self.capacity - len(self.leases)
+
+    def accepts(self, kind: str) -> bool:
+        return "*" in self.kinds or kind in self.kinds
+
+
+class WorkerDispatcher:
+    """Queues jobs and leases them to registered worker nodes"""
+
+    def __init__(self, lease_timeout: float = 10.0, heartbeat_interval: Optional[float] = None,
+                 max_attempts: int = 3):
+        self.lease_timeout = lease_timeout
+        self.heartbeat_interval = heartbeat_interval or lease_timeout / 4
+        self.max_attempts = max_attempts
+        self.workers: Dict[str, RemoteWorker] = {}
+        self.counters: Counter = Counter()
+        self.address: Optional[str] = None
+        self._queue: Deque[Job] = deque()
+        self._leases: Dict[str, Lease] = {}
+        self._ids = itertools.count(1)
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._reaper: Optional[asyncio.Task] = None
+        self._connections: Set[asyncio.Task] = set()
+        self._registered = asyncio.Condition()
+
+    async def start(self, address: str = "127.0.0.1:0") -> str:
+        """Listen for workers; returns the bound address"""
+        self._server, self.address = await start_server(self._handle_connection, address)
+        self._reaper = asyncio.ensure_future(self._reap())
+        return self.address
+
+    async def close(self):
+        if self._reaper:
+            self._reaper.cancel()
+        if self._server:
+            self._server.close()
+        for job in itertools.chain(self._queue, (lease.job for lease in self._leases.values())):
+            if not job.future.done():
+                job.future.cancel()
+        self._queue.clear()
+        for worker in list(self.workers.values()):
+            self._evict(worker, requeue=False)
+        if self._connections:
+            # Let each connection handler see EOF rather than be cancelled mid-read
+            await asyncio.wait(self._connections, timeout=1.0)
+        if self._server:
+            await self._server.wait_closed()
+
+    async def __aenter__(self) -> "WorkerDispatcher":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    # Job API
+
+    def submit(self, kind: str, payload: Any) -> asyncio.Future:
+        job = Job(f"job-{next(self._ids)}", kind, payload, asyncio.get_running_loop().create_future())
+        job.future.add_done_callback(lambda future: self._withdraw(job) if future.cancelled() else None)
+        self._queue.append(job)
+        self.counters["submitted"] += 1
+        self._dispatch()
+        return job.future
+
+    async def run(self, kind: str, payload: Any, timeout: Optional[float] = None) -> Any:
+        return await asyncio.wait_for(self.submit(kind, payload), timeout)
+
+    async def analyze(self, task) -> Dict[str, Any]:
+        """AgentOrchestrator analyzer hook: AgentOrchestrator(analyzer=dispatcher.analyze)"""
+        from agent_orchestrator_core import analysis_kind
+        return await self.submit(analysis_kind(task.description), {
+            "task_id": task.id, "description": task.description, "priority": task.priority
+        })
+
+    async def wait_for_workers(self, count: int, timeout: Optional[float] = None):
+        async with self._registered:
+            await asyncio.wait_for(self._registered.wait_for(lambda: len(self.workers) >= count), timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "address": self.address,
+            "queued": len(self._queue),
+            "leased": len(self._leases),
+            "counters": dict(self.counters),
+            "workers": [
+                {"worker_id": w.worker_id, "capacity": w.capacity, "kinds": w.kinds,
+                 "in_flight": len(w.leases), "completed": w.completed}
+                for w in self.workers.values()
+            ]
+        }
+
+    # Scheduling
+
+    def _dispatch(self):
+        """Lease queued jobs to the least-loaded worker that handles their kind"""
+        waiting: Deque[Job] = deque()
+        while self._queue:
+            job = self._queue.popleft()
+            if job.future.done():
+                continue
+            eligible = [w for w in self.workers.values() if w.free_slots > 0 and w.accepts(job.kind)]
+            if not eligible:
+                waiting.append(job)
+                continue
+            self._lease(max(eligible, key=lambda w: w.free_slots), job)
+        self._queue = waiting
+
+    def _lease(self, worker: RemoteWorker, job: Job):
+        job.attempts += 1
+        lease = Lease(f"{job.job_id}.{job.attempts}", job, worker.worker_id,
+                      time.monotonic() + self.lease_timeout)
+        self._leases[lease.lease_id] = lease
+        worker.leases[lease.lease_id] = lease
+        job.lease_id = lease.lease_id
+        self.counters["leased"] += 1
+        asyncio.ensure_future(self._send(worker, MessageType.LEASE,
+                                         {"lease_id": lease.lease_id, "kind": job.kind, "payload": job.payload}))
+
+    async def _send(self, worker: RemoteWorker, message_type: MessageType, payload: Any):
+        try:
+            await write_frame(worker.writer, message_type, payload)
+        except CONNECTION_ERRORS:
+            self._evict(worker)
+
+    def _release(self, lease: Lease):
+        self._leases.pop(lease.lease_id, None)
+        worker = self.workers.get(lease.worker_id)
+        if worker is not None:
+            worker.leases.pop(lease.lease_id, None)
+
+    def _withdraw(self, job: Job):
+        """A cancelled job gives its worker slot back now; the worker is told to stop it"""
+        self.counters["cancelled"] += 1
+        lease = self._leases.get(job.lease_id) if job.lease_id else None
+        if lease is not None:
+            self._release(lease)
+            worker = self.workers.get(lease.worker_id)
+            if worker is not None:
+                asyncio.ensure_future(self._send(worker, MessageType.CANCEL, {"lease_id": lease.lease_id}))
+        self._dispatch()
+
+    def _requeue(self, lease: Lease):
+        self._release(lease)
+        job = lease.job
+        if job.future.done():
+            return
+        if job.attempts >= self.max_attempts:
+            self.counters["failed"] += 1
+            job.future.set_exception(LeaseExpired(f"{job.job_id} lost its lease {job.attempts} times"))
+            return
+        self.counters["requeued"] += 1
+        self._queue.appendleft(job)
+
+    def _evict(self, worker: RemoteWorker, requeue: bool = True):
+        if self.workers.get(worker.worker_id) is worker:
+            del self.workers[worker.worker_id]
+            self.counters["evicted"] += 1
+        leases = list(worker.leases.values())
+        worker.leases.clear()
+        for lease in leases:
+            if requeue:
+                self._requeue(lease)
+            else:
+                self._release(lease)
+        worker.writer.close()
+        if requeue:
+            self._dispatch()
+
+    async def _reap(self):
+        """Re-queue expired leases; a worker that stopped heartbeating is evicted with all its leases"""
+        while True:
+            await asyncio.sleep(self.heartbeat_interval / 2)
+            now = time.monotonic()
+            for lease in [l for l in self._leases.values() if l.expires_at <= now]:
+                if lease.lease_id not in self._leases:
+                    continue
+                worker = self.workers.get(lease.worker_id)
+                if worker is not None and now - worker.last_seen > self.lease_timeout:
+                    self._evict(worker)
+                else:
+                    self._requeue(lease)
+            self._dispatch()
+
+    # Connections
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        connection = asyncio.current_task()
+        self._connections.add(connection)
+        try:
+            await self._serve_worker(reader, writer)
+        finally:
+            self._connections.discard(connection)
+
+    async def _serve_worker(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            message_type, hello = await asyncio.wait_for(read_frame(reader), self.lease_timeout)
+            if message_type != MessageType.REGISTER:
+                raise ProtocolError(f"Expected REGISTER, got {message_type.name}")
+        except (asyncio.TimeoutError, *CONNECTION_ERRORS):
+            writer.close()
+            return
+
+        worker = RemoteWorker(str(hello["worker_id"]), max(1, int(hello.get("capacity", 1))),
+                              list(hello.get("kinds") or ["*"]), writer, time.monotonic())
+        previous = self.workers.get(worker.worker_id)
+        if previous is not None:
+            # A reconnecting worker lost whatever it was running
+            self._evict(previous)
+        self.workers[worker.worker_id] = worker
+        await self._send(worker, MessageType.REGISTERED, {
+            "heartbeat_interval": self.heartbeat_interval, "lease_timeout": self.lease_timeout
+        })
+        async with self._registered:
+            self._registered.notify_all()
+        self._dispatch()
+
+        try:
+            while True:
+                message_type, message = await read_frame(reader)
+                worker.last_seen = time.monotonic()
+                if message_type == MessageType.HEARTBEAT:
+                    expires_at = worker.last_seen + self.lease_timeout
+                    for lease_id in message.get("leases", []):
+                        if lease_id in worker.leases:
+                            worker.leases[lease_id].expires_at = expires_at
+                elif message_type in (MessageType.RESULT, MessageType.FAIL):
+                    self._finish(worker, message_type, message)
+                else:
+                    raise ProtocolError(f"Unexpected {message_type.name} from worker")
+        except CONNECTION_ERRORS:
+            pass
+        finally:
+            self._evict(worker)
+
+    def _finish(self, worker: RemoteWorker, message_type: MessageType, message: Dict[str, Any]):
+        lease = worker.leases.get(message["lease_id"])
+        if lease is None:
+            # Stale: the lease expired and the job was already re-queued
+            self.counters["stale_results"] += 1
+            return
+        self._release(lease)
+        job = lease.job
+        if not job.future.done():
+            if message_type == MessageType.RESULT:
+                worker.completed += 1
+                self.counters["completed"] += 1
+                job.future.set_result(message["result"])
+            else:
+                self.counters["failed"] += 1
+                job.future.set_exception(RemoteTaskError(f"{worker.worker_id}: {message['error']}"))
+        self._dispatch()
+
+
+class WorkerNode:
+    """Connects to a dispatcher and runs leased jobs with its handlers.
+
+    Handlers take the job payload; plain functions run on a thread pool sized
+    to the advertised capacity so heartbeats keep flowing during CPU work.
+    A plain handler with a cancel_token parameter gets a CancelToken that is
+    cancelled when the dispatcher withdraws the lease.
+    """
+
+    def __init__(self, handlers: Dict[str, Callable[[Any], Any]], capacity: int = 1,
+                 worker_id: Optional[str] = None, heartbeat_interval: Optional[float] = None):
+        self.handlers = handlers
+        self.capacity = capacity
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        self.heartbeat_interval = heartbeat_interval
+        self.completed = 0
+        self._active: Dict[str, asyncio.Task] = {}
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._executor = concurrent.futures.ThreadPoolExecutor(capacity, thread_name_prefix="worker-node")
+
+    async def run(self, address: str):
+        """Register and serve leases until the dispatcher closes the connection"""
+        reader, self._writer = await open_connection(address)
+        heartbeat = None
+        try:
+            await write_frame(self._writer, MessageType.REGISTER, {
+                "worker_id": self.worker_id, "capacity": self.capacity, "kinds": sorted(self.handlers)
+            })
+            message_type, config = await read_frame(reader)
+            if message_type != MessageType.REGISTERED:
+                raise ProtocolError(f"Expected REGISTERED, got {message_type.name}")
+            heartbeat = asyncio.ensure_future(self._heartbeat(self.heartbeat_interval or config["heartbeat_interval"]))
+            while True:
+                message_type, lease = await read_frame(reader)
+                if message_type == MessageType.CANCEL:
+                    work = self._active.get(lease["lease_id"])
+                    if work is not None:
+                        work.cancel()
+                    continue
+                if message_type != MessageType.LEASE:
+                    raise ProtocolError(f"Unexpected {message_type.name} from dispatcher")
+                self._active[lease["lease_id"]] = asyncio.ensure_future(self._work(lease))
+        except CONNECTION_ERRORS:
+            pass
+        finally:
+            if heartbeat:
+                heartbeat.cancel()
+            for work in self._active.values():
+                work.cancel()
+            self._writer.close()
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+
+    async def _heartbeat(self, interval: float):
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await write_frame(self._writer, MessageType.HEARTBEAT, {"leases": list(self._active)})
+            except CONNECTION_ERRORS:
+                return
+
+    async def _work(self, lease: Dict[str, Any]):
+        lease_id = lease["lease_id"]
+        token = CancelToken()
+        try:
+            handler = self.handlers[lease["kind"]]
+            if inspect.iscoroutinefunction(handler):
+                result = await handler(lease["payload"])
+            else:
+                call = functools.partial(handler, lease["payload"])
+                if "cancel_token" in inspect.signature(handler).parameters:
+                    call = functools.partial(call, cancel_token=token)
+                result = await asyncio.get_running_loop().run_in_executor(self._executor, call)
+            reply = (MessageType.RESULT, {"lease_id": lease_id, "result": result})
+            self.completed += 1
+        except asyncio.CancelledError:
+            # The executor thread cannot be interrupted; the token stops it at its next check
+            token.cancel("lease cancelled")
+            raise
+        except Exception as e:
+            reply = (MessageType.FAIL, {"lease_id": lease_id, "error": f"{type(e).__name__}: {e}"})
+        finally:
+            self._active.pop(lease_id, None)
+        try:
+            await write_frame(self._writer, *reply)
+        except CONNECTION_ERRORS:
+            pass
+
+
+def tree_scan(payload: Dict[str, Any], cancel_token: Optional[CancelToken] = None) -> Dict[str, Any]:
+    """Scan every JavaScript file under payload["root"] for fabric canvas sites"""
+    from fabric_canvas_scanner import scan_file
+
+    root = payload["root"]
+    skip = set(payload.get("skip", ["node_modules", ".git", "vendor"]))
+    files, tokens, sites = 0, 0, {}
+    for directory, subdirs, names in os.walk(root):
+        subdirs[:] = [d for d in subdirs if d not in skip]
+        for name in names:
+            if not name.endswith(".js"):
+                continue
+            if cancel_token is not None:
+                cancel_token.check()
+            path = os.path.join(directory, name)
+            try:
+                result = scan_file(path)
+            except OSError:
+                continue
+            files += 1
+            tokens += result.token_count
+            if result.sites:
+                sites[os.path.relpath(path, root)] = len(result.sites)
+    return {"root": root, "worker": socket.gethostname(), "files": files, "tokens": tokens, "canvas_sites": sites}
+
+
+DEFAULT_HANDLERS = {"tree_scan": tree_scan}
+
+
+async def scan_checkouts(address: str, roots: List[str], workers: int, timeout: float) -> List[Dict[str, Any]]:
+    dispatcher = WorkerDispatcher()
+    await dispatcher.start(address)
+    try:
+        print(f"📡 Dispatcher listening on {dispatcher.address}; waiting for {workers} worker(s)")
+        await dispatcher.wait_for_workers(workers, timeout)
+        return await asyncio.gather(*(dispatcher.run("tree_scan", {"root": os.path.abspath(root)}, timeout)
+                                      for root in roots))
+    finally:
+        await dispatcher.close()
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Remote analyzer worker nodes")
+    commands = parser.add_subparsers(dest="command", required=True)
+    worker = commands.add_parser("worker", help="Run a worker node")
+    worker.add_argument("--connect", required=True, help="Dispatcher address, host:port or unix:/path")
+    worker.add_argument("--capacity", type=int, default=os.cpu_count() or 1)
+    scan = commands.add_parser("scan", help="Spread tree scans of plugin checkouts across workers")
+    scan.add_argument("--listen", default="127.0.0.1:7400")
+    scan.add_argument("--workers", type=int, default=1)
+    scan.add_argument("--timeout", type=float, default=600.0)
+    scan.add_argument("roots", nargs="+")
+    args = parser.parse_args(argv)
+
+    if args.command == "worker":
+        node = WorkerNode(DEFAULT_HANDLERS, capacity=args.capacity)
+        print(f"🛰️ Worker {node.worker_id} (capacity {args.capacity}) → {args.connect}")
+        asyncio.run(node.run(args.connect))
+        print(f"✅ Dispatcher closed the connection after {node.completed} job(s)")
+        return 0
+
+    results = asyncio.run(scan_checkouts(args.listen, args.roots, args.workers, args.timeout))
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+🔀 WORKFLOW PIPELINE - Event-driven phase pipelining
+Phases declare the upstream fields they need ("analysis.findings") instead of
+waiting for whole predecessor phases. A phase starts the moment its required
+fields exist; phases with optional inputs may start speculatively and are
+restarted when those inputs arrive. Missed deadlines and missing inputs are
+raised as errors, never passed on as None.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+from plan_scheduler import PhaseNode, topological_order
+from span_tracing import span
+
+
+class PhaseDeadlineError(TimeoutError):
+    """Raised when a phase does not finish within its deadline"""
+
+
+class PhaseInputError(RuntimeError):
+    """Raised when a required upstream field can never become available"""
+
+
+class WorkflowError(RuntimeError):
+    """Raised after a run in which one or more phases did not complete"""
+
+    def __init__(self, message: str, outcomes: Dict[str, "PipelineOutcome"]):
+        super().__init__(message)
+        self.outcomes = outcomes
+
+
+@dataclass
+class PipelinePhase:
+    name: str
+    func: Callable[["PhaseContext"], Awaitable[Any]]
+    requires: List[str] = field(default_factory=list)
+    optional: List[str] = field(default_factory=list)
+    # Start as soon as the required fields exist, without waiting for optional ones
+    speculative: bool = False
+    deadline: Optional[float] = None
+
+
+@dataclass
+class PipelineOutcome:
+    name: str
+    status: str = "pending"
+    result: Any = None
+    error: Optional[str] = None
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    speculative: bool = False
+    restarts: int = 0
+    inputs_used: List[str] = field(default_factory=list)
+
+    @property
+    def duration(self) -> float:
+        if self.started_at is None or self.finished_at is None:
+            return 0.0
+        return self.finished_at - self.started_at
+
+
+def _producer(field_name: str) -> str:
+    return field_name.split(".", 1)[0]
+
+
+class PhaseContext:
+    """What a running phase sees: its inputs and a way to publish fields early"""
+
+    def __init__(self, pipeline: "WorkflowPipeline", phase: PipelinePhase, inputs: Dict[str, Any]):
+        self._pipeline = pipeline
+        self.phase = phase
+        self.inputs = inputs
+        self.missing_optional = [f for f in phase.optional if f not in inputs]
+
+    @property
+    def speculative(self) -> bool:
+        return bool(self.missing_optional)
+
+    def fields_of(self, phase_name: str) -> Optional[Dict[str, Any]]:
+        """Regroup the inputs produced by one upstream phase into a dict"""
+        if phase_name in self.inputs:
+            return self.inputs[phase_name]
+        prefix = f"{phase_name}."
+        grouped = {name[len(prefix):]: value for name, value in self.inputs.items() if name.startswith(prefix)}
+        return grouped or None
+
+    def publish(self, key: str, value: Any):
+        """Make one output field available downstream before the phase finishes.
+
+        Early fields are final: they must not depend on optional inputs, since a
+        speculative restart does not retract them.
+        """
+        self._pipeline._publish(f"{self.phase.name}.{key}", value)
+
+
+class WorkflowPipeline:
+    """Runs phases as soon as the fields they need are available"""
+
+    def __init__(self, phases: List[PipelinePhase]):
+        self.phases = {phase.name: phase for phase in phases}
+        for phase in phases:
+            for field_name in phase.requires + phase.optional:
+                if _producer(field_name) not in self.phases:
+                    raise KeyError(f"Phase {phase.name} needs {field_name} from unknown phase {_producer(field_name)}")
+        # Reject cycles up front; the order itself is only used for stable launch order
+        self.order = topological_order([
+            PhaseNode(id=phase.name,
+                      depends_on=sorted({_producer(f) for f in phase.requires + phase.optional}))
+            for phase in phases
+        ])
+        self.fields: Dict[str, Any] = {}
+        self.outcomes: Dict[str, PipelineOutcome] = {name: PipelineOutcome(name=name) for name in self.order}
+        self._wakeup: Optional[asyncio.Event] = None
+        self._epoch = 0.0
+
+    @property
+    def results(self) -> Dict[str, Any]:
+        return {name: outcome.result for name, outcome in self.outcomes.items() if outcome.status == "completed"}
+
+    def _publish(self, field_name: str, value: Any):
+        self.fields[field_name] = value
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _resolved(self, field_name: str) -> bool:
+        """A field is resolved once it exists or its producer can no longer create it"""
+        return field_name in self.fields or self.outcomes[_producer(field_name)].status in ("completed", "failed", "skipped")
+
+    async def _execute(self, phase: PipelinePhase, context: PhaseContext) -> Any:
+        with span("phase", phase=phase.name, speculative=context.speculative, inputs=sorted(context.inputs)):
+            if phase.deadline is None:
+                return await phase.func(context)
+            try:
+                return await asyncio.wait_for(phase.func(context), phase.deadline)
+            except asyncio.TimeoutError as e:
+                # Deadline errors raised inside the phase (e.g. an agent task deadline) keep their own message
+                if type(e) is not asyncio.TimeoutError:
+                    raise
+                raise PhaseDeadlineError(f"Phase {phase.name} missed its {phase.deadline}s deadline") from None
+
+    async def run(self) -> Dict[str, Any]:
+        """Run every phase; raises WorkflowError if any phase fails or is skipped"""
+        with span("workflow", phases=len(self.phases)):
+            return await self._run()
+
+    async def _run(self) -> Dict[str, Any]:
+        self._wakeup = asyncio.Event()
+        self._epoch = time.perf_counter()
+        running: Dict[asyncio.Task, str] = {}
+        contexts: Dict[str, PhaseContext] = {}
+        # Cancelled speculative runs, awaited before run() returns
+        abandoned: Set[asyncio.Task] = set()
+
+        def launch(phase: PipelinePhase):
+            inputs = {f: self.fields[f] for f in phase.requires + phase.optional if f in self.fields}
+            context = PhaseContext(self, phase, inputs)
+            outcome = self.outcomes[phase.name]
+            outcome.status = "running"
+            outcome.speculative = context.speculative
+            outcome.inputs_used = sorted(inputs)
+            outcome.started_at = time.perf_counter() - self._epoch
+            contexts[phase.name] = context
+            future = asyncio.ensure_future(self._execute(phase, context))
+            # Each phase gets its own named lane in an exported trace
+            future.set_name(f"phase {phase.name}")
+            running[future] = phase.name
+            if context.speculative:
+                print(f"⚡ SPECULATIVE START: {phase.name} (without {', '.join(context.missing_optional)})")
+
+        def fail(name: str, status: str, error: str):
+            outcome = self.outcomes[name]
+            outcome.status = status
+            outcome.error = error
+            outcome.finished_at = time.perf_counter() - self._epoch
+            icon = "⏭️ " if status == "skipped" else "❌"
+            print(f"{icon} {status.upper()}: {name} ({error})")
+
+        def schedule():
+            for name in self.order:
+                phase = self.phases[name]
+                outcome = self.outcomes[name]
+                if outcome.status != "pending":
+                    continue
+                unavailable = [f for f in phase.requires if f not in self.fields and self._resolved(f)]
+                if unavailable:
+                    error = PhaseInputError(f"required field(s) never produced: {', '.join(unavailable)}")
+                    fail(name, "skipped", f"{type(error).__name__}: {error}")
+                    continue
+                if not all(f in self.fields for f in phase.requires):
+                    continue
+                if phase.speculative or all(self._resolved(f) for f in phase.optional):
+                    launch(phase)
+
+        def restart_stale_speculation():
+            for task, name in list(running.items()):
+                context = contexts[name]
+                arrived = [f for f in context.missing_optional if f in self.fields]
+                if not arrived:
+                    continue
+                # Optional inputs showed up while the speculative run was in flight: redo it with them
+                task.cancel()
+                del running[task]
+                abandoned.add(task)
+                self.outcomes[name].restarts += 1
+                print(f"🔁 RESTART: {name} (optional input arrived: {', '.join(arrived)})")
+                launch(self.phases[name])
+
+        waker: Optional[asyncio.Future] = None
+        try:
+            schedule()
+            while running:
+                self._wakeup.clear()
+                waker = asyncio.ensure_future(self._wakeup.wait())
+                done, _ = await asyncio.wait(set(running) | {waker}, return_when=asyncio.FIRST_COMPLETED)
+                if not waker.done():
+                    waker.cancel()
+
+                for finished in done:
+                    if finished is waker or finished not in running:
+                        continue
+                    name = running.pop(finished)
+                    outcome = self.outcomes[name]
+                    try:
+                        result = finished.result()
+                    except Exception as e:
+                        fail(name, "failed", f"{type(e).__name__}: {e}")
+                        continue
+                    outcome.result = result
+                    outcome.finished_at = time.perf_counter() - self._epoch
+                    outcome.status = "completed"
+                    if isinstance(result, dict):
+                        for key, value in result.items():
+                            self.fields.setdefault(f"{name}.{key}", value)
+                    self.fields[name] = result
+
+                restart_stale_speculation()
+                schedule()
+        finally:
+            # Cancelled or failed runs must not leave phases (or their agent tasks) running
+            leftovers = set(running) | abandoned
+            if waker is not None:
+                leftovers.add(waker)
+            for task in leftovers:
+                task.cancel()
+            if leftovers:
+                await asyncio.gather(*leftovers, return_exceptions=True)
+            for name in running.values():
+                fail(name, "failed", "CancelledError: workflow run stopped")
+
+        incomplete = {name: outcome.error for name, outcome in self.outcomes.items() if outcome.status != "completed"}
+        if incomplete:
+            details = "; ".join(f"{name}: {error}" for name, error in incomplete.items())
+            raise WorkflowError(f"{len(incomplete)} phase(s) did not complete — {details}", self.outcomes)
+        return self.results